@@ -4,10 +4,31 @@
 
 from .validator import ReviewValidator, validate_review
 from .analyzer import PharmacistAnalyzer, analyze_review
+from .structured_output import ParseMetrics, StructuredOutputError, parse_metrics, repair_json
+from .client_pool import get_anthropic_client, get_shared_analyzer
+from .usage_metrics import UsageTracker, usage_tracker
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, DeadlineExceededError
+from .background_tasks import BackgroundTaskStore, background_tasks
+from .stage_metrics import StageMetrics, stage_metrics
 
 __all__ = [
     "ReviewValidator",
     "validate_review",
     "PharmacistAnalyzer",
-    "analyze_review"
+    "analyze_review",
+    "ParseMetrics",
+    "StructuredOutputError",
+    "parse_metrics",
+    "repair_json",
+    "get_anthropic_client",
+    "get_shared_analyzer",
+    "UsageTracker",
+    "usage_tracker",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "BackgroundTaskStore",
+    "background_tasks",
+    "StageMetrics",
+    "stage_metrics"
 ]
@@ -4,14 +4,56 @@ Anthropic Claude를 활용한 전문가 관점의 리뷰 분석
 """
 
 import os
-import json
-from typing import Dict, Optional
-from anthropic import Anthropic
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from .structured_output import StructuredOutputError, build_tool_schema, repair_json, parse_metrics
+from .client_pool import get_anthropic_client, get_shared_analyzer
+from .usage_metrics import usage_tracker
+from .background_tasks import background_tasks
+from .length_policy import LLM_TOKEN_BUDGET, select_excerpt
+
+
+class AnalysisOutput(BaseModel):
+    """약사 분석 결과 스키마 (tool-use 입력 스키마로 사용)"""
+    Summary: str = Field(description="리뷰 한 줄 요약 (사용자 체감 중심, 30자 이내)")
+    Efficacy: List[str] = Field(default_factory=list, description="리뷰에 명시된 효능 목록")
+    Side_effects: List[str] = Field(default_factory=list, description="리뷰에 명시된 부작용 목록")
+    Trust_score: float = Field(ge=0, le=100, description="리뷰의 구체성, 신뢰성 종합 평가 (0-100)")
+    Tip: str = Field(description="약사의 핵심 조언 (50자 이내)")
+
+    @field_validator("Efficacy", "Side_effects", mode="before")
+    @classmethod
+    def _wrap_string_values(cls, value: Any) -> Any:
+        """목록 대신 문자열로 응답한 경우 목록으로 감쌈"""
+        if isinstance(value, str):
+            return [value] if value.strip() else []
+        return value
 
 
 class PharmacistAnalyzer:
     """15년 경력 임상 약사 페르소나 기반 AI 분석기"""
 
+    # 스키마 강제 출력용 tool 정의
+    ANALYSIS_TOOL = build_tool_schema(
+        AnalysisOutput,
+        name="record_review_analysis",
+        description="건강기능식품 리뷰에 대한 약사 분석 결과를 기록합니다."
+    )
+
+    # 파싱 실패 시 재호출 횟수 (로컬 복구 실패 후에만 재호출)
+    MAX_PARSE_RETRIES = 1
+    PARSE_METRICS_SOURCE = "core.analyzer"
+
+    # 프롬프트에 넣는 리뷰 본문 토큰 예산 (초과 시 핵심 문장만 발췌)
+    INPUT_TOKEN_BUDGET = LLM_TOKEN_BUDGET
+
+    # 일관성 있는 분석을 위해 낮은 temperature
+    # (SDK 버전에 따라 messages.create()에 temperature 인자가 없으므로 요청 본문으로 전달)
+    SAMPLING_PARAMS = {"temperature": 0.3}
+
+    # 기본 분석 모델
+    DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
     SYSTEM_PROMPT = """당신은 15년 경력의 임상 약사입니다.
 
 **역할 및 태도:**
@@ -30,7 +72,7 @@ class PharmacistAnalyzer:
 "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
 
 **출력 형식:**
-반드시 다음 JSON 형식으로 응답하세요:
+반드시 record_review_analysis 도구를 호출하여 다음 JSON 형식으로 응답하세요:
 {
   "Summary": "리뷰 한 줄 요약 (사용자 체감 중심, 30자 이내)",
   "Efficacy": ["효능1", "효능2"],
@@ -63,12 +105,19 @@ class PharmacistAnalyzer:
 본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다.
 """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = DEFAULT_MODEL,
+        client: Optional[Any] = None
+    ):
         """
         약사 분석기 초기화
 
         Args:
             api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            model: 기본 Claude 모델 (analyze()에서 model을 지정하지 않은 경우 사용)
+            client: 사용할 Anthropic 클라이언트 (None인 경우 API 키별 공유 클라이언트)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -77,15 +126,16 @@ class PharmacistAnalyzer:
                 "환경변수 ANTHROPIC_API_KEY를 설정하거나 api_key 매개변수를 전달하세요."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.model = model
+        self.client = client or get_anthropic_client(self.api_key)
 
-    def analyze(self, review_text: str, model: str = "claude-sonnet-4-5-20250929") -> Dict:
+    def analyze(self, review_text: str, model: Optional[str] = None) -> Dict:
         """
         리뷰를 약사 페르소나로 분석
 
         Args:
             review_text: 분석할 리뷰 텍스트
-            model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
+            model: 사용할 Claude 모델 (None인 경우 self.model)
 
         Returns:
             Dict: {
@@ -94,55 +144,110 @@ class PharmacistAnalyzer:
                 "Side_effects": ["부작용1", "부작용2"],
                 "Trust_score": 85,
                 "Tip": "약사의 핵심 조언",
-                "disclaimer": "부인 공지"
+                "disclaimer": "부인 공지",
+                "input_truncation": 발췌 통계 (토큰 예산을 넘어 본문을 발췌한 경우)
             }
 
         Raises:
             ValueError: 리뷰 텍스트가 10자 미만인 경우
+            StructuredOutputError: 재호출 후에도 응답을 스키마로 파싱하지 못한 경우
             Exception: API 호출 실패 시
         """
         # 입력 검증
         if len(review_text.strip()) < 10:
             raise ValueError("리뷰 텍스트가 너무 짧습니다 (최소 10자 이상)")
 
-        try:
-            # Anthropic API 호출
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=1000,
-                temperature=0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-                system=self.SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": self.USER_PROMPT_TEMPLATE.format(
-                            review_text=review_text
-                        )
-                    }
-                ]
-            )
-
-            # JSON 파싱
-            content = response.content[0].text
-            result = json.loads(content)
+        # 긴 리뷰는 토큰 예산 안에서 핵심 문장만 발췌
+        excerpt, truncation = select_excerpt(review_text, token_budget=self.INPUT_TOKEN_BUDGET)
+
+        model = model or self.model
+        result = None
+        parse_error = None
+        with usage_tracker.track(self.PARSE_METRICS_SOURCE, model) as call:
+            for attempt in range(self.MAX_PARSE_RETRIES + 1):
+                try:
+                    # Anthropic API 호출 (tool-use로 출력 스키마 강제)
+                    response = self.client.messages.create(
+                        model=model,
+                        max_tokens=1000,
+                        system=self.SYSTEM_PROMPT,
+                        tools=[self.ANALYSIS_TOOL],
+                        tool_choice={"type": "tool", "name": self.ANALYSIS_TOOL["name"]},
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": self.USER_PROMPT_TEMPLATE.format(
+                                    review_text=excerpt
+                                )
+                            }
+                        ],
+                        extra_body=self.SAMPLING_PARAMS
+                    )
+                except Exception as e:
+                    call.add_failed_attempt()
+                    call.outcome = "api_error"
+                    raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+                call.add_response(response)
+
+                # 구조화 출력 추출 (tool 입력 → 실패 시 로컬 복구 → 그래도 실패 시 재호출)
+                result, repaired, parse_error = self._extract_result(response)
+                if result is not None:
+                    if attempt > 0:
+                        outcome = "retried"
+                    else:
+                        outcome = "repaired" if repaired else "structured"
+                    parse_metrics.record(self.PARSE_METRICS_SOURCE, outcome)
+                    call.outcome = outcome
+                    break
+
+            if result is None:
+                parse_metrics.record(self.PARSE_METRICS_SOURCE, "failed")
+                call.outcome = "failed"
+                raise StructuredOutputError(f"AI 응답 파싱 실패: {parse_error}")
+
+        # 부인 공지 추가
+        result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+
+        if truncation["truncated"]:
+            result["input_truncation"] = truncation
+
+        return result
+
+    def _extract_result(self, response: Any) -> Tuple[Optional[Dict], bool, Optional[str]]:
+        """
+        API 응답에서 분석 결과 추출 및 스키마 검증
 
-            # 필수 필드 검증
-            required_fields = ["Summary", "Efficacy", "Side_effects", "Trust_score", "Tip"]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"필수 필드 누락: {field}")
+        Args:
+            response: messages API 응답
 
-            # 부인 공지 추가
-            result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+        Returns:
+            Tuple[Optional[Dict], bool, Optional[str]]: (결과, 로컬 복구 여부, 오류 메시지)
+        """
+        tool_input = None
+        texts = []
+        for block in getattr(response, "content", None) or []:
+            block_type = getattr(block, "type", None)
+            if block_type == "tool_use" and getattr(block, "name", None) == self.ANALYSIS_TOOL["name"]:
+                tool_input = block.input
+            elif block_type == "text":
+                texts.append(block.text)
+
+        repaired = False
+        if not isinstance(tool_input, dict):
+            tool_input = repair_json("\n".join(texts))
+            repaired = True
+            if tool_input is None:
+                return None, repaired, "응답에서 JSON 객체를 찾을 수 없습니다"
 
-            return result
+        try:
+            validated = AnalysisOutput.model_validate(tool_input)
+        except ValidationError as e:
+            return None, repaired, f"스키마 검증 실패: {e.error_count()}개 필드 오류"
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"AI 응답 파싱 실패: {e}")
-        except Exception as e:
-            raise Exception(f"AI 분석 중 오류 발생: {e}")
+        return validated.model_dump(), repaired, None
 
-    def analyze_safe(self, review_text: str, model: str = "claude-sonnet-4-5-20250929") -> Dict:
+    def analyze_safe(self, review_text: str, model: Optional[str] = None) -> Dict:
         """
         안전한 분석 (오류 발생 시 기본값 반환)
 
@@ -180,7 +285,12 @@ class PharmacistAnalyzer:
 
 
 # 편의 함수
-def analyze_review(review_text: str, api_key: Optional[str] = None, model: str = "claude-sonnet-4-5-20250929") -> Dict:
+def analyze_review(
+    review_text: str,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-5-20250929",
+    deadline_ms: Optional[float] = None
+) -> Dict:
     """
     리뷰 분석 편의 함수
 
@@ -188,9 +298,31 @@ def analyze_review(review_text: str, api_key: Optional[str] = None, model: str =
         review_text: 분석할 리뷰 텍스트
         api_key: Anthropic API 키 (선택)
         model: 사용할 모델 (기본값: claude-sonnet-4-5-20250929)
+        deadline_ms: 응답 마감 시간 (밀리초, 기본값: None → 분석 완료까지 대기)
+                     초과 시 analysis_pending=True와 handle을 즉시 반환하고,
+                     분석은 백그라운드에서 계속 진행됩니다
+                     (background_tasks.poll(handle)로 조회).
 
     Returns:
-        Dict: 분석 결과
+        Dict: 분석 결과 (마감 시간 초과 시 analysis_pending 표시 결과)
     """
-    analyzer = PharmacistAnalyzer(api_key=api_key)
-    return analyzer.analyze_safe(review_text, model)
+    # API 키/모델별 공유 분석기 재사용 (커넥션 풀 공유)
+    analyzer = get_shared_analyzer(PharmacistAnalyzer, api_key=api_key, model=model)
+    if deadline_ms is None:
+        return analyzer.analyze_safe(review_text)
+
+    handle = background_tasks.submit(analyzer.analyze_safe, review_text)
+    result = background_tasks.poll(handle, timeout=max(0.0, deadline_ms) / 1000)
+    if result is not None:
+        return result
+    return {
+        "analysis_pending": True,
+        "handle": handle,
+        "message": "AI 분석이 진행 중입니다. background_tasks.poll(handle)로 결과를 조회하세요.",
+        "Summary": "분석 진행 중",
+        "Efficacy": [],
+        "Side_effects": [],
+        "Trust_score": 0,
+        "Tip": "AI 분석 결과는 잠시 후 제공됩니다.",
+        "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+    }
@@ -0,0 +1,169 @@
+"""
+백그라운드 작업 저장소
+느린 단계(AI 분석 등)를 스레드 풀에서 실행하고, 핸들로 결과를 나중에 조회합니다.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+
+class BackgroundTaskStore:
+    """
+    핸들 기반 백그라운드 작업 실행/결과 캐시 (스레드 안전)
+
+    submit()은 작업을 스레드 풀에 넣고 핸들(문자열)을 반환합니다.
+    결과는 wait()로 기다리거나 get()으로 즉시 조회할 수 있으며,
+    완료된 작업은 max_entries개까지 오래된 순으로 보관합니다.
+    """
+
+    def __init__(self, max_workers: int = 16, max_entries: int = 1000):
+        """
+        저장소 초기화
+
+        Args:
+            max_workers: 동시에 실행할 작업 수 상한
+            max_entries: 보관할 작업(결과) 수 상한 (초과 시 완료된 작업부터 제거)
+        """
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._tasks: "OrderedDict[str, Future]" = OrderedDict()
+        self._counts = {"submitted": 0, "cancelled": 0, "discarded": 0}
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> str:
+        """
+        작업 실행 예약
+
+        Args:
+            fn: 실행할 함수
+            *args, **kwargs: fn 인자
+
+        Returns:
+            str: 결과 조회용 핸들
+        """
+        handle = uuid.uuid4().hex
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="background-task"
+                )
+            self._tasks[handle] = self._executor.submit(fn, *args, **kwargs)
+            self._counts["submitted"] += 1
+            self._evict_locked()
+        return handle
+
+    def wait(self, handle: str, timeout: Optional[float] = None) -> Any:
+        """
+        작업 완료까지 대기 후 결과 반환
+
+        Args:
+            handle: submit()이 반환한 핸들
+            timeout: 최대 대기 시간 (초, None이면 완료까지 대기)
+
+        Returns:
+            작업 결과
+
+        Raises:
+            KeyError: 알 수 없는(또는 제거된) 핸들
+            concurrent.futures.TimeoutError: timeout 안에 끝나지 않은 경우
+            Exception: 작업이 발생시킨 예외
+        """
+        return self._future(handle).result(timeout=timeout)
+
+    def poll(self, handle: str, timeout: float = 0.0) -> Optional[Any]:
+        """
+        결과가 준비되었으면 반환, 아니면 None (최대 timeout초 대기)
+
+        Args:
+            handle: submit()이 반환한 핸들
+            timeout: 최대 대기 시간 (초, 기본값: 0 → 대기하지 않음)
+
+        Returns:
+            작업 결과 또는 None (아직 실행 중)
+
+        Raises:
+            KeyError: 알 수 없는(또는 제거된) 핸들
+            Exception: 작업이 발생시킨 예외
+        """
+        try:
+            return self.wait(handle, timeout=timeout)
+        except FutureTimeoutError:
+            return None
+
+    def get(self, handle: str) -> Dict[str, Any]:
+        """
+        작업 상태 즉시 조회 (대기하지 않음)
+
+        Args:
+            handle: submit()이 반환한 핸들
+
+        Returns:
+            Dict: {"status": "pending"/"done"/"failed"/"cancelled"/"unknown",
+                   "result": 결과 (done인 경우), "error": 오류 메시지 (failed인 경우)}
+        """
+        try:
+            future = self._future(handle)
+        except KeyError:
+            return {"status": "unknown"}
+        if future.cancelled():
+            return {"status": "cancelled"}
+        if not future.done():
+            return {"status": "pending"}
+        error = future.exception()
+        if error is not None:
+            return {"status": "failed", "error": str(error)}
+        return {"status": "done", "result": future.result()}
+
+    def cancel(self, handle: str) -> bool:
+        """
+        작업 취소
+
+        아직 시작하지 않은 작업은 실행되지 않으며, 이미 실행 중인 작업은
+        끝까지 진행되지만 결과는 버려집니다(저장소에서 제거).
+
+        Args:
+            handle: submit()이 반환한 핸들
+
+        Returns:
+            bool: 시작 전에 취소되었으면 True
+        """
+        with self._lock:
+            future = self._tasks.pop(handle, None)
+            if future is None:
+                return False
+            cancelled = future.cancel()
+            self._counts["cancelled" if cancelled else "discarded"] += 1
+        return cancelled
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        저장소 통계 반환
+
+        Returns:
+            Dict: {"submitted", "cancelled", "discarded", "pending", "stored"}
+        """
+        with self._lock:
+            pending = sum(1 for f in self._tasks.values() if not f.done())
+            return {**self._counts, "pending": pending, "stored": len(self._tasks)}
+
+    def _future(self, handle: str) -> Future:
+        """핸들에 해당하는 Future 반환"""
+        with self._lock:
+            return self._tasks[handle]
+
+    def _evict_locked(self) -> None:
+        """보관 수 상한 초과 시 오래된 완료 작업 제거 (호출자가 락을 보유한 상태)"""
+        excess = len(self._tasks) - self.max_entries
+        if excess <= 0:
+            return
+        for handle in [h for h, f in self._tasks.items() if f.done()][:excess]:
+            del self._tasks[handle]
+
+
+# 프로세스 전역 백그라운드 작업 저장소
+background_tasks = BackgroundTaskStore()
@@ -0,0 +1,272 @@
+"""
+서킷 브레이커 모듈
+외부 API 장애 시 연속 실패/지연 호출을 감지하여 호출을 즉시 차단하고,
+백그라운드 프로브로 복구 여부를 확인합니다.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출이 차단된 경우"""
+
+
+class DeadlineExceededError(TimeoutError):
+    """호출이 지정된 마감 시간(deadline_ms) 안에 끝나지 않은 경우"""
+
+
+# 마감 시간이 지정된 호출을 실행하는 공유 스레드 풀
+_DEADLINE_WORKERS = 32
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """마감 시간 호출용 스레드 풀 반환 (최초 사용 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=_DEADLINE_WORKERS,
+                    thread_name_prefix="deadline-call"
+                )
+    return _executor
+
+
+class CircuitBreaker:
+    """
+    실패/지연 호출 기반 서킷 브레이커 (스레드 안전)
+
+    상태:
+        - closed: 정상 호출
+        - open: 호출 즉시 차단 (CircuitOpenError)
+        - half_open: 프로브 함수가 없는 경우 복구 확인용 호출 1건만 허용
+
+    연속된 실패가 failure_threshold회, 또는 연속된 지연 호출(slow_call_ms 초과)이
+    slow_call_threshold회에 도달하면 열립니다. 정상 속도의 성공 호출은 연속 횟수를 초기화합니다.
+    열린 뒤 recovery_seconds가 지나면 probe 함수를 백그라운드에서 실행하여,
+    성공 시 닫고 실패 시 대기 시간을 두 배로 늘려(max_recovery_seconds 이하) 다시 엽니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        slow_call_ms: float = 20000.0,
+        slow_call_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        max_recovery_seconds: float = 300.0,
+        probe: Optional[Callable[[], Any]] = None,
+        ignore_exceptions: Tuple[Type[BaseException], ...] = (ValueError,)
+    ):
+        """
+        서킷 브레이커 초기화
+
+        Args:
+            name: 식별용 이름 (통계/오류 메시지에 사용)
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            slow_call_ms: 지연 호출로 간주하는 소요 시간 (밀리초)
+            slow_call_threshold: 서킷을 여는 연속 지연 호출 횟수
+            recovery_seconds: 열린 뒤 복구 확인까지 대기 시간 (초)
+            max_recovery_seconds: 프로브 실패 시 늘어나는 대기 시간 상한 (초)
+            probe: 복구 확인용 함수 (예외 없이 끝나면 복구로 판단, None이면 half_open 방식)
+            ignore_exceptions: 실패로 집계하지 않을 예외 (입력 오류 등)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_ms = slow_call_ms
+        self.slow_call_threshold = slow_call_threshold
+        self.recovery_seconds = recovery_seconds
+        self.max_recovery_seconds = max_recovery_seconds
+        self.probe = probe
+        self.ignore_exceptions = ignore_exceptions
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._opened_at = 0.0
+        self._current_recovery = recovery_seconds
+        self._probe_running = False
+        self._half_open_in_flight = False
+        self._counts = {"calls": 0, "failures": 0, "slow": 0, "rejected": 0, "deadline_exceeded": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (closed/open/half_open)"""
+        with self._lock:
+            return self._state
+
+    def call(self, fn: Callable[..., Any], *args, deadline_ms: Optional[float] = None, **kwargs) -> Any:
+        """
+        서킷 브레이커를 거쳐 함수 호출
+
+        Args:
+            fn: 호출할 함수
+            *args, **kwargs: fn 인자
+            deadline_ms: 호출 마감 시간 (밀리초, None이면 제한 없음)
+
+        Returns:
+            fn의 반환값
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우 (즉시 반환)
+            DeadlineExceededError: 마감 시간 초과 (호출은 백그라운드에서 계속 진행되며 결과는 버려짐)
+            Exception: fn이 발생시킨 예외
+        """
+        self._before_call()
+
+        start = time.perf_counter()
+        try:
+            if deadline_ms is None:
+                result = fn(*args, **kwargs)
+            else:
+                future = _get_executor().submit(fn, *args, **kwargs)
+                try:
+                    result = future.result(timeout=max(0.0, deadline_ms) / 1000)
+                except FutureTimeoutError:
+                    with self._lock:
+                        self._counts["deadline_exceeded"] += 1
+                    raise DeadlineExceededError(
+                        f"{self.name}: {deadline_ms:.0f}ms 안에 응답하지 않았습니다."
+                    )
+        except self.ignore_exceptions:
+            self._release_half_open()
+            raise
+        except Exception:
+            self._on_failure()
+            raise
+
+        self._on_success((time.perf_counter() - start) * 1000)
+        return result
+
+    def _before_call(self) -> None:
+        """호출 허용 여부 확인 (열려 있으면 CircuitOpenError)"""
+        start_probe = False
+        with self._lock:
+            self._counts["calls"] += 1
+            if self._state == self.OPEN:
+                elapsed = time.monotonic() - self._opened_at
+                if self.probe is None and elapsed >= self._current_recovery:
+                    self._state = self.HALF_OPEN
+                elif self.probe is not None and elapsed >= self._current_recovery and not self._probe_running:
+                    # 타이머 스레드가 종료된 경우 등을 대비한 보조 프로브 시작
+                    self._probe_running = True
+                    start_probe = True
+
+            if self._state == self.HALF_OPEN and not self._half_open_in_flight:
+                self._half_open_in_flight = True
+            elif self._state != self.CLOSED:
+                self._counts["rejected"] += 1
+                retry_in = max(0.0, self._current_recovery - (time.monotonic() - self._opened_at))
+                if start_probe:
+                    self._start_probe_thread(delay=0.0)
+                raise CircuitOpenError(
+                    f"{self.name}: 서킷이 열려 있어 호출을 차단했습니다 (약 {retry_in:.0f}초 후 복구 확인)."
+                )
+
+    def _on_success(self, elapsed_ms: float) -> None:
+        """성공 호출 기록 (지연 호출이면 연속 지연 횟수 증가)"""
+        with self._lock:
+            self._half_open_in_flight = False
+            self._consecutive_failures = 0
+            if elapsed_ms > self.slow_call_ms:
+                self._counts["slow"] += 1
+                self._consecutive_slow += 1
+                if self._consecutive_slow >= self.slow_call_threshold:
+                    self._open_locked()
+                    return
+            else:
+                self._consecutive_slow = 0
+            if self._state == self.HALF_OPEN:
+                self._close_locked()
+
+    def _on_failure(self) -> None:
+        """실패 호출 기록 (임계값 도달 또는 half_open 중 실패 시 서킷 열기)"""
+        with self._lock:
+            self._half_open_in_flight = False
+            self._counts["failures"] += 1
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN:
+                self._current_recovery = min(self._current_recovery * 2, self.max_recovery_seconds)
+                self._open_locked(reset_recovery=False)
+            elif self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open_locked()
+
+    def _release_half_open(self) -> None:
+        """실패로 집계하지 않는 예외로 끝난 half_open 호출 슬롯 반환"""
+        with self._lock:
+            self._half_open_in_flight = False
+
+    def _open_locked(self, reset_recovery: bool = True) -> None:
+        """서킷 열기 (호출자가 락을 보유한 상태)"""
+        if reset_recovery and self._state == self.CLOSED:
+            self._current_recovery = self.recovery_seconds
+        if self._state != self.OPEN:
+            self._counts["opened"] += 1
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        if self.probe is not None and not self._probe_running:
+            self._probe_running = True
+            self._start_probe_thread(delay=self._current_recovery)
+
+    def _close_locked(self) -> None:
+        """서킷 닫기 (호출자가 락을 보유한 상태)"""
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._consecutive_slow = 0
+        self._current_recovery = self.recovery_seconds
+
+    def _start_probe_thread(self, delay: float) -> None:
+        """delay초 후 백그라운드 프로브 실행"""
+        timer = threading.Timer(delay, self._run_probe)
+        timer.daemon = True
+        timer.start()
+
+    def _run_probe(self) -> None:
+        """복구 확인 프로브 실행 (성공 시 닫기, 실패 시 대기 시간을 늘려 다시 열기)"""
+        try:
+            self.probe()
+            succeeded = True
+        except Exception:
+            succeeded = False
+
+        with self._lock:
+            self._probe_running = False
+            if self._state != self.OPEN:
+                return
+            if succeeded:
+                self._close_locked()
+            else:
+                self._current_recovery = min(self._current_recovery * 2, self.max_recovery_seconds)
+                self._open_locked(reset_recovery=False)
+
+    def reset(self) -> None:
+        """서킷 강제 닫기 및 연속 횟수 초기화"""
+        with self._lock:
+            self._close_locked()
+            self._half_open_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        서킷 브레이커 통계 반환
+
+        Returns:
+            Dict: {"name", "state", "calls", "failures", "slow", "rejected",
+                   "deadline_exceeded", "opened", "recovery_seconds"}
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._state,
+                **self._counts,
+                "recovery_seconds": self._current_recovery
+            }
@@ -0,0 +1,141 @@
+"""
+공유 Anthropic 클라이언트 풀
+API 키별로 하나의 HTTP 커넥션 풀을 프로세스 전체에서 재사용합니다.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+from anthropic import DEFAULT_CONNECTION_LIMITS, Anthropic, DefaultHttpxClient, Timeout
+
+
+# 커넥션 풀 설정 (동시 분석 호출 수 기준으로 조정)
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# 요청 타임아웃 (연결 10초, 전체 60초)
+REQUEST_TIMEOUT = Timeout(60.0, connect=10.0)
+
+# SDK가 내부적으로 사용하는 HTTP 라이브러리의 Limits 타입 (SDK 버전별로 다를 수 있음)
+_Limits = type(DEFAULT_CONNECTION_LIMITS)
+
+_lock = threading.Lock()
+_clients: Dict[str, Anthropic] = {}
+_analyzers: Dict[Tuple[type, str, Optional[str]], Any] = {}
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    """API 키 확인 (None인 경우 환경변수에서 로드)"""
+    resolved = api_key or os.getenv("ANTHROPIC_API_KEY")
+    if not resolved:
+        raise ValueError(
+            "Anthropic API 키가 필요합니다. "
+            "환경변수 ANTHROPIC_API_KEY를 설정하거나 api_key 매개변수를 전달하세요."
+        )
+    return resolved
+
+
+def get_anthropic_client(api_key: Optional[str] = None) -> Anthropic:
+    """
+    API 키별 공유 Anthropic 클라이언트 반환 (스레드 안전)
+
+    같은 API 키로 호출하면 항상 같은 클라이언트를 반환하므로
+    TCP/TLS 연결이 keep-alive로 재사용됩니다.
+
+    Args:
+        api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+
+    Returns:
+        Anthropic: 커넥션 풀이 설정된 공유 클라이언트
+
+    Raises:
+        ValueError: API 키가 없는 경우
+    """
+    key = _resolve_api_key(api_key)
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = Anthropic(
+                api_key=key,
+                timeout=REQUEST_TIMEOUT,
+                http_client=DefaultHttpxClient(
+                    limits=_Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS
+                    )
+                )
+            )
+            _clients[key] = client
+        return client
+
+
+def get_shared_analyzer(
+    analyzer_cls: Type,
+    api_key: Optional[str] = None,
+    model: Optional[str] = None
+):
+    """
+    (분석기 클래스, API 키, 모델)별 공유 분석기 인스턴스 반환 (스레드 안전)
+
+    분석기는 get_anthropic_client()의 공유 클라이언트를 사용하므로
+    모델이 달라도 같은 API 키라면 커넥션 풀을 함께 씁니다.
+
+    Args:
+        analyzer_cls: 분석기 클래스 (api_key, model, client 인자를 받는 클래스)
+        api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+        model: 분석기 기본 모델 (None인 경우 클래스 기본값)
+
+    Returns:
+        analyzer_cls 인스턴스
+
+    Raises:
+        ValueError: API 키가 없는 경우
+    """
+    key = _resolve_api_key(api_key)
+    registry_key = (analyzer_cls, key, model)
+
+    analyzer = _analyzers.get(registry_key)
+    if analyzer is not None:
+        return analyzer
+
+    client = get_anthropic_client(key)
+    with _lock:
+        analyzer = _analyzers.get(registry_key)
+        if analyzer is None:
+            kwargs = {"api_key": key, "client": client}
+            if model:
+                kwargs["model"] = model
+            analyzer = analyzer_cls(**kwargs)
+            _analyzers[registry_key] = analyzer
+        return analyzer
+
+
+def get_pool_stats() -> Dict[str, int]:
+    """
+    풀 상태 반환
+
+    Returns:
+        Dict: {"clients": 공유 클라이언트 수, "analyzers": 공유 분석기 수}
+    """
+    with _lock:
+        return {"clients": len(_clients), "analyzers": len(_analyzers)}
+
+
+def close_all_clients() -> None:
+    """모든 공유 클라이언트의 연결을 닫고 풀 초기화 (테스트/종료 시 사용)"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _analyzers.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
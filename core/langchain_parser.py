@@ -1,13 +1,21 @@
 """
-LangChain Pydantic Output Parser를 활용한 리뷰 분석 모듈
+LangChain 구조화 출력(tool-use)을 활용한 리뷰 분석 모듈
 ReviewValidator의 결과를 구조화된 객체로 반환
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from langchain_core.output_parsers import PydanticOutputParser
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, ValidationError
 from langchain_core.prompts import PromptTemplate
 from langchain_anthropic import ChatAnthropic
+from .structured_output import repair_json, parse_metrics
+from .usage_metrics import CallUsage, usage_tracker
+
+
+# 파싱 실패 시 재호출 횟수 (로컬 복구 실패 후에만 재호출)
+MAX_PARSE_RETRIES = 1
+PARSE_METRICS_SOURCE = "core.langchain_parser"
 
 
 class AdCheckItem(BaseModel):
@@ -45,6 +53,70 @@ class ReviewValidationResult(BaseModel):
     )
 
 
+class BatchParseResults(list):
+    """
+    배치 분석 결과 (입력 순서의 ReviewValidationResult 또는 None 목록 + 실패 사유)
+
+    errors: 실패한 리뷰 인덱스별 {"type": "api_error"/"parse_error", "error": 예외 유형, "message": 오류 메시지}
+    (api_error는 SDK 재시도 후에도 실패한 API 오류(429/529/인증 등)로 다시 호출하지 않음)
+    """
+
+    def __init__(self, results: List[Optional[ReviewValidationResult]], errors: Dict[int, Dict[str, str]]):
+        super().__init__(results)
+        self.errors = errors
+
+
+# 검증 프롬프트 (모듈 로드 시 한 번만 생성)
+VALIDATION_PROMPT = PromptTemplate(
+    template="""당신은 건강기능식품 리뷰의 신뢰도를 평가하는 전문가입니다.
+
+다음 리뷰 텍스트를 분석하여 13단계 광고 판별 체크리스트를 적용하고,
+신뢰도 점수를 계산하여 구조화된 형태로 반환하세요.
+
+## 13단계 광고 판별 체크리스트:
+1. 대가성 문구 존재 (무상/무료 제공, 협찬, 받았어요 등)
+2. 감탄사 남발 (!!!, ~~~, ♡♡♡, 완전/진짜/정말/너무 반복)
+3. 정돈된 문단 구조 (번호매기기, 불릿 포인트 등)
+4. 개인 경험 부재 (나는/저는/제가/직접 등의 표현 없음)
+5. 원료 특징 나열 (성분, 함유량, mg/g 등 나열)
+6. 키워드 반복 (특정 단어 5회 이상 반복)
+7. 단점 회피 (부정적 의견이나 단점 언급 없음)
+8. 찬사 위주 구성 (최고/강추/추천/만족 등 과도한 칭찬)
+9. 전문 용어 오남용 (항산화/면역력/임상 등 전문용어 남발)
+10. 비현실적 효과 강조 (100%/즉시/바로/하루만에 등)
+11. 타사 제품 비교 (다른 제품보다 좋다는 비교)
+12. 홍보성 블로그 문체 (~했답니다, ~해드립니다, ~추천드려요)
+13. 이모티콘 과다 사용 (이모티콘 5개 이상 연속)
+
+## 신뢰도 점수 계산 공식:
+- 기본 점수 = (L × 0.2) + (R × 0.2) + (M × 0.3) + (P × 0.1) + (C × 0.2)
+  * L (length_score): {length_score}
+  * R (repurchase_score): {repurchase_score}
+  * M (monthly_use_score): {monthly_use_score}
+  * P (photo_score): {photo_score}
+  * C (consistency_score): {consistency_score}
+
+- 감점 = 감지된 항목 개수 × 10점
+- 최종 점수 = max(0, 기본 점수 - 감점)
+- 광고 판별: 최종 점수 < 40 또는 감점 항목 >= 3개
+
+## 분석할 리뷰 텍스트:
+{review_text}
+
+위 리뷰를 분석하여 각 체크리스트 항목의 감지 여부를 판단하고,
+신뢰도 점수를 계산한 후 ReviewValidationResult 도구를 호출하여 응답하세요.
+""",
+    input_variables=[
+        "review_text",
+        "length_score",
+        "repurchase_score",
+        "monthly_use_score",
+        "photo_score",
+        "consistency_score"
+    ]
+)
+
+
 def parse_review_with_langchain(
     review_text: str,
     model_name: str = "claude-3-5-sonnet-20241022",
@@ -57,9 +129,12 @@ def parse_review_with_langchain(
     anthropic_api_key: Optional[str] = None
 ) -> ReviewValidationResult:
     """
-    LangChain Pydantic Output Parser를 사용하여 리뷰 텍스트를 분석하고
+    LangChain 구조화 출력(tool-use)을 사용하여 리뷰 텍스트를 분석하고
     구조화된 ReviewValidationResult 객체로 반환
 
+    ReviewValidationResult 스키마를 tool 정의로 전달하여 출력 형식을 강제하고,
+    스키마 검증에 실패하면 로컬 복구를 먼저 시도한 뒤에만 재호출합니다.
+
     Args:
         review_text: 분석할 리뷰 텍스트
         model_name: 사용할 Claude 모델 이름 (기본값: "claude-3-5-sonnet-20241022")
@@ -74,6 +149,9 @@ def parse_review_with_langchain(
     Returns:
         ReviewValidationResult: 구조화된 리뷰 검증 결과 객체
 
+    Raises:
+        ValueError: 재호출 후에도 응답을 스키마에 맞게 해석할 수 없는 경우
+
     Example:
         >>> review = "이 제품 정말 좋아요!!! 완전 대박!!! 강추합니다!!!"
         >>> result = parse_review_with_langchain(
@@ -86,86 +164,295 @@ def parse_review_with_langchain(
         >>> for item in result.detected_items:
         ...     print(f"{item.item_number}. {item.item_name}: {item.detected}")
     """
-    # Pydantic Output Parser 초기화
-    output_parser = PydanticOutputParser(pydantic_object=ReviewValidationResult)
+    chain = get_validation_chain(model_name, temperature, anthropic_api_key)
+    inputs = _build_inputs(
+        review_text,
+        length_score,
+        repurchase_score,
+        monthly_use_score,
+        photo_score,
+        consistency_score
+    )
 
-    # Format instructions 생성
-    format_instructions = output_parser.get_format_instructions()
+    # 실행 (스키마 검증 → 로컬 복구 → 재호출)
+    parse_error = None
+    with usage_tracker.track(PARSE_METRICS_SOURCE, model_name) as call:
+        for attempt in range(MAX_PARSE_RETRIES + 1):
+            try:
+                output = chain.invoke(inputs)
+            except Exception:
+                call.add_failed_attempt()
+                call.outcome = "api_error"
+                raise
+            call.add_response(output)
+            result, repaired, parse_error = _coerce_structured_output(output, review_text)
+            if result is not None:
+                call.outcome = _record_outcome(attempt, repaired)
+                return result
+
+        parse_metrics.record(PARSE_METRICS_SOURCE, "failed")
+        call.outcome = "failed"
+        raise ValueError(f"AI 응답 파싱 실패: {parse_error}")
+
+
+def parse_reviews_with_langchain_batch(
+    review_texts: List[str],
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    max_concurrency: int = 5,
+    score_params: Optional[List[Dict[str, float]]] = None,
+    anthropic_api_key: Optional[str] = None
+) -> BatchParseResults:
+    """
+    여러 리뷰를 캐시된 체인의 batch()로 동시에 분석
 
-    # Prompt Template 정의
-    prompt_template = PromptTemplate(
-        template="""당신은 건강기능식품 리뷰의 신뢰도를 평가하는 전문가입니다.
+    파싱에 실패한 리뷰만 모아서 다시 batch로 재호출하며,
+    최종 실패한 리뷰는 None으로 반환합니다 (입력 순서 유지).
+    API 오류(429/529/인증 등)는 파싱 실패와 구분하여 errors에 기록하고 다시 호출하지 않습니다.
 
-다음 리뷰 텍스트를 분석하여 13단계 광고 판별 체크리스트를 적용하고,
-신뢰도 점수를 계산하여 구조화된 형태로 반환하세요.
+    Args:
+        review_texts: 분석할 리뷰 텍스트 목록
+        model_name: 사용할 Claude 모델 이름 (기본값: "claude-3-5-sonnet-20241022")
+        temperature: LLM temperature 설정 (기본값: 0)
+        max_concurrency: 동시 요청 수 상한 (기본값: 5)
+        score_params: 리뷰별 점수 매개변수 목록 (length_score 등, 없으면 기본값)
+        anthropic_api_key: Anthropic API 키 (선택사항)
 
-## 13단계 광고 판별 체크리스트:
-1. 대가성 문구 존재 (무상/무료 제공, 협찬, 받았어요 등)
-2. 감탄사 남발 (!!!, ~~~, ♡♡♡, 완전/진짜/정말/너무 반복)
-3. 정돈된 문단 구조 (번호매기기, 불릿 포인트 등)
-4. 개인 경험 부재 (나는/저는/제가/직접 등의 표현 없음)
-5. 원료 특징 나열 (성분, 함유량, mg/g 등 나열)
-6. 키워드 반복 (특정 단어 5회 이상 반복)
-7. 단점 회피 (부정적 의견이나 단점 언급 없음)
-8. 찬사 위주 구성 (최고/강추/추천/만족 등 과도한 칭찬)
-9. 전문 용어 오남용 (항산화/면역력/임상 등 전문용어 남발)
-10. 비현실적 효과 강조 (100%/즉시/바로/하루만에 등)
-11. 타사 제품 비교 (다른 제품보다 좋다는 비교)
-12. 홍보성 블로그 문체 (~했답니다, ~해드립니다, ~추천드려요)
-13. 이모티콘 과다 사용 (이모티콘 5개 이상 연속)
+    Returns:
+        BatchParseResults: 리뷰별 결과 목록 (실패 시 None, 실패 사유는 results.errors)
 
-## 신뢰도 점수 계산 공식:
-- 기본 점수 = (L × 0.2) + (R × 0.2) + (M × 0.3) + (P × 0.1) + (C × 0.2)
-  * L (length_score): {length_score}
-  * R (repurchase_score): {repurchase_score}
-  * M (monthly_use_score): {monthly_use_score}
-  * P (photo_score): {photo_score}
-  * C (consistency_score): {consistency_score}
+    Example:
+        >>> results = parse_reviews_with_langchain_batch(reviews, max_concurrency=8)
+        >>> ads = [r for r in results if r and r.is_ad]
+        >>> rate_limited = [i for i, e in results.errors.items() if e["type"] == "api_error"]
+    """
+    chain = get_validation_chain(model_name, temperature, anthropic_api_key)
+    all_inputs = _build_batch_inputs(review_texts, score_params)
+    config = {"max_concurrency": max_concurrency}
+
+    results: List[Optional[ReviewValidationResult]] = [None] * len(review_texts)
+    errors: Dict[int, Dict[str, str]] = {}
+    calls = [CallUsage(PARSE_METRICS_SOURCE, model_name) for _ in review_texts]
+    start = time.perf_counter()
+    pending = list(range(len(review_texts)))
+    for attempt in range(MAX_PARSE_RETRIES + 1):
+        if not pending:
+            break
+        outputs = chain.batch([all_inputs[i] for i in pending], config=config, return_exceptions=True)
+        pending = _collect_batch_outputs(pending, outputs, review_texts, results, attempt, calls, errors)
+
+    _record_batch_usage(calls, pending, start)
+    return BatchParseResults(results, errors)
+
+
+async def aparse_reviews_with_langchain_batch(
+    review_texts: List[str],
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    max_concurrency: int = 5,
+    score_params: Optional[List[Dict[str, float]]] = None,
+    anthropic_api_key: Optional[str] = None
+) -> BatchParseResults:
+    """
+    parse_reviews_with_langchain_batch()의 비동기 버전 (체인의 abatch() 사용)
 
-- 감점 = 감지된 항목 개수 × 10점
-- 최종 점수 = max(0, 기본 점수 - 감점)
-- 광고 판별: 최종 점수 < 40 또는 감점 항목 >= 3개
+    Args:
+        parse_reviews_with_langchain_batch()와 동일
 
-## 분석할 리뷰 텍스트:
-{review_text}
+    Returns:
+        BatchParseResults: 리뷰별 결과 목록 (실패 시 None, 실패 사유는 results.errors)
+    """
+    chain = get_validation_chain(model_name, temperature, anthropic_api_key)
+    all_inputs = _build_batch_inputs(review_texts, score_params)
+    config = {"max_concurrency": max_concurrency}
+
+    results: List[Optional[ReviewValidationResult]] = [None] * len(review_texts)
+    errors: Dict[int, Dict[str, str]] = {}
+    calls = [CallUsage(PARSE_METRICS_SOURCE, model_name) for _ in review_texts]
+    start = time.perf_counter()
+    pending = list(range(len(review_texts)))
+    for attempt in range(MAX_PARSE_RETRIES + 1):
+        if not pending:
+            break
+        outputs = await chain.abatch([all_inputs[i] for i in pending], config=config, return_exceptions=True)
+        pending = _collect_batch_outputs(pending, outputs, review_texts, results, attempt, calls, errors)
+
+    _record_batch_usage(calls, pending, start)
+    return BatchParseResults(results, errors)
+
+
+@lru_cache(maxsize=16)
+def get_validation_chain(
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    anthropic_api_key: Optional[str] = None
+):
+    """
+    (모델, temperature)별 검증 체인을 한 번만 생성하여 재사용
 
-{format_instructions}
+    PromptTemplate, ChatAnthropic 클라이언트, 구조화 출력 래퍼를
+    호출마다 다시 만들지 않도록 캐시합니다.
 
-위 리뷰를 분석하여 각 체크리스트 항목의 감지 여부를 판단하고,
-신뢰도 점수를 계산한 후 지정된 JSON 형식으로 응답하세요.
-""",
-        input_variables=[
-            "review_text",
-            "length_score",
-            "repurchase_score",
-            "monthly_use_score",
-            "photo_score",
-            "consistency_score"
-        ],
-        partial_variables={"format_instructions": format_instructions}
-    )
+    Args:
+        model_name: Claude 모델 이름
+        temperature: LLM temperature 설정
+        anthropic_api_key: Anthropic API 키 (None이면 환경변수 사용)
 
-    # LLM 초기화
+    Returns:
+        Runnable: prompt | llm.with_structured_output(...) 체인
+    """
     llm = ChatAnthropic(
         model=model_name,
         temperature=temperature,
         anthropic_api_key=anthropic_api_key
     )
 
-    # Chain 생성 및 실행
-    chain = prompt_template | llm | output_parser
+    # 스키마를 tool로 전달, 원본 응답도 함께 반환
+    return VALIDATION_PROMPT | llm.with_structured_output(
+        ReviewValidationResult,
+        include_raw=True
+    )
+
 
-    # 실행
-    result = chain.invoke({
+def _build_inputs(
+    review_text: str,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50
+) -> Dict[str, Any]:
+    """체인 입력 딕셔너리 생성"""
+    return {
         "review_text": review_text,
         "length_score": length_score,
         "repurchase_score": repurchase_score,
         "monthly_use_score": monthly_use_score,
         "photo_score": photo_score,
         "consistency_score": consistency_score
-    })
+    }
+
+
+def _build_batch_inputs(
+    review_texts: List[str],
+    score_params: Optional[List[Dict[str, float]]] = None
+) -> List[Dict[str, Any]]:
+    """배치 입력 목록 생성 (score_params 길이는 review_texts와 같아야 함)"""
+    if score_params is not None and len(score_params) != len(review_texts):
+        raise ValueError("score_params 길이는 review_texts 길이와 같아야 합니다.")
+    return [
+        _build_inputs(text, **(score_params[i] if score_params else {}))
+        for i, text in enumerate(review_texts)
+    ]
+
+
+def _collect_batch_outputs(
+    pending: List[int],
+    outputs: List[Any],
+    review_texts: List[str],
+    results: List[Optional[ReviewValidationResult]],
+    attempt: int,
+    calls: List[CallUsage],
+    errors: Dict[int, Dict[str, str]]
+) -> List[int]:
+    """
+    배치 결과를 results에 채우고(리뷰별 사용량 누적), 파싱 재호출이 필요한 인덱스 목록 반환
+
+    API 오류는 errors에 api_error로 기록하고 재호출 대상에서 제외합니다 (파싱 실패로 집계하지 않음).
+    """
+    still_pending = []
+    for index, output in zip(pending, outputs):
+        call = calls[index]
+        if isinstance(output, Exception):
+            call.add_failed_attempt()
+            call.outcome = "api_error"
+            errors[index] = {"type": "api_error", "error": type(output).__name__, "message": str(output)}
+            continue
+        call.add_response(output)
+        result, repaired, parse_error = _coerce_structured_output(output, review_texts[index])
+        if result is None:
+            call.outcome = "failed"
+            errors[index] = {"type": "parse_error", "error": "ValueError", "message": parse_error}
+            still_pending.append(index)
+            continue
+        results[index] = result
+        errors.pop(index, None)
+        call.outcome = _record_outcome(attempt, repaired)
+    return still_pending
+
+
+def _record_batch_usage(calls: List[CallUsage], pending: List[int], start: float) -> None:
+    """배치 리뷰별 사용량 기록 (지연 시간은 배치 전체 소요 시간, 최종 파싱 실패 리뷰는 파싱 지표에도 기록)"""
+    for _ in pending:
+        parse_metrics.record(PARSE_METRICS_SOURCE, "failed")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for call in calls:
+        usage_tracker.record(
+            call.source,
+            call.model,
+            elapsed_ms,
+            call.usage,
+            call.retries,
+            call.outcome or "unknown"
+        )
+
+
+def _record_outcome(attempt: int, repaired: bool) -> str:
+    """성공한 파싱 결과 유형을 지표에 기록하고 반환"""
+    if attempt > 0:
+        outcome = "retried"
+    else:
+        outcome = "repaired" if repaired else "structured"
+    parse_metrics.record(PARSE_METRICS_SOURCE, outcome)
+    return outcome
+
+
+def _coerce_structured_output(
+    output: Dict[str, Any],
+    review_text: str
+) -> Tuple[Optional[ReviewValidationResult], bool, Optional[str]]:
+    """
+    with_structured_output(include_raw=True) 결과를 ReviewValidationResult로 변환
+
+    파싱된 객체가 없으면 원본 메시지의 tool 인자 또는 텍스트를
+    로컬에서 복구하여 다시 검증합니다.
+
+    Args:
+        output: {"raw": AIMessage, "parsed": 객체 또는 None, "parsing_error": 예외 또는 None}
+        review_text: 원본 리뷰 텍스트 (응답에서 누락된 경우 보완)
+
+    Returns:
+        Tuple: (결과 객체 또는 None, 로컬 복구 여부, 오류 메시지)
+    """
+    parsed = output.get("parsed")
+    if isinstance(parsed, ReviewValidationResult):
+        return parsed, False, None
+
+    raw = output.get("raw")
+    candidate = None
+    for tool_call in getattr(raw, "tool_calls", None) or []:
+        if isinstance(tool_call.get("args"), dict):
+            candidate = dict(tool_call["args"])
+            break
+
+    if candidate is None:
+        content = getattr(raw, "content", "")
+        if isinstance(content, list):
+            content = "\n".join(
+                part.get("text", "") for part in content
+                if isinstance(part, dict) and part.get("type") == "text"
+            )
+        candidate = repair_json(content)
+        if candidate is None:
+            return None, True, f"응답에서 JSON 객체를 찾을 수 없습니다 ({output.get('parsing_error')})"
+
+    # 원본 리뷰 텍스트는 모델 출력에 의존하지 않고 보완
+    candidate.setdefault("review_text", review_text)
 
-    return result
+    try:
+        return ReviewValidationResult.model_validate(candidate), True, None
+    except ValidationError as e:
+        return None, True, f"스키마 검증 실패: {e.error_count()}개 필드 오류"
 
 
 def parse_review_hybrid(
@@ -0,0 +1,173 @@
+"""
+리뷰 길이 정책 모듈
+긴 리뷰를 규칙 검사용 고정 크기 구간(window)으로 나누고,
+AI 분석에는 토큰 예산 안에서 핵심 문장(성분/효과/복용 기간 언급)만 발췌하여 전달합니다.
+리뷰 1건당 최악의 정규식 비용과 프롬프트 토큰 수가 상한을 갖도록 합니다.
+"""
+
+import math
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# 규칙 검사 구간 크기/겹침 (문자 수) 및 구간 수 상한 → 규칙 검사 입력은 최대 약 16,000자
+RULE_WINDOW_CHARS = 2000
+RULE_WINDOW_OVERLAP = 200
+RULE_MAX_WINDOWS = 8
+
+# 발췌 대상으로 살펴보는 최대 문자 수 (이후 부분은 읽지 않음)
+MAX_SCAN_CHARS = RULE_WINDOW_CHARS * RULE_MAX_WINDOWS
+
+# AI 분석에 전달하는 리뷰 본문 토큰 예산 (추정치)
+LLM_TOKEN_BUDGET = 800
+
+# 토큰 수 추정용 평균 문자 수 (한국어 기준 보수적 값)
+CHARS_PER_TOKEN = 1.5
+
+# 발췌 문장 사이 구분자 (생략된 부분이 있음을 표시)
+EXCERPT_SEPARATOR = " … "
+
+# 문장 경계: 종결 부호 또는 줄바꿈 뒤
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。…~])\s+|\n+")
+
+# 기본 핵심 문장 판별 패턴 (성분, 효과/부작용, 복용 기간)
+DEFAULT_SALIENCE_PATTERNS = [
+    re.compile(
+        r"루테인|지아잔틴|오메가|비타민|마그네슘|유산균|프로바이오틱스|아연|철분|칼슘|콜라겐|"
+        r"밀크씨슬|코엔자임|홍삼|lutein|omega|vitamin|magnesium|probiotic|zinc|iron|calcium|collagen",
+        re.IGNORECASE
+    ),
+    re.compile(
+        r"효과|효능|개선|나아|좋아|줄었|덜|부작용|속쓰림|두통|설사|변비|피로|피곤|잠|"
+        r"effect|better|improv|side\s*effect|tired|sleep",
+        re.IGNORECASE
+    ),
+    re.compile(
+        r"\d+\s*(?:일|주|달|개월|년)|(?:한|두|세)\s*(?:달|주)|일주일|보름|매일|아침|저녁|식후|"
+        r"\d+\s*(?:days?|weeks?|months?)|daily",
+        re.IGNORECASE
+    ),
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 추정 토큰 수 (문자 수 / CHARS_PER_TOKEN, 올림)"""
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 단위로 분리 (빈 문장 제외)"""
+    return [s.strip() for s in _SENTENCE_BOUNDARY.split(text or "") if s and s.strip()]
+
+
+def default_salience(sentence: str) -> int:
+    """기본 핵심도 점수: 언급된 범주(성분, 효과/부작용, 복용 기간) 수"""
+    return sum(1 for pattern in DEFAULT_SALIENCE_PATTERNS if pattern.search(sentence))
+
+
+def split_windows(
+    text: str,
+    window_chars: int = RULE_WINDOW_CHARS,
+    overlap_chars: int = RULE_WINDOW_OVERLAP,
+    max_windows: int = RULE_MAX_WINDOWS
+) -> Tuple[List[str], int]:
+    """
+    규칙 검사용 구간 분할
+
+    구간은 가능하면 겹침 영역 안의 문장 경계에서 끊고, 다음 구간은 overlap_chars만큼
+    앞에서 시작하여 경계에 걸친 표현도 검사되도록 합니다.
+
+    Args:
+        text: 리뷰 텍스트
+        window_chars: 구간 크기 (문자 수)
+        overlap_chars: 구간 간 겹침 (문자 수, window_chars보다 작아야 함)
+        max_windows: 구간 수 상한 (초과분은 검사하지 않음)
+
+    Returns:
+        Tuple[List[str], int]: (구간 목록, 검사 대상 문자 수 = 마지막 구간의 끝 위치)
+    """
+    if overlap_chars >= window_chars:
+        raise ValueError("overlap_chars는 window_chars보다 작아야 합니다.")
+    if len(text) <= window_chars:
+        return [text], len(text)
+
+    windows: List[str] = []
+    start = 0
+    end = 0
+    while start < len(text) and len(windows) < max_windows:
+        end = min(start + window_chars, len(text))
+        if end < len(text):
+            # 겹침 영역 안의 마지막 문장 경계에서 끊기
+            boundaries = list(_SENTENCE_BOUNDARY.finditer(text, end - overlap_chars, end))
+            if boundaries:
+                end = boundaries[-1].end()
+        windows.append(text[start:end])
+        if end >= len(text):
+            break
+        start = max(end - overlap_chars, start + 1)
+    return windows, end
+
+
+def select_excerpt(
+    text: str,
+    token_budget: int = LLM_TOKEN_BUDGET,
+    salience: Callable[[str], int] = default_salience
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    토큰 예산 안에서 핵심 문장 발췌
+
+    예산 안에 들어오면 원문을 그대로 반환합니다. 넘으면 핵심도 점수가 높은 문장부터
+    (같은 점수는 앞 문장 우선) 예산이 허락하는 만큼 고른 뒤 원래 순서대로 이어 붙입니다.
+    첫 문장은 맥락 유지를 위해 항상 포함을 시도하며, 앞쪽 MAX_SCAN_CHARS까지만 살펴봅니다.
+
+    Args:
+        text: 리뷰 텍스트
+        token_budget: 발췌문 토큰 예산 (추정치)
+        salience: 문장 → 핵심도 점수 함수 (기본값: default_salience)
+
+    Returns:
+        Tuple[str, Dict]: (발췌문, 절단 통계 {"truncated", "original_chars", "excerpt_chars",
+                          "original_tokens", "excerpt_tokens", "truncated_ratio",
+                          "sentences_total", "sentences_kept"})
+    """
+    if estimate_tokens(text) <= token_budget:
+        total = len(split_sentences(text))
+        return text, _truncation_stats(text, text, total, total)
+
+    sentences = split_sentences(text[:MAX_SCAN_CHARS])
+
+    max_chars = int(token_budget * CHARS_PER_TOKEN)
+    separator_chars = len(EXCERPT_SEPARATOR)
+
+    # 첫 문장 우선, 이후 핵심도 내림차순 (같으면 앞 문장 우선)
+    order = sorted(range(len(sentences)), key=lambda i: (i != 0, -salience(sentences[i]), i))
+    chosen: List[int] = []
+    used = 0
+    for index in order:
+        cost = len(sentences[index]) + (separator_chars if chosen else 0)
+        if used + cost <= max_chars:
+            chosen.append(index)
+            used += cost
+
+    if chosen:
+        excerpt = EXCERPT_SEPARATOR.join(sentences[i] for i in sorted(chosen))
+    else:
+        # 예산보다 긴 단일 문장뿐인 경우 앞부분만 사용
+        excerpt = text[:max_chars]
+    return excerpt, _truncation_stats(text, excerpt, len(sentences), len(chosen) or 1)
+
+
+def _truncation_stats(original: str, excerpt: str, total: int, kept: int) -> Dict[str, Any]:
+    """발췌 전후 크기 비교 통계"""
+    original_chars = len(original)
+    excerpt_chars = len(excerpt)
+    return {
+        "truncated": excerpt != original,
+        "original_chars": original_chars,
+        "excerpt_chars": excerpt_chars,
+        "original_tokens": estimate_tokens(original),
+        "excerpt_tokens": estimate_tokens(excerpt),
+        "truncated_ratio": round(1 - excerpt_chars / original_chars, 4) if original_chars else 0.0,
+        "sentences_total": total,
+        "sentences_kept": kept
+    }
@@ -0,0 +1,404 @@
+"""
+모의 Anthropic API 서버
+실제 API 없이 분석기 동시성/배치/재시도 동작을 측정하기 위한 로컬 HTTP 서버입니다.
+
+Anthropic SDK와 LangChain(ChatAnthropic) 모두 base_url만 바꾸면 그대로 연결되며,
+요청의 tool 스키마에 맞는 응답을 생성하고 지연 분포, 429/529 연속 오류,
+잘못된 JSON 응답 비율을 설정할 수 있습니다.
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from anthropic import Anthropic, AsyncAnthropic
+
+
+# 지연 분포: 난수 생성기 → 지연 시간 (밀리초)
+LatencyModel = Callable[[random.Random], float]
+
+
+def fixed_latency(ms: float) -> LatencyModel:
+    """고정 지연"""
+    return lambda rng: ms
+
+
+def uniform_latency(low_ms: float, high_ms: float) -> LatencyModel:
+    """균등 분포 지연"""
+    return lambda rng: rng.uniform(low_ms, high_ms)
+
+
+def lognormal_latency(median_ms: float, sigma: float = 0.5) -> LatencyModel:
+    """
+    로그정규 분포 지연 (실제 API 응답 시간처럼 긴 꼬리)
+
+    Args:
+        median_ms: 중앙값 (밀리초)
+        sigma: 로그 표준편차 (클수록 꼬리가 김, 0.5이면 p99 ≈ 중앙값 × 3.2)
+    """
+    mu = math.log(median_ms)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def schema_example(schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    JSON 스키마를 만족하는 예시 값 생성 (필수 필드만 채움)
+
+    Args:
+        schema: JSON 스키마 (tool input_schema)
+        defs: $ref 해석용 정의 ($defs)
+
+    Returns:
+        스키마에 맞는 값
+    """
+    defs = defs if defs is not None else schema.get("$defs", {})
+    if "$ref" in schema:
+        return schema_example(defs[schema["$ref"].split("/")[-1]], defs)
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [s for s in schema[key] if s.get("type") != "null"] or schema[key]
+            return schema_example(options[0], defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "default" in schema and schema["default"] is not None:
+        return schema["default"]
+
+    schema_type = schema.get("type", "object")
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        return {
+            name: schema_example(properties[name], defs)
+            for name in schema.get("required", properties.keys())
+        }
+    if schema_type == "array":
+        return [schema_example(schema["items"], defs)] if schema.get("minItems") else []
+    if schema_type in ("number", "integer"):
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", 100))
+        value = (low + high) / 2
+        return int(value) if schema_type == "integer" else value
+    if schema_type == "boolean":
+        return False
+    return "모의 응답"
+
+
+class MockAnthropicServer:
+    """
+    Messages API(/v1/messages)를 흉내 내는 로컬 HTTP 서버 (별도 스레드에서 실행)
+
+    응답 유형:
+        - 정상: 요청의 tool 스키마를 만족하는 tool_use 블록
+        - 429/529 연속 오류: 요청마다 burst_rate 확률로 burst_length개 연속 오류 시작
+          (retry-after-ms 헤더 포함 → SDK 재시도 동작 측정)
+        - 복구 가능한 잘못된 JSON: 코드 펜스 + 후행 쉼표가 있는 텍스트 블록 (로컬 복구 경로)
+        - 복구 불가능한 잘못된 JSON: 중간에 끊긴 텍스트 블록 (재호출 경로)
+
+    사용 예:
+        >>> with MockAnthropicServer(latency=lognormal_latency(300)) as server:
+        ...     analyzer = PharmacistAnalyzer(api_key=server.api_key, client=server.client())
+        ...     analyzer.analyze("루테인 한 달째 먹고 있어요. 눈이 덜 피곤해요.")
+    """
+
+    def __init__(
+        self,
+        latency: LatencyModel = fixed_latency(0.0),
+        rate_limit_burst_rate: float = 0.0,
+        overload_burst_rate: float = 0.0,
+        burst_length: int = 3,
+        malformed_rate: float = 0.0,
+        repairable_rate: float = 0.0,
+        retry_after_ms: int = 20,
+        seed: Optional[int] = 42,
+        echo_prompt: bool = False
+    ):
+        """
+        서버 설정
+
+        Args:
+            latency: 응답 지연 분포 (기본값: 지연 없음)
+            rate_limit_burst_rate: 요청당 429 연속 오류가 시작될 확률
+            overload_burst_rate: 요청당 529 연속 오류가 시작될 확률
+            burst_length: 한 번 시작된 연속 오류의 요청 수
+            malformed_rate: 복구 불가능한 잘못된 JSON 응답 비율
+            repairable_rate: 로컬 복구 가능한 잘못된 JSON 응답 비율
+            retry_after_ms: 오류 응답의 retry-after-ms 헤더 값
+            seed: 난수 시드 (None이면 매번 다름)
+            echo_prompt: True이면 응답의 최상위 문자열 필드를 요청의 마지막 사용자 메시지로 채움
+                (배치 결과가 입력 순서와 맞는지 검증용)
+        """
+        self.latency = latency
+        self.rate_limit_burst_rate = rate_limit_burst_rate
+        self.overload_burst_rate = overload_burst_rate
+        self.burst_length = burst_length
+        self.malformed_rate = malformed_rate
+        self.repairable_rate = repairable_rate
+        self.retry_after_ms = retry_after_ms
+        self.echo_prompt = echo_prompt
+
+        # 서버마다 다른 키를 써서 키별로 캐시되는 클라이언트/체인이 섞이지 않도록 함
+        self.api_key = f"mock-{uuid.uuid4().hex[:12]}"
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._burst: Tuple[int, int] = (0, 0)  # (상태 코드, 남은 요청 수)
+        self._counts: Dict[str, int] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """SDK base_url로 사용할 주소"""
+        if self._httpd is None:
+            raise RuntimeError("서버가 시작되지 않았습니다.")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAnthropicServer":
+        """서버 시작 (임의의 빈 포트 사용)"""
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+            self._httpd.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                name="mock-anthropic",
+                daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockAnthropicServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def client(self, max_retries: int = 2) -> Anthropic:
+        """이 서버에 연결된 동기 Anthropic 클라이언트"""
+        return Anthropic(api_key=self.api_key, base_url=self.base_url, max_retries=max_retries)
+
+    def async_client(self, max_retries: int = 2) -> AsyncAnthropic:
+        """이 서버에 연결된 비동기 Anthropic 클라이언트"""
+        return AsyncAnthropic(api_key=self.api_key, base_url=self.base_url, max_retries=max_retries)
+
+    @contextmanager
+    def environment(self) -> Iterator["MockAnthropicServer"]:
+        """
+        ANTHROPIC_BASE_URL/ANTHROPIC_API_KEY를 이 서버로 임시 설정
+        (LangChain 체인처럼 클라이언트를 직접 넘길 수 없는 경로용)
+        """
+        keys = ("ANTHROPIC_BASE_URL", "ANTHROPIC_API_KEY")
+        previous = {key: os.environ.get(key) for key in keys}
+        os.environ["ANTHROPIC_BASE_URL"] = self.base_url
+        os.environ["ANTHROPIC_API_KEY"] = self.api_key
+        try:
+            yield self
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        응답 유형별 집계
+
+        Returns:
+            Dict: {"requests", "ok", "429", "529", "malformed", "repairable", ...}
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _count(self, key: str) -> None:
+        """집계 증가 (호출자가 락을 보유한 상태)"""
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _decide(self) -> Tuple[str, float]:
+        """다음 응답 유형과 지연 시간 결정 ("ok"/"429"/"529"/"malformed"/"repairable")"""
+        with self._lock:
+            self._count("requests")
+            delay_ms = max(0.0, self.latency(self._rng))
+
+            status, remaining = self._burst
+            if remaining == 0:
+                roll = self._rng.random()
+                if roll < self.rate_limit_burst_rate:
+                    status, remaining = 429, self.burst_length
+                elif roll < self.rate_limit_burst_rate + self.overload_burst_rate:
+                    status, remaining = 529, self.burst_length
+            if remaining > 0:
+                self._burst = (status, remaining - 1)
+                self._count(str(status))
+                return str(status), delay_ms
+
+            roll = self._rng.random()
+            if roll < self.malformed_rate:
+                kind = "malformed"
+            elif roll < self.malformed_rate + self.repairable_rate:
+                kind = "repairable"
+            else:
+                kind = "ok"
+            self._count(kind)
+            return kind, delay_ms
+
+    def _handler_class(self) -> type:
+        """요청 처리기 클래스 (서버 설정을 참조)"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # 벤치마크 출력이 요청 로그로 덮이지 않도록 비활성화
+                return
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if not self.path.split("?")[0].endswith("/v1/messages"):
+                    self._send_json(404, _error_body("not_found_error", "unknown path"))
+                    return
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    self._send_json(400, _error_body("invalid_request_error", "invalid JSON body"))
+                    return
+
+                kind, delay_ms = server._decide()
+                time.sleep(delay_ms / 1000)
+
+                if kind == "429":
+                    self._send_json(429, _error_body("rate_limit_error", "mock rate limit"))
+                elif kind == "529":
+                    self._send_json(529, _error_body("overloaded_error", "mock overloaded"))
+                elif request.get("stream"):
+                    self._send_stream(_build_message(request, kind, server.echo_prompt))
+                else:
+                    self._send_json(200, _build_message(request, kind, server.echo_prompt))
+
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if status in (429, 529):
+                    self.send_header("retry-after-ms", str(server.retry_after_ms))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_stream(self, message: Dict[str, Any]) -> None:
+                data = "".join(
+                    f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                    for event in _stream_events(message)
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def _error_body(error_type: str, message: str) -> Dict[str, Any]:
+    """API 오류 응답 본문"""
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+def _build_message(request: Dict[str, Any], kind: str, echo_prompt: bool = False) -> Dict[str, Any]:
+    """요청의 첫 번째 tool 스키마에 맞는 메시지 응답 생성 (echo_prompt: 문자열 필드에 사용자 메시지)"""
+    tools = request.get("tools") or []
+    if tools:
+        tool = tools[0]
+        payload = schema_example(tool.get("input_schema", {}))
+    else:
+        tool, payload = None, {"text": "모의 응답"}
+
+    if echo_prompt:
+        prompt = _last_user_text(request)
+        payload = {key: prompt if isinstance(value, str) else value for key, value in payload.items()}
+
+    if kind == "ok" and tool is not None:
+        content: List[Dict[str, Any]] = [{
+            "type": "tool_use",
+            "id": f"toolu_{uuid.uuid4().hex[:24]}",
+            "name": tool["name"],
+            "input": payload
+        }]
+        stop_reason = "tool_use"
+    else:
+        text = json.dumps(payload, ensure_ascii=False)
+        if kind == "repairable":
+            text = f"분석 결과입니다:\n```json\n{text[:-1]},}}\n```"
+        elif kind == "malformed":
+            text = text[:max(1, len(text) // 2)]
+        content = [{"type": "text", "text": text}]
+        stop_reason = "end_turn"
+
+    input_tokens = max(1, len(json.dumps(request.get("messages", []), ensure_ascii=False)) // 4)
+    output_tokens = max(1, len(json.dumps(content, ensure_ascii=False)) // 4)
+    return {
+        "id": f"msg_mock_{uuid.uuid4().hex[:20]}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model", "mock-model"),
+        "content": content,
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens}
+    }
+
+
+def _last_user_text(request: Dict[str, Any]) -> str:
+    """요청의 마지막 사용자 메시지 텍스트 (content 블록은 텍스트만 이어 붙임)"""
+    for message in reversed(request.get("messages") or []):
+        if message.get("role") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, list):
+            return "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+        return str(content or "")
+    return ""
+
+
+def _stream_events(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """메시지를 SSE 스트리밍 이벤트 목록으로 변환 (JSON 조각은 32자 단위)"""
+    events: List[Dict[str, Any]] = [{
+        "type": "message_start",
+        "message": {**message, "content": [], "stop_reason": None,
+                    "usage": {**message["usage"], "output_tokens": 0}}
+    }]
+    for index, block in enumerate(message["content"]):
+        if block["type"] == "tool_use":
+            events.append({"type": "content_block_start", "index": index,
+                           "content_block": {**block, "input": {}}})
+            raw = json.dumps(block["input"], ensure_ascii=False)
+            delta_type, key = "input_json_delta", "partial_json"
+        else:
+            events.append({"type": "content_block_start", "index": index,
+                           "content_block": {"type": "text", "text": ""}})
+            raw = block["text"]
+            delta_type, key = "text_delta", "text"
+        for start in range(0, len(raw), 32):
+            events.append({"type": "content_block_delta", "index": index,
+                           "delta": {"type": delta_type, key: raw[start:start + 32]}})
+        events.append({"type": "content_block_stop", "index": index})
+    events.append({
+        "type": "message_delta",
+        "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+        "usage": {"output_tokens": message["usage"]["output_tokens"]}
+    })
+    events.append({"type": "message_stop"})
+    return events
@@ -0,0 +1,302 @@
+"""
+분석 단계별 소요 시간 계측 모듈
+analyze()의 단계(체크리스트, 영양성분 조회, 신뢰도 점수, 평점 분석, AI 분석, JSON 파싱)별
+소요 시간을 프로세스 내 히스토그램으로 집계하고, 단계에서 삼킨 예외 수를 유형별로 셉니다.
+
+기본적으로 꺼져 있으며(환경변수 STAGE_METRICS_ENABLED=1 또는 stage_metrics.enable()로 켬),
+꺼져 있을 때는 단계마다 속성 확인 1회만 수행합니다.
+
+집계 결과는 snapshot()(딕셔너리), dump()(JSONL 지표 파일), to_prometheus()(텍스트 노출 형식)로 조회합니다.
+단계는 중첩될 수 있습니다 (예: 영양성분 조회 시간은 체크리스트/신뢰도 점수 시간에도 포함).
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# analyze()에서 계측하는 단계
+STAGES = ("checklist", "nutrition_fetch", "trust_score", "rating_analysis", "llm", "json_parse")
+
+# 히스토그램 구간 상한 (밀리초, 마지막 구간은 +Inf)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+# 기본 지표 파일 경로 (환경변수 STAGE_METRICS_PATH로 변경 가능)
+DEFAULT_STAGE_METRICS_PATH = Path(__file__).parent.parent / "output" / "metrics" / "stage_timings.jsonl"
+
+
+class _NoopTimer:
+    """계측이 꺼져 있을 때 쓰는 빈 컨텍스트 매니저 (공유 인스턴스)"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopTimer":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+class _StageTimer:
+    """단계 1회 소요 시간 측정 (예외로 끝나도 기록)"""
+
+    __slots__ = ("_metrics", "_stage", "_start")
+
+    def __init__(self, metrics: "StageMetrics", stage: str):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self) -> "_StageTimer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self._metrics.record(self._stage, (time.perf_counter() - self._start) * 1000)
+        return False
+
+
+class StageMetrics:
+    """단계별 소요 시간 히스토그램 + 삼킨 예외 집계 클래스 (스레드 안전)"""
+
+    def __init__(self, enabled: bool = False):
+        """
+        집계 초기화
+
+        Args:
+            enabled: 계측 사용 여부 (기본값: False)
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._started_at = datetime.now()
+
+    def enable(self) -> None:
+        """계측 켜기"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """계측 끄기 (지금까지의 집계는 유지)"""
+        self.enabled = False
+
+    def time(self, stage: str):
+        """
+        단계 소요 시간을 측정하는 컨텍스트 매니저
+
+        Args:
+            stage: 단계 이름 (STAGES 중 하나 권장)
+
+        Returns:
+            컨텍스트 매니저 (계측이 꺼져 있으면 아무것도 하지 않음)
+
+        Example:
+            >>> with stage_metrics.time("checklist"):
+            ...     detected = checklist.check_ad_patterns(text)
+        """
+        if not self.enabled:
+            return _NOOP_TIMER
+        return _StageTimer(self, stage)
+
+    def record(self, stage: str, elapsed_ms: float) -> None:
+        """
+        단계 소요 시간 1건 기록
+
+        Args:
+            stage: 단계 이름
+            elapsed_ms: 소요 시간 (밀리초)
+        """
+        bucket = len(BUCKETS_MS)
+        for i, upper in enumerate(BUCKETS_MS):
+            if elapsed_ms <= upper:
+                bucket = i
+                break
+        with self._lock:
+            stats = self._get_stats(stage)
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["buckets"][bucket] += 1
+
+    def record_error(self, stage: str, error: BaseException) -> None:
+        """
+        단계에서 처리하고 넘어간(삼킨) 예외 1건 기록
+
+        Args:
+            stage: 단계 이름
+            error: 예외 객체 (유형 이름으로 집계)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            errors = self._get_stats(stage)["errors"]
+            name = type(error).__name__
+            errors[name] = errors.get(name, 0) + 1
+
+    def _get_stats(self, stage: str) -> Dict[str, Any]:
+        """단계 집계 항목 (없으면 생성, 잠금 안에서 호출)"""
+        stats = self._stats.get(stage)
+        if stats is None:
+            stats = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "buckets": [0] * (len(BUCKETS_MS) + 1),
+                "errors": {}
+            }
+            self._stats[stage] = stats
+        return stats
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        단계별 집계 결과 반환
+
+        백분위수는 히스토그램 구간 상한으로 추정합니다.
+
+        Returns:
+            Dict: {
+                stage: {
+                    "count", "total_ms", "mean_ms", "max_ms",
+                    "p50_ms", "p95_ms", "p99_ms": 추정 백분위수,
+                    "buckets": {구간 상한("+Inf" 포함): 누적 건수},
+                    "errors": {예외 유형: 건수}, "error_count": 삼킨 예외 수
+                }
+            }
+        """
+        with self._lock:
+            stats = {
+                stage: {**s, "buckets": list(s["buckets"]), "errors": dict(s["errors"])}
+                for stage, s in self._stats.items()
+            }
+
+        summary = {}
+        for stage, s in sorted(stats.items()):
+            count = s["count"]
+            cumulative = []
+            running = 0
+            for n in s["buckets"]:
+                running += n
+                cumulative.append(running)
+            summary[stage] = {
+                "count": count,
+                "total_ms": round(s["total_ms"], 3),
+                "mean_ms": round(s["total_ms"] / count, 3) if count else 0.0,
+                "max_ms": round(s["max_ms"], 3),
+                "p50_ms": _bucket_percentile(cumulative, s["max_ms"], 50),
+                "p95_ms": _bucket_percentile(cumulative, s["max_ms"], 95),
+                "p99_ms": _bucket_percentile(cumulative, s["max_ms"], 99),
+                "buckets": {
+                    _bucket_label(i): cumulative[i] for i in range(len(cumulative))
+                },
+                "errors": s["errors"],
+                "error_count": sum(s["errors"].values())
+            }
+        return summary
+
+    def to_prometheus(self, prefix: str = "review_analysis_stage") -> str:
+        """
+        Prometheus 텍스트 노출 형식으로 변환 (스크래핑 엔드포인트용)
+
+        Args:
+            prefix: 지표 이름 접두사
+
+        Returns:
+            str: {prefix}_duration_ms 히스토그램과 {prefix}_swallowed_errors_total 카운터
+        """
+        lines = [
+            f"# HELP {prefix}_duration_ms 분석 단계별 소요 시간 (밀리초)",
+            f"# TYPE {prefix}_duration_ms histogram"
+        ]
+        snapshot = self.snapshot()
+        for stage, s in snapshot.items():
+            for label, count in s["buckets"].items():
+                lines.append(f'{prefix}_duration_ms_bucket{{stage="{stage}",le="{label}"}} {count}')
+            lines.append(f'{prefix}_duration_ms_sum{{stage="{stage}"}} {s["total_ms"]}')
+            lines.append(f'{prefix}_duration_ms_count{{stage="{stage}"}} {s["count"]}')
+        lines.append(f"# HELP {prefix}_swallowed_errors_total 단계에서 처리하고 넘어간 예외 수")
+        lines.append(f"# TYPE {prefix}_swallowed_errors_total counter")
+        for stage, s in snapshot.items():
+            for error_type, count in sorted(s["errors"].items()):
+                lines.append(f'{prefix}_swallowed_errors_total{{stage="{stage}",type="{error_type}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "review_analysis_stage") -> None:
+        """
+        to_prometheus() 결과를 파일로 저장 (node_exporter textfile 수집기용, 임시 파일 → 교체)
+
+        Args:
+            path: 저장 경로 (.prom)
+            prefix: 지표 이름 접두사
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(target.name + ".tmp")
+        temp_path.write_text(self.to_prometheus(prefix), encoding="utf-8")
+        os.replace(temp_path, target)
+
+    def dump(
+        self,
+        path: Optional[str] = None,
+        run_id: Optional[str] = None,
+        reset: bool = False
+    ) -> Dict[str, Any]:
+        """
+        현재 집계를 지표 파일(JSONL)에 한 줄로 추가
+
+        Args:
+            path: 지표 파일 경로 (None이면 STAGE_METRICS_PATH 또는 기본 경로)
+            run_id: 실행 식별자 (None이면 자동 생성)
+            reset: 기록 후 집계 초기화 여부
+
+        Returns:
+            Dict: 기록한 항목 ({"run_id", "started_at", "finished_at", "stages"})
+        """
+        target = Path(path or os.getenv("STAGE_METRICS_PATH") or DEFAULT_STAGE_METRICS_PATH)
+        entry = {
+            "run_id": run_id or uuid.uuid4().hex[:12],
+            "started_at": self._started_at.isoformat(timespec="seconds"),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "stages": self.snapshot()
+        }
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        if reset:
+            self.reset()
+        return entry
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self._started_at = datetime.now()
+
+
+def _bucket_label(index: int) -> str:
+    """히스토그램 구간 상한 표시 ("+Inf" 포함)"""
+    return "+Inf" if index >= len(BUCKETS_MS) else f"{BUCKETS_MS[index]:g}"
+
+
+def _bucket_percentile(cumulative: List[int], max_ms: float, pct: float) -> float:
+    """누적 히스토그램에서 백분위수 추정 (해당 구간 상한, 최댓값을 넘지 않음)"""
+    total = cumulative[-1] if cumulative else 0
+    if total == 0:
+        return 0.0
+    rank = pct / 100 * total
+    for i, count in enumerate(cumulative):
+        if count >= rank:
+            upper = BUCKETS_MS[i] if i < len(BUCKETS_MS) else max_ms
+            return round(min(upper, max_ms), 3)
+    return round(max_ms, 3)
+
+
+# 프로세스 전역 단계 계측 (환경변수 STAGE_METRICS_ENABLED=1이면 켜진 상태로 시작)
+stage_metrics = StageMetrics(enabled=os.getenv("STAGE_METRICS_ENABLED", "").lower() in ("1", "true", "yes"))
@@ -0,0 +1,210 @@
+"""
+스키마 강제 구조화 출력 유틸리티
+Pydantic 모델 기반 tool-use 스키마 생성, 로컬 JSON 복구, 파싱 실패율 지표
+"""
+
+import json
+import re
+import threading
+from typing import Any, Dict, Optional, Type
+from pydantic import BaseModel
+
+
+class StructuredOutputError(Exception):
+    """로컬 복구와 재호출 후에도 응답을 출력 스키마로 파싱하지 못한 경우 (API 오류와 구분)"""
+
+
+def build_tool_schema(
+    model_cls: Type[BaseModel],
+    name: str,
+    description: str
+) -> Dict[str, Any]:
+    """
+    Pydantic 모델로부터 Anthropic tool 정의 생성
+
+    Args:
+        model_cls: 출력 스키마 Pydantic 모델
+        name: tool 이름
+        description: tool 설명
+
+    Returns:
+        Dict: messages API의 tools 항목
+    """
+    schema = model_cls.model_json_schema()
+    definitions = schema.pop("$defs", {})
+    return {
+        "name": name,
+        "description": description,
+        "input_schema": _inline_refs(schema, definitions)
+    }
+
+
+def _inline_refs(node: Any, definitions: Dict[str, Any]) -> Any:
+    """중첩 모델의 $ref를 실제 정의로 치환 (tool 스키마를 자기완결적으로 유지)"""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            resolved = dict(definitions.get(ref.split("/")[-1], {}))
+            resolved.update({k: v for k, v in node.items() if k != "$ref"})
+            return _inline_refs(resolved, definitions)
+        return {k: _inline_refs(v, definitions) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, definitions) for v in node]
+    return node
+
+
+def repair_json(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    LLM 텍스트 응답에서 JSON 객체를 관대하게 복구
+
+    다음 순서로 시도합니다:
+    1. 코드 펜스(```json ... ```) 제거
+    2. 앞뒤 설명 문구 제거 (첫 '{' ~ 마지막 '}')
+    3. 후행 쉼표 제거
+    4. 닫히지 않은 문자열/괄호 보정
+
+    Args:
+        text: LLM 응답 텍스트
+
+    Returns:
+        Dict: 복구된 JSON 객체 또는 None (복구 불가)
+    """
+    if not text:
+        return None
+
+    candidate = text.strip()
+
+    # 1. 코드 펜스 제거
+    fence = re.search(r"```(?:json)?\s*(.*?)(?:```|$)", candidate, re.DOTALL)
+    if fence:
+        candidate = fence.group(1).strip()
+
+    # 2. 첫 '{' 이전 문구 제거
+    start = candidate.find("{")
+    if start == -1:
+        return None
+    candidate = candidate[start:]
+
+    parsed = _loads_dict(candidate)
+    if parsed is not None:
+        return parsed
+
+    end = candidate.rfind("}")
+    if end != -1:
+        parsed = _loads_dict(_strip_trailing_commas(candidate[:end + 1]))
+        if parsed is not None:
+            return parsed
+
+    # 4. 잘린 응답 보정 (max_tokens 도달 등)
+    return _loads_dict(_strip_trailing_commas(_close_unbalanced(candidate)))
+
+
+def _loads_dict(text: str) -> Optional[Dict[str, Any]]:
+    """JSON 파싱 (dict가 아니거나 실패 시 None)"""
+    try:
+        result = json.loads(text)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """'}' 또는 ']' 직전의 후행 쉼표 제거"""
+    return re.sub(r",\s*([}\]])", r"\1", text)
+
+
+def _close_unbalanced(text: str) -> str:
+    """닫히지 않은 문자열과 괄호를 순서대로 닫기"""
+    stack = []
+    in_string = False
+    escape = False
+    for c in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+            continue
+        if c == '"':
+            in_string = True
+        elif c in "{[":
+            stack.append("}" if c == "{" else "]")
+        elif c in "}]" and stack:
+            stack.pop()
+
+    repaired = text + ('"' if in_string else "")
+    repaired = re.sub(r"[,:]\s*$", "", repaired.rstrip())
+    return repaired + "".join(reversed(stack))
+
+
+class ParseMetrics:
+    """
+    구조화 출력 파싱 결과 집계 클래스 (스레드 안전)
+
+    결과 유형:
+        - structured: tool-use 응답이 스키마 검증을 바로 통과
+        - repaired: 로컬 복구 후 통과 (재호출 없음)
+        - retried: 재호출 후 통과
+        - failed: 최종 실패
+    """
+
+    OUTCOMES = ("structured", "repaired", "retried", "failed")
+
+    def __init__(self):
+        """지표 초기화"""
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, source: str, outcome: str) -> None:
+        """
+        파싱 결과 기록
+
+        Args:
+            source: 호출 위치 (예: "logic_designer.analyzer")
+            outcome: 결과 유형 (OUTCOMES 중 하나)
+        """
+        if outcome not in self.OUTCOMES:
+            raise ValueError(f"알 수 없는 파싱 결과 유형: {outcome}")
+        with self._lock:
+            counts = self._counts.setdefault(source, {o: 0 for o in self.OUTCOMES})
+            counts[outcome] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        호출 위치별 집계 결과 반환
+
+        Returns:
+            Dict: {
+                source: {
+                    "total": 전체 호출 수,
+                    "structured"/"repaired"/"retried"/"failed": 유형별 건수,
+                    "parse_failure_rate": 1차 파싱 실패율 (복구/재호출/실패 비율),
+                    "final_failure_rate": 최종 실패율
+                }
+            }
+        """
+        with self._lock:
+            counts = {source: dict(c) for source, c in self._counts.items()}
+
+        summary = {}
+        for source, c in counts.items():
+            total = sum(c.values())
+            first_pass_failures = total - c["structured"]
+            summary[source] = {
+                "total": total,
+                **c,
+                "parse_failure_rate": round(first_pass_failures / total, 4) if total else 0.0,
+                "final_failure_rate": round(c["failed"] / total, 4) if total else 0.0
+            }
+        return summary
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._counts.clear()
+
+
+# 프로세스 전역 파싱 지표
+parse_metrics = ParseMetrics()
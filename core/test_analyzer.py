@@ -0,0 +1,90 @@
+"""
+analyzer.py 테스트 스크립트 (모의 Anthropic 서버 사용)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.analyzer import analyze_review
+from core.background_tasks import background_tasks
+from core.mock_anthropic import MockAnthropicServer, fixed_latency
+
+
+NORMAL_REVIEW = "루테인 한 달째 먹고 있는데 눈이 좀 덜 피곤해요. 캡슐도 작아서 삼키기 편해요."
+
+
+def test_case_1_deadline_pending_handle():
+    """테스트 케이스 1: 마감 시간 초과 시 analysis_pending과 핸들 반환, 결과는 핸들로 나중에 조회"""
+    print("=" * 80)
+    print("테스트 1: 마감 시간 초과")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(400)) as server, server.environment():
+        start = time.perf_counter()
+        pending = analyze_review(NORMAL_REVIEW, api_key=server.api_key, deadline_ms=50)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"소요 시간: {elapsed_ms:.0f}ms, 결과: {pending}")
+
+        assert elapsed_ms < 400
+        assert pending["analysis_pending"] is True and pending["handle"]
+        assert background_tasks.poll(pending["handle"]) is None
+
+        result = background_tasks.poll(pending["handle"], timeout=5.0)
+        print(f"나중에 조회한 결과: {result}")
+        assert result["Summary"] == "모의 응답" and "analysis_pending" not in result
+        assert server.get_stats()["requests"] == 1
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_deadline_met():
+    """테스트 케이스 2: 마감 시간 안에 끝나면 보류 표시 없이 결과 반환"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 마감 시간 내 완료")
+    print("=" * 80)
+
+    with MockAnthropicServer() as server, server.environment():
+        result = analyze_review(NORMAL_REVIEW, api_key=server.api_key, deadline_ms=5000)
+        print(f"결과: {result}")
+        assert "analysis_pending" not in result and result["Summary"] == "모의 응답"
+
+    try:
+        background_tasks.poll("unknown-handle")
+        assert False, "알 수 없는 핸들 검사 실패"
+    except KeyError:
+        pass
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 analyzer.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_deadline_pending_handle()
+        test_case_2_deadline_met()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,142 @@
+"""
+circuit_breaker.py 테스트 스크립트
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError, DeadlineExceededError
+
+
+def _fail():
+    raise ConnectionError("API 장애")
+
+
+def _wait_for_state(breaker, state, timeout=2.0):
+    """백그라운드 프로브가 상태를 바꿀 때까지 대기"""
+    end = time.monotonic() + timeout
+    while breaker.state != state and time.monotonic() < end:
+        time.sleep(0.01)
+    return breaker.state
+
+
+def test_case_1_open_and_probe_recovery():
+    """테스트 케이스 1: 연속 실패 시 열리고, 프로브 성공 시 닫힘"""
+    print("=" * 80)
+    print("테스트 1: 실패 누적 → 차단 → 프로브 복구")
+    print("=" * 80)
+
+    probe_results = [ConnectionError("아직 장애"), None]
+
+    def probe():
+        outcome = probe_results.pop(0)
+        if outcome is not None:
+            raise outcome
+
+    breaker = CircuitBreaker(name="test", failure_threshold=3, recovery_seconds=0.05, probe=probe)
+    for _ in range(3):
+        try:
+            breaker.call(_fail)
+        except ConnectionError:
+            pass
+    assert breaker.state == CircuitBreaker.OPEN
+
+    start = time.perf_counter()
+    try:
+        breaker.call(lambda: "호출되면 안 됨")
+        assert False, "열린 서킷은 호출을 차단해야 합니다"
+    except CircuitOpenError:
+        pass
+    assert (time.perf_counter() - start) < 0.05
+
+    # 첫 프로브 실패 → 대기 시간 2배 → 두 번째 프로브 성공
+    assert _wait_for_state(breaker, CircuitBreaker.CLOSED) == CircuitBreaker.CLOSED
+    assert breaker.call(lambda: "ok") == "ok"
+
+    stats = breaker.get_stats()
+    print(f"통계: {stats}")
+    assert stats["opened"] == 1
+    assert stats["rejected"] == 1
+    assert probe_results == []  # 프로브 2회 실행
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_slow_calls_and_ignored_errors():
+    """테스트 케이스 2: 지연 호출 누적 시 열림, 입력 오류는 실패로 집계하지 않음"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 지연 호출 + 무시 예외")
+    print("=" * 80)
+
+    breaker = CircuitBreaker(name="test", failure_threshold=2, slow_call_ms=1, slow_call_threshold=2)
+    for _ in range(3):
+        try:
+            breaker.call(lambda: (_ for _ in ()).throw(ValueError("짧은 리뷰")))
+        except ValueError:
+            pass
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.call(time.sleep, 0.01)
+    breaker.call(time.sleep, 0.01)
+    print(f"통계: {breaker.get_stats()}")
+    assert breaker.state == CircuitBreaker.OPEN
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_deadline_and_half_open():
+    """테스트 케이스 3: 마감 시간 초과, 프로브 없는 경우 half_open 시험 호출"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 마감 시간 + half_open")
+    print("=" * 80)
+
+    breaker = CircuitBreaker(name="test", failure_threshold=1, recovery_seconds=0.05)
+    start = time.perf_counter()
+    try:
+        breaker.call(time.sleep, 0.5, deadline_ms=30)
+        assert False, "마감 시간을 넘기면 예외가 발생해야 합니다"
+    except DeadlineExceededError:
+        pass
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"마감 시간 초과까지 {elapsed_ms:.0f}ms")
+    assert elapsed_ms < 300
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.call(lambda: "복구") == "복구"
+    assert breaker.state == CircuitBreaker.CLOSED
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 circuit_breaker.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_open_and_probe_recovery()
+        test_case_2_slow_calls_and_ignored_errors()
+        test_case_3_deadline_and_half_open()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,97 @@
+"""
+client_pool.py 테스트 스크립트
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.client_pool import (
+    close_all_clients,
+    get_anthropic_client,
+    get_pool_stats,
+    get_shared_analyzer
+)
+from core.analyzer import PharmacistAnalyzer as CoreAnalyzer
+from logic_designer.analyzer import PharmacistAnalyzer, get_pharmacist_analyzer
+
+
+def test_case_1_client_reuse_across_threads():
+    """테스트 케이스 1: 여러 스레드에서 같은 API 키로 요청해도 클라이언트 1개"""
+    print("=" * 80)
+    print("테스트 1: 스레드 간 클라이언트 공유")
+    print("=" * 80)
+
+    close_all_clients()
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(get_anthropic_client("test-key-a")))
+        for _ in range(16)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f"풀 상태: {get_pool_stats()}")
+    assert len({id(c) for c in clients}) == 1
+    assert get_anthropic_client("test-key-b") is not clients[0]
+    assert get_pool_stats()["clients"] == 2
+    close_all_clients()
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_analyzer_registry():
+    """테스트 케이스 2: (클래스, API 키, 모델)별 분석기 재사용, 클라이언트는 공유"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 분석기 레지스트리")
+    print("=" * 80)
+
+    close_all_clients()
+    sonnet = get_pharmacist_analyzer("test-key", "claude-sonnet-4-5-20250929")
+    haiku = get_pharmacist_analyzer("test-key", "claude-haiku-4-5-20251001")
+    core = get_shared_analyzer(CoreAnalyzer, "test-key")
+
+    assert get_pharmacist_analyzer("test-key", "claude-sonnet-4-5-20250929") is sonnet
+    assert sonnet is not haiku
+    assert haiku.model == "claude-haiku-4-5-20251001"
+    assert core.model == CoreAnalyzer.DEFAULT_MODEL
+    assert sonnet.client is haiku.client is core.client
+    assert PharmacistAnalyzer(api_key="test-key").client is sonnet.client
+    print(f"풀 상태: {get_pool_stats()}")
+    close_all_clients()
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 client_pool.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_client_reuse_across_threads()
+        test_case_2_analyzer_registry()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
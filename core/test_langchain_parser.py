@@ -0,0 +1,113 @@
+"""
+langchain_parser.py 테스트 스크립트 (모의 Anthropic 서버 사용)
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.langchain_parser import (
+    PARSE_METRICS_SOURCE,
+    get_validation_chain,
+    parse_review_with_langchain,
+    parse_reviews_with_langchain_batch
+)
+from core.mock_anthropic import MockAnthropicServer
+from core.structured_output import parse_metrics
+
+
+REVIEWS = [f"리뷰 {i}번: 루테인 {i + 1}개월째 먹고 있는데 눈이 덜 피곤해요." for i in range(12)]
+
+
+def test_case_1_chain_cache_reuse():
+    """테스트 케이스 1: 같은 (모델, temperature, 키)는 체인을 한 번만 생성하여 재사용"""
+    print("=" * 80)
+    print("테스트 1: 체인 캐시")
+    print("=" * 80)
+
+    with MockAnthropicServer() as server, server.environment():
+        get_validation_chain.cache_clear()
+        first = parse_review_with_langchain(REVIEWS[0], anthropic_api_key=server.api_key)
+        second = parse_review_with_langchain(REVIEWS[1], anthropic_api_key=server.api_key)
+        info = get_validation_chain.cache_info()
+        print(f"캐시: {info}")
+
+        assert first.trust_score is not None and second.trust_score is not None
+        assert info.misses == 1 and info.hits == 1
+        chain = get_validation_chain("claude-3-5-sonnet-20241022", 0, server.api_key)
+        assert get_validation_chain("claude-3-5-sonnet-20241022", 0, server.api_key) is chain
+        assert get_validation_chain("claude-3-5-sonnet-20241022", 0.5, server.api_key) is not chain
+        assert server.get_stats()["requests"] == 2
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_batch_order_with_partial_failures():
+    """테스트 케이스 2: 일부 리뷰가 API 오류여도 결과는 입력 순서, API 오류는 파싱 실패와 따로 기록"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 부분 실패 배치")
+    print("=" * 80)
+
+    server = MockAnthropicServer(
+        rate_limit_burst_rate=0.15,
+        burst_length=3,
+        repairable_rate=0.3,
+        retry_after_ms=1,
+        seed=7,
+        echo_prompt=True
+    )
+    with server, server.environment():
+        parse_metrics.reset()
+        results = parse_reviews_with_langchain_batch(REVIEWS, max_concurrency=1, anthropic_api_key=server.api_key)
+        stats = server.get_stats()
+    parse_counts = parse_metrics.snapshot()[PARSE_METRICS_SOURCE]
+    print(f"서버 응답: {stats}")
+    print(f"실패 사유: {results.errors}")
+
+    assert len(results) == len(REVIEWS)
+    for index, result in enumerate(results):
+        if result is None:
+            assert index in results.errors
+        else:
+            # 모의 서버가 요청 프롬프트를 그대로 돌려주므로 결과가 같은 위치의 리뷰에 대한 것인지 확인 가능
+            assert REVIEWS[index] in result.review_text and index not in results.errors
+
+    api_errors = [e for e in results.errors.values() if e["type"] == "api_error"]
+    assert api_errors and all("RateLimitError" in e["error"] and "429" in e["message"] for e in api_errors)
+    assert any(result is not None for result in results) and stats["repairable"] > 0
+    # API 오류는 파싱 실패로 집계하지 않고 다시 호출하지도 않음
+    assert parse_counts["failed"] == 0
+    assert parse_counts["total"] == len(REVIEWS) - len(api_errors)
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 langchain_parser.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_chain_cache_reuse()
+        test_case_2_batch_order_with_partial_failures()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,107 @@
+"""
+length_policy.py 테스트 스크립트
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.length_policy import (
+    CHARS_PER_TOKEN,
+    RULE_MAX_WINDOWS,
+    RULE_WINDOW_CHARS,
+    estimate_tokens,
+    select_excerpt,
+    split_windows
+)
+from logic_designer.checklist import AdChecklist
+from logic_designer.local_extractor import default_local_extractor
+
+
+FILLER = "오늘은 날씨가 맑았고 택배 상자는 튼튼했습니다. "
+
+
+def test_case_1_excerpt_within_budget():
+    """테스트 케이스 1: 예산 초과 시 핵심 문장 발췌 + 절단 통계"""
+    print("=" * 80)
+    print("테스트 1: 핵심 문장 발췌")
+    print("=" * 80)
+
+    short = "루테인 한 달째 먹고 있는데 눈이 덜 피곤해요."
+    excerpt, stats = select_excerpt(short)
+    assert excerpt == short and not stats["truncated"]
+
+    key_sentence = "루테인 두 달째 먹었더니 눈 피로가 줄었어요."
+    text = "처음 주문해봤어요. " + FILLER * 60 + key_sentence + " " + FILLER * 60
+    excerpt, stats = select_excerpt(text, token_budget=100, salience=default_local_extractor.salience)
+    print(f"통계: {stats}")
+
+    assert stats["truncated"]
+    assert key_sentence in excerpt
+    assert excerpt.startswith("처음 주문해봤어요.")  # 첫 문장 유지
+    assert len(excerpt) <= 100 * CHARS_PER_TOKEN
+    assert stats["excerpt_tokens"] <= 100 < stats["original_tokens"] == estimate_tokens(text)
+    assert 0 < stats["truncated_ratio"] < 1
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_rule_windows_bounded_and_aggregated():
+    """테스트 케이스 2: 규칙 검사 구간 상한 + 구간별 결과 합산"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 규칙 검사 구간")
+    print("=" * 80)
+
+    huge = FILLER * 5000
+    windows, covered = split_windows(huge)
+    assert len(windows) == RULE_MAX_WINDOWS
+    assert all(len(w) <= RULE_WINDOW_CHARS for w in windows)
+    assert covered < len(huge)
+
+    checklist = AdChecklist()
+    start = time.perf_counter()
+    checklist.check_ad_patterns(huge)
+    elapsed = time.perf_counter() - start
+    print(f"{len(huge):,}자 검사: {elapsed * 1000:.1f}ms")
+    assert elapsed < 2.0
+
+    # 개인 경험은 뒤쪽 구간에만 있어도 4번(개인 경험 부재)이 감지되지 않아야 함
+    late_experience = FILLER * 80 + "제가 직접 한 달 먹어봤어요."
+    assert len(split_windows(late_experience)[0]) > 1
+    detected = checklist.check_ad_patterns(late_experience)
+    print(f"감지 항목: {detected}")
+    assert 4 not in detected
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 length_policy.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_excerpt_within_budget()
+        test_case_2_rule_windows_bounded_and_aggregated()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
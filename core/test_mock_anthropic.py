@@ -0,0 +1,110 @@
+"""
+mock_anthropic.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from anthropic import RateLimitError
+
+from core.analyzer import AnalysisOutput, PharmacistAnalyzer
+from core.mock_anthropic import MockAnthropicServer, fixed_latency, schema_example
+from core.structured_output import repair_json
+
+
+def _create(client):
+    """분석기와 같은 tool 정의로 메시지 생성"""
+    return client.messages.create(
+        model="mock-model",
+        max_tokens=100,
+        tools=[PharmacistAnalyzer.ANALYSIS_TOOL],
+        tool_choice={"type": "tool", "name": PharmacistAnalyzer.ANALYSIS_TOOL["name"]},
+        messages=[{"role": "user", "content": "루테인 한 달째 먹고 있어요."}]
+    )
+
+
+def test_case_1_schema_valid_tool_response():
+    """테스트 케이스 1: tool 스키마를 만족하는 응답 + 토큰 사용량"""
+    print("=" * 80)
+    print("테스트 1: 스키마에 맞는 응답")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(5)) as server:
+        response = _create(server.client())
+        block = response.content[0]
+        print(f"응답: {block.input}")
+
+        assert block.type == "tool_use"
+        assert block.name == PharmacistAnalyzer.ANALYSIS_TOOL["name"]
+        AnalysisOutput.model_validate(block.input)
+        assert response.usage.input_tokens > 0
+        assert server.get_stats() == {"requests": 1, "ok": 1}
+
+    # 범위 제약이 있는 숫자는 범위 안의 값
+    assert 0 <= schema_example(AnalysisOutput.model_json_schema())["Trust_score"] <= 100
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_error_bursts_and_malformed_json():
+    """테스트 케이스 2: 429 연속 오류는 SDK가 재시도, 잘못된 JSON 응답 유형"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 오류 주입")
+    print("=" * 80)
+
+    with MockAnthropicServer(rate_limit_burst_rate=1.0, burst_length=3, retry_after_ms=1) as server:
+        try:
+            _create(server.client(max_retries=0))
+            assert False, "429 오류가 발생해야 합니다"
+        except RateLimitError:
+            pass
+
+        # 새 연속 오류는 시작되지 않고, 남은 2건의 429는 SDK가 재시도
+        server.rate_limit_burst_rate = 0.0
+        response = _create(server.client(max_retries=2))
+        stats = server.get_stats()
+        print(f"서버 집계: {stats}")
+        assert response.content[0].type == "tool_use"
+        assert stats["429"] == 3 and stats["ok"] == 1
+
+    with MockAnthropicServer(repairable_rate=1.0) as server:
+        text = _create(server.client()).content[0].text
+        AnalysisOutput.model_validate(repair_json(text))
+
+    with MockAnthropicServer(malformed_rate=1.0) as server:
+        text = _create(server.client()).content[0].text
+        assert repair_json(text) is None
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 mock_anthropic.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_schema_valid_tool_response()
+        test_case_2_error_bursts_and_malformed_json()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,144 @@
+"""
+stage_metrics.py 테스트 스크립트
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.stage_metrics import StageMetrics, stage_metrics
+
+
+REVIEW = "3개월째 먹고 있는데 아침에 일어나기가 한결 수월해졌어요. 재구매 의사 있습니다."
+
+
+def test_case_1_histogram_and_errors():
+    """테스트 케이스 1: 단계별 히스토그램/백분위수/삼킨 예외 집계"""
+    print("=" * 80)
+    print("테스트 1: 히스토그램 집계")
+    print("=" * 80)
+
+    metrics = StageMetrics(enabled=True)
+    for elapsed in (0.05, 0.3, 0.3, 4.0, 120.0):
+        metrics.record("checklist", elapsed)
+    with metrics.time("llm"):
+        pass
+    metrics.record_error("llm", TimeoutError("timeout"))
+    metrics.record_error("llm", TimeoutError("timeout"))
+    metrics.record_error("llm", ValueError("bad"))
+
+    snapshot = metrics.snapshot()
+    print(f"checklist: {snapshot['checklist']}")
+    checklist = snapshot["checklist"]
+    assert checklist["count"] == 5
+    assert checklist["buckets"]["0.1"] == 1
+    assert checklist["buckets"]["0.5"] == 3
+    assert checklist["buckets"]["+Inf"] == 5
+    assert checklist["p50_ms"] == 0.5
+    assert checklist["p99_ms"] == 120.0
+    assert snapshot["llm"]["count"] == 1
+    assert snapshot["llm"]["errors"] == {"TimeoutError": 2, "ValueError": 1}
+    assert snapshot["llm"]["error_count"] == 3
+
+    text = metrics.to_prometheus()
+    assert 'review_analysis_stage_duration_ms_bucket{stage="checklist",le="+Inf"} 5' in text
+    assert 'review_analysis_stage_swallowed_errors_total{stage="llm",type="TimeoutError"} 2' in text
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "metrics" / "stage_timings.jsonl"
+        metrics.dump(str(path), run_id="run-1", reset=True)
+        metrics.dump(str(path), run_id="run-2")
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        prom_path = Path(tmp) / "stage_timings.prom"
+        metrics.write_prometheus(str(prom_path))
+        assert prom_path.read_text(encoding="utf-8") == metrics.to_prometheus()
+    assert lines[0]["stages"]["checklist"]["count"] == 5
+    assert lines[1]["stages"] == {}
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_analyze_stages():
+    """테스트 케이스 2: analyze() 단계 계측과 체크리스트 예외 집계"""
+    print("\n" + "=" * 80)
+    print("테스트 2: analyze() 단계 계측")
+    print("=" * 80)
+
+    from logic_designer import analyze
+
+    stage_metrics.reset()
+    stage_metrics.enable()
+    try:
+        analyze(REVIEW, local_only=True, use_nutrition_validation=False)
+        with mock.patch("logic_designer.pipeline.AdChecklist.check_ad_patterns", side_effect=RuntimeError("boom")):
+            result = analyze(REVIEW, local_only=True, use_nutrition_validation=False)
+        snapshot = stage_metrics.snapshot()
+    finally:
+        stage_metrics.disable()
+        stage_metrics.reset()
+
+    print(f"단계: { {stage: s['count'] for stage, s in snapshot.items()} }")
+    assert result["validation"]["trust_score"] is not None
+    assert snapshot["checklist"]["count"] == 2
+    assert snapshot["checklist"]["errors"] == {"RuntimeError": 1}
+    assert snapshot["trust_score"]["count"] == 2
+    assert snapshot["trust_score"]["error_count"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_disabled_overhead():
+    """테스트 케이스 3: 꺼져 있을 때는 집계하지 않고 비용이 무시할 수준"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 비활성 오버헤드")
+    print("=" * 80)
+
+    metrics = StageMetrics(enabled=False)
+    iterations = 100_000
+    started = time.perf_counter()
+    for _ in range(iterations):
+        with metrics.time("checklist"):
+            pass
+    per_call_us = (time.perf_counter() - started) / iterations * 1e6
+    metrics.record_error("checklist", RuntimeError("ignored"))
+
+    print(f"호출당 {per_call_us:.3f}µs")
+    assert metrics.snapshot() == {}
+    assert per_call_us < 5.0
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 stage_metrics.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_histogram_and_errors()
+        test_case_2_analyze_stages()
+        test_case_3_disabled_overhead()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,92 @@
+"""
+structured_output.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.structured_output import ParseMetrics, repair_json
+
+
+def test_case_1_code_fence_and_prose():
+    """테스트 케이스 1: 코드 펜스와 앞뒤 설명 문구 제거"""
+    print("=" * 80)
+    print("테스트 1: 코드 펜스 + 설명 문구")
+    print("=" * 80)
+
+    text = '분석 결과입니다.\n```json\n{"Summary": "눈 피로 감소", "Tip": "식후 복용"}\n```\n참고하세요.'
+    result = repair_json(text)
+
+    print(f"복구 결과: {result}")
+    assert result == {"Summary": "눈 피로 감소", "Tip": "식후 복용"}
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_trailing_comma_and_truncation():
+    """테스트 케이스 2: 후행 쉼표, 잘린 응답 보정"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 후행 쉼표 + 잘린 응답")
+    print("=" * 80)
+
+    trailing = repair_json('{"Efficacy": ["눈 피로 감소",], "Tip": "꾸준히",}')
+    truncated = repair_json('{"Summary": "요약", "Efficacy": ["눈 피로')
+
+    print(f"후행 쉼표: {trailing}")
+    print(f"잘린 응답: {truncated}")
+    assert trailing == {"Efficacy": ["눈 피로 감소"], "Tip": "꾸준히"}
+    assert truncated == {"Summary": "요약", "Efficacy": ["눈 피로"]}
+    assert repair_json("JSON이 없는 응답") is None
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_parse_metrics():
+    """테스트 케이스 3: 파싱 실패율 집계"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 파싱 실패율 지표")
+    print("=" * 80)
+
+    metrics = ParseMetrics()
+    for outcome in ["structured", "structured", "repaired", "failed"]:
+        metrics.record("test", outcome)
+    summary = metrics.snapshot()["test"]
+
+    print(f"집계: {summary}")
+    assert summary["total"] == 4
+    assert summary["parse_failure_rate"] == 0.5
+    assert summary["final_failure_rate"] == 0.25
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 structured_output.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_code_fence_and_prose()
+        test_case_2_trailing_comma_and_truncation()
+        test_case_3_parse_metrics()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,157 @@
+"""
+usage_metrics.py 테스트 스크립트
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.langchain_parser import PARSE_METRICS_SOURCE, parse_reviews_with_langchain_batch
+from core.mock_anthropic import MockAnthropicServer
+from core.usage_metrics import UsageTracker, estimate_cost, extract_usage, usage_tracker
+
+
+def _sdk_response(input_tokens, output_tokens, cache_read=0):
+    """Anthropic Message 형태의 응답 생성"""
+    return SimpleNamespace(usage=SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_read_input_tokens=cache_read,
+        cache_creation_input_tokens=None
+    ))
+
+
+def test_case_1_extract_usage():
+    """테스트 케이스 1: SDK/LangChain 응답의 토큰 사용량 추출"""
+    print("=" * 80)
+    print("테스트 1: 토큰 사용량 추출")
+    print("=" * 80)
+
+    sdk = extract_usage(_sdk_response(1200, 300, cache_read=800))
+    langchain = extract_usage({"raw": SimpleNamespace(usage_metadata={
+        "input_tokens": 2000,
+        "output_tokens": 150,
+        "input_token_details": {"cache_read": 1500}
+    })})
+
+    print(f"SDK: {sdk}")
+    print(f"LangChain: {langchain}")
+    assert sdk == {"input_tokens": 1200, "output_tokens": 300, "cache_read_tokens": 800, "cache_creation_tokens": 0}
+    assert langchain["input_tokens"] == 500
+    assert langchain["cache_read_tokens"] == 1500
+    assert extract_usage(None)["input_tokens"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_track_and_summary():
+    """테스트 케이스 2: 호출 추적, 재시도/결과 집계, 비용 추정"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 호출 추적 및 요약")
+    print("=" * 80)
+
+    tracker = UsageTracker()
+    with tracker.track("test", "claude-haiku-4-5-20251001") as call:
+        call.add_response(_sdk_response(1000, 200))
+        call.add_response(_sdk_response(1000, 200))
+        call.outcome = "retried"
+    try:
+        with tracker.track("test", "claude-haiku-4-5-20251001") as call:
+            call.add_failed_attempt()
+            raise RuntimeError("API 오류")
+    except RuntimeError:
+        pass
+
+    entry = tracker.summary()["by_source"][0]
+    print(f"요약: {entry}")
+    assert entry["calls"] == 2
+    assert entry["retries"] == 1
+    assert entry["outcomes"] == {"retried": 1, "error": 1}
+    assert entry["tokens"]["output_tokens"] == 400
+    assert entry["estimated_cost_usd"] == round(estimate_cost("claude-haiku-4-5-20251001", entry["tokens"]), 6)
+    assert entry["latency_ms"]["p99"] >= entry["latency_ms"]["p50"]
+    assert estimate_cost("unknown-model", entry["tokens"]) is None
+    # 가장 긴 접두사 우선: opus-4-5는 opus-4 가격이 아닌 자체 가격
+    million = {"input_tokens": 1_000_000, "output_tokens": 1_000_000}
+    assert estimate_cost("claude-opus-4-5-20251101", million) == 30.0
+    assert estimate_cost("claude-opus-4-1-20250805", million) == 90.0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_write_summary():
+    """테스트 케이스 3: 실행 요약을 JSONL 파일에 추가하고 집계 초기화"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 지표 파일 기록")
+    print("=" * 80)
+
+    tracker = UsageTracker()
+    tracker.record("test", "claude-sonnet-4-5-20250929", 120.0, {"input_tokens": 10}, 0, "structured")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "metrics" / "llm_usage.jsonl"
+        tracker.write_summary(str(path), run_id="run-1")
+        tracker.write_summary(str(path), run_id="run-2")
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    print(f"기록된 실행: {[line['run_id'] for line in lines]}")
+    assert [line["run_id"] for line in lines] == ["run-1", "run-2"]
+    assert lines[0]["total"]["calls"] == 1
+    assert lines[1]["total"]["calls"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_4_langchain_batch_usage():
+    """테스트 케이스 4: LangChain 배치 분석도 리뷰별 호출로 사용량 기록 (모의 서버)"""
+    print("\n" + "=" * 80)
+    print("테스트 4: 배치 분석 사용량")
+    print("=" * 80)
+
+    reviews = [f"루테인 {i}개월째 먹고 있는데 눈이 덜 피곤해요." for i in range(1, 4)]
+    with MockAnthropicServer() as server, server.environment():
+        usage_tracker.reset()
+        results = parse_reviews_with_langchain_batch(reviews, anthropic_api_key=server.api_key)
+        entry = next(e for e in usage_tracker.summary()["by_source"] if e["source"] == PARSE_METRICS_SOURCE)
+        usage_tracker.reset()
+
+    print(f"요약: {entry}")
+    assert all(result is not None for result in results)
+    assert entry["calls"] == 3 and entry["outcomes"] == {"structured": 3}
+    assert entry["tokens"]["input_tokens"] > 0 and entry["tokens"]["output_tokens"] > 0
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 usage_metrics.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_extract_usage()
+        test_case_2_track_and_summary()
+        test_case_3_write_summary()
+        test_case_4_langchain_batch_usage()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,326 @@
+"""
+LLM 사용량/지연 시간 집계 모듈
+분석기 호출별 토큰, 소요 시간, 재시도 횟수, 결과를 기록하고
+실행(run) 단위 요약(백분위수, 비용 추정)을 로컬 지표 파일에 저장합니다.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# 모델별 100만 토큰당 가격 (USD, 추정치): (입력, 출력, 캐시 읽기, 캐시 쓰기)
+# 모델명 접두사로 매칭하며, 가장 긴 접두사를 우선합니다.
+MODEL_PRICING_PER_MTOK: Dict[str, Tuple[float, float, float, float]] = {
+    "claude-sonnet-4": (3.0, 15.0, 0.30, 3.75),
+    "claude-3-7-sonnet": (3.0, 15.0, 0.30, 3.75),
+    "claude-3-5-sonnet": (3.0, 15.0, 0.30, 3.75),
+    "claude-haiku-4-5": (1.0, 5.0, 0.10, 1.25),
+    "claude-3-5-haiku": (0.80, 4.0, 0.08, 1.0),
+    "claude-opus-4-5": (5.0, 25.0, 0.50, 6.25),
+    "claude-opus-4": (15.0, 75.0, 1.50, 18.75),
+}
+
+# 기본 지표 파일 경로 (환경변수 LLM_USAGE_METRICS_PATH로 변경 가능)
+DEFAULT_METRICS_PATH = Path(__file__).parent.parent / "output" / "metrics" / "llm_usage.jsonl"
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens")
+
+
+def extract_usage(response: Any) -> Dict[str, int]:
+    """
+    LLM 응답에서 토큰 사용량 추출
+
+    Anthropic Message(response.usage)와 LangChain AIMessage(usage_metadata),
+    with_structured_output(include_raw=True) 결과({"raw": AIMessage})를 지원합니다.
+    input_tokens는 캐시 읽기/쓰기를 제외한 일반 입력 토큰입니다.
+
+    Args:
+        response: LLM 응답 객체
+
+    Returns:
+        Dict: {"input_tokens", "output_tokens", "cache_read_tokens", "cache_creation_tokens"}
+    """
+    usage = {field: 0 for field in TOKEN_FIELDS}
+    if isinstance(response, dict) and "raw" in response:
+        response = response["raw"]
+
+    # Anthropic SDK 응답
+    sdk_usage = getattr(response, "usage", None)
+    if sdk_usage is not None and not isinstance(sdk_usage, dict):
+        usage["input_tokens"] = getattr(sdk_usage, "input_tokens", 0) or 0
+        usage["output_tokens"] = getattr(sdk_usage, "output_tokens", 0) or 0
+        usage["cache_read_tokens"] = getattr(sdk_usage, "cache_read_input_tokens", 0) or 0
+        usage["cache_creation_tokens"] = getattr(sdk_usage, "cache_creation_input_tokens", 0) or 0
+        return usage
+
+    # LangChain 응답 (input_tokens에 캐시 토큰이 포함되어 있으므로 분리)
+    metadata = getattr(response, "usage_metadata", None)
+    if isinstance(metadata, dict):
+        details = metadata.get("input_token_details") or {}
+        cache_read = details.get("cache_read", 0) or 0
+        cache_creation = details.get("cache_creation", 0) or 0
+        usage["input_tokens"] = max(0, (metadata.get("input_tokens", 0) or 0) - cache_read - cache_creation)
+        usage["output_tokens"] = metadata.get("output_tokens", 0) or 0
+        usage["cache_read_tokens"] = cache_read
+        usage["cache_creation_tokens"] = cache_creation
+    return usage
+
+
+def estimate_cost(model: str, usage: Dict[str, int]) -> Optional[float]:
+    """
+    토큰 사용량 기반 비용 추정 (USD)
+
+    Args:
+        model: 모델명
+        usage: extract_usage() 형식의 토큰 사용량
+
+    Returns:
+        float: 추정 비용 또는 None (가격 정보가 없는 모델)
+    """
+    prefixes = [p for p in MODEL_PRICING_PER_MTOK if model and model.startswith(p)]
+    if not prefixes:
+        return None
+    input_price, output_price, cache_read_price, cache_write_price = MODEL_PRICING_PER_MTOK[max(prefixes, key=len)]
+    cost = (
+        usage.get("input_tokens", 0) * input_price
+        + usage.get("output_tokens", 0) * output_price
+        + usage.get("cache_read_tokens", 0) * cache_read_price
+        + usage.get("cache_creation_tokens", 0) * cache_write_price
+    ) / 1_000_000
+    return cost
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class CallUsage:
+    """단일 분석 호출의 사용량 기록 (UsageTracker.track()에서 생성)"""
+
+    def __init__(self, source: str, model: str):
+        self.source = source
+        self.model = model
+        self.usage = {field: 0 for field in TOKEN_FIELDS}
+        self.attempts = 0
+        self.outcome: Optional[str] = None
+
+    def add_response(self, response: Any) -> None:
+        """API 응답 1건의 토큰 사용량 누적 (재호출 시 합산)"""
+        self.attempts += 1
+        for field, value in extract_usage(response).items():
+            self.usage[field] += value
+
+    def add_failed_attempt(self) -> None:
+        """응답 없이 실패한 API 호출 1건 기록"""
+        self.attempts += 1
+
+    @property
+    def retries(self) -> int:
+        """재호출 횟수"""
+        return max(0, self.attempts - 1)
+
+
+class UsageTracker:
+    """
+    LLM 호출 사용량/지연 시간 집계 클래스 (스레드 안전)
+
+    (호출 위치, 모델)별로 호출 수, 결과 유형, 토큰 합계, 재시도 횟수,
+    최근 지연 시간 샘플을 보관합니다.
+    """
+
+    # (호출 위치, 모델)별 지연 시간 샘플 보관 개수
+    LATENCY_WINDOW = 10000
+
+    def __init__(self):
+        """집계 초기화"""
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._started_at = datetime.now()
+
+    @contextmanager
+    def track(self, source: str, model: str) -> Iterator[CallUsage]:
+        """
+        분석 호출 1건을 측정하는 컨텍스트 매니저
+
+        블록 안에서 call.add_response(response)로 응답을 누적하고
+        call.outcome에 결과 유형을 지정합니다. 예외로 종료되면서
+        결과 유형이 지정되지 않은 경우 "error"로 기록합니다.
+
+        Args:
+            source: 호출 위치 (예: "logic_designer.analyzer")
+            model: 모델명
+
+        Yields:
+            CallUsage: 호출 사용량 기록 객체
+        """
+        call = CallUsage(source, model)
+        start = time.perf_counter()
+        try:
+            yield call
+        except BaseException:
+            if call.outcome is None:
+                call.outcome = "error"
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.record(
+                call.source,
+                call.model,
+                elapsed_ms,
+                call.usage,
+                call.retries,
+                call.outcome or "unknown"
+            )
+
+    def record(
+        self,
+        source: str,
+        model: str,
+        wall_ms: float,
+        usage: Dict[str, int],
+        retries: int,
+        outcome: str
+    ) -> None:
+        """
+        호출 1건 기록
+
+        Args:
+            source: 호출 위치
+            model: 모델명
+            wall_ms: 소요 시간 (밀리초)
+            usage: 토큰 사용량
+            retries: 재호출 횟수
+            outcome: 결과 유형 (structured/repaired/retried/failed/api_error 등)
+        """
+        with self._lock:
+            stats = self._stats.get((source, model))
+            if stats is None:
+                stats = {
+                    "calls": 0,
+                    "retries": 0,
+                    "outcomes": {},
+                    "tokens": {field: 0 for field in TOKEN_FIELDS},
+                    "latencies": deque(maxlen=self.LATENCY_WINDOW)
+                }
+                self._stats[(source, model)] = stats
+            stats["calls"] += 1
+            stats["retries"] += retries
+            stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+            for field in TOKEN_FIELDS:
+                stats["tokens"][field] += usage.get(field, 0)
+            stats["latencies"].append(wall_ms)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        현재 실행의 요약 반환
+
+        Returns:
+            Dict: {
+                "started_at": 집계 시작 시각,
+                "by_source": [
+                    {"source", "model", "calls", "retries", "outcomes", "tokens",
+                     "latency_ms": {"mean", "p50", "p95", "p99", "max"}, "estimated_cost_usd"}
+                ],
+                "total": {"calls", "tokens", "estimated_cost_usd"}
+            }
+        """
+        with self._lock:
+            snapshot = {
+                key: {
+                    "calls": s["calls"],
+                    "retries": s["retries"],
+                    "outcomes": dict(s["outcomes"]),
+                    "tokens": dict(s["tokens"]),
+                    "latencies": sorted(s["latencies"])
+                }
+                for key, s in self._stats.items()
+            }
+            started_at = self._started_at
+
+        by_source = []
+        total_tokens = {field: 0 for field in TOKEN_FIELDS}
+        total_calls = 0
+        total_cost = 0.0
+        for (source, model), s in sorted(snapshot.items()):
+            latencies = s.pop("latencies")
+            cost = estimate_cost(model, s["tokens"])
+            by_source.append({
+                "source": source,
+                "model": model,
+                **s,
+                "latency_ms": {
+                    "mean": round(sum(latencies) / len(latencies), 1),
+                    "p50": round(percentile(latencies, 50), 1),
+                    "p95": round(percentile(latencies, 95), 1),
+                    "p99": round(percentile(latencies, 99), 1),
+                    "max": round(latencies[-1], 1)
+                } if latencies else None,
+                "estimated_cost_usd": round(cost, 6) if cost is not None else None
+            })
+            total_calls += s["calls"]
+            for field in TOKEN_FIELDS:
+                total_tokens[field] += s["tokens"][field]
+            total_cost += cost or 0.0
+
+        return {
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "by_source": by_source,
+            "total": {
+                "calls": total_calls,
+                "tokens": total_tokens,
+                "estimated_cost_usd": round(total_cost, 6)
+            }
+        }
+
+    def write_summary(
+        self,
+        path: Optional[str] = None,
+        run_id: Optional[str] = None,
+        reset: bool = True
+    ) -> Dict[str, Any]:
+        """
+        현재 실행의 요약을 지표 파일(JSONL)에 한 줄로 추가
+
+        Args:
+            path: 지표 파일 경로 (None이면 LLM_USAGE_METRICS_PATH 또는 기본 경로)
+            run_id: 실행 식별자 (None이면 자동 생성)
+            reset: 기록 후 집계 초기화 여부 (다음 실행과 분리)
+
+        Returns:
+            Dict: 기록한 요약 ({"run_id", "finished_at", ...summary()})
+        """
+        target = Path(path or os.getenv("LLM_USAGE_METRICS_PATH") or DEFAULT_METRICS_PATH)
+        entry = {
+            "run_id": run_id or uuid.uuid4().hex[:12],
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            **self.summary()
+        }
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        if reset:
+            self.reset()
+        return entry
+
+    def reset(self) -> None:
+        """집계 초기화 (새 실행 시작)"""
+        with self._lock:
+            self._stats.clear()
+            self._started_at = datetime.now()
+
+
+# 프로세스 전역 사용량 집계
+usage_tracker = UsageTracker()
@@ -9,12 +9,25 @@ from .supabase_client import (
     get_supabase_service_client,
     test_connection
 )
+from .analysis_store import ReviewAnalysisStore, build_row, text_hash
+from .rating_aggregates import ProductRatingAggregates, RatingAggregate, aggregate_ratings
+from .reviewer_index import HyperLogLog, ReviewerIndex, estimate_overlap, normalize_author
 
 __all__ = [
     "SupabaseClient",
     "get_supabase_client",
     "get_supabase_service_client",
-    "test_connection"
+    "test_connection",
+    "ReviewAnalysisStore",
+    "build_row",
+    "text_hash",
+    "ProductRatingAggregates",
+    "RatingAggregate",
+    "aggregate_ratings",
+    "HyperLogLog",
+    "ReviewerIndex",
+    "estimate_overlap",
+    "normalize_author"
 ]
 
 
@@ -0,0 +1,344 @@
+"""
+리뷰 분석 결과 저장소 모듈
+review_analysis 테이블(Supabase)과 로컬 SQLite 미러에 리뷰별 분석 결과와
+입력/버전 지문(text_hash, rule_version, model_version)을 저장합니다.
+
+변경 감지는 로컬 SQLite 미러만 조회하므로 전체 코퍼스를 비교해도 네트워크 왕복이 없고,
+Supabase에는 새로 분석한 행만 upsert합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Supabase 테이블 이름
+REVIEW_ANALYSIS_TABLE = "review_analysis"
+
+# 로컬 SQLite 미러 기본 경로 (프로젝트 루트/data/)
+DEFAULT_SQLITE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "review_analysis.sqlite3"
+)
+
+# SQLite IN 절/Supabase upsert 한 번에 보내는 행 수
+CHUNK_SIZE = 500
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_analysis (
+  review_id INTEGER PRIMARY KEY,
+  product_id INTEGER,
+  text_hash TEXT NOT NULL,
+  rule_version TEXT NOT NULL,
+  model_version TEXT NOT NULL,
+  trust_score REAL,
+  is_ad INTEGER,
+  validation TEXT,
+  analysis TEXT,
+  analyzed_at TEXT,
+  detected_items TEXT,
+  rule_fingerprints TEXT
+)
+"""
+
+_COLUMNS = (
+    "review_id", "product_id", "text_hash", "rule_version", "model_version",
+    "trust_score", "is_ad", "validation", "analysis", "analyzed_at",
+    "detected_items", "rule_fingerprints"
+)
+
+# JSON 문자열로 저장하는 컬럼
+_JSON_COLUMNS = ("validation", "analysis", "detected_items", "rule_fingerprints")
+
+
+def text_hash(text: str) -> str:
+    """
+    리뷰 텍스트 지문 (SHA-256)
+
+    Args:
+        text: 리뷰 텍스트
+
+    Returns:
+        str: 16진수 해시
+    """
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+class ReviewAnalysisStore:
+    """review_analysis 저장소 (로컬 SQLite 미러 + 선택적 Supabase 동기화)"""
+
+    def __init__(self, sqlite_path: str = DEFAULT_SQLITE_PATH, supabase: Optional[Any] = None):
+        """
+        저장소 초기화
+
+        Args:
+            sqlite_path: 로컬 SQLite 미러 경로 (":memory:" 가능)
+            supabase: Supabase 클라이언트 (None이면 로컬 미러에만 저장)
+        """
+        if sqlite_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(sqlite_path)), exist_ok=True)
+        self.sqlite_path = sqlite_path
+        self.supabase = supabase
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(sqlite_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if sqlite_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SQLITE_SCHEMA)
+        # 이전 스키마로 만든 미러에 빠진 컬럼 추가
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(review_analysis)")}
+        for column in _COLUMNS:
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE review_analysis ADD COLUMN {column} TEXT")
+        self._conn.commit()
+
+    def get_fingerprints(self, review_ids: Iterable[int]) -> Dict[int, Tuple[str, str, str]]:
+        """
+        저장된 지문 조회
+
+        Args:
+            review_ids: 리뷰 ID 목록
+
+        Returns:
+            Dict[int, Tuple[str, str, str]]: 리뷰 ID → (text_hash, rule_version, model_version)
+        """
+        ids = list(review_ids)
+        fingerprints = {}
+        with self._lock:
+            for start in range(0, len(ids), CHUNK_SIZE):
+                chunk = ids[start:start + CHUNK_SIZE]
+                rows = self._conn.execute(
+                    "SELECT review_id, text_hash, rule_version, model_version FROM review_analysis "
+                    f"WHERE review_id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for row in rows:
+                    fingerprints[row["review_id"]] = (row["text_hash"], row["rule_version"], row["model_version"])
+        return fingerprints
+
+    def find_stale(
+        self,
+        reviews: Iterable[Dict[str, Any]],
+        rule_version: str,
+        model_version: str,
+        chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        다시 분석해야 하는 리뷰만 골라내는 제너레이터 (입력은 chunk_size개씩 읽음)
+
+        Args:
+            reviews: {"id", "text", ...} 딕셔너리 iterable
+            rule_version: 현재 규칙 버전
+            model_version: 현재 모델 버전
+            chunk_size: 한 번에 조회하는 리뷰 수
+
+        Yields:
+            Tuple[Dict, str]: (리뷰, 사유) - 사유는 "new", "text", "rules", "model" 중 하나
+        """
+        chunk: List[Dict[str, Any]] = []
+        for review in reviews:
+            chunk.append(review)
+            if len(chunk) >= chunk_size:
+                yield from self._stale_in_chunk(chunk, rule_version, model_version)
+                chunk = []
+        if chunk:
+            yield from self._stale_in_chunk(chunk, rule_version, model_version)
+
+    def _stale_in_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        rule_version: str,
+        model_version: str
+    ) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """chunk 안에서 지문이 다른 리뷰 반환"""
+        stored = self.get_fingerprints(review["id"] for review in chunk)
+        for review in chunk:
+            fingerprint = stored.get(review["id"])
+            if fingerprint is None:
+                yield review, "new"
+            elif fingerprint[0] != text_hash(review["text"]):
+                yield review, "text"
+            elif fingerprint[1] != rule_version:
+                yield review, "rules"
+            elif fingerprint[2] != model_version:
+                yield review, "model"
+
+    def upsert(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        분석 결과 저장 (로컬 미러 + Supabase)
+
+        Args:
+            rows: build_row()로 만든 행 목록
+
+        Returns:
+            int: 저장한 행 수
+
+        Raises:
+            Exception: Supabase 저장 실패 (로컬 미러에는 이미 저장됨)
+        """
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO review_analysis ({','.join(_COLUMNS)}) "
+                f"VALUES ({','.join('?' * len(_COLUMNS))})",
+                [self._to_sqlite(row) for row in rows]
+            )
+            self._conn.commit()
+        if self.supabase is not None:
+            for start in range(0, len(rows), CHUNK_SIZE):
+                self.supabase.table(REVIEW_ANALYSIS_TABLE)\
+                    .upsert(rows[start:start + CHUNK_SIZE], on_conflict="review_id")\
+                    .execute()
+        return len(rows)
+
+    def get(self, review_id: int) -> Optional[Dict[str, Any]]:
+        """
+        저장된 분석 결과 조회 (로컬 미러)
+
+        Args:
+            review_id: 리뷰 ID
+
+        Returns:
+            Dict: 저장된 행 또는 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM review_analysis WHERE review_id = ?", (review_id,)
+            ).fetchone()
+        return self._from_sqlite(row) if row is not None else None
+
+    def get_many(self, review_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        저장된 분석 결과 여러 건 조회 (로컬 미러)
+
+        Args:
+            review_ids: 리뷰 ID 목록
+
+        Returns:
+            Dict[int, Dict]: 리뷰 ID → 저장된 행 (없는 ID는 제외)
+        """
+        ids = list(review_ids)
+        rows = {}
+        with self._lock:
+            for start in range(0, len(ids), CHUNK_SIZE):
+                chunk = ids[start:start + CHUNK_SIZE]
+                for row in self._conn.execute(
+                    f"SELECT * FROM review_analysis WHERE review_id IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ):
+                    rows[row["review_id"]] = self._from_sqlite(row)
+        return rows
+
+    def count(self) -> int:
+        """로컬 미러에 저장된 행 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM review_analysis").fetchone()[0]
+
+    def pull_from_supabase(self, page_size: int = 1000) -> int:
+        """
+        Supabase review_analysis 테이블을 로컬 미러로 가져오기 (새 환경에서 최초 1회)
+
+        Args:
+            page_size: 페이지 크기
+
+        Returns:
+            int: 가져온 행 수
+        """
+        if self.supabase is None:
+            raise ValueError("Supabase 클라이언트가 없습니다.")
+        pulled = 0
+        offset = 0
+        while True:
+            response = self.supabase.table(REVIEW_ANALYSIS_TABLE)\
+                .select("*")\
+                .order("review_id")\
+                .range(offset, offset + page_size - 1)\
+                .execute()
+            rows = response.data or []
+            if not rows:
+                break
+            with self._lock:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO review_analysis ({','.join(_COLUMNS)}) "
+                    f"VALUES ({','.join('?' * len(_COLUMNS))})",
+                    [self._to_sqlite(row) for row in rows]
+                )
+                self._conn.commit()
+            pulled += len(rows)
+            offset += page_size
+            if len(rows) < page_size:
+                break
+        return pulled
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_sqlite(row: Dict[str, Any]) -> Tuple:
+        """행 딕셔너리 → SQLite 파라미터"""
+        values = []
+        for column in _COLUMNS:
+            value = row.get(column)
+            if column in _JSON_COLUMNS and value is not None and not isinstance(value, str):
+                value = json.dumps(value, ensure_ascii=False)
+            elif column == "is_ad" and value is not None:
+                value = int(bool(value))
+            values.append(value)
+        return tuple(values)
+
+    @staticmethod
+    def _from_sqlite(row: sqlite3.Row) -> Dict[str, Any]:
+        """SQLite 행 → 행 딕셔너리"""
+        result = dict(row)
+        for column in _JSON_COLUMNS:
+            if result[column] is not None:
+                result[column] = json.loads(result[column])
+        if result["is_ad"] is not None:
+            result["is_ad"] = bool(result["is_ad"])
+        return result
+
+
+def build_row(
+    review: Dict[str, Any],
+    result: Dict[str, Any],
+    rule_version: str,
+    model_version: str,
+    detected_items: Optional[Dict[int, str]] = None,
+    rule_fingerprints: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    analyze() 결과를 review_analysis 행으로 변환
+
+    Args:
+        review: {"id", "text", "product_id"(선택)} 딕셔너리
+        result: analyze()/analyze_batch() 결과
+        rule_version: 규칙 버전
+        model_version: 모델 버전
+        detected_items: 체크리스트 항목 벡터 {항목번호: 항목명} (항목 단위 재검사용, 선택)
+        rule_fingerprints: 분석 당시 규칙 지문 {"framework", "items"} (항목 단위 재검사용, 선택)
+
+    Returns:
+        Dict: review_analysis 행
+    """
+    validation = result.get("validation") or {}
+    return {
+        "review_id": review["id"],
+        "product_id": review.get("product_id"),
+        "text_hash": text_hash(review["text"]),
+        "rule_version": rule_version,
+        "model_version": model_version,
+        "trust_score": validation.get("trust_score"),
+        "is_ad": validation.get("is_ad"),
+        "validation": result.get("validation"),
+        "analysis": result.get("analysis") if result.get("analysis") is not None else (
+            {"error": result["error"], "message": result.get("message")} if "error" in result else None
+        ),
+        "analyzed_at": datetime.now(timezone.utc).isoformat(),
+        "detected_items": {str(num): name for num, name in detected_items.items()} if detected_items is not None else None,
+        "rule_fingerprints": rule_fingerprints
+    }
@@ -0,0 +1,263 @@
+-- =====================================================
+-- 제품 평점 집계 (증분 유지)
+-- =====================================================
+-- 설명: 제품별 평점 합계/개수/분포(1~5점)를 product_rating_stats에 유지하고
+--       products.rating_avg, products.rating_count에 반영합니다.
+--       - reviews INSERT/UPDATE/DELETE(upsert 포함) 시 문장 단위 트리거가
+--         바뀐 행만으로 집계를 증감합니다 (전체 재집계 없음).
+--       - reconcile_product_rating_stats(): 오래 확인하지 않은 제품부터 일부만
+--         실제 리뷰와 비교하여 어긋난 집계를 바로잡습니다 (주기 실행용).
+--       - rebuild_product_rating_stats(): 전체 재집계 (단일 문장).
+--       스크립트: scripts/fix_products_ratings.py
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS public.product_rating_stats (
+  product_id BIGINT PRIMARY KEY REFERENCES public.products(id) ON DELETE CASCADE,
+  rating_sum BIGINT NOT NULL DEFAULT 0,        -- 평점 합계 (1~5점 리뷰만)
+  rating_count BIGINT NOT NULL DEFAULT 0,      -- 평점 개수
+  rating_1 BIGINT NOT NULL DEFAULT 0,          -- 점수별 리뷰 수 (분포)
+  rating_2 BIGINT NOT NULL DEFAULT 0,
+  rating_3 BIGINT NOT NULL DEFAULT 0,
+  rating_4 BIGINT NOT NULL DEFAULT 0,
+  rating_5 BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  reconciled_at TIMESTAMPTZ                    -- 마지막 정합성 확인 시간
+);
+
+CREATE INDEX IF NOT EXISTS idx_product_rating_stats_reconciled_at
+  ON public.product_rating_stats(reconciled_at NULLS FIRST);
+
+-- 실제 리뷰 기준 제품별 집계 (전체 재집계/정합성 확인의 기준)
+CREATE OR REPLACE VIEW public.product_rating_summary AS
+SELECT
+  p.id AS product_id,
+  COALESCE(SUM(r.rating), 0)::BIGINT AS rating_sum,
+  COUNT(r.rating)::BIGINT AS rating_count,
+  COUNT(*) FILTER (WHERE r.rating = 1)::BIGINT AS rating_1,
+  COUNT(*) FILTER (WHERE r.rating = 2)::BIGINT AS rating_2,
+  COUNT(*) FILTER (WHERE r.rating = 3)::BIGINT AS rating_3,
+  COUNT(*) FILTER (WHERE r.rating = 4)::BIGINT AS rating_4,
+  COUNT(*) FILTER (WHERE r.rating = 5)::BIGINT AS rating_5
+FROM public.products p
+LEFT JOIN public.reviews r ON r.product_id = p.id AND r.rating BETWEEN 1 AND 5
+GROUP BY p.id;
+
+-- 평점 증감 반영: (제품, 평점, +1/-1) 목록 → 집계 증감 → products 갱신
+CREATE OR REPLACE FUNCTION public.apply_product_rating_deltas(
+  p_product_ids BIGINT[],
+  p_ratings INT[],
+  p_signs INT[]
+)
+RETURNS VOID AS $$
+BEGIN
+  WITH delta AS (
+    SELECT
+      d.product_id,
+      SUM(d.sign * d.rating) AS rating_sum,
+      SUM(d.sign) AS rating_count,
+      SUM(d.sign) FILTER (WHERE d.rating = 1) AS rating_1,
+      SUM(d.sign) FILTER (WHERE d.rating = 2) AS rating_2,
+      SUM(d.sign) FILTER (WHERE d.rating = 3) AS rating_3,
+      SUM(d.sign) FILTER (WHERE d.rating = 4) AS rating_4,
+      SUM(d.sign) FILTER (WHERE d.rating = 5) AS rating_5
+    FROM unnest(p_product_ids, p_ratings, p_signs) AS d(product_id, rating, sign)
+    WHERE d.rating BETWEEN 1 AND 5
+      -- 제품 삭제로 리뷰가 연쇄 삭제될 때는 집계 행도 함께 삭제되므로 건너뜀
+      AND EXISTS (SELECT 1 FROM public.products p WHERE p.id = d.product_id)
+    GROUP BY d.product_id
+  ),
+  merged AS (
+    INSERT INTO public.product_rating_stats AS s
+      (product_id, rating_sum, rating_count, rating_1, rating_2, rating_3, rating_4, rating_5)
+    SELECT product_id, rating_sum, rating_count,
+           COALESCE(rating_1, 0), COALESCE(rating_2, 0), COALESCE(rating_3, 0),
+           COALESCE(rating_4, 0), COALESCE(rating_5, 0)
+    FROM delta
+    ON CONFLICT (product_id) DO UPDATE SET
+      rating_sum = s.rating_sum + EXCLUDED.rating_sum,
+      rating_count = s.rating_count + EXCLUDED.rating_count,
+      rating_1 = s.rating_1 + EXCLUDED.rating_1,
+      rating_2 = s.rating_2 + EXCLUDED.rating_2,
+      rating_3 = s.rating_3 + EXCLUDED.rating_3,
+      rating_4 = s.rating_4 + EXCLUDED.rating_4,
+      rating_5 = s.rating_5 + EXCLUDED.rating_5,
+      updated_at = NOW()
+    RETURNING s.product_id, s.rating_sum, s.rating_count
+  )
+  UPDATE public.products p
+  SET rating_avg = CASE WHEN m.rating_count > 0 THEN m.rating_sum::NUMERIC / m.rating_count ELSE 0 END,
+      rating_count = m.rating_count
+  FROM merged m
+  WHERE p.id = m.product_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 집계 증감은 트리거에서만 (API로 직접 호출 불가)
+REVOKE EXECUTE ON FUNCTION public.apply_product_rating_deltas(BIGINT[], INT[], INT[]) FROM PUBLIC, anon, authenticated;
+
+-- reviews 변경 트리거 (문장 단위: upsert 한 번에 한 번 실행)
+-- 리뷰를 넣는 역할(스크레이퍼 등)에 products 갱신 권한이 없어도 되도록 소유자 권한으로 실행
+CREATE OR REPLACE FUNCTION public.track_review_ratings()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_product_ids BIGINT[];
+  v_ratings INT[];
+  v_signs INT[];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    SELECT array_agg(product_id), array_agg(rating), array_agg(1)
+    INTO v_product_ids, v_ratings, v_signs
+    FROM new_rows WHERE rating BETWEEN 1 AND 5;
+  ELSIF TG_OP = 'DELETE' THEN
+    SELECT array_agg(product_id), array_agg(rating), array_agg(-1)
+    INTO v_product_ids, v_ratings, v_signs
+    FROM old_rows WHERE rating BETWEEN 1 AND 5;
+  ELSE
+    -- 평점이나 제품이 바뀐 행만 (같은 리뷰 재수집 upsert는 변화 없음)
+    SELECT array_agg(c.product_id), array_agg(c.rating), array_agg(c.sign)
+    INTO v_product_ids, v_ratings, v_signs
+    FROM (
+      SELECT o.product_id, o.rating, -1 AS sign
+      FROM old_rows o JOIN new_rows n ON n.id = o.id
+      WHERE o.rating IS DISTINCT FROM n.rating OR o.product_id IS DISTINCT FROM n.product_id
+      UNION ALL
+      SELECT n.product_id, n.rating, 1 AS sign
+      FROM old_rows o JOIN new_rows n ON n.id = o.id
+      WHERE o.rating IS DISTINCT FROM n.rating OR o.product_id IS DISTINCT FROM n.product_id
+    ) c
+    WHERE c.rating BETWEEN 1 AND 5;
+  END IF;
+
+  IF v_product_ids IS NOT NULL THEN
+    PERFORM public.apply_product_rating_deltas(v_product_ids, v_ratings, v_signs);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 전이 테이블을 쓰는 트리거는 이벤트당 하나씩 만들어야 함
+DROP TRIGGER IF EXISTS track_review_ratings_insert ON public.reviews;
+CREATE TRIGGER track_review_ratings_insert
+  AFTER INSERT ON public.reviews
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_review_ratings();
+
+DROP TRIGGER IF EXISTS track_review_ratings_update ON public.reviews;
+CREATE TRIGGER track_review_ratings_update
+  AFTER UPDATE ON public.reviews
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_review_ratings();
+
+DROP TRIGGER IF EXISTS track_review_ratings_delete ON public.reviews;
+CREATE TRIGGER track_review_ratings_delete
+  AFTER DELETE ON public.reviews
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_review_ratings();
+
+-- 전체 재집계 (단일 문장): 실제 리뷰 기준으로 집계를 다시 쓰고, 바뀐 제품만 갱신
+-- 반환값: products.rating_avg/rating_count가 바뀐 제품 수
+CREATE OR REPLACE FUNCTION public.rebuild_product_rating_stats()
+RETURNS INT AS $$
+  WITH rebuilt AS (
+    INSERT INTO public.product_rating_stats AS s
+      (product_id, rating_sum, rating_count, rating_1, rating_2, rating_3, rating_4, rating_5, reconciled_at)
+    SELECT product_id, rating_sum, rating_count, rating_1, rating_2, rating_3, rating_4, rating_5, NOW()
+    FROM public.product_rating_summary
+    ON CONFLICT (product_id) DO UPDATE SET
+      rating_sum = EXCLUDED.rating_sum,
+      rating_count = EXCLUDED.rating_count,
+      rating_1 = EXCLUDED.rating_1,
+      rating_2 = EXCLUDED.rating_2,
+      rating_3 = EXCLUDED.rating_3,
+      rating_4 = EXCLUDED.rating_4,
+      rating_5 = EXCLUDED.rating_5,
+      updated_at = NOW(),
+      reconciled_at = NOW()
+    RETURNING s.product_id, s.rating_sum, s.rating_count
+  ),
+  updated AS (
+    UPDATE public.products p
+    SET rating_avg = CASE WHEN r.rating_count > 0 THEN r.rating_sum::NUMERIC / r.rating_count ELSE 0 END,
+        rating_count = r.rating_count
+    FROM rebuilt r
+    WHERE p.id = r.product_id
+      AND (p.rating_count IS DISTINCT FROM r.rating_count::INT
+           OR p.rating_avg IS DISTINCT FROM
+              CASE WHEN r.rating_count > 0 THEN r.rating_sum::NUMERIC / r.rating_count ELSE 0 END)
+    RETURNING p.id
+  )
+  SELECT COUNT(*)::INT FROM updated;
+$$ LANGUAGE sql;
+
+-- 정합성 확인 (주기 실행): 마지막 확인이 오래된 제품부터 p_limit개만 실제 리뷰와 비교
+-- 집계가 어긋났거나(트리거 설치 전 데이터, 수동 수정 등) products 값이 집계와 다르면 바로잡음
+CREATE OR REPLACE FUNCTION public.reconcile_product_rating_stats(p_limit INT DEFAULT 200)
+RETURNS TABLE(checked INT, stats_fixed INT, products_fixed INT) AS $$
+  WITH targets AS (
+    SELECT p.id AS product_id
+    FROM public.products p
+    LEFT JOIN public.product_rating_stats s ON s.product_id = p.id
+    ORDER BY s.reconciled_at NULLS FIRST, p.id
+    LIMIT p_limit
+  ),
+  actual AS (
+    SELECT t.product_id,
+           COALESCE(SUM(r.rating), 0)::BIGINT AS rating_sum,
+           COUNT(r.rating)::BIGINT AS rating_count,
+           COUNT(*) FILTER (WHERE r.rating = 1)::BIGINT AS rating_1,
+           COUNT(*) FILTER (WHERE r.rating = 2)::BIGINT AS rating_2,
+           COUNT(*) FILTER (WHERE r.rating = 3)::BIGINT AS rating_3,
+           COUNT(*) FILTER (WHERE r.rating = 4)::BIGINT AS rating_4,
+           COUNT(*) FILTER (WHERE r.rating = 5)::BIGINT AS rating_5
+    FROM targets t
+    LEFT JOIN public.reviews r ON r.product_id = t.product_id AND r.rating BETWEEN 1 AND 5
+    GROUP BY t.product_id
+  ),
+  drift AS (
+    SELECT a.product_id
+    FROM actual a
+    LEFT JOIN public.product_rating_stats s ON s.product_id = a.product_id
+    WHERE s.product_id IS NULL
+       OR (s.rating_sum, s.rating_count, s.rating_1, s.rating_2, s.rating_3, s.rating_4, s.rating_5)
+          IS DISTINCT FROM
+          (a.rating_sum, a.rating_count, a.rating_1, a.rating_2, a.rating_3, a.rating_4, a.rating_5)
+  ),
+  fixed AS (
+    INSERT INTO public.product_rating_stats AS s
+      (product_id, rating_sum, rating_count, rating_1, rating_2, rating_3, rating_4, rating_5, reconciled_at)
+    SELECT product_id, rating_sum, rating_count, rating_1, rating_2, rating_3, rating_4, rating_5, NOW()
+    FROM actual
+    ON CONFLICT (product_id) DO UPDATE SET
+      rating_sum = EXCLUDED.rating_sum,
+      rating_count = EXCLUDED.rating_count,
+      rating_1 = EXCLUDED.rating_1,
+      rating_2 = EXCLUDED.rating_2,
+      rating_3 = EXCLUDED.rating_3,
+      rating_4 = EXCLUDED.rating_4,
+      rating_5 = EXCLUDED.rating_5,
+      reconciled_at = NOW()
+    RETURNING s.product_id
+  ),
+  products_updated AS (
+    UPDATE public.products p
+    SET rating_avg = CASE WHEN a.rating_count > 0 THEN a.rating_sum::NUMERIC / a.rating_count ELSE 0 END,
+        rating_count = a.rating_count
+    FROM actual a
+    WHERE p.id = a.product_id
+      AND (p.rating_count IS DISTINCT FROM a.rating_count::INT
+           OR p.rating_avg IS DISTINCT FROM
+              CASE WHEN a.rating_count > 0 THEN a.rating_sum::NUMERIC / a.rating_count ELSE 0 END)
+    RETURNING p.id
+  )
+  SELECT (SELECT COUNT(*) FROM fixed)::INT,
+         (SELECT COUNT(*) FROM drift)::INT,
+         (SELECT COUNT(*) FROM products_updated)::INT;
+$$ LANGUAGE sql;
+
+-- 재집계/정합성 확인은 서비스 역할만 (scripts/fix_products_ratings.py)
+REVOKE EXECUTE ON FUNCTION public.rebuild_product_rating_stats() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION public.reconcile_product_rating_stats(INT) FROM PUBLIC, anon, authenticated;
+
+COMMENT ON TABLE public.product_rating_stats IS '제품별 평점 집계 (reviews 트리거로 증분 유지)';
+COMMENT ON COLUMN public.product_rating_stats.reconciled_at IS '마지막 정합성 확인 시간 (reconcile_product_rating_stats)';
+COMMENT ON VIEW public.product_rating_summary IS '실제 리뷰 기준 제품별 평점 집계 (전체 재집계 기준)';
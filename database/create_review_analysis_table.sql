@@ -0,0 +1,36 @@
+-- =====================================================
+-- 리뷰 분석 결과 저장 테이블
+-- =====================================================
+-- 설명: 리뷰별 검증/AI 분석 결과와 분석 당시의 입력/버전 지문
+--       (text_hash, rule_version, model_version)을 저장합니다.
+--       증분 재분석(scripts/refresh_review_analysis.py)은 세 값 중 하나라도
+--       바뀐 리뷰만 다시 분석합니다.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS public.review_analysis (
+  review_id BIGINT PRIMARY KEY REFERENCES public.reviews(id) ON DELETE CASCADE,
+  product_id BIGINT,
+  text_hash TEXT NOT NULL,                     -- 분석한 리뷰 텍스트의 SHA-256
+  rule_version TEXT NOT NULL,                  -- 체크리스트/신뢰도 규칙 버전
+  model_version TEXT NOT NULL,                 -- AI 분석 모델(또는 local_rules) 버전
+  trust_score NUMERIC,
+  is_ad BOOLEAN,
+  validation JSONB,                            -- analyze() 결과의 validation
+  analysis JSONB,                              -- analyze() 결과의 analysis
+  analyzed_at TIMESTAMPTZ DEFAULT NOW(),
+  detected_items JSONB,                        -- 체크리스트 항목 벡터 {항목번호: 항목명}
+  rule_fingerprints JSONB                      -- 분석 당시 규칙 지문 {"framework", "items": {항목번호: 지문}}
+);
+
+-- 항목 벡터 컬럼 추가 이전에 만든 테이블용
+ALTER TABLE public.review_analysis ADD COLUMN IF NOT EXISTS detected_items JSONB;
+ALTER TABLE public.review_analysis ADD COLUMN IF NOT EXISTS rule_fingerprints JSONB;
+
+CREATE INDEX IF NOT EXISTS idx_review_analysis_product_id ON public.review_analysis(product_id);
+CREATE INDEX IF NOT EXISTS idx_review_analysis_versions ON public.review_analysis(rule_version, model_version);
+
+COMMENT ON TABLE public.review_analysis IS '리뷰 분석 결과 (증분 재분석용 지문 포함)';
+COMMENT ON COLUMN public.review_analysis.text_hash IS '분석한 리뷰 텍스트의 SHA-256 (텍스트 변경 감지)';
+COMMENT ON COLUMN public.review_analysis.rule_version IS '규칙 버전 (규칙 변경 감지)';
+COMMENT ON COLUMN public.review_analysis.model_version IS '모델 버전 (모델 변경 감지)';
+COMMENT ON COLUMN public.review_analysis.rule_fingerprints IS '항목별 규칙 지문 (규칙 변경 시 바뀐 항목만 재검사)';
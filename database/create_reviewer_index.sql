@@ -0,0 +1,329 @@
+-- =====================================================
+-- 리뷰어 인덱스 (제품 간 작성자 색인, 증분 유지)
+-- =====================================================
+-- 설명: 작성자 → 리뷰 id/제품/작성일 색인(reviewer_products, reviewers)과
+--       제품별 작성자 집계(product_reviewer_stats)를 reviews 트리거로 유지합니다.
+--       - 리뷰어 다양성(8_reviewer_diversity): 제품별 고유 작성자 수를 행 하나로 조회
+--       - 여러 제품에 리뷰를 쓴 작성자 수(shared_reviewer_count)도 행 하나로 조회
+--       - reviewer_sketch: 작성자 HyperLogLog 레지스터 (2^11개, 오차 약 2.3%)
+--         제품끼리 합쳐 경쟁 제품 간 겹치는 작성자 수를 리뷰 수와 무관하게 추정
+--         (database/reviewer_index.py의 HyperLogLog와 같은 해시 사용)
+--       - 작성자 없음/익명 표시("Anonymous", "iHerb Customer" 등)는 색인하지 않음
+--       스크립트: scripts/rebuild_reviewer_index.py
+-- =====================================================
+
+-- 작성자 정규화 키 (공백 정리 + 소문자, 익명 표시는 NULL)
+-- database/reviewer_index.py normalize_author()와 같은 규칙
+CREATE OR REPLACE FUNCTION public.reviewer_key(p_author TEXT)
+RETURNS TEXT AS $$
+  SELECT CASE
+    WHEN k IS NULL OR k = '' OR k IN ('anonymous', 'iherb customer', 'iherb 고객', '익명', '비회원') THEN NULL
+    ELSE k
+  END
+  FROM (SELECT lower(btrim(regexp_replace(p_author, '\s+', ' ', 'g'))) AS k) n;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 작성자 키 목록을 HyperLogLog 레지스터에 추가
+-- 해시: md5 앞 32비트, 상위 11비트 = 레지스터 번호, 나머지 21비트의 앞쪽 0 개수 + 1 = 값
+CREATE OR REPLACE FUNCTION public.reviewer_sketch_add(p_sketch SMALLINT[], p_author_keys TEXT[])
+RETURNS SMALLINT[] AS $$
+  SELECT array_agg(GREATEST(COALESCE(p_sketch[g.i], 0), COALESCE(h.rho, 0))::SMALLINT ORDER BY g.i)
+  FROM generate_series(1, 2048) AS g(i)
+  LEFT JOIN (
+    SELECT (x >> 21)::INT + 1 AS idx,
+           MAX(22 - length(ltrim((x & 2097151)::BIT(21)::TEXT, '0'))) AS rho
+    FROM (SELECT ('x' || substr(md5(k), 1, 8))::BIT(32)::BIGINT AS x
+          FROM unnest(p_author_keys) AS k) hashed
+    GROUP BY 1
+  ) h ON h.idx = g.i;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 두 레지스터 배열 합치기 (원소별 최댓값)
+CREATE OR REPLACE FUNCTION public.reviewer_sketch_union(p_a SMALLINT[], p_b SMALLINT[])
+RETURNS SMALLINT[] AS $$
+  SELECT CASE
+    WHEN p_b IS NULL THEN p_a
+    WHEN p_a IS NULL THEN p_b
+    ELSE ARRAY(SELECT GREATEST(u.a, u.b) FROM unnest(p_a, p_b) WITH ORDINALITY AS u(a, b, i) ORDER BY u.i)
+  END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- 작성자 + 제품 쌍 (리뷰 id, 작성일)
+CREATE TABLE IF NOT EXISTS public.reviewer_products (
+  author_key TEXT NOT NULL,
+  product_id BIGINT NOT NULL REFERENCES public.products(id) ON DELETE CASCADE,
+  review_ids BIGINT[] NOT NULL DEFAULT '{}',
+  review_count INT NOT NULL DEFAULT 0,
+  first_review_date DATE,
+  last_review_date DATE,
+  PRIMARY KEY (author_key, product_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_reviewer_products_product_id ON public.reviewer_products(product_id);
+
+-- 작성자별 요약
+CREATE TABLE IF NOT EXISTS public.reviewers (
+  author_key TEXT PRIMARY KEY,
+  review_count INT NOT NULL DEFAULT 0,
+  product_count INT NOT NULL DEFAULT 0,        -- 리뷰를 쓴 제품 수
+  first_review_date DATE,
+  last_review_date DATE,
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_reviewers_product_count ON public.reviewers(product_count) WHERE product_count > 1;
+
+-- 제품별 작성자 집계
+CREATE TABLE IF NOT EXISTS public.product_reviewer_stats (
+  product_id BIGINT PRIMARY KEY REFERENCES public.products(id) ON DELETE CASCADE,
+  review_count BIGINT NOT NULL DEFAULT 0,           -- 작성자가 있는 리뷰 수
+  reviewer_count BIGINT NOT NULL DEFAULT 0,         -- 고유 작성자 수 (정확)
+  shared_reviewer_count BIGINT NOT NULL DEFAULT 0,  -- 다른 제품에도 리뷰를 쓴 작성자 수
+  reviewer_sketch SMALLINT[],                       -- 작성자 HyperLogLog 레지스터 (추가만 반영, 재구축 시 정리)
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 트리거에서 (제품, 작성자) 쌍의 리뷰를 찾기 위한 식 인덱스
+CREATE INDEX IF NOT EXISTS idx_reviews_product_reviewer
+  ON public.reviews(product_id, public.reviewer_key(author));
+
+-- 바뀐 (작성자, 제품) 쌍을 실제 리뷰로 다시 계산하고 작성자/제품 집계에 차이만 반영
+CREATE OR REPLACE FUNCTION public.refresh_reviewer_pairs(p_author_keys TEXT[], p_product_ids BIGINT[])
+RETURNS VOID AS $$
+DECLARE
+  v_keys TEXT[];
+  v_old_keys TEXT[];
+  v_old_products BIGINT[];
+  v_old_counts INT[];
+BEGIN
+  v_keys := ARRAY(SELECT DISTINCT k FROM unnest(p_author_keys) AS k);
+
+  -- 변경 전: 영향받는 작성자의 모든 (작성자, 제품) 쌍
+  SELECT array_agg(rp.author_key), array_agg(rp.product_id), array_agg(rp.review_count)
+  INTO v_old_keys, v_old_products, v_old_counts
+  FROM public.reviewer_products rp
+  WHERE rp.author_key = ANY(v_keys);
+
+  -- 바뀐 쌍을 reviews 기준으로 다시 계산 (식 인덱스 조회)
+  WITH pairs AS (
+    SELECT DISTINCT t.author_key, t.product_id
+    FROM unnest(p_author_keys, p_product_ids) AS t(author_key, product_id)
+  ),
+  fresh AS (
+    SELECT pr.author_key, pr.product_id, agg.review_ids, agg.review_count, agg.first_date, agg.last_date
+    FROM pairs pr
+    CROSS JOIN LATERAL (
+      SELECT array_agg(r.id ORDER BY r.id) AS review_ids,
+             COUNT(*)::INT AS review_count,
+             MIN(r.review_date) AS first_date,
+             MAX(r.review_date) AS last_date
+      FROM public.reviews r
+      WHERE r.product_id = pr.product_id AND public.reviewer_key(r.author) = pr.author_key
+    ) agg
+  ),
+  removed AS (
+    DELETE FROM public.reviewer_products rp
+    USING fresh f
+    WHERE rp.author_key = f.author_key AND rp.product_id = f.product_id AND f.review_count = 0
+  )
+  INSERT INTO public.reviewer_products AS rp
+    (author_key, product_id, review_ids, review_count, first_review_date, last_review_date)
+  SELECT author_key, product_id, review_ids, review_count, first_date, last_date
+  FROM fresh
+  WHERE review_count > 0
+  ON CONFLICT (author_key, product_id) DO UPDATE SET
+    review_ids = EXCLUDED.review_ids,
+    review_count = EXCLUDED.review_count,
+    first_review_date = EXCLUDED.first_review_date,
+    last_review_date = EXCLUDED.last_review_date;
+
+  -- 제품별 증감: 변경 후 쌍의 기여 - 변경 전 쌍의 기여
+  WITH old_pairs AS (
+    SELECT o.author_key, o.product_id, o.review_count
+    FROM unnest(v_old_keys, v_old_products, v_old_counts) AS o(author_key, product_id, review_count)
+  ),
+  new_pairs AS (
+    SELECT rp.author_key, rp.product_id, rp.review_count
+    FROM public.reviewer_products rp
+    WHERE rp.author_key = ANY(v_keys)
+  ),
+  old_spread AS (SELECT author_key, COUNT(*) AS product_count FROM old_pairs GROUP BY author_key),
+  new_spread AS (SELECT author_key, COUNT(*) AS product_count FROM new_pairs GROUP BY author_key),
+  contrib AS (
+    SELECT n.product_id, n.review_count AS reviews, 1 AS reviewers,
+           CASE WHEN s.product_count > 1 THEN 1 ELSE 0 END AS shared
+    FROM new_pairs n JOIN new_spread s USING (author_key)
+    UNION ALL
+    SELECT o.product_id, -o.review_count, -1,
+           CASE WHEN s.product_count > 1 THEN -1 ELSE 0 END
+    FROM old_pairs o JOIN old_spread s USING (author_key)
+  ),
+  delta AS (
+    SELECT c.product_id, SUM(c.reviews) AS reviews, SUM(c.reviewers) AS reviewers, SUM(c.shared) AS shared
+    FROM contrib c
+    WHERE EXISTS (SELECT 1 FROM public.products p WHERE p.id = c.product_id)
+    GROUP BY c.product_id
+    HAVING SUM(c.reviews) <> 0 OR SUM(c.reviewers) <> 0 OR SUM(c.shared) <> 0
+  ),
+  added AS (
+    SELECT n.product_id, array_agg(n.author_key) AS author_keys
+    FROM new_pairs n
+    LEFT JOIN old_pairs o USING (author_key, product_id)
+    WHERE o.author_key IS NULL
+    GROUP BY n.product_id
+  )
+  INSERT INTO public.product_reviewer_stats AS s
+    (product_id, review_count, reviewer_count, shared_reviewer_count, reviewer_sketch)
+  SELECT d.product_id, d.reviews, d.reviewers, d.shared,
+         CASE WHEN a.author_keys IS NULL THEN NULL ELSE public.reviewer_sketch_add(NULL, a.author_keys) END
+  FROM delta d
+  LEFT JOIN added a USING (product_id)
+  ON CONFLICT (product_id) DO UPDATE SET
+    review_count = s.review_count + EXCLUDED.review_count,
+    reviewer_count = s.reviewer_count + EXCLUDED.reviewer_count,
+    shared_reviewer_count = s.shared_reviewer_count + EXCLUDED.shared_reviewer_count,
+    reviewer_sketch = public.reviewer_sketch_union(s.reviewer_sketch, EXCLUDED.reviewer_sketch),
+    updated_at = NOW();
+
+  -- 작성자 요약 갱신 (쌍이 모두 사라진 작성자는 삭제)
+  DELETE FROM public.reviewers r
+  WHERE r.author_key = ANY(v_keys)
+    AND NOT EXISTS (SELECT 1 FROM public.reviewer_products rp WHERE rp.author_key = r.author_key);
+
+  INSERT INTO public.reviewers AS r
+    (author_key, review_count, product_count, first_review_date, last_review_date)
+  SELECT rp.author_key, SUM(rp.review_count), COUNT(*), MIN(rp.first_review_date), MAX(rp.last_review_date)
+  FROM public.reviewer_products rp
+  WHERE rp.author_key = ANY(v_keys)
+  GROUP BY rp.author_key
+  ON CONFLICT (author_key) DO UPDATE SET
+    review_count = EXCLUDED.review_count,
+    product_count = EXCLUDED.product_count,
+    first_review_date = EXCLUDED.first_review_date,
+    last_review_date = EXCLUDED.last_review_date,
+    updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- 색인 갱신은 트리거에서만 (API로 직접 호출 불가)
+REVOKE EXECUTE ON FUNCTION public.refresh_reviewer_pairs(TEXT[], BIGINT[]) FROM PUBLIC, anon, authenticated;
+
+-- reviews 변경 트리거 (문장 단위: upsert 한 번에 한 번 실행)
+-- 리뷰를 넣는 역할(스크레이퍼 등)에 색인 갱신 권한이 없어도 되도록 소유자 권한으로 실행
+CREATE OR REPLACE FUNCTION public.track_reviewers()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_author_keys TEXT[];
+  v_product_ids BIGINT[];
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    SELECT array_agg(c.author_key), array_agg(c.product_id)
+    INTO v_author_keys, v_product_ids
+    FROM (SELECT DISTINCT public.reviewer_key(author) AS author_key, product_id FROM new_rows) c
+    WHERE c.author_key IS NOT NULL;
+  ELSIF TG_OP = 'DELETE' THEN
+    SELECT array_agg(c.author_key), array_agg(c.product_id)
+    INTO v_author_keys, v_product_ids
+    FROM (SELECT DISTINCT public.reviewer_key(author) AS author_key, product_id FROM old_rows) c
+    WHERE c.author_key IS NOT NULL;
+  ELSE
+    -- 작성자, 제품, 작성일이 바뀐 행만 (같은 리뷰 재수집 upsert는 변화 없음)
+    SELECT array_agg(c.author_key), array_agg(c.product_id)
+    INTO v_author_keys, v_product_ids
+    FROM (
+      SELECT public.reviewer_key(o.author) AS author_key, o.product_id
+      FROM old_rows o JOIN new_rows n ON n.id = o.id
+      WHERE (o.author, o.product_id, o.review_date) IS DISTINCT FROM (n.author, n.product_id, n.review_date)
+      UNION
+      SELECT public.reviewer_key(n.author), n.product_id
+      FROM old_rows o JOIN new_rows n ON n.id = o.id
+      WHERE (o.author, o.product_id, o.review_date) IS DISTINCT FROM (n.author, n.product_id, n.review_date)
+    ) c
+    WHERE c.author_key IS NOT NULL;
+  END IF;
+
+  IF v_author_keys IS NOT NULL THEN
+    PERFORM public.refresh_reviewer_pairs(v_author_keys, v_product_ids);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 전이 테이블을 쓰는 트리거는 이벤트당 하나씩 만들어야 함
+DROP TRIGGER IF EXISTS track_reviewers_insert ON public.reviews;
+CREATE TRIGGER track_reviewers_insert
+  AFTER INSERT ON public.reviews
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_reviewers();
+
+DROP TRIGGER IF EXISTS track_reviewers_update ON public.reviews;
+CREATE TRIGGER track_reviewers_update
+  AFTER UPDATE ON public.reviews
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_reviewers();
+
+DROP TRIGGER IF EXISTS track_reviewers_delete ON public.reviews;
+CREATE TRIGGER track_reviewers_delete
+  AFTER DELETE ON public.reviews
+  REFERENCING OLD TABLE AS old_rows
+  FOR EACH STATEMENT EXECUTE FUNCTION public.track_reviewers();
+
+-- 전체 재구축: 설치 직후 한 번, 또는 스케치를 정리할 때 (삭제된 작성자는 스케치에서 빠지지 않음)
+-- 반환값: 작성자 집계가 있는 제품 수
+CREATE OR REPLACE FUNCTION public.rebuild_reviewer_index()
+RETURNS INT AS $$
+DECLARE
+  v_products INT;
+BEGIN
+  DELETE FROM public.product_reviewer_stats WHERE TRUE;
+  DELETE FROM public.reviewers WHERE TRUE;
+  DELETE FROM public.reviewer_products WHERE TRUE;
+
+  INSERT INTO public.reviewer_products
+    (author_key, product_id, review_ids, review_count, first_review_date, last_review_date)
+  SELECT public.reviewer_key(r.author), r.product_id, array_agg(r.id ORDER BY r.id), COUNT(*),
+         MIN(r.review_date), MAX(r.review_date)
+  FROM public.reviews r
+  WHERE public.reviewer_key(r.author) IS NOT NULL
+  GROUP BY 1, 2;
+
+  INSERT INTO public.reviewers (author_key, review_count, product_count, first_review_date, last_review_date)
+  SELECT author_key, SUM(review_count), COUNT(*), MIN(first_review_date), MAX(last_review_date)
+  FROM public.reviewer_products
+  GROUP BY author_key;
+
+  INSERT INTO public.product_reviewer_stats
+    (product_id, review_count, reviewer_count, shared_reviewer_count, reviewer_sketch)
+  SELECT rp.product_id, SUM(rp.review_count), COUNT(*),
+         COUNT(*) FILTER (WHERE r.product_count > 1),
+         public.reviewer_sketch_add(NULL, array_agg(rp.author_key))
+  FROM public.reviewer_products rp
+  JOIN public.reviewers r USING (author_key)
+  GROUP BY rp.product_id;
+
+  GET DIAGNOSTICS v_products = ROW_COUNT;
+  RETURN v_products;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 제품 간 같은 작성자 조회: 이 제품 작성자 중 다른 제품에도 리뷰를 쓴 작성자와 그 제품 목록
+CREATE OR REPLACE FUNCTION public.product_shared_reviewers(p_product_id BIGINT, p_limit INT DEFAULT 50)
+RETURNS TABLE(author_key TEXT, review_count INT, product_count INT, other_product_ids BIGINT[]) AS $$
+  SELECT rp.author_key, rp.review_count, r.product_count,
+         ARRAY(SELECT o.product_id FROM public.reviewer_products o
+               WHERE o.author_key = rp.author_key AND o.product_id <> p_product_id
+               ORDER BY o.product_id)
+  FROM public.reviewer_products rp
+  JOIN public.reviewers r ON r.author_key = rp.author_key
+  WHERE rp.product_id = p_product_id AND r.product_count > 1
+  ORDER BY r.product_count DESC, rp.author_key
+  LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+-- 재구축은 서비스 역할만 (scripts/rebuild_reviewer_index.py)
+REVOKE EXECUTE ON FUNCTION public.rebuild_reviewer_index() FROM PUBLIC, anon, authenticated;
+
+COMMENT ON TABLE public.reviewer_products IS '작성자-제품 쌍별 리뷰 id/작성일 (reviews 트리거로 증분 유지)';
+COMMENT ON TABLE public.reviewers IS '작성자별 리뷰 수/제품 수 (reviews 트리거로 증분 유지)';
+COMMENT ON TABLE public.product_reviewer_stats IS '제품별 고유 작성자 수, 다른 제품 공유 작성자 수, 작성자 HyperLogLog';
+COMMENT ON COLUMN public.product_reviewer_stats.reviewer_sketch IS 'HyperLogLog 레지스터 2048개 (database/reviewer_index.py HyperLogLog와 같은 해시)';
@@ -0,0 +1,178 @@
+"""
+제품 평점 집계 모듈
+products.rating_avg / rating_count를 제품별 평점 합계·개수·분포(product_rating_stats)로 유지합니다.
+
+평소에는 reviews 트리거(create_product_rating_stats.sql)가 바뀐 리뷰만큼 집계를 증감하므로
+전체 재집계가 필요 없고, 이 모듈은 주기적인 정합성 확인과 전체 재집계를 호출합니다.
+SQL 함수를 설치하기 전에는 rebuild_client_side()로 리뷰를 페이지 단위로 한 번만 읽어
+값이 바뀐 제품만 갱신합니다 (제품마다 리뷰를 조회하던 N+1 방식 대체).
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+RATING_STATS_TABLE = "product_rating_stats"
+PAGE_SIZE = 1000
+UPDATE_CHUNK_SIZE = 200
+
+
+class RatingAggregate:
+    """제품 1개의 평점 집계 (합계, 개수, 1~5점 분포)"""
+
+    __slots__ = ("rating_sum", "rating_count", "histogram")
+
+    def __init__(self):
+        self.rating_sum = 0
+        self.rating_count = 0
+        self.histogram = [0, 0, 0, 0, 0]
+
+    def add(self, rating: Optional[int], sign: int = 1) -> None:
+        """
+        평점 1건 반영
+
+        Args:
+            rating: 평점 (1~5가 아니면 무시)
+            sign: +1 (추가) 또는 -1 (삭제)
+        """
+        if rating is None or not 1 <= rating <= 5:
+            return
+        self.rating_sum += sign * rating
+        self.rating_count += sign
+        self.histogram[rating - 1] += sign
+
+    @property
+    def rating_avg(self) -> float:
+        """평균 평점 (평점이 없으면 0, SQL 집계와 같은 규칙)"""
+        return self.rating_sum / self.rating_count if self.rating_count > 0 else 0
+
+    def to_row(self, product_id: int) -> Dict[str, Any]:
+        """product_rating_stats 행으로 변환"""
+        row = {"product_id": product_id, "rating_sum": self.rating_sum, "rating_count": self.rating_count}
+        for score, count in enumerate(self.histogram, 1):
+            row[f"rating_{score}"] = count
+        return row
+
+
+def aggregate_ratings(rows: Iterable[Dict[str, Any]]) -> Dict[int, RatingAggregate]:
+    """
+    리뷰 행을 한 번 순회하여 제품별 평점 집계
+
+    Args:
+        rows: {"product_id", "rating"} 리뷰 행
+
+    Returns:
+        Dict[int, RatingAggregate]: {product_id: 집계}
+    """
+    aggregates: Dict[int, RatingAggregate] = {}
+    for row in rows:
+        product_id = row.get("product_id")
+        if product_id is None:
+            continue
+        aggregate = aggregates.get(product_id)
+        if aggregate is None:
+            aggregate = aggregates[product_id] = RatingAggregate()
+        aggregate.add(row.get("rating"))
+    return aggregates
+
+
+class ProductRatingAggregates:
+    """제품 평점 집계 관리 (정합성 확인, 전체 재집계)"""
+
+    def __init__(self, supabase):
+        """
+        Args:
+            supabase: Supabase 클라이언트 (products 갱신 권한 필요 → 서비스 역할 클라이언트)
+        """
+        self.supabase = supabase
+
+    def rebuild(self) -> int:
+        """
+        전체 재집계 (SQL 함수 rebuild_product_rating_stats, 단일 문장)
+
+        Returns:
+            int: rating_avg/rating_count가 바뀐 제품 수
+        """
+        response = self.supabase.rpc("rebuild_product_rating_stats").execute()
+        return int(response.data or 0)
+
+    def reconcile(self, limit: int = 200) -> Dict[str, int]:
+        """
+        정합성 확인 (SQL 함수 reconcile_product_rating_stats)
+
+        마지막 확인이 오래된 제품부터 limit개만 실제 리뷰와 비교하여 어긋난 집계를 바로잡습니다.
+        주기적으로 실행하면 전체 제품을 나누어 확인합니다.
+
+        Args:
+            limit: 이번에 확인할 제품 수
+
+        Returns:
+            Dict: {"checked", "stats_fixed", "products_fixed"}
+        """
+        response = self.supabase.rpc("reconcile_product_rating_stats", {"p_limit": limit}).execute()
+        data = response.data
+        row = (data[0] if isinstance(data, list) and data else data) or {}
+        return {key: int(row.get(key) or 0) for key in ("checked", "stats_fixed", "products_fixed")}
+
+    def rebuild_client_side(self, page_size: int = PAGE_SIZE, dry_run: bool = False) -> Dict[str, int]:
+        """
+        SQL 함수 없이 전체 재집계 (리뷰/제품 테이블을 페이지 단위로 한 번씩 읽고 바뀐 제품만 갱신)
+
+        같은 값으로 바뀌는 제품은 한 번의 요청으로 묶어 갱신합니다.
+
+        Args:
+            page_size: 조회 페이지 크기
+            dry_run: True이면 갱신하지 않고 바뀔 제품 수만 집계
+
+        Returns:
+            Dict: {"products", "reviews", "changed", "requests"}
+        """
+        stats = {"products": 0, "reviews": 0, "changed": 0, "requests": 0}
+
+        def counted(rows: Iterator[Dict[str, Any]], key: str) -> Iterator[Dict[str, Any]]:
+            for row in rows:
+                stats[key] += 1
+                yield row
+
+        aggregates = aggregate_ratings(counted(self._iter_table("reviews", "id,product_id,rating", page_size, stats),
+                                               "reviews"))
+
+        changes: Dict[Tuple[float, int], List[int]] = {}
+        for product in counted(self._iter_table("products", "id,rating_avg,rating_count", page_size, stats),
+                               "products"):
+            aggregate = aggregates.get(product["id"]) or RatingAggregate()
+            target = (aggregate.rating_avg, aggregate.rating_count)
+            current = (product.get("rating_avg"), product.get("rating_count"))
+            if current[1] != target[1] or current[0] is None or abs(float(current[0]) - target[0]) > 1e-9:
+                changes.setdefault(target, []).append(product["id"])
+                stats["changed"] += 1
+
+        if not dry_run:
+            for (rating_avg, rating_count), product_ids in changes.items():
+                for start in range(0, len(product_ids), UPDATE_CHUNK_SIZE):
+                    self.supabase.table("products")\
+                        .update({"rating_avg": rating_avg, "rating_count": rating_count})\
+                        .in_("id", product_ids[start:start + UPDATE_CHUNK_SIZE])\
+                        .execute()
+                    stats["requests"] += 1
+        return stats
+
+    def _iter_table(
+        self,
+        table: str,
+        columns: str,
+        page_size: int,
+        stats: Dict[str, int]
+    ) -> Iterator[Dict[str, Any]]:
+        """테이블을 id 순서로 페이지 단위 조회"""
+        offset = 0
+        while True:
+            response = self.supabase.table(table)\
+                .select(columns)\
+                .order("id")\
+                .range(offset, offset + page_size - 1)\
+                .execute()
+            stats["requests"] += 1
+            rows = response.data or []
+            yield from rows
+            if len(rows) < page_size:
+                break
+            offset += page_size
@@ -0,0 +1,206 @@
+"""
+리뷰어 인덱스 모듈
+작성자 → 리뷰 id/제품/작성일 색인(create_reviewer_index.sql)을 조회합니다.
+
+색인과 제품별 작성자 집계(product_reviewer_stats)는 reviews 트리거가 바뀐 (작성자, 제품) 쌍만
+다시 계산하여 유지하므로, 리뷰어 다양성과 다른 제품 공유 작성자 수는 제품 행 하나로 조회합니다.
+경쟁 제품 간 겹치는 작성자 수는 제품별 HyperLogLog 레지스터를 합쳐 리뷰 수와 무관하게 추정합니다.
+"""
+
+import hashlib
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+SKETCH_PRECISION = 11                    # 레지스터 2^11개 (SQL reviewer_sketch_add()와 같아야 함)
+SKETCH_REGISTERS = 1 << SKETCH_PRECISION
+_HASH_BITS = 32
+_RANK_BITS = _HASH_BITS - SKETCH_PRECISION
+
+# 색인하지 않는 익명 표시 (SQL reviewer_key()와 같아야 함)
+PLACEHOLDER_AUTHORS = frozenset({"anonymous", "iherb customer", "iherb 고객", "익명", "비회원"})
+
+STATS_COLUMNS = "product_id,review_count,reviewer_count,shared_reviewer_count"
+
+
+def normalize_author(author: Optional[str]) -> Optional[str]:
+    """
+    작성자 정규화 키 (공백 정리 + 소문자, 익명 표시는 None)
+
+    Args:
+        author: reviews.author 값
+
+    Returns:
+        Optional[str]: 색인 키 (색인하지 않는 작성자면 None)
+    """
+    if author is None:
+        return None
+    key = re.sub(r"\s+", " ", author).strip().lower()
+    if not key or key in PLACEHOLDER_AUTHORS:
+        return None
+    return key
+
+
+class HyperLogLog:
+    """
+    작성자 수 추정용 HyperLogLog (SQL reviewer_sketch와 같은 해시/레지스터 배치)
+
+    해시는 md5 앞 32비트, 상위 SKETCH_PRECISION비트가 레지스터 번호, 나머지 비트의
+    앞쪽 0 개수 + 1이 레지스터 값입니다. 합치기(merge)는 원소별 최댓값입니다.
+    """
+
+    def __init__(self, registers: Optional[Sequence[int]] = None):
+        """
+        Args:
+            registers: 기존 레지스터 (product_reviewer_stats.reviewer_sketch, 없으면 빈 스케치)
+        """
+        if registers is None:
+            self.registers = bytearray(SKETCH_REGISTERS)
+        else:
+            if len(registers) != SKETCH_REGISTERS:
+                raise ValueError(f"레지스터 수가 {SKETCH_REGISTERS}개가 아닙니다: {len(registers)}")
+            self.registers = bytearray(registers)
+
+    def add(self, author_key: str) -> None:
+        """정규화된 작성자 키 추가"""
+        value = int(hashlib.md5(author_key.encode("utf-8")).hexdigest()[:8], 16)
+        index = value >> _RANK_BITS
+        rank = _RANK_BITS + 1 - (value & ((1 << _RANK_BITS) - 1)).bit_length()
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, author_keys: Iterable[str]) -> "HyperLogLog":
+        """작성자 키 여러 개 추가"""
+        for author_key in author_keys:
+            self.add(author_key)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """두 스케치의 합집합 스케치 (새 객체)"""
+        return HyperLogLog([max(a, b) for a, b in zip(self.registers, other.registers)])
+
+    def count(self) -> float:
+        """고유 작성자 수 추정 (작은 값은 선형 계수 보정)"""
+        m = SKETCH_REGISTERS
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return estimate
+
+
+def estimate_overlap(a: HyperLogLog, b: HyperLogLog) -> float:
+    """
+    두 제품의 겹치는 작성자 수 추정 (|A| + |B| - |A ∪ B|, 음수는 0)
+
+    Args:
+        a, b: 제품별 작성자 스케치
+
+    Returns:
+        float: 겹치는 작성자 수 추정값
+    """
+    return max(0.0, a.count() + b.count() - a.merge(b).count())
+
+
+class ReviewerIndex:
+    """리뷰어 인덱스 조회 (제품별 작성자 집계, 제품 간 같은 작성자)"""
+
+    def __init__(self, supabase):
+        """
+        Args:
+            supabase: Supabase 클라이언트 (조회는 anon, rebuild()는 서비스 역할 클라이언트)
+        """
+        self.supabase = supabase
+
+    def product_stats(self, product_ids: Iterable[Any]) -> Dict[str, Dict[str, int]]:
+        """
+        제품별 작성자 집계 (제품당 행 하나, 한 번의 요청)
+
+        Args:
+            product_ids: 제품 ID 목록
+
+        Returns:
+            Dict[str, Dict]: {product_id(str): {"review_count", "reviewer_count", "shared_reviewer_count"}}
+        """
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return {}
+        response = self.supabase.table("product_reviewer_stats")\
+            .select(STATS_COLUMNS)\
+            .in_("product_id", ids)\
+            .execute()
+        return {
+            str(row["product_id"]): {key: int(row.get(key) or 0) for key in STATS_COLUMNS.split(",")[1:]}
+            for row in response.data or []
+        }
+
+    def shared_reviewers(self, product_id: Any, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        이 제품 작성자 중 다른 제품에도 리뷰를 쓴 작성자 (SQL 함수 product_shared_reviewers)
+
+        Args:
+            product_id: 제품 ID
+            limit: 최대 작성자 수 (리뷰한 제품이 많은 작성자부터)
+
+        Returns:
+            List[Dict]: [{"author_key", "review_count", "product_count", "other_product_ids"}]
+        """
+        response = self.supabase.rpc(
+            "product_shared_reviewers", {"p_product_id": int(product_id), "p_limit": limit}
+        ).execute()
+        return response.data or []
+
+    def sketches(self, product_ids: Iterable[Any]) -> Dict[str, HyperLogLog]:
+        """
+        제품별 작성자 스케치 조회
+
+        Args:
+            product_ids: 제품 ID 목록
+
+        Returns:
+            Dict[str, HyperLogLog]: {product_id(str): 스케치} (스케치가 없는 제품은 빠짐)
+        """
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return {}
+        response = self.supabase.table("product_reviewer_stats")\
+            .select("product_id,reviewer_sketch")\
+            .in_("product_id", ids)\
+            .execute()
+        return {
+            str(row["product_id"]): HyperLogLog(row["reviewer_sketch"])
+            for row in response.data or []
+            if row.get("reviewer_sketch")
+        }
+
+    def competitor_overlap(self, product_id: Any, competitor_ids: Iterable[Any]) -> Dict[str, float]:
+        """
+        경쟁 제품별 겹치는 작성자 수 추정 (스케치 합치기, 제품 리뷰 수와 무관)
+
+        Args:
+            product_id: 기준 제품 ID
+            competitor_ids: 경쟁 제품 ID 목록
+
+        Returns:
+            Dict[str, float]: {competitor_id(str): 겹치는 작성자 수 추정값}
+        """
+        competitors = [str(competitor_id) for competitor_id in competitor_ids]
+        sketches = self.sketches([product_id, *competitors])
+        base = sketches.get(str(product_id))
+        if base is None:
+            return {competitor_id: 0.0 for competitor_id in competitors}
+        return {
+            competitor_id: estimate_overlap(base, sketches[competitor_id]) if competitor_id in sketches else 0.0
+            for competitor_id in competitors
+        }
+
+    def rebuild(self) -> int:
+        """
+        전체 재구축 (SQL 함수 rebuild_reviewer_index: 설치 직후 한 번, 스케치 정리 시)
+
+        Returns:
+            int: 작성자 집계가 있는 제품 수
+        """
+        response = self.supabase.rpc("rebuild_reviewer_index").execute()
+        return int(response.data or 0)
@@ -0,0 +1,169 @@
+"""
+rating_aggregates.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.rating_aggregates import ProductRatingAggregates, RatingAggregate, aggregate_ratings
+
+
+class _FakeQuery:
+    """Supabase 쿼리 빌더 대역 (select/order/range/update/in_만 지원)"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.bounds = None
+        self.values = None
+        self.ids = None
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def update(self, values):
+        self.values = values
+        return self
+
+    def in_(self, column, ids):
+        self.ids = set(ids)
+        return self
+
+    def execute(self):
+        self.client.requests += 1
+        rows = self.client.tables[self.table]
+        if self.values is not None:
+            for row in rows:
+                if row["id"] in self.ids:
+                    row.update(self.values)
+            return SimpleNamespace(data=[])
+        start, end = self.bounds
+        return SimpleNamespace(data=[dict(row) for row in rows[start:end + 1]])
+
+
+class _FakeSupabase:
+    """products/reviews 테이블을 메모리에 둔 Supabase 클라이언트 대역"""
+
+    def __init__(self, products, reviews):
+        self.tables = {"products": products, "reviews": reviews}
+        self.requests = 0
+        self.rpc_calls = []
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        self.rpc_calls.append((name, params))
+        data = 3 if name == "rebuild_product_rating_stats" else [{"checked": 200, "stats_fixed": 1, "products_fixed": 2}]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=data))
+
+
+def test_case_1_aggregate():
+    """테스트 케이스 1: 합계/개수/분포 증감"""
+    print("=" * 80)
+    print("테스트 1: 평점 집계")
+    print("=" * 80)
+
+    aggregates = aggregate_ratings([
+        {"product_id": 1, "rating": 5},
+        {"product_id": 1, "rating": 4},
+        {"product_id": 1, "rating": None},
+        {"product_id": 2, "rating": 1},
+        {"product_id": None, "rating": 3}
+    ])
+    print(f"제품 1: {aggregates[1].to_row(1)}")
+    assert aggregates[1].rating_avg == 4.5 and aggregates[1].rating_count == 2
+    assert aggregates[1].to_row(1)["rating_5"] == 1
+    assert set(aggregates) == {1, 2}
+
+    aggregates[1].add(5, sign=-1)
+    aggregates[1].add(7)
+    assert aggregates[1].rating_sum == 4 and aggregates[1].histogram == [0, 0, 0, 1, 0]
+    assert RatingAggregate().rating_avg == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_client_side_rebuild():
+    """테스트 케이스 2: 페이지 단위 한 번 조회 + 바뀐 제품만 묶어서 갱신"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 클라이언트 재집계")
+    print("=" * 80)
+
+    products = [{"id": pid, "rating_avg": None, "rating_count": None} for pid in range(1, 51)]
+    products[0].update(rating_avg=4.5, rating_count=2)          # 이미 맞음
+    products[1].update(rating_avg=0, rating_count=0)            # 리뷰 없음, 이미 맞음
+    reviews = [{"id": 1, "product_id": 1, "rating": 5}, {"id": 2, "product_id": 1, "rating": 4}]
+    reviews += [{"id": 10 + i, "product_id": 3 + i % 48, "rating": 4} for i in range(480)]
+    client = _FakeSupabase(products, reviews)
+
+    aggregates = ProductRatingAggregates(client)
+    dry = aggregates.rebuild_client_side(page_size=100, dry_run=True)
+    print(f"점검: {dry}")
+    assert dry["changed"] == 48 and products[2]["rating_count"] is None
+
+    stats = aggregates.rebuild_client_side(page_size=100)
+    print(f"갱신: {stats}")
+    assert stats["reviews"] == 482 and stats["products"] == 50
+    assert stats["changed"] == 48
+    # 리뷰 5페이지 + 제품 1페이지 + 같은 값(4.0, 10개) 제품 48개를 한 번에 갱신
+    assert stats["requests"] == 5 + 1 + 1
+    assert products[2]["rating_avg"] == 4.0 and products[2]["rating_count"] == 10
+    assert aggregates.rebuild_client_side(page_size=100, dry_run=True)["changed"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_rpc():
+    """테스트 케이스 3: SQL 함수 호출 (전체 재집계/정합성 확인)"""
+    print("\n" + "=" * 80)
+    print("테스트 3: SQL 함수 호출")
+    print("=" * 80)
+
+    client = _FakeSupabase([], [])
+    aggregates = ProductRatingAggregates(client)
+    assert aggregates.rebuild() == 3
+    assert aggregates.reconcile(limit=200) == {"checked": 200, "stats_fixed": 1, "products_fixed": 2}
+    assert client.rpc_calls[1] == ("reconcile_product_rating_stats", {"p_limit": 200})
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 rating_aggregates.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_aggregate()
+        test_case_2_client_side_rebuild()
+        test_case_3_rpc()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
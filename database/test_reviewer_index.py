@@ -0,0 +1,181 @@
+"""
+reviewer_index.py 테스트 스크립트
+"""
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.reviewer_index import (
+    SKETCH_REGISTERS,
+    HyperLogLog,
+    ReviewerIndex,
+    estimate_overlap,
+    normalize_author
+)
+
+
+class _FakeQuery:
+    """Supabase 쿼리 빌더 대역 (select/in_만 지원)"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.columns = None
+        self.ids = None
+
+    def select(self, columns):
+        self.columns = columns.split(",")
+        return self
+
+    def in_(self, column, ids):
+        self.ids = set(ids)
+        return self
+
+    def execute(self):
+        self.client.requests += 1
+        rows = [row for row in self.client.tables[self.table] if str(row["product_id"]) in self.ids]
+        return SimpleNamespace(data=[{key: row.get(key) for key in self.columns} for row in rows])
+
+
+class _FakeSupabase:
+    """product_reviewer_stats 테이블을 메모리에 둔 Supabase 클라이언트 대역"""
+
+    def __init__(self, stats_rows):
+        self.tables = {"product_reviewer_stats": stats_rows}
+        self.requests = 0
+        self.rpc_calls = []
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+    def rpc(self, name, params=None):
+        self.rpc_calls.append((name, params))
+        data = 12 if name == "rebuild_reviewer_index" else [
+            {"author_key": "kim", "review_count": 1, "product_count": 3, "other_product_ids": [2, 3]}
+        ]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=data))
+
+
+def test_case_1_normalize_author():
+    """테스트 케이스 1: 작성자 정규화 (SQL reviewer_key()와 같은 규칙)"""
+    print("=" * 80)
+    print("테스트 1: 작성자 정규화")
+    print("=" * 80)
+
+    assert normalize_author("  Kim   Min\tJi ") == "kim min ji"
+    assert normalize_author("KIM MIN JI") == normalize_author("kim min ji")
+    for placeholder in (None, "", "   ", "Anonymous", "iHerb Customer", "익명"):
+        assert normalize_author(placeholder) is None, placeholder
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_hyperloglog():
+    """테스트 케이스 2: 작성자 수 추정 오차, 합치기, 겹치는 작성자 추정"""
+    print("\n" + "=" * 80)
+    print("테스트 2: HyperLogLog")
+    print("=" * 80)
+
+    for size in (10, 1000, 50_000):
+        sketch = HyperLogLog().update(f"user{i}" for i in range(size))
+        error = abs(sketch.count() - size) / size
+        print(f"작성자 {size:,}명 → 추정 {sketch.count():,.0f} (오차 {error:.1%})")
+        assert error < 0.06
+
+    # 같은 작성자를 다시 넣어도 값이 바뀌지 않음
+    sketch = HyperLogLog().update(["kim", "lee", "park"])
+    registers = bytes(sketch.registers)
+    sketch.update(["kim", "lee"])
+    assert bytes(sketch.registers) == registers
+
+    # 합치기 = 합집합을 한 번에 넣은 스케치
+    a = HyperLogLog().update(f"user{i}" for i in range(0, 20_000))
+    b = HyperLogLog().update(f"user{i}" for i in range(15_000, 30_000))
+    union = HyperLogLog().update(f"user{i}" for i in range(0, 30_000))
+    assert a.merge(b).registers == union.registers
+
+    overlap = estimate_overlap(a, b)
+    print(f"겹치는 작성자 5,000명 → 추정 {overlap:,.0f}")
+    assert 3_500 < overlap < 6_500
+
+    # SQL에서 읽은 레지스터(정수 목록)로 복원
+    restored = HyperLogLog(list(a.registers))
+    assert restored.count() == a.count()
+    try:
+        HyperLogLog([0] * (SKETCH_REGISTERS - 1))
+        assert False, "레지스터 수 검사 실패"
+    except ValueError:
+        pass
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_index_lookups():
+    """테스트 케이스 3: 제품 집계/스케치 조회는 제품 목록당 요청 한 번"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 인덱스 조회")
+    print("=" * 80)
+
+    rng = random.Random(5)
+    sketch_1 = HyperLogLog().update(f"user{i}" for i in range(3000))
+    sketch_2 = HyperLogLog().update(f"user{i}" for i in range(2000, 4000))
+    sketch_3 = HyperLogLog().update(f"other{rng.random()}" for _ in range(500))
+    client = _FakeSupabase([
+        {"product_id": 1, "review_count": 3200, "reviewer_count": 3000, "shared_reviewer_count": 1000,
+         "reviewer_sketch": list(sketch_1.registers)},
+        {"product_id": 2, "review_count": 2000, "reviewer_count": 2000, "shared_reviewer_count": 1000,
+         "reviewer_sketch": list(sketch_2.registers)},
+        {"product_id": 3, "review_count": 500, "reviewer_count": 500, "shared_reviewer_count": 0,
+         "reviewer_sketch": list(sketch_3.registers)}
+    ])
+    index = ReviewerIndex(client)
+
+    stats = index.product_stats([1, 2])
+    print(f"제품 집계: {stats}")
+    assert stats["1"] == {"review_count": 3200, "reviewer_count": 3000, "shared_reviewer_count": 1000}
+    assert client.requests == 1
+
+    overlap = index.competitor_overlap(1, [2, 3, 99])
+    print(f"경쟁 제품 겹침: { {key: round(value) for key, value in overlap.items()} }")
+    assert 800 < overlap["2"] < 1200 and overlap["3"] < 100 and overlap["99"] == 0.0
+    assert client.requests == 2
+
+    assert index.shared_reviewers(1, limit=10)[0]["other_product_ids"] == [2, 3]
+    assert client.rpc_calls[0] == ("product_shared_reviewers", {"p_product_id": 1, "p_limit": 10})
+    assert index.rebuild() == 12
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 reviewer_index.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_normalize_author()
+        test_case_2_hyperloglog()
+        test_case_3_index_lookups()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
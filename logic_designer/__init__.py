@@ -3,10 +3,27 @@
 검증 로직과 AI 분석을 통합한 파이프라인
 """
 
+import time
 from typing import Dict, Optional
 from .checklist import AdChecklist, check_ad_patterns
 from .trust_score import TrustScoreCalculator, calculate_trust_score
-from .analyzer import PharmacistAnalyzer
+from .analyzer import PharmacistAnalyzer, get_pharmacist_analyzer
+from .stream_parser import IncrementalJSONParser
+from .model_router import ModelRouter, default_router
+from .dedup import NearDuplicateIndex, default_dedup_index
+from .local_extractor import LocalExtractor, extract_local
+from .pre_classifier import PreClassifier, get_pre_classifier
+from .pipeline import (
+    DISCLAIMER,
+    analyze_batch,
+    resolve_without_llm,
+    run_llm_analysis,
+    run_rule_stage,
+    too_short_result
+)
+from .incremental import model_version, refresh_analysis, rule_pack_version
+from .shadow import RulePack, run_shadow
+from core.background_tasks import background_tasks
 
 
 def analyze(
@@ -18,8 +35,14 @@ def analyze(
     photo_score: float = 0,
     consistency_score: float = 50,
     api_key: Optional[str] = None,
-    model: str = "claude-sonnet-4-5-20250929",
-    use_nutrition_validation: bool = True
+    model: Optional[str] = None,
+    use_nutrition_validation: bool = True,
+    router: Optional[ModelRouter] = None,
+    speculative: bool = False,
+    deadline_ms: Optional[float] = None,
+    reuse_similar: bool = False,
+    local_only: bool = False,
+    pre_classify: bool = False
 ) -> Dict:
     """
     리뷰 종합 분석 통합 함수 (영양성분 DB 통합, 안전한 방식)
@@ -39,8 +62,26 @@ def analyze(
         photo_score: 사진 점수 (기본값: 0)
         consistency_score: 일치도 점수 (기본값: 50)
         api_key: Anthropic API 키 (선택)
-        model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
+        model: 사용할 Claude 모델 (기본값: None → 모델 라우터가 자동 선택)
         use_nutrition_validation: 영양성분 검증 사용 여부 (기본값: True)
+        router: 모델 라우터 (기본값: None → default_router 사용)
+                빠른 모델을 기본으로 쓰고 경계선 점수/긴 리뷰/검증 실패 시에만 대형 모델 사용
+        speculative: AI 분석을 규칙 검사와 동시에 시작할지 여부 (기본값: False)
+                     광고로 판별되면 AI 분석을 취소(실행 중이면 결과 폐기)합니다.
+                     신뢰도 점수 전에 시작하므로 라우터는 리뷰 길이 기준으로만 모델을 고릅니다.
+        deadline_ms: 전체 응답 마감 시간 (밀리초, 기본값: None → AI 분석 완료까지 대기)
+                     마감 시간까지 AI 분석이 끝나지 않으면 검증 결과만 즉시 반환하고
+                     analysis_pending=True와 analysis_handle을 함께 반환합니다.
+                     AI 분석은 백그라운드에서 계속 진행되며 get_analysis_result(handle)로 조회합니다.
+        reuse_similar: 거의 같은 리뷰의 이전 AI 분석 결과 재사용 여부 (기본값: False, 명시적으로 켠 경우만)
+                       MinHash 추정 유사도가 기준 이상이고 제품/언급 성분이 같을 때만 재사용하며,
+                       부정어 하나만 다른 리뷰("부작용 없어요"/"부작용 있어요")도 재사용될 수 있습니다.
+                       재사용한 결과에는 reused=True와 reuse_similarity가 표시됩니다.
+        local_only: AI 호출 없이 로컬 규칙 기반 추출기로만 분석할지 여부 (기본값: False)
+                    결과에는 confidence="low", source="local_rules"가 표시됩니다 (대시보드용).
+        pre_classify: 로컬 사전 분류기로 확실한 경우 AI 호출을 생략할지 여부 (기본값: False)
+                      확실한 광고는 AI 분석을 생략하고, 확실한 정상 리뷰는 로컬 추출기로 분석하며,
+                      불확실한 경우에만 AI 분석을 수행합니다. 판정은 validation["pre_classifier"]에 기록됩니다.
 
     Returns:
         Dict: {
@@ -51,7 +92,9 @@ def analyze(
                 "base_score": 기본 점수,
                 "nutrition_score": 영양성분 일치도 점수 (선택적),
                 "penalty": 감점 점수,
-                "detected_count": 감지된 항목 개수
+                "detected_count": 감지된 항목 개수,
+                "pre_classifier": 사전 분류 결과 (pre_classify=True인 경우),
+                "rule_input": 규칙 검사 구간 통계 (RULE_WINDOW_CHARS보다 긴 리뷰인 경우)
             },
             "analysis": {
                 "summary": "리뷰 요약",
@@ -60,131 +103,138 @@ def analyze(
                 "tip": "약사의 핵심 조언",
                 "disclaimer": "부인 공지",
                 "ingredient_validation": 성분 검증 결과 (선택적)
-            } 또는 None (광고인 경우)
+            } 또는 None (광고인 경우),
+            "analysis_pending": AI 분석 진행 중 여부 (deadline_ms 초과 시에만 포함),
+            "analysis_handle": AI 분석 결과 조회 핸들 (deadline_ms 초과 시에만 포함)
         }
     """
+    started_at = time.monotonic()
+
     # 입력 검증: 리뷰가 너무 짧으면 오류 반환
     if len(review_text.strip()) < 10:
-        return {
-            "error": "REVIEW_TOO_SHORT",
-            "message": "리뷰가 너무 짧습니다 (최소 10자 이상)",
-            "validation": None,
-            "analysis": None
-        }
-
-    # 1단계: 광고 패턴 검사 (영양성분 DB 통합)
-    try:
-        checklist = AdChecklist()
-        detected_issues = checklist.check_ad_patterns(review_text, product_id)
-        penalty_count = len(detected_issues)
-    except Exception:
-        # 체크리스트 검사 실패 시 기본값 사용
-        detected_issues = {}
-        penalty_count = 0
-
-    # 2단계: 신뢰도 점수 계산 (영양성분 일치도 포함)
-    try:
-        calculator = TrustScoreCalculator()
-        score_result = calculator.calculate_final_score(
-            length_score=length_score,
-            repurchase_score=repurchase_score,
-            monthly_use_score=monthly_use_score,
-            photo_score=photo_score,
-            consistency_score=consistency_score,
-            penalty_count=penalty_count,
-            review_text=review_text if use_nutrition_validation else None,
-            product_id=product_id if use_nutrition_validation else None,
-            use_nutrition_score=use_nutrition_validation
+        return too_short_result()
+
+    analysis_product_id = product_id if use_nutrition_validation else None
+
+    # 투기적 실행: 규칙 단계와 동시에 AI 분석 시작 (마지막에 결과 합침)
+    speculative_handle = None
+    if speculative and not local_only:
+        speculative_handle = background_tasks.submit(
+            run_llm_analysis,
+            review_text,
+            analysis_product_id,
+            api_key,
+            model,
+            router,
+            None,
+            reuse_similar
         )
-    except Exception:
-        # 점수 계산 실패 시 기본값 사용
-        score_result = {
-            "base_score": 50.0,
-            "nutrition_score": 50.0,
-            "penalty": penalty_count * 10,
-            "final_score": max(0, 50.0 - (penalty_count * 10)),
-            "raw_scores": {
-                "L": length_score,
-                "R": repurchase_score,
-                "M": monthly_use_score,
-                "P": photo_score,
-                "C": consistency_score,
-                "N": 50.0
-            }
-        }
 
-    # 3단계: 광고 여부 판별
-    try:
-        is_ad = calculator.is_ad(
-            final_score=score_result["final_score"],
-            penalty_count=penalty_count
-        )
-    except Exception:
-        # 광고 판별 실패 시 기본값 사용
-        is_ad = score_result["final_score"] < 40 or penalty_count >= 3
-
-    # 감점 사유 리스트 생성
-    reasons = [f"{num}. {name}" for num, name in detected_issues.items()]
-
-    validation_result = {
-        "trust_score": score_result["final_score"],
-        "is_ad": is_ad,
-        "reasons": reasons,
-        "base_score": score_result["base_score"],
-        "penalty": score_result["penalty"],
-        "detected_count": penalty_count,
-        "raw_scores": score_result["raw_scores"]
-    }
-    
-    # 영양성분 점수 추가 (있는 경우)
-    if "nutrition_score" in score_result:
-        validation_result["nutrition_score"] = score_result["nutrition_score"]
-
-    # 4단계: 광고가 아닌 경우에만 AI 분석 수행 (영양성분 정보 포함)
-    analysis_result = None
-    if not is_ad:
-        try:
-            analyzer = PharmacistAnalyzer(api_key=api_key)
-            analysis_result = analyzer.analyze_safe(
-                review_text, 
-                product_id=product_id if use_nutrition_validation else None,
-                model=model
-            )
-        except Exception as e:
-            analysis_result = {
-                "error": "ANALYSIS_ERROR",
-                "message": str(e),
-                "summary": "분석 실패",
-                "efficacy": "정보 없음",
-                "side_effects": "정보 없음",
-                "tip": "분석 중 오류가 발생했습니다.",
-                "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
-            }
+    # 1~3단계: 광고 패턴 검사 → 신뢰도 점수 → 광고 판별 (→ 사전 분류)
+    validation_result, trust_score, pre_decision = run_rule_stage(
+        review_text,
+        product_id,
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score,
+        use_nutrition_validation=use_nutrition_validation,
+        pre_classify=pre_classify,
+        local_only=local_only
+    )
+
+    # 4단계: 광고가 아니고 로컬로 결정되지 않은 경우에만 AI 분석 수행 (영양성분 정보 포함)
+    pending_handle = None
+    analysis_result = resolve_without_llm(review_text, validation_result["is_ad"], pre_decision, local_only)
+    if analysis_result is not None:
+        # AI 분석 생략 (투기적으로 시작한 AI 분석은 취소)
+        if speculative_handle is not None:
+            background_tasks.cancel(speculative_handle)
     else:
-        # 광고인 경우 분석 생략
-        analysis_result = {
-            "error": "AD_REVIEW",
-            "message": "광고 리뷰는 분석하지 않습니다.",
-            "summary": "광고 리뷰",
-            "efficacy": "정보 없음",
-            "side_effects": "정보 없음",
-            "tip": "이 리뷰는 광고로 판별되어 분석하지 않습니다.",
-            "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
-        }
-
-    return {
+        llm_args = (
+            review_text,
+            analysis_product_id,
+            api_key,
+            model,
+            router,
+            trust_score,
+            reuse_similar
+        )
+        if deadline_ms is None:
+            if speculative_handle is not None:
+                analysis_result = background_tasks.wait(speculative_handle)
+            else:
+                analysis_result = run_llm_analysis(*llm_args)
+        else:
+            # 마감 시간까지만 기다리고, 초과 시 AI 분석은 백그라운드에서 계속 진행
+            handle = speculative_handle or background_tasks.submit(run_llm_analysis, *llm_args)
+            remaining = deadline_ms / 1000 - (time.monotonic() - started_at)
+            analysis_result = background_tasks.poll(handle, timeout=max(0.0, remaining))
+            if analysis_result is None:
+                pending_handle = handle
+                analysis_result = {
+                    "analysis_pending": True,
+                    "handle": handle,
+                    "message": "AI 분석이 진행 중입니다. get_analysis_result(handle)로 결과를 조회하세요.",
+                    "summary": "AI 분석 진행 중",
+                    "efficacy": "정보 없음",
+                    "side_effects": "정보 없음",
+                    "tip": "AI 분석 결과는 잠시 후 제공됩니다.",
+                    "disclaimer": DISCLAIMER
+                }
+
+    result = {
         "validation": validation_result,
         "analysis": analysis_result
     }
+    if pending_handle is not None:
+        result["analysis_pending"] = True
+        result["analysis_handle"] = pending_handle
+    return result
+
+
+def get_analysis_result(handle: str, timeout: float = 0.0) -> Optional[Dict]:
+    """
+    analyze(deadline_ms=...)가 analysis_pending으로 반환한 AI 분석 결과 조회
+
+    Args:
+        handle: analyze() 결과의 analysis_handle
+        timeout: 최대 대기 시간 (초, 기본값: 0 → 대기하지 않음)
+
+    Returns:
+        Dict: AI 분석 결과 또는 None (아직 진행 중)
+
+    Raises:
+        KeyError: 알 수 없는(또는 보관 기간이 지난) 핸들
+    """
+    return background_tasks.poll(handle, timeout=timeout)
 
 
 __all__ = [
     "analyze",
+    "analyze_batch",
+    "get_analysis_result",
     "AdChecklist",
     "check_ad_patterns",
     "TrustScoreCalculator",
     "calculate_trust_score",
-    "PharmacistAnalyzer"
+    "PharmacistAnalyzer",
+    "get_pharmacist_analyzer",
+    "IncrementalJSONParser",
+    "ModelRouter",
+    "default_router",
+    "NearDuplicateIndex",
+    "default_dedup_index",
+    "LocalExtractor",
+    "extract_local",
+    "PreClassifier",
+    "get_pre_classifier",
+    "refresh_analysis",
+    "rule_pack_version",
+    "model_version",
+    "RulePack",
+    "run_shadow"
 ]
 
 
@@ -4,9 +4,18 @@
 """
 
 import os
-import json
-from typing import Dict, Optional
-from anthropic import Anthropic
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from core.structured_output import StructuredOutputError, build_tool_schema, repair_json, parse_metrics
+from core.client_pool import get_anthropic_client, get_shared_analyzer
+from core.usage_metrics import usage_tracker
+from core.stage_metrics import stage_metrics
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.length_policy import LLM_TOKEN_BUDGET, select_excerpt
+from .stream_parser import IncrementalJSONParser
+from .local_extractor import default_local_extractor
 from .nutrition_utils import (
     get_nutrition_info_safe,
     extract_ingredients,
@@ -15,9 +24,57 @@ from .nutrition_utils import (
 )
 
 
+class IngredientValidationOutput(BaseModel):
+    """AI가 보고하는 성분 검증 결과"""
+    mentioned_ingredients: List[str] = Field(default_factory=list, description="리뷰에서 언급된 성분 목록")
+    valid_ingredients: List[str] = Field(default_factory=list, description="실제 제품에 포함된 성분")
+    invalid_claims: List[str] = Field(default_factory=list, description="허위 주장 목록 (있는 경우)")
+
+
+class PharmacistAnalysisOutput(BaseModel):
+    """약사 분석 결과 스키마 (tool-use 입력 스키마로 사용)"""
+    summary: str = Field(description="리뷰 한 줄 요약 (사용자 체감 중심, 30자 이내)")
+    efficacy: str = Field(description="효능 관련 내용 (원문 근거만, 공식 효능과 비교). 없으면 '정보 없음'")
+    side_effects: str = Field(description="부작용 관련 내용. 없으면 '정보 없음'")
+    tip: str = Field(description="약사의 핵심 조언 (50자 이내, 영양성분 정보 기반)")
+    ingredient_validation: Optional[IngredientValidationOutput] = Field(
+        default=None,
+        description="영양성분 정보가 제공된 경우에만 포함"
+    )
+
+    @field_validator("summary", "efficacy", "side_effects", "tip", mode="before")
+    @classmethod
+    def _join_list_values(cls, value: Any) -> Any:
+        """문자열 대신 목록으로 응답한 경우 하나의 문자열로 합침"""
+        if isinstance(value, list):
+            return ", ".join(str(v) for v in value) if value else "정보 없음"
+        return value
+
+
 class PharmacistAnalyzer:
     """15년 경력 임상 약사 페르소나 기반 AI 분석기"""
 
+    # 스키마 강제 출력용 tool 정의
+    ANALYSIS_TOOL = build_tool_schema(
+        PharmacistAnalysisOutput,
+        name="record_pharmacist_analysis",
+        description="건강기능식품 리뷰에 대한 약사 분석 결과를 기록합니다."
+    )
+
+    # 파싱 실패 시 재호출 횟수 (로컬 복구 실패 후에만 재호출)
+    MAX_PARSE_RETRIES = 1
+    PARSE_METRICS_SOURCE = "logic_designer.analyzer"
+
+    # 프롬프트에 넣는 리뷰 본문 토큰 예산 (초과 시 핵심 문장만 발췌)
+    INPUT_TOKEN_BUDGET = LLM_TOKEN_BUDGET
+
+    # 기본 분석 모델
+    DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+
+    # 일관성 있는 분석을 위해 낮은 temperature
+    # (SDK 버전에 따라 messages.create()/stream()에 temperature 인자가 없으므로 요청 본문으로 전달)
+    SAMPLING_PARAMS = {"temperature": 0.3}
+
     SYSTEM_PROMPT = """당신은 15년 경력의 임상 약사입니다.
 
 **역할 및 태도:**
@@ -46,7 +103,7 @@ class PharmacistAnalyzer:
 "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
 
 **출력 형식:**
-반드시 다음 JSON 형식으로 응답하세요:
+반드시 record_pharmacist_analysis 도구를 호출하여 다음 JSON 형식으로 응답하세요:
 {
   "summary": "리뷰 한 줄 요약 (사용자 체감 중심, 30자 이내)",
   "efficacy": "효능 관련 내용 (원문 근거만, 공식 효능과 비교)",
@@ -83,12 +140,19 @@ class PharmacistAnalyzer:
 본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다.
 """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = DEFAULT_MODEL,
+        client: Optional[Any] = None
+    ):
         """
         약사 분석기 초기화
 
         Args:
             api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            model: 기본 Claude 모델 (analyze()에서 model을 지정하지 않은 경우 사용)
+            client: 사용할 Anthropic 클라이언트 (None인 경우 API 키별 공유 클라이언트)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -97,13 +161,18 @@ class PharmacistAnalyzer:
                 "환경변수 ANTHROPIC_API_KEY를 설정하거나 api_key 매개변수를 전달하세요."
             )
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.model = model
+        self.client = client or get_anthropic_client(self.api_key)
+
+        # API 장애 시 호출을 즉시 차단하고 백그라운드 프로브로 복구 확인
+        self.breaker = CircuitBreaker(name=f"pharmacist_analyzer:{model}", probe=self.probe)
 
     def analyze(
         self, 
         review_text: str, 
         product_id: Optional[int] = None,
-        model: str = "claude-sonnet-4-5-20250929"
+        model: Optional[str] = None,
+        timeout: Optional[float] = None
     ) -> Dict:
         """
         리뷰를 약사 페르소나로 분석 (영양성분 DB 통합)
@@ -111,7 +180,8 @@ class PharmacistAnalyzer:
         Args:
             review_text: 분석할 리뷰 텍스트
             product_id: 제품 ID (제공 시 영양성분 정보 포함, 없어도 오류 없음)
-            model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
+            model: 사용할 Claude 모델 (None인 경우 self.model)
+            timeout: 재호출을 포함한 API 호출 전체 제한 시간 (초, None이면 SDK 기본값)
 
         Returns:
             Dict: {
@@ -120,18 +190,247 @@ class PharmacistAnalyzer:
                 "side_effects": "부작용 관련 내용",
                 "tip": "약사의 핵심 조언",
                 "disclaimer": "부인 공지",
-                "ingredient_validation": 성분 검증 결과 (선택적)
+                "ingredient_validation": 성분 검증 결과 (선택적),
+                "input_truncation": 발췌 통계 (토큰 예산을 넘어 본문을 발췌한 경우)
             }
 
         Raises:
             ValueError: 리뷰 텍스트가 10자 미만인 경우
+            StructuredOutputError: 재호출 후에도 응답을 스키마로 파싱하지 못한 경우
             Exception: API 호출 실패 시
         """
+        # 1~2. 입력 검증, 영양성분 정보 조회, AI 프롬프트 생성 (긴 리뷰는 핵심 문장 발췌)
+        user_prompt, nutrition_info, truncation = self._prepare_prompt(review_text, product_id)
+        model = model or self.model
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        result = None
+        parse_error = None
+        with usage_tracker.track(self.PARSE_METRICS_SOURCE, model) as call:
+            for attempt in range(self.MAX_PARSE_RETRIES + 1):
+                request_options = {}
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        call.outcome = "timeout"
+                        raise TimeoutError("AI 분석 제한 시간을 초과했습니다.")
+                    request_options["timeout"] = remaining
+                try:
+                    # 3. Anthropic API 호출 (tool-use로 출력 스키마 강제)
+                    response = self.client.messages.create(
+                        model=model,
+                        max_tokens=1000,
+                        system=self.SYSTEM_PROMPT,
+                        tools=[self.ANALYSIS_TOOL],
+                        tool_choice={"type": "tool", "name": self.ANALYSIS_TOOL["name"]},
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": user_prompt
+                            }
+                        ],
+                        extra_body=self.SAMPLING_PARAMS,
+                        **request_options
+                    )
+                except Exception as e:
+                    call.add_failed_attempt()
+                    call.outcome = "api_error"
+                    raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+                call.add_response(response)
+
+                # 4. 구조화 출력 추출 (tool 입력 → 실패 시 로컬 복구 → 그래도 실패 시 재호출)
+                with stage_metrics.time("json_parse"):
+                    result, repaired, parse_error = self._extract_result(response)
+                if result is not None:
+                    if attempt > 0:
+                        outcome = "retried"
+                    else:
+                        outcome = "repaired" if repaired else "structured"
+                    parse_metrics.record(self.PARSE_METRICS_SOURCE, outcome)
+                    call.outcome = outcome
+                    break
+
+            if result is None:
+                parse_metrics.record(self.PARSE_METRICS_SOURCE, "failed")
+                call.outcome = "failed"
+                raise StructuredOutputError(f"AI 응답 파싱 실패: {parse_error}")
+
+        # 5. 부인 공지 추가
+        result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+
+        # 6. 영양성분 검증 결과 추가 (있는 경우)
+        if nutrition_info:
+            ingredient_validation = self._validate_ingredients(review_text, nutrition_info)
+            result["ingredient_validation"] = ingredient_validation
+
+        # 7. 발췌 통계 추가 (본문을 줄인 경우)
+        if truncation["truncated"]:
+            result["input_truncation"] = truncation
+
+        return result
+
+    def _extract_result(self, response: Any) -> Tuple[Optional[Dict], bool, Optional[str]]:
+        """
+        API 응답에서 분석 결과 추출 및 스키마 검증
+
+        tool_use 블록의 입력을 우선 사용하고, 없으면 텍스트 블록을
+        로컬에서 복구(코드 펜스/설명 문구/후행 쉼표 제거 등)하여 사용합니다.
+
+        Args:
+            response: messages API 응답
+
+        Returns:
+            Tuple[Optional[Dict], bool, Optional[str]]: (결과, 로컬 복구 여부, 오류 메시지)
+        """
+        tool_input = None
+        texts = []
+        for block in getattr(response, "content", None) or []:
+            block_type = getattr(block, "type", None)
+            if block_type == "tool_use" and getattr(block, "name", None) == self.ANALYSIS_TOOL["name"]:
+                tool_input = block.input
+            elif block_type == "text":
+                texts.append(block.text)
+
+        repaired = False
+        if not isinstance(tool_input, dict):
+            tool_input = repair_json("\n".join(texts))
+            repaired = True
+            if tool_input is None:
+                return None, repaired, "응답에서 JSON 객체를 찾을 수 없습니다"
+
+        try:
+            validated = PharmacistAnalysisOutput.model_validate(tool_input)
+        except ValidationError as e:
+            stage_metrics.record_error("json_parse", e)
+            return None, repaired, f"스키마 검증 실패: {e.error_count()}개 필드 오류"
+
+        return validated.model_dump(exclude_none=True), repaired, None
+
+    def analyze_stream(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None,
+        model: Optional[str] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        리뷰를 스트리밍 방식으로 분석 (필드가 완성되는 즉시 반환)
+
+        전체 응답을 기다리지 않고, summary → efficacy → side_effects → tip
+        순서로 각 필드가 완성될 때마다 (필드명, 값)을 yield합니다.
+        마지막에 disclaimer, ingredient_validation(선택적), input_truncation(발췌한 경우)을 yield합니다.
+        스트림 연결은 서킷 브레이커를 거치며, 최종 메시지가 도착하면 토큰 사용량을 기록합니다.
+
+        Args:
+            review_text: 분석할 리뷰 텍스트
+            product_id: 제품 ID (제공 시 영양성분 정보 포함, 없어도 오류 없음)
+            model: 사용할 Claude 모델 (None인 경우 self.model)
+
+        Yields:
+            Tuple[str, Any]: (필드명, 값)
+
+        Raises:
+            ValueError: 리뷰 텍스트가 10자 미만인 경우
+            CircuitOpenError: 서킷이 열려 있는 경우 (요청을 보내지 않음)
+            StructuredOutputError: 필수 필드 누락 등 스키마 검증 실패 시
+            Exception: API 호출 실패 시
+        """
+        user_prompt, nutrition_info, truncation = self._prepare_prompt(review_text, product_id)
+        model = model or self.model
+        parser = IncrementalJSONParser()
+
+        with usage_tracker.track(self.PARSE_METRICS_SOURCE, model) as call, ExitStack() as stack:
+            # 스트림 연결(요청 전송 ~ 응답 헤더)을 서킷 브레이커로 감싸 API 장애 시 즉시 차단
+            try:
+                stream = self.breaker.call(stack.enter_context, self._open_stream(model, user_prompt))
+            except CircuitOpenError:
+                call.outcome = "circuit_open"
+                raise
+            except Exception as e:
+                call.add_failed_attempt()
+                call.outcome = "api_error"
+                raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+            try:
+                for event in stream:
+                    if event.type != "content_block_delta":
+                        continue
+                    # tool 입력(JSON 조각) 또는 텍스트 조각을 점진 파서에 전달
+                    chunk = getattr(event.delta, "partial_json", None) or getattr(event.delta, "text", None)
+                    for field, value in parser.feed(chunk):
+                        yield field, value
+                final_message = stream.get_final_message()
+            except GeneratorExit:
+                call.add_failed_attempt()
+                call.outcome = "cancelled"
+                raise
+            except Exception as e:
+                call.add_failed_attempt()
+                call.outcome = "api_error"
+                raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+            # 최종 메시지 도착 시 토큰 사용량 기록 후 스키마 검증
+            call.add_response(final_message)
+            try:
+                PharmacistAnalysisOutput.model_validate(parser.fields)
+            except ValidationError as e:
+                parse_metrics.record(self.PARSE_METRICS_SOURCE, "failed")
+                call.outcome = "failed"
+                raise StructuredOutputError(f"AI 응답 파싱 실패: 스키마 검증 실패: {e.error_count()}개 필드 오류")
+            parse_metrics.record(self.PARSE_METRICS_SOURCE, "structured")
+            call.outcome = "structured"
+
+        yield "disclaimer", "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+
+        if nutrition_info:
+            yield "ingredient_validation", self._validate_ingredients(review_text, nutrition_info)
+
+        if truncation["truncated"]:
+            yield "input_truncation", truncation
+
+    def _open_stream(self, model: str, user_prompt: str) -> Any:
+        """스트리밍 요청 컨텍스트 매니저 생성 (진입 시 요청 전송)"""
+        return self.client.messages.stream(
+            model=model,
+            max_tokens=1000,
+            system=self.SYSTEM_PROMPT,
+            tools=[self.ANALYSIS_TOOL],
+            tool_choice={"type": "tool", "name": self.ANALYSIS_TOOL["name"]},
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            extra_body=self.SAMPLING_PARAMS
+        )
+
+    def _prepare_prompt(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None
+    ) -> Tuple[str, Optional[Dict], Dict]:
+        """
+        입력 검증 후 영양성분 정보를 조회하고 프롬프트 생성
+
+        리뷰 본문이 INPUT_TOKEN_BUDGET을 넘으면 성분/효능/부작용/복용 기간을
+        언급한 문장 위주로 발췌하여 프롬프트에 넣습니다.
+
+        Args:
+            review_text: 리뷰 텍스트
+            product_id: 제품 ID (선택적)
+
+        Returns:
+            Tuple[str, Optional[Dict], Dict]: (사용자 프롬프트, 영양성분 정보, 발췌 통계)
+
+        Raises:
+            ValueError: 리뷰 텍스트가 10자 미만인 경우
+        """
         # 입력 검증: 리뷰가 너무 짧으면 오류 반환
         if len(review_text.strip()) < 10:
             raise ValueError("리뷰 텍스트가 너무 짧습니다 (최소 10자 이상)")
-        
-        # 1. 영양성분 정보 조회 (실패해도 계속 진행)
+
+        # 영양성분 정보 조회 (실패해도 계속 진행)
         nutrition_info = None
         if product_id:
             try:
@@ -140,49 +439,15 @@ class PharmacistAnalyzer:
             except Exception:
                 # 예외 발생해도 분석은 계속 (기본 모드로 동작)
                 nutrition_info = None
-        
-        # 2. AI 프롬프트 생성 (영양성분 정보가 있으면 포함, 없으면 기본 프롬프트)
-        user_prompt = self._build_enhanced_prompt(review_text, nutrition_info)
-
-        try:
-            # 3. Anthropic API 호출
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=1000,
-                temperature=0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-                system=self.SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
-            )
-
-            # 4. JSON 파싱
-            content = response.content[0].text
-            result = json.loads(content)
 
-            # 5. 필수 필드 검증
-            required_fields = ["summary", "efficacy", "side_effects", "tip"]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"필수 필드 누락: {field}")
+        excerpt, truncation = select_excerpt(
+            review_text,
+            token_budget=self.INPUT_TOKEN_BUDGET,
+            salience=default_local_extractor.salience
+        )
 
-            # 6. 부인 공지 추가
-            result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
-            
-            # 7. 영양성분 검증 결과 추가 (있는 경우)
-            if nutrition_info:
-                ingredient_validation = self._validate_ingredients(review_text, nutrition_info)
-                result["ingredient_validation"] = ingredient_validation
-
-            return result
-
-        except json.JSONDecodeError as e:
-            raise Exception(f"AI 응답 파싱 실패: {e}")
-        except Exception as e:
-            raise Exception(f"AI 분석 중 오류 발생: {e}")
+        # AI 프롬프트 생성 (영양성분 정보가 있으면 포함, 없으면 기본 프롬프트)
+        return self._build_enhanced_prompt(excerpt, nutrition_info), nutrition_info, truncation
 
     def _build_enhanced_prompt(
         self, 
@@ -305,21 +570,36 @@ class PharmacistAnalyzer:
         self, 
         review_text: str, 
         product_id: Optional[int] = None,
-        model: str = "claude-sonnet-4-5-20250929"
+        model: Optional[str] = None,
+        deadline_ms: Optional[float] = None
     ) -> Dict:
         """
         안전한 분석 (오류 발생 시 기본값 반환, 영양성분 DB 통합)
 
+        서킷 브레이커를 거쳐 호출하므로 API 장애 중에는 SDK 타임아웃을 기다리지 않고
+        즉시 규칙 기반 전용 결과(fallback_result)를 반환합니다.
+
         Args:
             review_text: 분석할 리뷰 텍스트
             product_id: 제품 ID (선택적)
             model: 사용할 Claude 모델
+            deadline_ms: 호출 마감 시간 (밀리초, 초과 시 분석 실패 결과 반환)
 
         Returns:
             Dict: 분석 결과 또는 오류 정보
         """
+        timeout = deadline_ms / 1000 if deadline_ms is not None else None
         try:
-            return self.analyze(review_text, product_id, model)
+            return self.breaker.call(
+                self.analyze,
+                review_text,
+                product_id,
+                model,
+                timeout=timeout,
+                deadline_ms=deadline_ms
+            )
+        except CircuitOpenError as e:
+            return self.fallback_result(str(e))
         except ValueError as e:
             return {
                 "error": "입력 오류",
@@ -342,5 +622,58 @@ class PharmacistAnalyzer:
             }
 
 
+    @staticmethod
+    def fallback_result(message: str) -> Dict:
+        """
+        AI 분석을 건너뛸 때의 규칙 기반 전용 결과 (서킷이 열린 경우)
 
+        Args:
+            message: 건너뛴 사유
+
+        Returns:
+            Dict: rule_only 표시가 포함된 분석 결과
+        """
+        return {
+            "error": "CIRCUIT_OPEN",
+            "message": message,
+            "summary": "AI 분석 일시 중단",
+            "efficacy": "정보 없음",
+            "side_effects": "정보 없음",
+            "tip": "AI 분석이 일시적으로 중단되어 규칙 기반 검증 결과만 제공합니다.",
+            "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다.",
+            "rule_only": True
+        }
+
+    def probe(self) -> None:
+        """
+        API 복구 확인용 최소 호출 (서킷 브레이커 백그라운드 프로브)
 
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        self.client.messages.create(
+            model=self.model,
+            max_tokens=1,
+            messages=[{"role": "user", "content": "ping"}],
+            timeout=10.0
+        )
+
+
+def get_pharmacist_analyzer(
+    api_key: Optional[str] = None,
+    model: Optional[str] = None
+) -> PharmacistAnalyzer:
+    """
+    API 키/모델별 공유 약사 분석기 반환 (프로세스 전역, 스레드 안전)
+
+    Args:
+        api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+        model: 기본 Claude 모델 (None인 경우 PharmacistAnalyzer.DEFAULT_MODEL)
+
+    Returns:
+        PharmacistAnalyzer: 공유 커넥션 풀을 사용하는 분석기
+
+    Raises:
+        ValueError: API 키가 없는 경우
+    """
+    return get_shared_analyzer(PharmacistAnalyzer, api_key=api_key, model=model)
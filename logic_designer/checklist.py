@@ -15,10 +15,14 @@
 - 평균 신뢰도 점수: 47.54점 (목표 50점 미달)
 """
 
+import hashlib
+import json
 import re
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set
+from core.length_policy import split_windows
 from .product_criteria import ProductCheckCriteria
 from .nutrition_utils import (
+    INGREDIENT_PATTERNS,
     get_nutrition_info_safe,
     extract_ingredients,
     is_valid_ingredient,
@@ -115,6 +119,67 @@ class AdChecklist:
         }
     }
 
+    # 개인 경험 표현 패턴 (4번 개인 경험 부재)
+    PERSONAL_PATTERNS = [
+        # 1인칭 대명사
+        r"나는", r"저는", r"제가", r"내가", r"우리",
+        # 직접 경험
+        r"직접", r"실제로", r"먹어보니", r"사용해보니",
+        # 구매/사용 표현
+        r"구매", r"샀", r"사서", r"먹", r"사용", r"복용", r"써",
+        # 체감 표현
+        r"느", r"같아", r"되는", r"됐", r"했", r"해서",
+        # 재구매 및 지속 사용
+        r"재구매", r"또", r"다시", r"계속", r"리피트",
+        # 소유 표현
+        r"내", r"제", r"우리", r"아버지", r"어머니", r"부모님", r"가족"
+    ]
+
+    # 키워드 반복 기본 임계값 (6번, 개선 2026-01-07: 5 → 7로 완화)
+    KEYWORD_REPETITION_THRESHOLD = 7
+
+    # 기본 부정적 의견 패턴 (7번 단점 회피)
+    NEGATIVE_PATTERNS = [
+        r"단점", r"아쉬", r"불편", r"별로", r"그런데",
+        r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
+    ]
+
+    # 과장된 의학적 주장 패턴 (9번)
+    EXAGGERATED_CLAIM_PATTERNS = [
+        r"100%.*(회복|치료|완치)",
+        r"(완벽|완전).*(치료|회복|개선)",
+        r"(기적|놀라운|엄청난).*(효과|변화)",
+        r"(즉시|바로|단.*하루|일주일).*(효과|개선|변화)"
+    ]
+
+    # 비현실적인 효과 시점 표현 패턴 (10번)
+    UNREALISTIC_TIMELINE_PATTERNS = [
+        r"(즉시|바로|단.*하루|하루만에|일주일만에).*(효과|개선|변화|달라)",
+        r"(하루|일주일).*(만에|만).*(효과|개선|변화)"
+    ]
+
+    # 단기 효과 주장 표현과, 그 주장을 비현실적으로 보는 성분의 최소 효과 발현 기간(일)
+    SHORT_PERIOD_PATTERN = r"(하루|일주일).*(만에|만)"
+    MIN_EFFECT_PERIOD_DAYS = 14
+
+    # 항목별 규칙 데이터 (항목 지문 계산용, 클래스 속성 이름)
+    ITEM_RULE_DATA = {
+        4: ("PERSONAL_PATTERNS",),
+        6: ("KEYWORD_REPETITION_THRESHOLD",),
+        7: ("NEGATIVE_PATTERNS",),
+        9: ("EXAGGERATED_CLAIM_PATTERNS",),
+        10: ("UNREALISTIC_TIMELINE_PATTERNS", "SHORT_PERIOD_PATTERN", "MIN_EFFECT_PERIOD_DAYS")
+    }
+
+    # 리뷰에서 추출한 성분으로 영양성분 DB를 검증하는 항목 (성분 패턴이 지문에 포함됨)
+    INGREDIENT_ITEMS = (5, 9, 10)
+
+    # 항목별 판정 로직 버전 (데이터가 아닌 판정 로직을 바꿀 때 해당 항목만 올림, 기본 1)
+    ITEM_LOGIC_VERSIONS: Dict[int, int] = {}
+
+    # 다른 항목의 감지 결과를 사용하는 항목 (7번 단점 회피 ← 2번 감탄사 남발, 8번 찬사 위주)
+    ITEM_DEPENDENCIES = {7: (2, 8)}
+
     def __init__(self, criteria: Optional[ProductCheckCriteria] = None):
         """
         체크리스트 초기화
@@ -127,7 +192,8 @@ class AdChecklist:
     def check_ad_patterns(
         self, 
         review_text: str, 
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        items: Optional[Iterable[int]] = None
     ) -> Dict[int, str]:
         """
         13단계 광고 판별 체크리스트 검사 (영양성분 DB 통합)
@@ -135,6 +201,9 @@ class AdChecklist:
         Args:
             review_text: 검사할 리뷰 텍스트
             product_id: 제품 ID (제공 시 영양성분 DB 조회, 없어도 오류 없음)
+            items: 검사할 항목 번호 (기본값: None → 전체 13개 항목)
+                   의존 항목(ITEM_DEPENDENCIES)은 자동으로 함께 검사하며,
+                   결과에는 expand_items(items)에 속한 항목만 포함됩니다.
 
         Returns:
             Dict[int, str]: {항목번호: 항목명} 형태로 감지된 항목 반환
@@ -142,30 +211,166 @@ class AdChecklist:
         # 입력 검증: 리뷰가 너무 짧으면 빈 결과 반환
         if not review_text or len(review_text.strip()) < 3:
             return {}
-        
+
+        # 긴 리뷰는 고정 크기 구간별로 검사하여 합산 (정규식 비용 상한)
+        windows, covered_chars = split_windows(review_text)
+        return self.check_windows(windows, review_text[:covered_chars], product_id, items)
+
+    def check_windows(
+        self,
+        windows: List[str],
+        review_text: str,
+        product_id: Optional[int] = None,
+        items: Optional[Iterable[int]] = None
+    ) -> Dict[int, str]:
+        """
+        split_windows()로 나눈 구간에 대해 체크리스트 검사
+
+        여러 규칙 세트가 같은 리뷰를 검사할 때(섀도 비교 등) 구간 분할을 한 번만 하도록
+        check_ad_patterns()에서 분리한 단계입니다.
+
+        Args:
+            windows: split_windows() 구간 목록
+            review_text: 검사 대상 텍스트 (split_windows()가 덮는 범위까지)
+            product_id: 제품 ID (제공 시 영양성분 DB 조회, 없어도 오류 없음)
+            items: 검사할 항목 번호 (check_ad_patterns()와 같음)
+
+        Returns:
+            Dict[int, str]: {항목번호: 항목명} 형태로 감지된 항목 반환
+        """
+        selected = self.expand_items(items) if items is not None else None
+
+        if len(windows) == 1:
+            detected_issues = self._check_window(windows[0], selected)
+        else:
+            detected_issues = self._aggregate_windows(windows, selected)
+
+        # 영양성분 DB 기반 추가 검증 (product_id가 있고 정보가 있는 경우만)
+        if product_id:
+            try:
+                # 5번: 원료 특징 나열 - 허위 성분 주장 검증
+                if self._selected(5, selected) and self._validate_ingredient_claims(review_text, product_id):
+                    # 기존 5번 항목이 있으면 강화, 없으면 추가
+                    if 5 in detected_issues:
+                        detected_issues[5] = f"{detected_issues[5]} (허위 성분 주장 포함)"
+                    else:
+                        detected_issues[5] = "원료 특징 나열 (허위 성분 주장)"
+                
+                # 9번: 전문 용어 오남용 - 허위 의학적 주장 검증
+                if self._selected(9, selected) and self._validate_medical_claims(review_text, product_id):
+                    if 9 in detected_issues:
+                        detected_issues[9] = f"{detected_issues[9]} (허위 의학적 주장 포함)"
+                    else:
+                        detected_issues[9] = "전문 용어 오남용 (허위 의학적 주장)"
+                
+                # 10번: 비현실적 효과 강조 - 효과 시점 검증
+                if self._selected(10, selected) and self._validate_effect_timeline(review_text, product_id):
+                    if 10 in detected_issues:
+                        detected_issues[10] = f"{detected_issues[10]} (효과 시점 과장)"
+                    else:
+                        detected_issues[10] = "비현실적 효과 강조 (효과 시점 과장)"
+            except Exception:
+                # 영양성분 검증 중 오류 발생 시 무시하고 기존 결과만 반환
+                pass
+
+        return detected_issues
+
+    @classmethod
+    def expand_items(cls, items: Iterable[int]) -> Set[int]:
+        """
+        검사 항목에 의존 항목을 추가한 집합 반환
+
+        Args:
+            items: 항목 번호 목록
+
+        Returns:
+            Set[int]: 실제로 검사해야 하는 항목 번호
+        """
+        expanded: Set[int] = set()
+        pending = list(items)
+        while pending:
+            item_num = pending.pop()
+            if item_num not in expanded:
+                expanded.add(item_num)
+                pending.extend(cls.ITEM_DEPENDENCIES.get(item_num, ()))
+        return expanded
+
+    @classmethod
+    def item_fingerprints(cls) -> Dict[int, str]:
+        """
+        항목별 규칙 지문 (패턴 + 항목 규칙 데이터 + 로직 버전 + 의존 항목 지문)
+
+        한 항목의 패턴이나 임계값을 조정하거나 ITEM_LOGIC_VERSIONS를 올리면
+        그 항목(과 그 항목에 의존하는 항목)의 지문만 바뀌므로
+        저장된 결과에서 바뀐 항목만 다시 검사할 수 있습니다.
+
+        Returns:
+            Dict[int, str]: {항목번호: 지문}
+        """
+        fingerprints: Dict[int, str] = {}
+
+        def fingerprint(item_num: int) -> str:
+            if item_num not in fingerprints:
+                rule_data = {
+                    "patterns": cls.AD_PATTERNS[item_num],
+                    "data": {name: getattr(cls, name) for name in cls.ITEM_RULE_DATA.get(item_num, ())},
+                    "ingredients": INGREDIENT_PATTERNS if item_num in cls.INGREDIENT_ITEMS else None,
+                    "version": cls.ITEM_LOGIC_VERSIONS.get(item_num, 1)
+                }
+                hasher = hashlib.sha256(
+                    json.dumps(rule_data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+                )
+                for dependency in cls.ITEM_DEPENDENCIES.get(item_num, ()):
+                    hasher.update(fingerprint(dependency).encode("utf-8"))
+                fingerprints[item_num] = hasher.hexdigest()[:12]
+            return fingerprints[item_num]
+
+        return {item_num: fingerprint(item_num) for item_num in cls.AD_PATTERNS}
+
+    @staticmethod
+    def _selected(item_num: int, selected: Optional[Set[int]]) -> bool:
+        """검사 대상 항목인지 여부 (selected가 None이면 전체)"""
+        return selected is None or item_num in selected
+
+    def _check_window(self, text: str, selected: Optional[Set[int]] = None) -> Dict[int, str]:
+        """
+        한 구간에 대한 패턴 기반 체크리스트 검사 (영양성분 DB 검증 제외)
+
+        Args:
+            text: 검사할 텍스트 (구간)
+            selected: 검사할 항목 번호 (None이면 전체)
+
+        Returns:
+            Dict[int, str]: {항목번호: 항목명} 형태로 감지된 항목 반환
+        """
         detected_issues = {}
 
         for item_num, item_data in self.AD_PATTERNS.items():
+            if not self._selected(item_num, selected):
+                continue
             name = item_data["name"]
             patterns = item_data["patterns"]
 
             # 특수 케이스 처리
             if item_num == 4:  # 개인 경험 부재
-                if not self._has_personal_experience(review_text):
+                if not self._has_personal_experience(text):
                     detected_issues[item_num] = name
                 continue
 
             if item_num == 6:  # 키워드 반복
                 # 개선 (2026-01-07): 임계값 5 → 7로 완화
-                threshold = self.criteria.keyword_repetition_threshold if self.criteria else 7
-                if self._has_keyword_repetition(review_text, threshold=threshold):
+                threshold = (
+                    self.criteria.keyword_repetition_threshold if self.criteria
+                    else self.KEYWORD_REPETITION_THRESHOLD
+                )
+                if self._has_keyword_repetition(text, threshold=threshold):
                     detected_issues[item_num] = name
                 continue
 
             if item_num == 7:  # 단점 회피
                 # 개선 (2026-01-07): 단점이 없다고 무조건 광고는 아님
                 # 다른 광고 패턴(찬사 위주, 감탄사 남발)이 함께 있을 때만 의심
-                if not self._has_negative_opinion(review_text):
+                if not self._has_negative_opinion(text):
                     # 찬사 위주(8번) 또는 감탄사 남발(2번)이 이미 감지된 경우에만 추가
                     if 8 in detected_issues or 2 in detected_issues:
                         detected_issues[item_num] = name
@@ -174,46 +379,51 @@ class AdChecklist:
             # 제품별 광고의심 표현 체크 (기본 패턴에 추가)
             if self.criteria and self.criteria.ad_suspicious_expressions:
                 for suspicious_expr in self.criteria.ad_suspicious_expressions:
-                    if suspicious_expr in review_text:
+                    if suspicious_expr in text:
                         detected_issues[item_num] = f"{name} (제품별 기준: {suspicious_expr})"
                         break
 
             # 정규표현식 패턴 매칭
             for pattern in patterns:
-                if re.search(pattern, review_text, re.IGNORECASE | re.MULTILINE):
+                if re.search(pattern, text, re.IGNORECASE | re.MULTILINE):
                     detected_issues[item_num] = name
                     break
 
-        # 영양성분 DB 기반 추가 검증 (product_id가 있고 정보가 있는 경우만)
-        if product_id:
-            try:
-                # 5번: 원료 특징 나열 - 허위 성분 주장 검증
-                if self._validate_ingredient_claims(review_text, product_id):
-                    # 기존 5번 항목이 있으면 강화, 없으면 추가
-                    if 5 in detected_issues:
-                        detected_issues[5] = f"{detected_issues[5]} (허위 성분 주장 포함)"
-                    else:
-                        detected_issues[5] = "원료 특징 나열 (허위 성분 주장)"
-                
-                # 9번: 전문 용어 오남용 - 허위 의학적 주장 검증
-                if self._validate_medical_claims(review_text, product_id):
-                    if 9 in detected_issues:
-                        detected_issues[9] = f"{detected_issues[9]} (허위 의학적 주장 포함)"
-                    else:
-                        detected_issues[9] = "전문 용어 오남용 (허위 의학적 주장)"
-                
-                # 10번: 비현실적 효과 강조 - 효과 시점 검증
-                if self._validate_effect_timeline(review_text, product_id):
-                    if 10 in detected_issues:
-                        detected_issues[10] = f"{detected_issues[10]} (효과 시점 과장)"
-                    else:
-                        detected_issues[10] = "비현실적 효과 강조 (효과 시점 과장)"
-            except Exception:
-                # 영양성분 검증 중 오류 발생 시 무시하고 기존 결과만 반환
-                pass
-
         return detected_issues
 
+    def _aggregate_windows(self, windows: List[str], selected: Optional[Set[int]] = None) -> Dict[int, str]:
+        """
+        구간별 검사 결과 합산
+
+        대부분의 항목은 한 구간에서라도 감지되면 감지로 봅니다.
+        4번(개인 경험 부재)은 모든 구간에서 감지된 경우만, 7번(단점 회피)은
+        합산 결과에 2번/8번이 있고 어느 구간에도 부정적 의견이 없는 경우만 감지로 봅니다.
+
+        Args:
+            windows: split_windows()로 나눈 구간 목록
+            selected: 검사할 항목 번호 (None이면 전체)
+
+        Returns:
+            Dict[int, str]: {항목번호: 항목명} 형태로 감지된 항목 반환
+        """
+        window_results = [self._check_window(window, selected) for window in windows]
+
+        detected_issues: Dict[int, str] = {}
+        for result in window_results:
+            for item_num, name in result.items():
+                detected_issues.setdefault(item_num, name)
+
+        detected_issues.pop(4, None)
+        detected_issues.pop(7, None)
+        if self._selected(4, selected) and all(4 in result for result in window_results):
+            detected_issues[4] = self.AD_PATTERNS[4]["name"]
+        if self._selected(7, selected) and (8 in detected_issues or 2 in detected_issues) and not any(
+            self._has_negative_opinion(window) for window in windows
+        ):
+            detected_issues[7] = self.AD_PATTERNS[7]["name"]
+
+        return dict(sorted(detected_issues.items()))
+
     def _has_personal_experience(self, text: str) -> bool:
         """
         개인 경험 표현 존재 여부 검사
@@ -223,26 +433,12 @@ class AdChecklist:
         - 체감 표현 추가 (느, 같아, 되는, 했)
         - 재구매 표현 추가 (재구매, 또, 다시, 계속)
         """
-        personal_patterns = [
-            # 1인칭 대명사
-            r"나는", r"저는", r"제가", r"내가", r"우리",
-            # 직접 경험
-            r"직접", r"실제로", r"먹어보니", r"사용해보니",
-            # 구매/사용 표현
-            r"구매", r"샀", r"사서", r"먹", r"사용", r"복용", r"써",
-            # 체감 표현
-            r"느", r"같아", r"되는", r"됐", r"했", r"해서",
-            # 재구매 및 지속 사용
-            r"재구매", r"또", r"다시", r"계속", r"리피트",
-            # 소유 표현
-            r"내", r"제", r"우리", r"아버지", r"어머니", r"부모님", r"가족"
-        ]
-        for pattern in personal_patterns:
+        for pattern in self.PERSONAL_PATTERNS:
             if re.search(pattern, text):
                 return True
         return False
 
-    def _has_keyword_repetition(self, text: str, threshold: int = 7) -> bool:
+    def _has_keyword_repetition(self, text: str, threshold: int = KEYWORD_REPETITION_THRESHOLD) -> bool:
         """
         특정 키워드 과도한 반복 검사
 
@@ -271,12 +467,6 @@ class AdChecklist:
         - 단점이 없다고 무조건 광고는 아님 (정상 리뷰도 만족하면 단점을 안 쓸 수 있음)
         - 따라서 check_ad_patterns()에서 다른 광고 패턴과 함께 있을 때만 감점
         """
-        # 기본 부정적 패턴
-        negative_patterns = [
-            r"단점", r"아쉬", r"불편", r"별로", r"그런데",
-            r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
-        ]
-        
         # 제품별 부정적 표현 추가
         if self.criteria and self.criteria.negative_expressions:
             for expr in self.criteria.negative_expressions:
@@ -284,7 +474,7 @@ class AdChecklist:
                     return True
         
         # 기본 패턴 검사
-        for pattern in negative_patterns:
+        for pattern in self.NEGATIVE_PATTERNS:
             if re.search(pattern, text):
                 return True
         return False
@@ -421,17 +611,9 @@ class AdChecklist:
             if not mentioned_ingredients:
                 return False
             
-            # 의학적 주장 패턴 (과장된 표현)
-            exaggerated_claims = [
-                r"100%.*(회복|치료|완치)",
-                r"(완벽|완전).*(치료|회복|개선)",
-                r"(기적|놀라운|엄청난).*(효과|변화)",
-                r"(즉시|바로|단.*하루|일주일).*(효과|개선|변화)"
-            ]
-            
             # 리뷰에 과장된 주장이 있는지 확인
             has_exaggerated_claim = False
-            for pattern in exaggerated_claims:
+            for pattern in self.EXAGGERATED_CLAIM_PATTERNS:
                 if re.search(pattern, review_text, re.IGNORECASE):
                     has_exaggerated_claim = True
                     break
@@ -482,15 +664,9 @@ class AdChecklist:
             if not mentioned_ingredients:
                 return False
             
-            # 비현실적인 시점 표현 패턴
-            unrealistic_timeline_patterns = [
-                r"(즉시|바로|단.*하루|하루만에|일주일만에).*(효과|개선|변화|달라)",
-                r"(하루|일주일).*(만에|만).*(효과|개선|변화)"
-            ]
-            
             # 비현실적인 시점 표현이 있는지 확인
             has_unrealistic_timeline = False
-            for pattern in unrealistic_timeline_patterns:
+            for pattern in self.UNREALISTIC_TIMELINE_PATTERNS:
                 if re.search(pattern, review_text, re.IGNORECASE):
                     has_unrealistic_timeline = True
                     break
@@ -503,9 +679,9 @@ class AdChecklist:
                 typical_period = get_typical_effect_period(ingredient, nutrition_info)
                 if typical_period:
                     # 일반적으로 2주 이상 걸리는 성분인데 "하루만에" 효과 주장하면 의심
-                    if typical_period >= 14:
+                    if typical_period >= self.MIN_EFFECT_PERIOD_DAYS:
                         # "하루만에", "일주일만에" 같은 표현이 있으면 비현실적
-                        if re.search(r"(하루|일주일).*(만에|만)", review_text, re.IGNORECASE):
+                        if re.search(self.SHORT_PERIOD_PATTERN, review_text, re.IGNORECASE):
                             return True
             
             return False
@@ -0,0 +1,368 @@
+"""
+오프라인 대량 리뷰 분석 CLI
+CSV(scripts/export_supabase_data.py 출력) 또는 JSONL(스크래퍼 출력) 리뷰 덤프를 스트리밍으로 읽어
+analyze_batch() 파이프라인으로 분석하고, 결과를 JSONL로 바로바로 기록합니다 (메모리 사용량 일정).
+
+중단된 실행은 체크포인트(처리 완료 위치)부터 이어서 처리하며, 진행 중 처리량을 주기적으로 출력합니다.
+
+사용 방법:
+    python -m logic_designer.cli data/reviews.csv -o output/reviews.analysis.jsonl --local-only
+    python -m logic_designer.cli reviews.jsonl --llm-concurrency 16 --pre-classify
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+from core.stage_metrics import stage_metrics
+from core.usage_metrics import usage_tracker
+from .pipeline import SCORE_FIELDS, analyze_batch
+
+# 체크포인트 저장 주기 (결과 수 / 초 중 먼저 도달하는 쪽)
+CHECKPOINT_EVERY = 200
+CHECKPOINT_INTERVAL_SECONDS = 5.0
+
+FORMATS = ("auto", "jsonl", "csv")
+
+
+def iter_records(
+    path: str,
+    fmt: str = "auto",
+    on_error: Optional[Callable[[int, str, Exception], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    입력 파일을 한 레코드씩 읽어 analyze_batch() 입력 형태로 변환
+
+    텍스트는 "text" 또는 "review_text" 필드, 없으면 "title"과 "body"를 이어 붙여 사용합니다.
+    JSONL에서 파싱할 수 없는 줄은 건너뛰고 on_error로 알립니다 (레코드 번호에 포함되지 않음).
+
+    Args:
+        path: 입력 파일 경로
+        fmt: "jsonl", "csv" 또는 "auto" (확장자로 판단)
+        on_error: 잘못된 줄 콜백 (바이트 위치, 줄 내용, 예외) (기본값: stderr에 경고 출력)
+
+    Yields:
+        Dict: {"id", "text", "product_id", 점수 필드(있는 경우)}
+    """
+    for _, record in _iter_with_offsets(path, _resolve_format(path, fmt), on_error=on_error):
+        yield record
+
+
+def _resolve_format(path: str, fmt: str) -> str:
+    """"auto"이면 확장자로 입력 형식 판단"""
+    if fmt == "auto":
+        return "csv" if path.lower().endswith(".csv") else "jsonl"
+    return fmt
+
+
+def _iter_with_offsets(
+    path: str,
+    fmt: str,
+    start_offset: int = 0,
+    on_error: Optional[Callable[[int, str, Exception], None]] = None
+) -> Iterator[Tuple[Optional[int], Dict[str, Any]]]:
+    """
+    (레코드 다음 줄의 바이트 위치, 레코드) 순회
+
+    JSONL은 start_offset부터 읽으므로 재개 시 앞부분을 다시 파싱하지 않습니다.
+    CSV는 따옴표 안 줄바꿈 때문에 위치로 이어 읽을 수 없어 항상 처음부터 읽고 위치는 None입니다.
+    """
+    if fmt == "csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                yield None, _to_record(row)
+        return
+
+    on_error = on_error or _warn_invalid_line
+    with open(path, "rb") as f:
+        f.seek(start_offset)
+        offset = start_offset
+        for raw in f:
+            line_offset, offset = offset, offset + len(raw)
+            if not raw.strip():
+                continue
+            line = raw.decode("utf-8", errors="replace")
+            try:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError(f"JSON 객체가 아님 ({type(row).__name__})")
+            except ValueError as e:
+                on_error(line_offset, line, e)
+                continue
+            yield offset, _to_record(row)
+
+
+def _warn_invalid_line(offset: int, line: str, error: Exception) -> None:
+    """잘못된 JSONL 줄 경고 (기본 on_error)"""
+    print(f"⚠️ 잘못된 JSONL 줄 건너뜀 (바이트 {offset}): {error}", file=sys.stderr)
+
+
+def _to_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """입력 행 → analyze_batch() 입력 딕셔너리 (CSV의 빈 문자열은 값 없음으로 처리)"""
+    text = row.get("text") or row.get("review_text")
+    if not text:
+        text = " ".join(str(part) for part in (row.get("title"), row.get("body")) if part)
+    record = {
+        "id": row.get("id") if row.get("id") != "" else None,
+        "text": text,
+        "product_id": _to_number(row.get("product_id"), int)
+    }
+    for field in SCORE_FIELDS:
+        value = _to_number(row.get(field), float)
+        if value is not None:
+            record[field] = value
+    return record
+
+
+def _to_number(value: Any, cast) -> Optional[Any]:
+    """CSV 문자열/JSON 값을 숫자로 변환 (빈 값/변환 불가 → None)"""
+    if value is None or value == "":
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _load_checkpoint(checkpoint_path: str, input_path: str) -> Optional[Dict[str, Any]]:
+    """같은 입력 파일의 체크포인트 로드 (없거나 다른 입력이면 None)"""
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    return state if state.get("input") == os.path.abspath(input_path) else None
+
+
+def _save_checkpoint(checkpoint_path: str, state: Dict[str, Any]) -> None:
+    """체크포인트 원자적 저장 (임시 파일 → 교체)"""
+    temp_path = checkpoint_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def run(
+    input_path: str,
+    output_path: str,
+    checkpoint_path: Optional[str] = None,
+    fmt: str = "auto",
+    restart: bool = False,
+    limit: Optional[int] = None,
+    progress_interval: float = 10.0,
+    log: Optional[TextIO] = None,
+    **analyze_options
+) -> Dict[str, Any]:
+    """
+    입력 덤프를 분석하여 JSONL로 기록 (체크포인트부터 이어서 처리)
+
+    체크포인트에는 "이 위치 이전은 모두 기록됨"(next_index), 그 이후에 먼저 끝난 레코드 번호(done),
+    기록된 출력 크기(output_bytes)를 저장합니다. 재시작 시 출력 파일을 output_bytes로 잘라
+    마지막 체크포인트 이후에 기록된 줄을 버리므로 결과가 중복되거나 빠지지 않습니다.
+    JSONL 입력은 next_index 레코드를 읽기 시작할 바이트 위치(input_offset)도 저장하여
+    재개 시 앞부분을 다시 읽지 않고 그 위치로 바로 이동합니다.
+    출력 파일이 없어졌거나 기록된 크기보다 작으면 체크포인트를 무시하고 처음부터 처리합니다.
+    JSONL의 잘못된 줄은 log에 경고를 남기고 건너뜁니다.
+
+    Args:
+        input_path: 입력 파일 (CSV/JSONL)
+        output_path: 출력 JSONL 파일
+        checkpoint_path: 체크포인트 파일 (기본값: output_path + ".ckpt")
+        fmt: 입력 형식 ("auto", "jsonl", "csv")
+        restart: True이면 체크포인트를 무시하고 처음부터 처리
+        limit: 이번 실행에서 처리할 최대 레코드 수 (None이면 끝까지)
+        progress_interval: 처리량 출력 주기 (초)
+        log: 진행 상황 출력 스트림 (기본값: sys.stderr)
+        **analyze_options: analyze_batch() 옵션 (local_only, llm_concurrency 등)
+
+    Returns:
+        Dict: {"processed", "skipped", "invalid", "total_written", "elapsed_s", "throughput_rps", "complete"}
+    """
+    log = log or sys.stderr
+    fmt = _resolve_format(input_path, fmt)
+    checkpoint_path = checkpoint_path or output_path + ".ckpt"
+    state = None if restart else _load_checkpoint(checkpoint_path, input_path)
+    if state is not None and (not os.path.exists(output_path)
+                              or os.path.getsize(output_path) < state["output_bytes"]):
+        print(f"⚠️ 출력 파일 {output_path}이(가) 없거나 체크포인트보다 작아 처음부터 다시 처리합니다", file=log)
+        state = None
+    if state is None:
+        state = {"input": os.path.abspath(input_path), "next_index": 0, "done": [], "output_bytes": 0, "written": 0,
+                 "input_offset": 0, "input_offset_index": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        open(output_path, "w", encoding="utf-8").close()
+    else:
+        print(f"체크포인트에서 재개: {state['next_index']}번째 레코드부터 (기록된 결과 {state['written']}건)", file=log)
+
+    done = set(state["done"])
+    resumed_from = state["next_index"]
+    original_index: Dict[int, int] = {}
+    # 레코드 번호 → 그 다음 레코드를 읽기 시작할 바이트 위치 (JSONL, next_index가 지나가면 제거)
+    end_offsets: Dict[int, int] = {}
+    stats = {"processed": 0, "skipped": 0, "invalid": 0, "exhausted": False}
+
+    def on_invalid_line(offset: int, line: str, error: Exception) -> None:
+        stats["invalid"] += 1
+        print(f"⚠️ 잘못된 JSONL 줄 건너뜀 (바이트 {offset}): {error}", file=log)
+
+    def pending_records() -> Iterator[Dict[str, Any]]:
+        batch_index = 0
+        # 이전 실행에서 읽은 부분은 건너뛰고 저장된 위치부터 읽음 (CSV는 처음부터)
+        start_index = state.get("input_offset_index", 0) if fmt == "jsonl" else 0
+        start_offset = state.get("input_offset", 0) if fmt == "jsonl" else 0
+        records = _iter_with_offsets(input_path, fmt, start_offset=start_offset, on_error=on_invalid_line)
+        for index, (end_offset, record) in enumerate(records, start=start_index):
+            if end_offset is not None:
+                end_offsets[index] = end_offset
+            if index < resumed_from or index in done:
+                stats["skipped"] += 1
+                continue
+            if limit is not None and batch_index >= limit:
+                return
+            original_index[batch_index] = index
+            batch_index += 1
+            yield record
+        stats["exhausted"] = True
+
+    started_at = time.perf_counter()
+    last_checkpoint = last_progress = started_at
+    since_checkpoint = 0
+
+    with open(output_path, "r+", encoding="utf-8") as out:
+        out.truncate(state["output_bytes"])
+        out.seek(state["output_bytes"])
+
+        def checkpoint() -> None:
+            out.flush()
+            state["output_bytes"] = out.tell()
+            state["done"] = sorted(done)
+            _save_checkpoint(checkpoint_path, state)
+
+        for result in analyze_batch(pending_records(), **analyze_options):
+            index = original_index.pop(result["index"])
+            result["index"] = index
+            out.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+
+            done.add(index)
+            while state["next_index"] in done:
+                done.discard(state["next_index"])
+                end_offset = end_offsets.pop(state["next_index"], None)
+                state["next_index"] += 1
+                if end_offset is not None:
+                    state["input_offset"], state["input_offset_index"] = end_offset, state["next_index"]
+            state["written"] += 1
+            stats["processed"] += 1
+            since_checkpoint += 1
+
+            now = time.perf_counter()
+            if since_checkpoint >= CHECKPOINT_EVERY or now - last_checkpoint >= CHECKPOINT_INTERVAL_SECONDS:
+                checkpoint()
+                since_checkpoint = 0
+                last_checkpoint = now
+            if now - last_progress >= progress_interval:
+                elapsed = now - started_at
+                print(f"처리 {stats['processed']:,}건, {stats['processed'] / elapsed:,.1f}건/초, "
+                      f"경과 {elapsed:,.0f}초", file=log)
+                last_progress = now
+
+        checkpoint()
+
+    elapsed = time.perf_counter() - started_at
+    return {
+        "processed": stats["processed"],
+        "skipped": stats["skipped"],
+        "invalid": stats["invalid"],
+        "total_written": state["written"],
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(stats["processed"] / elapsed, 2) if elapsed > 0 else 0.0,
+        "complete": stats["exhausted"]
+    }
+
+
+def _write_run_metrics(run_id: str, usage_path: Optional[str], prometheus_path: Optional[str]) -> None:
+    """
+    실행 종료 시 지표 기록
+
+    AI 사용량 요약(AI 호출이 있었던 경우)과 단계별 소요 시간(계측이 켜진 경우)을 지표 파일에 추가하고,
+    prometheus_path가 있으면 단계 계측 결과를 Prometheus 텍스트 형식으로도 저장합니다.
+    """
+    if usage_tracker.summary()["total"]["calls"]:
+        total = usage_tracker.write_summary(usage_path, run_id=run_id)["total"]
+        print(f"AI 호출: {total['calls']:,}건, 토큰: {total['tokens']}, "
+              f"추정 비용: ${total['estimated_cost_usd']:.4f}", file=sys.stderr)
+    if stage_metrics.enabled:
+        stages = stage_metrics.dump(run_id=run_id)["stages"]
+        print("단계별 p95(ms): " + ", ".join(f"{stage} {s['p95_ms']}" for stage, s in stages.items()),
+              file=sys.stderr)
+        if prometheus_path:
+            stage_metrics.write_prometheus(prometheus_path)
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m logic_designer.cli",
+        description="CSV/JSONL 리뷰 덤프 오프라인 대량 분석 (JSONL 출력, 체크포인트 재개)"
+    )
+    parser.add_argument("input", help="입력 파일 (CSV 또는 JSONL)")
+    parser.add_argument("-o", "--output", help="출력 JSONL 경로 (기본값: <입력>.analysis.jsonl)")
+    parser.add_argument("--format", choices=FORMATS, default="auto", help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--checkpoint", help="체크포인트 경로 (기본값: <출력>.ckpt)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터 처리")
+    parser.add_argument("--limit", type=int, help="이번 실행에서 처리할 최대 레코드 수")
+    parser.add_argument("--local-only", action="store_true", help="AI 호출 없이 로컬 추출기로만 분석")
+    parser.add_argument("--pre-classify", action="store_true", help="사전 분류기로 확실한 경우 AI 호출 생략")
+    parser.add_argument("--nutrition", action="store_true", help="영양성분 DB 검증 사용 (Supabase 접속 필요)")
+    parser.add_argument("--model", help="분석 모델 지정 (기본: 모델 라우터)")
+    parser.add_argument("--reuse-similar", action="store_true", help="거의 같은 리뷰의 이전 AI 분석 결과 재사용")
+    parser.add_argument("--rule-workers", type=int, default=4)
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--progress-interval", type=float, default=10.0, help="처리량 출력 주기 (초)")
+    parser.add_argument("--usage-metrics", help="AI 사용량 요약 JSONL 경로 (기본값: LLM_USAGE_METRICS_PATH 또는 output/metrics/llm_usage.jsonl)")
+    parser.add_argument("--stage-metrics", action="store_true",
+                        help="단계별 소요 시간 계측 (종료 시 STAGE_METRICS_PATH 또는 output/metrics/stage_timings.jsonl에 기록)")
+    parser.add_argument("--stage-metrics-prom", help="단계 계측 결과를 Prometheus 텍스트 형식으로도 저장할 경로 (--stage-metrics 포함)")
+    args = parser.parse_args(argv)
+
+    if args.stage_metrics or args.stage_metrics_prom:
+        stage_metrics.enable()
+
+    output_path = args.output or os.path.splitext(args.input)[0] + ".analysis.jsonl"
+    try:
+        summary = run(
+            args.input,
+            output_path,
+            checkpoint_path=args.checkpoint,
+            fmt=args.format,
+            restart=args.restart,
+            limit=args.limit,
+            progress_interval=args.progress_interval,
+            model=args.model,
+            reuse_similar=args.reuse_similar,
+            use_nutrition_validation=args.nutrition,
+            local_only=args.local_only,
+            pre_classify=args.pre_classify,
+            rule_workers=args.rule_workers,
+            llm_concurrency=args.llm_concurrency,
+            max_in_flight=args.max_in_flight
+        )
+    finally:
+        # 중단된 실행도 그때까지의 지표를 기록
+        _write_run_metrics(f"cli-{time.strftime('%Y%m%d-%H%M%S')}", args.usage_metrics, args.stage_metrics_prom)
+    print(f"처리: {summary['processed']:,}건 (건너뜀 {summary['skipped']:,}건, 잘못된 줄 {summary['invalid']:,}건), "
+          f"누적 기록: {summary['total_written']:,}건", file=sys.stderr)
+    print(f"소요 시간: {summary['elapsed_s']}초, 처리량: {summary['throughput_rps']}건/초", file=sys.stderr)
+    print(f"출력: {output_path}" + ("" if summary["complete"] else " (--limit 도달, 다시 실행하면 이어서 처리)"),
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+유사 리뷰 분석 재사용 모듈
+문자 shingle 기반 MinHash 서명으로 거의 같은 리뷰를 찾아 이전 AI 분석 결과를 재사용합니다.
+"""
+
+import copy
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+
+# MinHash 해시 함수 계수용 메르센 소수 (2^61 - 1)
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH 기반 유사 리뷰 분석 결과 캐시 (스레드 안전)
+
+    리뷰 텍스트를 정규화(소문자, 공백/문장부호 제거)한 뒤 문자 shingle 집합의
+    MinHash 서명을 만들고, 밴드별 버킷(LSH)으로 후보를 좁혀 추정 Jaccard 유사도가
+    threshold 이상이고 컨텍스트(제품/영양성분 문맥)가 같은 항목의 분석 결과를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        max_entries: int = 5000,
+        ttl_seconds: float = 3600.0,
+        seed: int = 42
+    ):
+        """
+        인덱스 초기화
+
+        Args:
+            threshold: 재사용 기준 추정 Jaccard 유사도 (0~1)
+            num_perm: MinHash 서명 길이 (해시 함수 개수)
+            bands: LSH 밴드 수 (num_perm의 약수여야 함)
+            shingle_size: 문자 shingle 길이
+            max_entries: 보관할 분석 결과 수 상한 (초과 시 오래된 항목부터 제거)
+            ttl_seconds: 분석 결과 보관 시간 (초)
+            seed: 해시 계수 생성용 시드 (같은 시드면 같은 서명)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold는 0 초과 1 이하여야 합니다.")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[Tuple[int, ...], Hashable, Dict[str, Any], float]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[int]] = {}
+        self._next_id = 0
+        self._counts = {"lookups": 0, "hits": 0, "added": 0}
+
+    def shingles(self, text: str) -> Set[str]:
+        """정규화된 텍스트의 문자 shingle 집합"""
+        normalized = re.sub(r"[\s\W_]+", "", (text or "").lower())
+        if len(normalized) <= self.shingle_size:
+            return {normalized} if normalized else set()
+        return {
+            normalized[i:i + self.shingle_size]
+            for i in range(len(normalized) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        MinHash 서명 계산
+
+        Args:
+            text: 리뷰 텍스트
+
+        Returns:
+            Tuple[int, ...]: 길이 num_perm의 서명 (빈 텍스트는 빈 튜플)
+        """
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in self.shingles(text)
+        ]
+        if not hashes:
+            return ()
+        return tuple(
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._coefficients
+        )
+
+    @staticmethod
+    def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """두 MinHash 서명의 추정 Jaccard 유사도"""
+        if not sig_a or len(sig_a) != len(sig_b):
+            return 0.0
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def lookup(
+        self,
+        text: str,
+        context: Hashable = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        유사한 리뷰의 분석 결과 조회
+
+        Args:
+            text: 리뷰 텍스트
+            context: 분석 문맥 키 (같은 문맥끼리만 재사용, 예: 제품/언급 성분)
+
+        Returns:
+            Tuple[Dict, float]: (분석 결과 사본, 추정 유사도) 또는 None
+        """
+        signature = self.signature(text)
+        with self._lock:
+            self._counts["lookups"] += 1
+            if not signature:
+                return None
+            self._expire_locked()
+
+            best_id, best_sim = None, 0.0
+            for entry_id in self._candidates_locked(signature):
+                entry_sig, entry_context, _, _ = self._entries[entry_id]
+                if entry_context != context:
+                    continue
+                sim = self.similarity(signature, entry_sig)
+                if sim >= self.threshold and sim > best_sim:
+                    best_id, best_sim = entry_id, sim
+
+            if best_id is None:
+                return None
+            self._counts["hits"] += 1
+            analysis = copy.deepcopy(self._entries[best_id][2])
+        return analysis, best_sim
+
+    def add(self, text: str, analysis: Dict[str, Any], context: Hashable = None) -> None:
+        """
+        분석 결과 등록
+
+        Args:
+            text: 리뷰 텍스트
+            analysis: AI 분석 결과 (사본을 보관)
+            context: 분석 문맥 키
+        """
+        signature = self.signature(text)
+        if not signature:
+            return
+        stored = copy.deepcopy(analysis)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (signature, context, stored, time.monotonic())
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, set()).add(entry_id)
+            self._counts["added"] += 1
+            while len(self._entries) > self.max_entries:
+                self._remove_locked(next(iter(self._entries)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        인덱스 통계 반환
+
+        Returns:
+            Dict: {"lookups", "hits", "added", "entries", "hit_rate"}
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            entries = len(self._entries)
+        lookups = counts["lookups"]
+        return {
+            **counts,
+            "entries": entries,
+            "hit_rate": round(counts["hits"] / lookups, 4) if lookups else 0.0
+        }
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        """LSH 밴드 버킷 키 목록"""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _candidates_locked(self, signature: Tuple[int, ...]) -> Set[int]:
+        """밴드가 하나 이상 일치하는 후보 항목 ID"""
+        candidates: Set[int] = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        return candidates
+
+    def _expire_locked(self) -> None:
+        """보관 시간이 지난 항목 제거 (등록 순서대로 확인)"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            entry_id, (_, _, _, created_at) = next(iter(self._entries.items()))
+            if created_at >= cutoff:
+                break
+            self._remove_locked(entry_id)
+
+    def _remove_locked(self, entry_id: int) -> None:
+        """항목과 버킷 참조 제거"""
+        signature = self._entries.pop(entry_id)[0]
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+
+# 프로세스 전역 기본 인덱스 (analyze()에서 reuse_similar=True인 경우 사용)
+default_dedup_index = NearDuplicateIndex()
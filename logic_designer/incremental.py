@@ -0,0 +1,342 @@
+"""
+증분 재분석 모듈
+규칙/모델 버전 지문을 계산하고, review_analysis 저장소와 비교하여
+텍스트·규칙·모델 중 하나라도 바뀐 리뷰만 다시 분석합니다.
+
+규칙만 바뀐 경우에는 저장된 체크리스트 항목 벡터에서 지문이 바뀐 항목만 다시 검사하고
+신뢰도 점수/광고 판별을 다시 계산합니다 (AI 분석은 광고 → 정상으로 바뀐 리뷰만).
+"""
+
+import hashlib
+import inspect
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from database.analysis_store import ReviewAnalysisStore, build_row
+from core import length_policy
+from . import nutrition_utils
+from .analyzer import PharmacistAnalyzer
+from .checklist import AdChecklist
+from .model_router import ModelRouter, default_router
+from .pipeline import analyze_batch, resolve_without_llm
+from .trust_score import TrustScoreCalculator
+from .pre_classifier import MODEL_VERSION as PRE_CLASSIFIER_VERSION
+
+# 로컬 추출기 전용 모드의 모델 버전
+LOCAL_MODEL_VERSION = "local_rules"
+
+# 규칙 판정 로직 버전: 체크리스트 검사 흐름/구간 합산, 신뢰도 점수 계산식, 성분 추출/검증 로직을 바꾸면 올림
+# (패턴, 임계값, 가중치, 구간 크기 같은 규칙 데이터는 지문에 직접 포함되므로 올리지 않아도 됨)
+RULES_VERSION = 1
+
+# 다시 분석해도 결과가 같은 오류 (저장함). 그 밖의 오류(API 실패 등)는 저장하지 않고 다음 실행에 재시도
+FINAL_ERRORS = ("REVIEW_TOO_SHORT", "AD_REVIEW", "PRE_CLASSIFIED_AD")
+
+
+def _digest(*parts: str) -> str:
+    """문자열 조각들의 짧은 SHA-256 지문 (줄바꿈 방식 차이는 무시)"""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.replace("\r\n", "\n").encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:12]
+
+
+def _default(func: Any, name: str) -> Any:
+    """함수 인자의 기본값 (소스 없이 설치된 경우에도 조회 가능)"""
+    return inspect.signature(func).parameters[name].default
+
+
+def framework_rule_data() -> Dict[str, Any]:
+    """
+    모든 항목과 점수에 영향을 주는 공통 규칙 데이터
+
+    소스 코드가 아닌 규칙 데이터(가중치, 임계값, 구간 크기, 성분 패턴)와 RULES_VERSION만 포함하므로
+    주석/계측/캐시 같은 무관한 수정으로는 바뀌지 않습니다.
+
+    Returns:
+        Dict: 규칙 데이터
+    """
+    return {
+        "rules_version": RULES_VERSION,
+        "base_weights": TrustScoreCalculator.BASE_WEIGHTS,
+        "nutrition_weights": TrustScoreCalculator.NUTRITION_WEIGHTS,
+        "penalty_per_item": _default(TrustScoreCalculator.apply_penalty, "penalty_per_item"),
+        "ad_threshold": _default(TrustScoreCalculator.is_ad, "threshold"),
+        "ad_penalty_count": TrustScoreCalculator.AD_PENALTY_COUNT,
+        "rule_windows": [length_policy.RULE_WINDOW_CHARS, length_policy.RULE_WINDOW_OVERLAP,
+                         length_policy.RULE_MAX_WINDOWS],
+        "ingredient_patterns": nutrition_utils.INGREDIENT_PATTERNS
+    }
+
+
+def rule_fingerprints() -> Dict[str, Any]:
+    """
+    규칙 지문: 공통 부분(framework)과 체크리스트 항목별 지문
+
+    framework는 framework_rule_data()의 지문으로, 바뀌면 모든 항목과 점수를 다시 계산해야 합니다.
+    items는 AdChecklist.item_fingerprints()입니다.
+
+    Returns:
+        Dict: {"framework": 지문, "items": {"항목번호": 지문}}
+    """
+    return {
+        "framework": _digest(json.dumps(framework_rule_data(), sort_keys=True, ensure_ascii=False)),
+        "items": {str(num): fingerprint for num, fingerprint in AdChecklist.item_fingerprints().items()}
+    }
+
+
+def rule_pack_version(fingerprints: Optional[Dict[str, Any]] = None) -> str:
+    """
+    규칙 버전: 규칙 지문 전체의 지문
+
+    패턴, 임계값, 가중치 중 하나라도 바뀌면 버전이 바뀝니다.
+
+    Args:
+        fingerprints: rule_fingerprints() 결과 (None이면 계산)
+
+    Returns:
+        str: "rules-<지문>"
+    """
+    return "rules-" + _digest(json.dumps(fingerprints or rule_fingerprints(), sort_keys=True))
+
+
+def model_version(
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    local_only: bool = False,
+    pre_classify: bool = False
+) -> str:
+    """
+    모델 버전: 분석 모델(또는 라우터 모델 쌍) + 프롬프트/출력 스키마 지문
+
+    Args:
+        model: 지정 모델 (None이면 라우터 모델 쌍)
+        router: 모델 라우터 (None이면 default_router)
+        local_only: 로컬 추출기 전용 모드 여부
+        pre_classify: 사전 분류기 사용 여부
+
+    Returns:
+        str: 예) "claude-haiku-4-5-20251001+claude-sonnet-4-5-20250929@<지문>+pre_v1"
+    """
+    if local_only:
+        return LOCAL_MODEL_VERSION
+    router = router or default_router
+    base = model or f"{router.fast_model}+{router.strong_model}"
+    prompt = _digest(
+        PharmacistAnalyzer.SYSTEM_PROMPT,
+        PharmacistAnalyzer.USER_PROMPT_TEMPLATE,
+        json.dumps(PharmacistAnalyzer.ANALYSIS_TOOL, sort_keys=True, ensure_ascii=False)
+    )
+    version = f"{base}@{prompt}"
+    if pre_classify:
+        version += f"+pre_v{PRE_CLASSIFIER_VERSION}"
+    return version
+
+
+def refresh_analysis(
+    reviews: Iterable[Dict[str, Any]],
+    store: ReviewAnalysisStore,
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    router: Optional[ModelRouter] = None,
+    use_nutrition_validation: bool = True,
+    local_only: bool = False,
+    pre_classify: bool = False,
+    write_batch_size: int = 200,
+    dry_run: bool = False,
+    **batch_options
+) -> Dict[str, Any]:
+    """
+    지문이 바뀐 리뷰만 다시 분석하여 저장
+
+    Args:
+        reviews: {"id", "text", "product_id"(선택), 점수 필드(선택)} 딕셔너리 iterable
+        store: review_analysis 저장소
+        api_key, model, router, use_nutrition_validation, local_only, pre_classify: analyze()와 동일
+        write_batch_size: 저장소에 한 번에 쓰는 행 수
+        dry_run: True이면 다시 분석할 리뷰 수만 집계 (분석/저장 안 함)
+        **batch_options: analyze_batch() 병렬 옵션 (rule_workers, llm_concurrency, max_in_flight 등)
+
+    Returns:
+        Dict: {"rule_version", "model_version", "scanned", "stale": {"new", "text", "rules", "model"},
+               "rescored", "rescored_items", "analyzed", "stored", "failed", "elapsed_s"}
+               rescored는 항목 단위로 다시 계산한 리뷰 수, rescored_items는 다시 검사한 항목 번호입니다.
+    """
+    started_at = time.perf_counter()
+    fingerprints = rule_fingerprints()
+    rule_version = rule_pack_version(fingerprints)
+    current_model_version = model_version(model, router, local_only, pre_classify)
+    stats = {
+        "rule_version": rule_version,
+        "model_version": current_model_version,
+        "scanned": 0,
+        "stale": {"new": 0, "text": 0, "rules": 0, "model": 0},
+        "rescored": 0,
+        "rescored_items": set(),
+        "analyzed": 0,
+        "stored": 0,
+        "failed": 0
+    }
+    checklist = AdChecklist()
+    rows: List[Dict[str, Any]] = []
+
+    def write(row: Dict[str, Any]) -> None:
+        rows.append(row)
+        if len(rows) >= write_batch_size:
+            stats["stored"] += store.upsert(rows)
+            rows.clear()
+
+    def scanned(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for item in items:
+            stats["scanned"] += 1
+            yield item
+
+    in_flight: Dict[Any, Dict[str, Any]] = {}
+
+    def stale_reviews() -> Iterator[Dict[str, Any]]:
+        for review, reason in store.find_stale(scanned(reviews), rule_version, current_model_version):
+            stats["stale"][reason] += 1
+            if dry_run:
+                continue
+            if reason == "rules":
+                # 규칙만 바뀐 경우: 저장된 항목 벡터에서 바뀐 항목만 다시 검사
+                rescored = _rescore_items(review, store.get(review["id"]), fingerprints, current_model_version, checklist)
+                if rescored is not None:
+                    row, dirty_items = rescored
+                    stats["rescored"] += 1
+                    stats["rescored_items"].update(dirty_items)
+                    write(build_row(review, row, rule_version, current_model_version,
+                                    row["detected_items"], fingerprints))
+                    continue
+            in_flight[review["id"]] = review
+            yield review
+
+    if dry_run:
+        for _ in stale_reviews():
+            pass
+        stats["rescored_items"] = sorted(stats["rescored_items"])
+        stats["elapsed_s"] = round(time.perf_counter() - started_at, 3)
+        return stats
+
+    for result in analyze_batch(
+        stale_reviews(),
+        api_key=api_key,
+        model=model,
+        use_nutrition_validation=use_nutrition_validation,
+        router=router,
+        local_only=local_only,
+        pre_classify=pre_classify,
+        **batch_options
+    ):
+        review = in_flight.pop(result["id"])
+        stats["analyzed"] += 1
+        if not _is_final(result):
+            stats["failed"] += 1
+            continue
+        write(build_row(review, result, rule_version, current_model_version,
+                        detected_items(result.get("validation")), fingerprints))
+    stats["stored"] += store.upsert(rows)
+
+    stats["rescored_items"] = sorted(stats["rescored_items"])
+    stats["elapsed_s"] = round(time.perf_counter() - started_at, 3)
+    return stats
+
+
+def detected_items(validation: Optional[Dict[str, Any]]) -> Optional[Dict[int, str]]:
+    """
+    검증 결과의 감점 사유("번호. 항목명")에서 체크리스트 항목 벡터 복원
+
+    Args:
+        validation: analyze() 결과의 validation (None 가능)
+
+    Returns:
+        Optional[Dict[int, str]]: {항목번호: 항목명} 또는 None (검증 결과 없음)
+    """
+    if not validation:
+        return None
+    items = {}
+    for reason in validation.get("reasons", []):
+        num, _, name = reason.partition(". ")
+        items[int(num)] = name
+    return items
+
+
+def rederive_validation(validation: Dict[str, Any], detected: Dict[int, str]) -> Dict[str, Any]:
+    """
+    저장된 검증 결과의 기본 점수와 새 항목 벡터로 신뢰도 점수/광고 판별 다시 계산
+
+    기본 점수(L/R/M/P/C/N)는 체크리스트와 무관하므로 그대로 사용하고,
+    감점과 최종 점수, 광고 여부, 감점 사유만 analyze()와 같은 방식으로 다시 계산합니다.
+
+    Args:
+        validation: 저장된 validation
+        detected: 새 항목 벡터 {항목번호: 항목명}
+
+    Returns:
+        Dict: 새 validation
+    """
+    calculator = TrustScoreCalculator()
+    penalty_count = len(detected)
+    final_score = calculator.apply_penalty(validation["base_score"], penalty_count)
+    updated = dict(validation)
+    updated.update({
+        "trust_score": final_score,
+        "is_ad": calculator.is_ad(final_score=final_score, penalty_count=penalty_count),
+        "reasons": [f"{num}. {name}" for num, name in sorted(detected.items())],
+        "penalty": penalty_count * 10,
+        "detected_count": penalty_count
+    })
+    return updated
+
+
+def _rescore_items(
+    review: Dict[str, Any],
+    stored: Optional[Dict[str, Any]],
+    fingerprints: Dict[str, Any],
+    current_model_version: str,
+    checklist: AdChecklist
+) -> Optional[Tuple[Dict[str, Any], List[int]]]:
+    """
+    항목 단위 재검사 (불가능하면 None → 전체 재분석)
+
+    다음 경우는 전체 재분석합니다: 공통 규칙(framework) 변경, 항목 지문/벡터가 없는 이전 행,
+    모델도 바뀐 경우, 사전 분류기 판정이 있는 경우(항목 벡터가 특징이라 판정이 바뀔 수 있음),
+    광고 → 정상으로 바뀌어 AI 분석이 새로 필요한 경우.
+
+    Returns:
+        Optional[Tuple[Dict, List[int]]]: ({"validation", "analysis", "detected_items"}, 다시 검사한 항목) 또는 None
+    """
+    if stored is None or not stored.get("rule_fingerprints") or stored.get("detected_items") is None:
+        return None
+    validation = stored.get("validation")
+    if (
+        not validation
+        or stored["model_version"] != current_model_version
+        or stored["rule_fingerprints"].get("framework") != fingerprints["framework"]
+        or "pre_classifier" in validation
+    ):
+        return None
+
+    stored_items = stored["rule_fingerprints"].get("items", {})
+    dirty = [int(num) for num, fingerprint in fingerprints["items"].items() if stored_items.get(num) != fingerprint]
+    evaluated = checklist.expand_items(dirty)
+
+    detected = {int(num): name for num, name in stored["detected_items"].items() if int(num) not in evaluated}
+    detected.update(checklist.check_ad_patterns(review["text"], review.get("product_id"), items=dirty))
+    updated = rederive_validation(validation, detected)
+
+    analysis = stored.get("analysis")
+    if updated["is_ad"] and not validation["is_ad"]:
+        analysis = resolve_without_llm(review["text"], True, None, False)
+    elif validation["is_ad"] and not updated["is_ad"]:
+        return None
+    return {"validation": updated, "analysis": analysis, "detected_items": detected}, sorted(evaluated)
+
+
+def _is_final(result: Dict[str, Any]) -> bool:
+    """저장할 결과인지 여부 (일시적 오류가 아닌 경우)"""
+    if result.get("error") in FINAL_ERRORS:
+        return True
+    analysis = result.get("analysis") or {}
+    return "error" not in analysis or analysis["error"] in FINAL_ERRORS
@@ -0,0 +1,327 @@
+"""
+로컬 규칙 기반 리뷰 추출 모듈
+AI 호출 없이 어휘 사전(한국어/영어)으로 효능, 부작용, 복용 기간을 추출하여
+PharmacistAnalyzer와 같은 결과 형식을 낮은 신뢰도로 채웁니다.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from .nutrition_utils import extract_ingredients, is_valid_ingredient
+
+
+# 효능 어휘 사전: 표준 표현 → 패턴 목록
+EFFECT_LEXICON: Dict[str, List[str]] = {
+    "눈 피로 감소": [
+        r"눈\s*(?:이|의)?\s*(?:좀|많이|훨씬|확실히)?\s*(?:덜|안)\s*(?:피로|피곤)",
+        r"눈\s*피로(?:가|감이?)?\s*(?:줄|감소|덜|사라|없어|풀)",
+        r"eye\s*(?:strain|fatigue)\s*(?:is\s*)?(?:reduced|less|gone|better)",
+        r"less\s*eye\s*(?:strain|fatigue)",
+    ],
+    "눈 침침함 개선": [
+        r"침침(?:함|한\s*게|하던\s*게)?\s*(?:이|가)?\s*(?:줄|사라|덜|좋아|나아)",
+        r"눈\s*(?:이|앞이)?\s*(?:맑아|밝아|선명)",
+        r"(?:clearer|sharper)\s*vision",
+    ],
+    "안구 건조 완화": [
+        r"(?:안구\s*)?건조(?:함|증)?(?:이|가)?\s*(?:줄|덜|완화|좋아|나아)",
+        r"눈\s*(?:이)?\s*(?:덜|안)\s*(?:건조|뻑뻑)",
+        r"(?:less|reduced)\s*dry\s*eyes?",
+    ],
+    "피로 개선": [
+        r"(?:덜|안)\s*피곤",
+        r"(?<!눈\s)(?<!눈)피로(?:가|감이?)?\s*(?:줄|회복|풀|덜|개선)",
+        r"(?:less\s*tired|more\s*energy|energized)",
+    ],
+    "수면 개선": [
+        r"잠\s*(?:이|을)?\s*(?:잘|푹)",
+        r"숙면",
+        r"sleep\s*(?:better|well)",
+    ],
+    "소화 개선": [
+        r"소화\s*(?:가)?\s*(?:잘|좋아|편)",
+        r"변비\s*(?:가)?\s*(?:해결|개선|좋아|없어|사라)",
+        r"장\s*(?:이)?\s*(?:편|좋아)",
+        r"(?:better\s*digestion|regular\s*bowel)",
+    ],
+    "피부 개선": [
+        r"피부\s*(?:가|결이?)?\s*(?:좋아|맑아|촉촉|매끈)",
+        r"(?:clearer|better)\s*skin",
+    ],
+    "관절 통증 완화": [
+        r"(?:관절|무릎|허리)\s*(?:이|가)?\s*(?:편|덜\s*아|안\s*아|좋아)",
+        r"(?:joint|knee)\s*pain\s*(?:is\s*)?(?:reduced|less|gone)",
+    ],
+    "면역력 체감": [
+        r"감기\s*(?:에)?\s*(?:덜|안)\s*걸",
+        r"면역(?:력)?\s*(?:이|가)?\s*(?:좋아|올라|강해)",
+        r"(?:fewer\s*colds|immune\s*system)",
+    ],
+}
+
+# 부작용 어휘 사전: 표준 표현 → (패턴 목록, 약사 조언)
+SIDE_EFFECT_LEXICON: Dict[str, Tuple[List[str], str]] = {
+    "속쓰림": (
+        [r"속\s*(?:이)?\s*쓰(?:림|려|리)", r"위\s*(?:가)?\s*쓰(?:림|려|리)", r"heartburn", r"acid\s*reflux"],
+        "공복 복용을 피하고 식사 직후에 복용하세요."
+    ),
+    "더부룩함": (
+        [r"더부룩", r"소화\s*불량", r"가스\s*(?:가)?\s*(?:차|많)", r"bloat"],
+        "식후에 복용하고 증상이 계속되면 복용량을 줄여 보세요."
+    ),
+    "메스꺼움": (
+        [r"메스꺼", r"울렁", r"구역질?", r"nause"],
+        "식사와 함께 복용하고 증상이 지속되면 복용을 중단하세요."
+    ),
+    "두통": (
+        [r"두통", r"머리\s*(?:가)?\s*아(?:프|파|팠)", r"headache"],
+        "두통이 반복되면 복용을 중단하고 전문가와 상담하세요."
+    ),
+    "설사": (
+        [r"설사", r"배탈", r"diarrh"],
+        "복용량을 줄이거나 중단하고 수분을 충분히 섭취하세요."
+    ),
+    "변비": (
+        [r"변비\s*(?:가)?\s*(?:생|심해|왔)", r"constipat"],
+        "물을 충분히 마시고 증상이 계속되면 복용을 중단하세요."
+    ),
+    "피부 트러블": (
+        [r"뾰루지", r"트러블", r"두드러기", r"가려(?:움|워)", r"\brash\b", r"breakout"],
+        "알레르기 반응일 수 있으니 복용을 중단하고 상담하세요."
+    ),
+    "비린 맛": (
+        [r"비린", r"생선\s*(?:냄새|트림)", r"fishy"],
+        "냉장 보관하거나 식사 직후에 복용하면 비린 맛이 줄어듭니다."
+    ),
+    "알약 크기 불편": (
+        [r"알\s*(?:약)?\s*(?:이|이\s*좀|이\s*너무)?\s*(?:커|크|큼|커서)", r"삼키기\s*(?:가)?\s*(?:힘|어려)", r"(?:pill|capsule)\s*is\s*(?:too\s*)?(?:big|large)"],
+        "물을 충분히 마시고 한 알씩 나누어 복용하세요."
+    ),
+}
+
+# 복용 기간 패턴
+TIMING_PATTERNS: List[str] = [
+    r"(?:\d+|한|두|세|네|다섯|여섯)\s*(?:달|개월|주|일|년)\s*(?:째|정도|동안|만에|후|이상)?",
+    r"(?:일주일|보름|한\s*달\s*반)\s*(?:째|정도|동안|만에|후|이상)?",
+    r"(?:\d+|a|one|two|three|four|six)\s*(?:days?|weeks?|months?|years?)",
+]
+
+# 매칭 직후 이 표현이 오면 부정으로 간주 (예: "속쓰림은 없어요")
+NEGATION_PATTERN = re.compile(r"^\s*(?:은|는|이|가|도|같은\s*건)?\s*(?:전혀\s*|별로\s*|딱히\s*)?(?:없|안\s*(?:생|나|느)|못\s*느)")
+ENGLISH_NEGATION_PATTERN = re.compile(r"\b(?:no|without|never)\s+(?:\w+\s+){0,2}$", re.IGNORECASE)
+
+# 부작용이 없다고 명시한 표현
+NO_SIDE_EFFECT_PATTERN = re.compile(
+    r"부작용\s*(?:은|이|도|같은\s*건)?\s*(?:전혀\s*|딱히\s*|별로\s*)?(?:없|못\s*느)|no\s*side\s*effects?",
+    re.IGNORECASE
+)
+
+DISCLAIMER = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+
+
+def _compile(patterns: List[str]) -> Pattern:
+    """패턴 목록을 하나의 정규식으로 결합"""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+class LocalExtractor:
+    """
+    AI 호출 없는 결정적(deterministic) 리뷰 추출기
+
+    효능/부작용/복용 기간 어휘 사전과 성분 어휘(nutrition_utils.extract_ingredients)를
+    사용하여 summary, efficacy, side_effects, tip 필드를 채웁니다.
+    결과에는 confidence="low"와 source="local_rules"가 표시됩니다.
+    """
+
+    def __init__(
+        self,
+        effect_lexicon: Optional[Dict[str, List[str]]] = None,
+        side_effect_lexicon: Optional[Dict[str, Tuple[List[str], str]]] = None
+    ):
+        """
+        추출기 초기화 (정규식은 생성 시 한 번만 컴파일)
+
+        Args:
+            effect_lexicon: 효능 어휘 사전 (기본값: EFFECT_LEXICON)
+            side_effect_lexicon: 부작용 어휘 사전 (기본값: SIDE_EFFECT_LEXICON)
+        """
+        effects = effect_lexicon or EFFECT_LEXICON
+        side_effects = side_effect_lexicon or SIDE_EFFECT_LEXICON
+
+        self._effects = [(name, _compile(patterns)) for name, patterns in effects.items()]
+        self._side_effects = [
+            (name, _compile(patterns), tip)
+            for name, (patterns, tip) in side_effects.items()
+        ]
+        self._timing = _compile(TIMING_PATTERNS)
+
+    def extract(
+        self,
+        review_text: str,
+        nutrition_info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        리뷰에서 효능/부작용/복용 기간 추출
+
+        Args:
+            review_text: 리뷰 텍스트
+            nutrition_info: 영양성분 정보 (제공 시 ingredient_validation 포함)
+
+        Returns:
+            Dict: {
+                "summary", "efficacy", "side_effects", "tip", "disclaimer",
+                "confidence": "low",
+                "source": "local_rules",
+                "matched": {"effects", "side_effects", "timing", "ingredients"},
+                "ingredient_validation": 성분 검증 결과 (nutrition_info 제공 시)
+            }
+        """
+        text = review_text or ""
+        claimed: List[Tuple[int, int]] = []
+        effects = [name for name, pattern in self._effects if self._find_affirmed(pattern, text, claimed)]
+        side_effects = [
+            (name, tip) for name, pattern, tip in self._side_effects
+            if self._find_affirmed(pattern, text, claimed)
+        ]
+        timing_match = self._timing.search(text)
+        timing = timing_match.group(0).strip() if timing_match else None
+        ingredients = extract_ingredients(text)
+
+        # 효능: 원문 근거 표현만 나열 (복용 기간이 있으면 함께 표시)
+        if effects:
+            efficacy = ", ".join(effects)
+            if timing:
+                efficacy += f" ({timing} 복용 후 체감)"
+        else:
+            efficacy = "정보 없음"
+
+        # 부작용: 명시적 부정("부작용 없어요")과 언급 없음 구분
+        if side_effects:
+            side_effects_text = ", ".join(name for name, _ in side_effects)
+        elif NO_SIDE_EFFECT_PATTERN.search(text):
+            side_effects_text = "부작용 없음 (리뷰 언급)"
+        else:
+            side_effects_text = "정보 없음"
+
+        result = {
+            "summary": self._summarize(effects, side_effects, ingredients, timing),
+            "efficacy": efficacy,
+            "side_effects": side_effects_text,
+            "tip": side_effects[0][1] if side_effects else self._default_tip(effects),
+            "disclaimer": DISCLAIMER,
+            "confidence": "low",
+            "source": "local_rules",
+            "matched": {
+                "effects": effects,
+                "side_effects": [name for name, _ in side_effects],
+                "timing": timing,
+                "ingredients": ingredients
+            }
+        }
+
+        if nutrition_info:
+            valid = [i for i in ingredients if is_valid_ingredient(i, nutrition_info)]
+            invalid = [i for i in ingredients if i not in valid]
+            result["ingredient_validation"] = {
+                "mentioned_ingredients": ingredients,
+                "valid_ingredients": valid,
+                "invalid_ingredients": invalid,
+                "has_invalid_claims": len(invalid) > 0
+            }
+
+        return result
+
+    def extract_batch(self, review_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 리뷰 일괄 추출 (대시보드용)
+
+        Args:
+            review_texts: 리뷰 텍스트 목록
+
+        Returns:
+            List[Dict]: 리뷰별 추출 결과 (입력 순서 유지)
+        """
+        return [self.extract(text) for text in review_texts]
+
+    @staticmethod
+    def _find_affirmed(pattern: Pattern, text: str, claimed: List[Tuple[int, int]]) -> bool:
+        """
+        부정 표현이 뒤따르거나 앞서지 않는 매칭이 있는지 확인
+
+        이미 다른 항목이 차지한 구간(claimed)과 겹치는 매칭은 건너뛰어
+        "눈이 덜 피곤" 같은 표현이 일반 피로 개선으로 중복 집계되지 않도록 합니다.
+        """
+        for match in pattern.finditer(text):
+            start, end = match.span()
+            if any(start < c_end and c_start < end for c_start, c_end in claimed):
+                continue
+            after = text[end:end + 12]
+            before = text[max(0, start - 20):start]
+            if NEGATION_PATTERN.match(after) or ENGLISH_NEGATION_PATTERN.search(before):
+                continue
+            claimed.append((start, end))
+            return True
+        return False
+
+    @staticmethod
+    def _summarize(
+        effects: List[str],
+        side_effects: List[Tuple[str, str]],
+        ingredients: List[str],
+        timing: Optional[str]
+    ) -> str:
+        """한 줄 요약 생성 (30자 이내)"""
+        subject = f"{ingredients[0]} " if ingredients else ""
+        if effects and side_effects:
+            summary = f"{subject}{effects[0]} 체감, {side_effects[0][0]} 언급"
+        elif effects:
+            summary = f"{subject}{timing + ' ' if timing else ''}{effects[0]} 체감"
+        elif side_effects:
+            summary = f"{subject}{side_effects[0][0]} 부작용 언급"
+        else:
+            summary = "구체적 효능/부작용 언급 없음"
+        return summary if len(summary) <= 30 else summary[:29] + "…"
+
+    @staticmethod
+    def _default_tip(effects: List[str]) -> str:
+        """부작용이 없을 때의 기본 조언"""
+        if effects:
+            return "효과 체감에는 개인차가 있으니 꾸준히 복용하며 변화를 관찰하세요."
+        return "리뷰에 구체적 정보가 부족하니 제품 성분표를 함께 확인하세요."
+
+    def salience(self, sentence: str) -> int:
+        """
+        문장 핵심도 점수 (AI 분석용 발췌문 선택에 사용)
+
+        Args:
+            sentence: 문장
+
+        Returns:
+            int: 언급된 범주(성분, 효능, 부작용, 복용 기간) 수 (0~4)
+        """
+        return (
+            bool(extract_ingredients(sentence))
+            + any(pattern.search(sentence) for _, pattern in self._effects)
+            + any(pattern.search(sentence) for _, pattern, _ in self._side_effects)
+            + bool(self._timing.search(sentence))
+        )
+
+
+# 기본 추출기 (정규식 컴파일 비용을 한 번만 지불)
+default_local_extractor = LocalExtractor()
+
+
+def extract_local(
+    review_text: str,
+    nutrition_info: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    로컬 규칙 기반 추출 편의 함수
+
+    Args:
+        review_text: 리뷰 텍스트
+        nutrition_info: 영양성분 정보 (선택적)
+
+    Returns:
+        Dict: LocalExtractor.extract() 결과
+    """
+    return default_local_extractor.extract(review_text, nutrition_info)
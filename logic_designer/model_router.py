@@ -0,0 +1,192 @@
+"""
+모델 라우팅 모듈
+명확한 리뷰는 빠른 소형 모델로, 경계선 리뷰만 대형 모델로 분석합니다.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from core.structured_output import StructuredOutputError
+
+
+class ModelRouter:
+    """
+    티어 기반 Claude 모델 라우터
+
+    기본적으로 빠른 모델(fast)을 사용하고, 다음 경우에만 대형 모델(strong)로 승격합니다.
+    1. 규칙 기반 신뢰도 점수가 경계 구간(borderline_band)에 있을 때
+    2. 리뷰가 길 때 (long_review_chars 이상)
+    3. 빠른 모델의 출력이 검증에 실패했을 때
+    """
+
+    FAST_MODEL = "claude-haiku-4-5-20251001"
+    STRONG_MODEL = "claude-sonnet-4-5-20250929"
+
+    # 광고 판별 기준(40점)을 겨우 넘긴 점수만 경계 구간으로 봄
+    # (기본 입력값만 넣은 깨끗한 리뷰는 45점이므로 구간 밖)
+    BORDERLINE_BAND = (40.0, 44.0)
+
+    # 티어별 지연 시간 샘플 보관 개수 (p50/p95 계산용)
+    LATENCY_WINDOW = 1000
+
+    def __init__(
+        self,
+        fast_model: str = FAST_MODEL,
+        strong_model: str = STRONG_MODEL,
+        borderline_band: Tuple[float, float] = BORDERLINE_BAND,
+        long_review_chars: int = 500
+    ):
+        """
+        라우터 초기화
+
+        Args:
+            fast_model: 기본 분석 모델 (기본값: claude-haiku-4-5-20251001)
+            strong_model: 승격 시 사용할 모델 (기본값: claude-sonnet-4-5-20250929)
+            borderline_band: 대형 모델로 보낼 신뢰도 점수 구간 (이상, 이하, 기본값: 40~44점)
+            long_review_chars: 대형 모델로 보낼 리뷰 길이 기준 (문자 수)
+        """
+        if borderline_band[0] > borderline_band[1]:
+            raise ValueError("borderline_band는 (하한, 상한) 순서여야 합니다.")
+
+        self.fast_model = fast_model
+        self.strong_model = strong_model
+        self.borderline_band = borderline_band
+        self.long_review_chars = long_review_chars
+
+        self._lock = threading.Lock()
+        self._counts = {"fast": 0, "strong": 0}
+        self._latencies = {
+            "fast": deque(maxlen=self.LATENCY_WINDOW),
+            "strong": deque(maxlen=self.LATENCY_WINDOW)
+        }
+        self._escalations = {"borderline": 0, "long_review": 0, "validation_failed": 0}
+
+    def choose_tier(
+        self,
+        review_text: str,
+        trust_score: Optional[float] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        초기 분석 티어 결정
+
+        Args:
+            review_text: 리뷰 텍스트
+            trust_score: 규칙 기반 최종 신뢰도 점수 (없으면 길이 기준만 적용)
+
+        Returns:
+            Tuple[str, Optional[str]]: (티어 "fast"/"strong", 승격 사유)
+        """
+        low, high = self.borderline_band
+        if trust_score is not None and low <= trust_score <= high:
+            return "strong", "borderline"
+        if len(review_text) >= self.long_review_chars:
+            return "strong", "long_review"
+        return "fast", None
+
+    def model_for(self, tier: str) -> str:
+        """티어에 해당하는 모델명 반환"""
+        return self.strong_model if tier == "strong" else self.fast_model
+
+    def analyze(
+        self,
+        analyzer,
+        review_text: str,
+        product_id: Optional[int] = None,
+        trust_score: Optional[float] = None
+    ) -> Dict:
+        """
+        라우팅 규칙에 따라 모델을 선택하여 분석
+
+        Args:
+            analyzer: PharmacistAnalyzer 인스턴스
+            review_text: 분석할 리뷰 텍스트
+            product_id: 제품 ID (선택적)
+            trust_score: 규칙 기반 최종 신뢰도 점수 (선택적)
+
+        Returns:
+            Dict: 분석 결과 (model, model_tier, routing_reason 필드 추가)
+
+        빠른 모델은 응답을 스키마로 파싱하지 못한 경우(StructuredOutputError)에만 대형 모델로 재시도하고,
+        API 오류(429/529, 시간 초과, 연결 오류, 서킷 차단 등)는 그대로 전달합니다.
+
+        Raises:
+            ValueError: 리뷰 텍스트가 10자 미만인 경우
+            Exception: API 오류 또는 대형 모델 분석까지 실패한 경우
+        """
+        tier, reason = self.choose_tier(review_text, trust_score)
+
+        if tier == "fast":
+            try:
+                result = self._timed_analyze(analyzer, "fast", review_text, product_id)
+                result["model_tier"] = "fast"
+                result["routing_reason"] = None
+                return result
+            except StructuredOutputError:
+                tier, reason = "strong", "validation_failed"
+
+        with self._lock:
+            self._escalations[reason] += 1
+
+        result = self._timed_analyze(analyzer, "strong", review_text, product_id)
+        result["model_tier"] = "strong"
+        result["routing_reason"] = reason
+        return result
+
+    def _timed_analyze(
+        self,
+        analyzer,
+        tier: str,
+        review_text: str,
+        product_id: Optional[int]
+    ) -> Dict:
+        """분석 호출 및 티어별 호출 수/지연 시간 기록"""
+        model = self.model_for(tier)
+        start = time.perf_counter()
+        try:
+            result = analyzer.analyze(review_text, product_id, model)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._counts[tier] += 1
+                self._latencies[tier].append(elapsed_ms)
+        result["model"] = model
+        return result
+
+    def get_stats(self) -> Dict:
+        """
+        티어별 호출 통계 반환
+
+        Returns:
+            Dict: {
+                "fast"/"strong": {"model", "count", "p50_latency_ms", "p95_latency_ms"},
+                "escalations": 승격 사유별 건수
+            }
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            latencies = {tier: sorted(values) for tier, values in self._latencies.items()}
+            escalations = dict(self._escalations)
+
+        stats = {}
+        for tier in ("fast", "strong"):
+            samples = latencies[tier]
+            stats[tier] = {
+                "model": self.model_for(tier),
+                "count": counts[tier],
+                "p50_latency_ms": round(_percentile(samples, 50), 1) if samples else None,
+                "p95_latency_ms": round(_percentile(samples, 95), 1) if samples else None
+            }
+        stats["escalations"] = escalations
+        return stats
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    """정렬된 값 목록의 백분위수 (최근접 순위 방식)"""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+# 프로세스 전역 기본 라우터 (analyze()에서 model을 지정하지 않은 경우 사용)
+default_router = ModelRouter()
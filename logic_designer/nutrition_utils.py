@@ -4,8 +4,78 @@
 """
 
 import re
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from database.supabase_client import SupabaseClient
+from core.stage_metrics import stage_metrics
+
+
+# 영양성분 정보 캐시 (제품 ID → (만료 시각, 정보 또는 None))
+# 리뷰 1건 분석 중 체크리스트/신뢰도/AI 분석 단계가 같은 제품을 여러 번 조회하므로 재사용
+NUTRITION_CACHE_TTL_SECONDS = 300.0
+_nutrition_cache: Dict[int, Tuple[float, Optional[Dict[str, Any]]]] = {}
+_nutrition_cache_lock = threading.Lock()
+
+# 성분명 추출 결과 캐시 크기 (리뷰 텍스트 기준)
+INGREDIENT_CACHE_SIZE = 8192
+
+# 리뷰에서 추출하는 주요 건강기능식품 성분 패턴 (규칙 데이터, 증분 재분석 규칙 지문에 포함)
+INGREDIENT_PATTERNS = [
+    # 비타민류
+    r'비타민\s*[A-Z]?\d*',
+    r'비타민\s*[A-Z]',
+    r'Vitamin\s*[A-Z]?\d*',
+    r'Vitamin\s*[A-Z]',
+    
+    # 카로티노이드
+    r'루테인',
+    r'제아잔틴',
+    r'제아잔틴',
+    r'리코펜',
+    r'베타카로틴',
+    r'Lutein',
+    r'Zeaxanthin',
+    r'Lycopene',
+    r'Beta[-\s]?carotene',
+    
+    # 오메가
+    r'오메가\s*3',
+    r'오메가\s*6',
+    r'오메가\s*9',
+    r'Omega\s*3',
+    r'Omega\s*6',
+    r'Omega\s*9',
+    r'DHA',
+    r'EPA',
+    
+    # 프로바이오틱스
+    r'프로바이오틱스',
+    r'Probiotic',
+    r'락토바실러스',
+    r'비피도박테리움',
+    r'Lactobacillus',
+    r'Bifidobacterium',
+    
+    # 미네랄
+    r'칼슘',
+    r'마그네슘',
+    r'아연',
+    r'셀레늄',
+    r'Calcium',
+    r'Magnesium',
+    r'Zinc',
+    r'Selenium',
+    
+    # 기타
+    r'코엔자임\s*Q10',
+    r'CoQ10',
+    r'글루코사민',
+    r'콘드로이틴',
+    r'Glucosamine',
+    r'Chondroitin',
+]
 
 
 def get_nutrition_info_safe(product_id: int) -> Optional[Dict[str, Any]]:
@@ -21,29 +91,97 @@ def get_nutrition_info_safe(product_id: int) -> Optional[Dict[str, Any]]:
     Note:
         - 오류 발생 시 None 반환 (오류 없이)
         - 영양성분 DB가 없어도 기존 기능은 정상 동작
+        - 조회 결과(정보 없음 포함)는 NUTRITION_CACHE_TTL_SECONDS 동안 캐시 (오류는 캐시하지 않음)
     """
+    with _nutrition_cache_lock:
+        cached = _nutrition_cache.get(product_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     try:
-        client = SupabaseClient()
-        supabase = client.get_client()
-        
-        # nutrition_info 테이블에서 제품 정보 조회
-        # 실제 스키마에 맞게 조정 필요
-        response = supabase.table('nutrition_info')\
-            .select('*')\
-            .eq('product_id', product_id)\
-            .execute()
+        with stage_metrics.time("nutrition_fetch"):
+            client = SupabaseClient()
+            supabase = client.get_client()
+            
+            # nutrition_info 테이블에서 제품 정보 조회
+            # 실제 스키마에 맞게 조정 필요
+            response = supabase.table('nutrition_info')\
+                .select('*')\
+                .eq('product_id', product_id)\
+                .execute()
         
+        nutrition_info = None  # 정보 없음 (오류 아님)
         if response.data and len(response.data) > 0:
-            return {
+            nutrition_info = {
                 'ingredients': response.data,
                 'product_id': product_id
             }
-        return None  # 정보 없음 (오류 아님)
-    except Exception:
+        _store_nutrition_info({product_id: nutrition_info})
+        return nutrition_info
+    except Exception as e:
         # 모든 예외를 무시하고 None 반환 (오류 없이)
+        stage_metrics.record_error("nutrition_fetch", e)
         return None
 
 
+def prefetch_nutrition_info(product_ids: Iterable[int]) -> int:
+    """
+    여러 제품의 영양성분 정보를 한 번의 쿼리로 미리 조회하여 캐시
+    (배치 분석 시 리뷰마다 제품별로 반복 조회하지 않도록 사용)
+
+    Args:
+        product_ids: 제품 ID 목록 (중복/None 허용)
+
+    Returns:
+        int: 새로 조회한 제품 수 (오류 시 0, 이미 캐시된 제품은 제외)
+    """
+    now = time.monotonic()
+    with _nutrition_cache_lock:
+        missing = sorted({
+            pid for pid in product_ids
+            if pid is not None and not (pid in _nutrition_cache and _nutrition_cache[pid][0] > now)
+        })
+    if not missing:
+        return 0
+
+    try:
+        with stage_metrics.time("nutrition_fetch"):
+            client = SupabaseClient()
+            supabase = client.get_client()
+            response = supabase.table('nutrition_info')\
+                .select('*')\
+                .in_('product_id', missing)\
+                .execute()
+
+        rows_by_product: Dict[int, List[Dict[str, Any]]] = {}
+        for row in response.data or []:
+            rows_by_product.setdefault(row.get('product_id'), []).append(row)
+
+        _store_nutrition_info({
+            pid: {'ingredients': rows_by_product[pid], 'product_id': pid} if pid in rows_by_product else None
+            for pid in missing
+        })
+        return len(missing)
+    except Exception as e:
+        # 미리 조회 실패 시 개별 조회로 대체 (오류 없이)
+        stage_metrics.record_error("nutrition_fetch", e)
+        return 0
+
+
+def clear_nutrition_cache() -> None:
+    """영양성분 정보 캐시 비우기 (DB 갱신 직후 등)"""
+    with _nutrition_cache_lock:
+        _nutrition_cache.clear()
+
+
+def _store_nutrition_info(entries: Dict[int, Optional[Dict[str, Any]]]) -> None:
+    """조회 결과를 캐시에 저장"""
+    expires_at = time.monotonic() + NUTRITION_CACHE_TTL_SECONDS
+    with _nutrition_cache_lock:
+        for product_id, nutrition_info in entries.items():
+            _nutrition_cache[product_id] = (expires_at, nutrition_info)
+
+
 def extract_ingredients(text: str) -> List[str]:
     """
     리뷰 텍스트에서 성분명 추출
@@ -53,70 +191,23 @@ def extract_ingredients(text: str) -> List[str]:
         
     Returns:
         List[str]: 추출된 성분명 리스트
+
+    Note:
+        - 같은 텍스트의 추출 결과는 캐시 (체크리스트/신뢰도 점수/분석기 등
+          여러 단계가 같은 리뷰를 검사해도 한 번만 추출)
     """
     if not text:
         return []
-    
-    # 주요 건강기능식품 성분 패턴
-    ingredient_patterns = [
-        # 비타민류
-        r'비타민\s*[A-Z]?\d*',
-        r'비타민\s*[A-Z]',
-        r'Vitamin\s*[A-Z]?\d*',
-        r'Vitamin\s*[A-Z]',
-        
-        # 카로티노이드
-        r'루테인',
-        r'제아잔틴',
-        r'제아잔틴',
-        r'리코펜',
-        r'베타카로틴',
-        r'Lutein',
-        r'Zeaxanthin',
-        r'Lycopene',
-        r'Beta[-\s]?carotene',
-        
-        # 오메가
-        r'오메가\s*3',
-        r'오메가\s*6',
-        r'오메가\s*9',
-        r'Omega\s*3',
-        r'Omega\s*6',
-        r'Omega\s*9',
-        r'DHA',
-        r'EPA',
-        
-        # 프로바이오틱스
-        r'프로바이오틱스',
-        r'Probiotic',
-        r'락토바실러스',
-        r'비피도박테리움',
-        r'Lactobacillus',
-        r'Bifidobacterium',
-        
-        # 미네랄
-        r'칼슘',
-        r'마그네슘',
-        r'아연',
-        r'셀레늄',
-        r'Calcium',
-        r'Magnesium',
-        r'Zinc',
-        r'Selenium',
-        
-        # 기타
-        r'코엔자임\s*Q10',
-        r'CoQ10',
-        r'글루코사민',
-        r'콘드로이틴',
-        r'Glucosamine',
-        r'Chondroitin',
-    ]
-    
+    return list(_extract_ingredients_cached(text))
+
+
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
+def _extract_ingredients_cached(text: str) -> Tuple[str, ...]:
+    """extract_ingredients() 본체 (캐시 공유를 위해 변경 불가능한 튜플 반환)"""
     extracted = []
     text_lower = text.lower()
     
-    for pattern in ingredient_patterns:
+    for pattern in INGREDIENT_PATTERNS:
         matches = re.findall(pattern, text, re.IGNORECASE)
         extracted.extend(matches)
     
@@ -130,7 +221,7 @@ def extract_ingredients(text: str) -> List[str]:
             seen.add(normalized_item)
             normalized.append(item.strip())
     
-    return normalized
+    return tuple(normalized)
 
 
 def normalize_ingredient_name(name: str) -> str:
@@ -0,0 +1,588 @@
+"""
+리뷰 분석 단계 함수 및 배치 파이프라인
+analyze()와 analyze_batch()가 공유하는 규칙 단계/AI 분석 단계를 정의하고,
+대량 리뷰를 단계별 파이프라인(영양성분 미리 조회 → 규칙 검사/신뢰도 → AI 분석)으로 처리합니다.
+"""
+
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from core.circuit_breaker import CircuitOpenError
+from core.length_policy import RULE_WINDOW_CHARS, split_windows
+from core.stage_metrics import stage_metrics
+from .checklist import AdChecklist
+from .trust_score import TrustScoreCalculator
+from .analyzer import PharmacistAnalyzer, get_pharmacist_analyzer
+from .model_router import ModelRouter, default_router
+from .dedup import default_dedup_index
+from .local_extractor import extract_local
+from .pre_classifier import get_pre_classifier
+from .nutrition_utils import extract_ingredients, normalize_ingredient_name, prefetch_nutrition_info
+
+
+# 배치 입력 딕셔너리에서 읽는 점수 필드와 기본값 (analyze()의 기본값과 동일)
+SCORE_FIELDS = {
+    "length_score": 50,
+    "repurchase_score": 50,
+    "monthly_use_score": 50,
+    "photo_score": 0,
+    "consistency_score": 50
+}
+
+DISCLAIMER = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+
+
+def too_short_result() -> Dict:
+    """10자 미만 리뷰 결과"""
+    return {
+        "error": "REVIEW_TOO_SHORT",
+        "message": "리뷰가 너무 짧습니다 (최소 10자 이상)",
+        "validation": None,
+        "analysis": None
+    }
+
+
+def run_rule_stage(
+    review_text: str,
+    product_id: Optional[int] = None,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50,
+    use_nutrition_validation: bool = True,
+    pre_classify: bool = False,
+    local_only: bool = False
+) -> Tuple[Dict, float, Optional[str]]:
+    """
+    규칙 단계 실행: 광고 패턴 검사 → 신뢰도 점수 → 광고 판별 (→ 사전 분류)
+
+    각 단계가 실패해도 기본값으로 계속 진행합니다 (예외 없음).
+
+    Args:
+        review_text: 리뷰 텍스트 (10자 이상)
+        product_id: 제품 ID (선택적)
+        length_score ~ consistency_score: 신뢰도 점수 입력값
+        use_nutrition_validation: 영양성분 검증 사용 여부
+        pre_classify: 사전 분류기 실행 여부 (광고가 아니고 local_only가 아닌 경우만)
+        local_only: 로컬 추출기 전용 모드 여부
+
+    Returns:
+        Tuple[Dict, float, Optional[str]]: (검증 결과, 최종 신뢰도 점수, 사전 분류 판정)
+    """
+    validation_result, final_score, detected_issues = _run_rule_checks(
+        review_text,
+        product_id,
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score,
+        use_nutrition_validation=use_nutrition_validation
+    )
+
+    # 사전 분류: 체크리스트 결과를 재사용하여 확실한 경우 AI 호출 생략
+    pre_decision = None
+    if pre_classify and not validation_result["is_ad"] and not local_only:
+        pre_decision = _pre_classify([review_text], [detected_issues], [validation_result])[0]
+
+    return validation_result, final_score, pre_decision
+
+
+def _run_rule_checks(
+    review_text: str,
+    product_id: Optional[int],
+    length_score: float,
+    repurchase_score: float,
+    monthly_use_score: float,
+    photo_score: float,
+    consistency_score: float,
+    use_nutrition_validation: bool
+) -> Tuple[Dict, float, Dict[int, str]]:
+    """
+    규칙 단계 중 사전 분류 이전 부분: 광고 패턴 검사 → 신뢰도 점수 → 광고 판별
+
+    Returns:
+        Tuple[Dict, float, Dict[int, str]]: (검증 결과, 최종 신뢰도 점수, 체크리스트 결과)
+    """
+    # 1단계: 광고 패턴 검사 (영양성분 DB 통합)
+    try:
+        with stage_metrics.time("checklist"):
+            checklist = AdChecklist()
+            detected_issues = checklist.check_ad_patterns(review_text, product_id)
+        penalty_count = len(detected_issues)
+    except Exception as e:
+        # 체크리스트 검사 실패 시 기본값 사용
+        stage_metrics.record_error("checklist", e)
+        detected_issues = {}
+        penalty_count = 0
+
+    # 2단계: 신뢰도 점수 계산 (영양성분 일치도 포함)
+    calculator = TrustScoreCalculator()
+    try:
+        with stage_metrics.time("trust_score"):
+            score_result = calculator.calculate_final_score(
+                length_score=length_score,
+                repurchase_score=repurchase_score,
+                monthly_use_score=monthly_use_score,
+                photo_score=photo_score,
+                consistency_score=consistency_score,
+                penalty_count=penalty_count,
+                review_text=review_text if use_nutrition_validation else None,
+                product_id=product_id if use_nutrition_validation else None,
+                use_nutrition_score=use_nutrition_validation
+            )
+    except Exception as e:
+        # 점수 계산 실패 시 기본값 사용
+        stage_metrics.record_error("trust_score", e)
+        score_result = {
+            "base_score": 50.0,
+            "nutrition_score": 50.0,
+            "penalty": penalty_count * 10,
+            "final_score": max(0, 50.0 - (penalty_count * 10)),
+            "raw_scores": {
+                "L": length_score,
+                "R": repurchase_score,
+                "M": monthly_use_score,
+                "P": photo_score,
+                "C": consistency_score,
+                "N": 50.0
+            }
+        }
+
+    # 3단계: 광고 여부 판별
+    try:
+        is_ad = calculator.is_ad(
+            final_score=score_result["final_score"],
+            penalty_count=penalty_count
+        )
+    except Exception as e:
+        # 광고 판별 실패 시 기본값 사용
+        stage_metrics.record_error("trust_score", e)
+        is_ad = score_result["final_score"] < 40 or penalty_count >= 3
+
+    # 감점 사유 리스트 생성
+    reasons = [f"{num}. {name}" for num, name in detected_issues.items()]
+
+    validation_result = {
+        "trust_score": score_result["final_score"],
+        "is_ad": is_ad,
+        "reasons": reasons,
+        "base_score": score_result["base_score"],
+        "penalty": score_result["penalty"],
+        "detected_count": penalty_count,
+        "raw_scores": score_result["raw_scores"]
+    }
+
+    # 영양성분 점수 추가 (있는 경우)
+    if "nutrition_score" in score_result:
+        validation_result["nutrition_score"] = score_result["nutrition_score"]
+
+    # 긴 리뷰: 규칙 검사 구간 수와 검사하지 않은 문자 수 기록
+    if len(review_text) > RULE_WINDOW_CHARS:
+        windows, covered_chars = split_windows(review_text)
+        validation_result["rule_input"] = {
+            "windows": len(windows),
+            "checked_chars": covered_chars,
+            "skipped_chars": len(review_text) - covered_chars
+        }
+
+    return validation_result, score_result["final_score"], detected_issues
+
+
+def _pre_classify(
+    review_texts: Sequence[str],
+    checklist_results: Sequence[Dict[int, str]],
+    validation_results: Sequence[Dict]
+) -> List[Optional[str]]:
+    """
+    사전 분류기로 리뷰 목록을 한 번에 판정하고 각 검증 결과에 판정을 기록
+
+    모델 파일이 없거나 손상된 경우 모두 None (사전 분류 없이 진행)을 반환합니다.
+
+    Returns:
+        List[Optional[str]]: 리뷰별 사전 분류 판정
+    """
+    try:
+        classifier = get_pre_classifier()
+        decisions = classifier.classify_batch(list(review_texts), list(checklist_results))
+    except Exception as e:
+        stage_metrics.record_error("pre_classifier", e)
+        return [None] * len(review_texts)
+
+    for validation_result, (decision, ad_probability) in zip(validation_results, decisions):
+        validation_result["pre_classifier"] = {
+            "decision": decision,
+            "ad_probability": ad_probability,
+            "model_version": classifier.version
+        }
+    return [decision for decision, _ in decisions]
+
+
+def resolve_without_llm(
+    review_text: str,
+    is_ad: bool,
+    pre_decision: Optional[str],
+    local_only: bool
+) -> Optional[Dict]:
+    """
+    AI 분석 없이 결정되는 분석 결과 반환 (AI 분석이 필요하면 None)
+
+    Args:
+        review_text: 리뷰 텍스트
+        is_ad: 규칙 기반 광고 판별 결과
+        pre_decision: 사전 분류 판정 ("ad"/"genuine"/"uncertain"/None)
+        local_only: 로컬 추출기 전용 모드 여부
+
+    Returns:
+        Optional[Dict]: 분석 결과 또는 None (AI 분석 필요)
+    """
+    if is_ad:
+        # 광고인 경우 분석 생략
+        return {
+            "error": "AD_REVIEW",
+            "message": "광고 리뷰는 분석하지 않습니다.",
+            "summary": "광고 리뷰",
+            "efficacy": "정보 없음",
+            "side_effects": "정보 없음",
+            "tip": "이 리뷰는 광고로 판별되어 분석하지 않습니다.",
+            "disclaimer": DISCLAIMER
+        }
+    if local_only:
+        # AI 호출 없는 로컬 추출 (낮은 신뢰도)
+        return extract_local(review_text)
+    if pre_decision == "ad":
+        # 사전 분류기가 확실한 광고로 판정 (AI 분석 생략)
+        return {
+            "error": "PRE_CLASSIFIED_AD",
+            "message": "사전 분류기가 광고로 판정하여 분석하지 않습니다.",
+            "summary": "광고 의심 리뷰",
+            "efficacy": "정보 없음",
+            "side_effects": "정보 없음",
+            "tip": "이 리뷰는 광고 가능성이 높아 분석하지 않습니다.",
+            "disclaimer": DISCLAIMER
+        }
+    if pre_decision == "genuine":
+        # 사전 분류기가 확실한 정상 리뷰로 판정 (로컬 추출기로 분석)
+        analysis_result = extract_local(review_text)
+        analysis_result["pre_classified"] = True
+        return analysis_result
+    return None
+
+
+def run_llm_analysis(
+    review_text: str,
+    product_id: Optional[int],
+    api_key: Optional[str],
+    model: Optional[str],
+    router: Optional[ModelRouter],
+    trust_score: Optional[float],
+    reuse_similar: bool = False
+) -> Dict:
+    """
+    AI 분석 단계 실행 (예외 없이 항상 분석 결과 딕셔너리 반환)
+
+    Args:
+        review_text: 분석할 리뷰 텍스트
+        product_id: 제품 ID (영양성분 검증 미사용 시 None)
+        api_key: Anthropic API 키 (선택)
+        model: 사용할 Claude 모델 (None이면 라우터가 선택)
+        router: 모델 라우터 (None이면 default_router)
+        trust_score: 규칙 기반 최종 신뢰도 점수 (투기적 실행 시 None)
+        reuse_similar: 거의 같은 리뷰의 이전 분석 결과 재사용 여부
+
+    Returns:
+        Dict: 분석 결과 또는 오류 정보
+    """
+    if not reuse_similar:
+        return _call_llm_analysis(review_text, product_id, api_key, model, router, trust_score)
+
+    # 같은 제품, 같은 언급 성분, 같은 지정 모델일 때만 재사용 (영양성분 검증 결과가 같도록)
+    context = (
+        product_id,
+        frozenset(normalize_ingredient_name(i) for i in extract_ingredients(review_text)),
+        model
+    )
+    cached = default_dedup_index.lookup(review_text, context)
+    if cached is not None:
+        analysis_result, similarity = cached
+        analysis_result["reused"] = True
+        analysis_result["reuse_similarity"] = round(similarity, 4)
+        return analysis_result
+
+    analysis_result = _call_llm_analysis(review_text, product_id, api_key, model, router, trust_score)
+    if "error" not in analysis_result:
+        default_dedup_index.add(review_text, analysis_result, context)
+        analysis_result["reused"] = False
+    return analysis_result
+
+
+def _call_llm_analysis(
+    review_text: str,
+    product_id: Optional[int],
+    api_key: Optional[str],
+    model: Optional[str],
+    router: Optional[ModelRouter],
+    trust_score: Optional[float]
+) -> Dict:
+    """AI 분석 호출 (서킷 브레이커/라우터 경유, 오류 시 오류 정보 반환)"""
+    with stage_metrics.time("llm"):
+        return _call_llm_analysis_untimed(review_text, product_id, api_key, model, router, trust_score)
+
+
+def _call_llm_analysis_untimed(
+    review_text: str,
+    product_id: Optional[int],
+    api_key: Optional[str],
+    model: Optional[str],
+    router: Optional[ModelRouter],
+    trust_score: Optional[float]
+) -> Dict:
+    """_call_llm_analysis 본체"""
+    try:
+        analyzer = get_pharmacist_analyzer(api_key=api_key)
+        if model:
+            # 모델을 직접 지정한 경우 라우팅 없이 해당 모델 사용
+            return analyzer.analyze_safe(
+                review_text,
+                product_id=product_id,
+                model=model
+            )
+        # 서킷 브레이커를 거쳐 호출 (API 장애 중에는 즉시 규칙 기반 전용 결과)
+        return analyzer.breaker.call(
+            (router or default_router).analyze,
+            analyzer,
+            review_text,
+            product_id=product_id,
+            trust_score=trust_score
+        )
+    except CircuitOpenError as e:
+        stage_metrics.record_error("llm", e)
+        return PharmacistAnalyzer.fallback_result(str(e))
+    except Exception as e:
+        stage_metrics.record_error("llm", e)
+        return {
+            "error": "ANALYSIS_ERROR",
+            "message": str(e),
+            "summary": "분석 실패",
+            "efficacy": "정보 없음",
+            "side_effects": "정보 없음",
+            "tip": "분석 중 오류가 발생했습니다.",
+            "disclaimer": DISCLAIMER
+        }
+
+
+def analyze_batch(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    use_nutrition_validation: bool = True,
+    router: Optional[ModelRouter] = None,
+    reuse_similar: bool = False,
+    local_only: bool = False,
+    pre_classify: bool = False,
+    rule_workers: int = 4,
+    llm_concurrency: int = 8,
+    max_in_flight: int = 256,
+    prefetch_size: int = 64
+) -> Iterator[Dict]:
+    """
+    여러 리뷰를 단계별 파이프라인으로 분석하여 끝나는 순서대로 결과를 반환하는 제너레이터
+
+    단계:
+        1. 영양성분 미리 조회: prefetch_size개 단위로 제품 ID를 모아 한 번에 조회 (캐시)
+        2. 규칙 검사 + 신뢰도 점수 + 광고 판별: rule_workers개 작업 스레드
+        3. 사전 분류 (pre_classify): 같은 단위의 규칙 검사가 끝나면 광고가 아닌 리뷰를 한 번에 판정
+        4. AI 분석: 광고가 아니고 로컬로 결정되지 않은 리뷰만 llm_concurrency개 동시 호출
+
+    입력은 필요한 만큼만 읽으므로(진행 중인 리뷰는 최대 max_in_flight개)
+    수만 건의 리뷰도 메모리 사용량이 일정합니다. 중간에 순회를 멈추면 남은 작업은 취소됩니다.
+
+    Args:
+        reviews: 리뷰 텍스트 또는 딕셔너리 {"text", "id"(선택), "product_id"(선택),
+                 "length_score" 등 점수 필드(선택)}의 iterable
+        api_key, model, use_nutrition_validation, router, reuse_similar,
+        local_only, pre_classify: analyze()와 동일
+        rule_workers: 규칙 단계 작업 스레드 수
+        llm_concurrency: 동시 AI 분석 호출 수
+        max_in_flight: 동시에 처리 중인 리뷰 수 상한
+        prefetch_size: 영양성분 미리 조회 단위 (리뷰 수)
+
+    Yields:
+        Dict: analyze()와 같은 결과에 "index"(입력 순서)와 "id"(입력에 있는 경우)를 추가한 딕셔너리
+
+    Example:
+        >>> for result in analyze_batch(reviews, llm_concurrency=16):
+        ...     save(result["id"], result)
+    """
+    if max_in_flight < 1 or prefetch_size < 1:
+        raise ValueError("max_in_flight와 prefetch_size는 1 이상이어야 합니다.")
+
+    indexed_reviews = enumerate(reviews)
+    prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-prefetch")
+    rule_pool = ThreadPoolExecutor(max_workers=rule_workers, thread_name_prefix="batch-rules")
+    llm_pool = ThreadPoolExecutor(max_workers=llm_concurrency, thread_name_prefix="batch-llm")
+    pending: Dict[Future, Tuple[str, int, Dict[str, Any]]] = {}
+    # 입력 단위별 남은 규칙 작업 수와 사전 분류 대기 리뷰 (단위의 규칙 검사가 모두 끝나면 한 번에 판정)
+    chunks: Dict[int, Dict[str, Any]] = {}
+    chunk_of: Dict[int, int] = {}
+    in_flight = 0
+    exhausted = False
+
+    try:
+        while True:
+            # 입력 읽기: 진행 중인 리뷰 수가 상한보다 적을 때만
+            while not exhausted and in_flight < max_in_flight:
+                chunk = list(itertools.islice(indexed_reviews, min(prefetch_size, max_in_flight - in_flight)))
+                if not chunk:
+                    exhausted = True
+                    break
+                chunk_id = chunk[0][0]
+                chunks[chunk_id] = {"remaining": len(chunk), "candidates": []}
+                in_flight += len(chunk)
+                items = [(index, _normalize_review(review)) for index, review in chunk]
+                product_ids = {item["product_id"] for _, item in items if item["product_id"] is not None}
+                prefetch = prefetch_pool.submit(prefetch_nutrition_info, product_ids) if product_ids else None
+                for index, item in items:
+                    future = rule_pool.submit(
+                        _rule_task, prefetch, item, use_nutrition_validation, pre_classify, local_only
+                    )
+                    pending[future] = ("rules", index, item)
+                    chunk_of[index] = chunk_id
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            ready = []
+            for future in done:
+                stage, index, item = pending.pop(future)
+                if stage == "rules":
+                    result, trust_score, checklist_result = future.result()
+                    chunk_id = chunk_of.pop(index)
+                    chunk_state = chunks[chunk_id]
+                    chunk_state["remaining"] -= 1
+                    if checklist_result is not None:
+                        chunk_state["candidates"].append((index, item, result, trust_score, checklist_result))
+                    else:
+                        ready.append((index, item, result, trust_score))
+                    if chunk_state["remaining"] == 0:
+                        del chunks[chunk_id]
+                        if chunk_state["candidates"]:
+                            classify_future = rule_pool.submit(_pre_classify_task, chunk_state["candidates"])
+                            pending[classify_future] = ("pre_classify", chunk_id, {})
+                elif stage == "pre_classify":
+                    ready.extend(future.result())
+                else:
+                    result = item["result"]
+                    result["analysis"] = future.result()
+                    ready.append((index, item, result, None))
+
+            for index, item, result, trust_score in ready:
+                if trust_score is not None:
+                    # AI 분석 필요 → 다음 단계로
+                    llm_future = llm_pool.submit(
+                        run_llm_analysis,
+                        item["text"],
+                        item["product_id"] if use_nutrition_validation else None,
+                        api_key,
+                        model,
+                        router,
+                        trust_score,
+                        reuse_similar
+                    )
+                    pending[llm_future] = ("llm", index, {**item, "result": result})
+                    continue
+                in_flight -= 1
+                yield _with_identity(result, index, item)
+    finally:
+        # 순회가 중간에 멈춘 경우 남은 작업 취소
+        for future in pending:
+            future.cancel()
+        for pool in (prefetch_pool, rule_pool, llm_pool):
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _normalize_review(review: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """배치 입력 항목을 {"text", "id", "product_id", 점수 필드} 형태로 변환"""
+    if isinstance(review, str):
+        review = {"text": review}
+    item = {
+        "text": review.get("text") or review.get("review_text") or "",
+        "id": review.get("id", review.get("review_id")),
+        "product_id": review.get("product_id")
+    }
+    for field, default in SCORE_FIELDS.items():
+        value = review.get(field)
+        item[field] = default if value is None else value
+    return item
+
+
+def _rule_task(
+    prefetch: Optional[Future],
+    item: Dict[str, Any],
+    use_nutrition_validation: bool,
+    pre_classify: bool,
+    local_only: bool
+) -> Tuple[Dict, Optional[float], Optional[Dict[int, str]]]:
+    """
+    규칙 단계 작업 (작업 스레드에서 실행)
+
+    사전 분류는 입력 단위로 모아 _pre_classify_task()에서 한 번에 실행하므로 여기서는 하지 않습니다.
+
+    Returns:
+        Tuple[Dict, Optional[float], Optional[Dict[int, str]]]:
+            (결과, 신뢰도 점수 → AI 분석 또는 사전 분류가 필요한 경우만, 아니면 None,
+             체크리스트 결과 → 사전 분류 대상인 경우만, 아니면 None)
+    """
+    if prefetch is not None:
+        prefetch.result()
+
+    review_text = item["text"]
+    if len(review_text.strip()) < 10:
+        return too_short_result(), None, None
+
+    validation_result, trust_score, detected_issues = _run_rule_checks(
+        review_text,
+        item["product_id"],
+        **{field: item[field] for field in SCORE_FIELDS},
+        use_nutrition_validation=use_nutrition_validation
+    )
+    if pre_classify and not validation_result["is_ad"] and not local_only:
+        return {"validation": validation_result, "analysis": None}, trust_score, detected_issues
+
+    analysis_result = resolve_without_llm(review_text, validation_result["is_ad"], None, local_only)
+    result = {"validation": validation_result, "analysis": analysis_result}
+    return result, (trust_score if analysis_result is None else None), None
+
+
+def _pre_classify_task(
+    candidates: List[Tuple[int, Dict[str, Any], Dict, float, Dict[int, str]]]
+) -> List[Tuple[int, Dict[str, Any], Dict, Optional[float]]]:
+    """
+    입력 단위의 사전 분류 대상 리뷰를 classify_batch() 한 번으로 판정 (작업 스레드에서 실행)
+
+    Args:
+        candidates: [(입력 순서, 입력 항목, 결과, 신뢰도 점수, 체크리스트 결과)]
+
+    Returns:
+        List: [(입력 순서, 입력 항목, 결과, 신뢰도 점수 → AI 분석이 필요한 경우만, 아니면 None)]
+    """
+    decisions = _pre_classify(
+        [item["text"] for _, item, _, _, _ in candidates],
+        [checklist_result for _, _, _, _, checklist_result in candidates],
+        [result["validation"] for _, _, result, _, _ in candidates]
+    )
+    resolved = []
+    for (index, item, result, trust_score, _), pre_decision in zip(candidates, decisions):
+        result["analysis"] = resolve_without_llm(item["text"], False, pre_decision, False)
+        resolved.append((index, item, result, trust_score if result["analysis"] is None else None))
+    return resolved
+
+
+def _with_identity(result: Dict, index: int, item: Dict[str, Any]) -> Dict:
+    """결과에 입력 순서와 리뷰 ID 추가"""
+    result["index"] = index
+    if item["id"] is not None:
+        result["id"] = item["id"]
+    return result
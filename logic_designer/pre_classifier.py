@@ -0,0 +1,336 @@
+"""
+로컬 사전 분류기 모듈
+문자 n-gram + 13단계 체크리스트 결과를 특징으로 하는 로지스틱 회귀(NumPy)로
+확실한 광고/확실한 정상 리뷰를 걸러 AI 호출을 줄입니다.
+
+모델은 scripts/train_pre_classifier.py로 오프라인 학습하여
+logic_designer/models/pre_classifier_v{버전}.npz에 저장하고, 최초 사용 시 로드합니다.
+"""
+
+import json
+import re
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+# 모델 파일 버전 (특징 구성이 바뀌면 올리고 다시 학습)
+MODEL_VERSION = 1
+MODEL_DIR = Path(__file__).parent / "models"
+
+# 특징 구성: 해시된 문자 n-gram 차원 + 체크리스트 13개 항목
+NGRAM_RANGE = (2, 3)
+HASH_DIM = 4096
+CHECKLIST_ITEMS = 13
+
+# 기본 판정 임계값 (광고 확률 기준)
+AD_THRESHOLD = 0.9
+GENUINE_THRESHOLD = 0.1
+
+# 일괄 추론 시 한 번에 만드는 행렬 행 수 (메모리 상한)
+BATCH_ROWS = 1024
+
+
+def default_model_path(version: int = MODEL_VERSION) -> Path:
+    """버전별 기본 모델 파일 경로"""
+    return MODEL_DIR / f"pre_classifier_v{version}.npz"
+
+
+def _normalize(text: str) -> str:
+    """소문자 변환 및 공백 정리 (문장부호는 광고 신호이므로 유지)"""
+    return re.sub(r"\s+", " ", (text or "").lower()).strip()
+
+
+def _hashed_ngrams(text: str) -> Dict[int, float]:
+    """문자 n-gram 해시 버킷별 등장 횟수"""
+    normalized = _normalize(text)
+    counts: Dict[int, float] = {}
+    for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1):
+        for i in range(len(normalized) - n + 1):
+            bucket = zlib.crc32(normalized[i:i + n].encode("utf-8")) % HASH_DIM
+            counts[bucket] = counts.get(bucket, 0.0) + 1.0
+    return counts
+
+
+def vectorize(
+    texts: Sequence[str],
+    checklist_results: Optional[Sequence[Dict[int, str]]] = None
+) -> np.ndarray:
+    """
+    리뷰 목록을 특징 행렬로 변환
+
+    n-gram 부분은 log(1+tf) 후 행별 L2 정규화, 체크리스트 부분은 감지 여부(0/1)입니다.
+
+    Args:
+        texts: 리뷰 텍스트 목록
+        checklist_results: 리뷰별 체크리스트 결과 ({항목번호: 항목명}, 없으면 새로 검사)
+
+    Returns:
+        np.ndarray: (리뷰 수, HASH_DIM + CHECKLIST_ITEMS) float32 행렬
+    """
+    if checklist_results is None:
+        from .checklist import AdChecklist
+        checklist = AdChecklist()
+        checklist_results = [checklist.check_ad_patterns(text) for text in texts]
+
+    matrix = np.zeros((len(texts), HASH_DIM + CHECKLIST_ITEMS), dtype=np.float32)
+    for row, text in enumerate(texts):
+        counts = _hashed_ngrams(text)
+        if counts:
+            buckets = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            matrix[row, buckets] = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        for item_num in checklist_results[row]:
+            if 1 <= item_num <= CHECKLIST_ITEMS:
+                matrix[row, HASH_DIM + item_num - 1] = 1.0
+
+    ngrams = np.log1p(matrix[:, :HASH_DIM])
+    norms = np.linalg.norm(ngrams, axis=1, keepdims=True)
+    matrix[:, :HASH_DIM] = ngrams / np.maximum(norms, 1e-12)
+    return matrix
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    """수치적으로 안정한 시그모이드"""
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+class PreClassifier:
+    """
+    광고 확률을 예측하는 로지스틱 회귀 사전 분류기
+
+    classify_batch()는 광고 확률이 ad_threshold 이상이면 "ad",
+    genuine_threshold 이하이면 "genuine", 그 사이면 "uncertain"(AI 분석 필요)으로 판정합니다.
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: float,
+        ad_threshold: float = AD_THRESHOLD,
+        genuine_threshold: float = GENUINE_THRESHOLD,
+        metadata: Optional[Dict] = None
+    ):
+        """
+        분류기 초기화
+
+        Args:
+            weights: 특징 가중치 (HASH_DIM + CHECKLIST_ITEMS,)
+            bias: 절편
+            ad_threshold: 확실한 광고 판정 기준 확률
+            genuine_threshold: 확실한 정상 판정 기준 확률
+            metadata: 모델 메타데이터 (버전, 학습 시각, 학습 정확도 등)
+        """
+        if weights.shape != (HASH_DIM + CHECKLIST_ITEMS,):
+            raise ValueError(f"가중치 크기가 특징 구성과 다릅니다: {weights.shape}")
+        self.weights = weights.astype(np.float32)
+        self.bias = float(bias)
+        self.ad_threshold = ad_threshold
+        self.genuine_threshold = genuine_threshold
+        self.metadata = metadata or {}
+
+    @property
+    def version(self) -> int:
+        """모델 버전"""
+        return int(self.metadata.get("version", MODEL_VERSION))
+
+    def predict_proba(
+        self,
+        texts: Sequence[str],
+        checklist_results: Optional[Sequence[Dict[int, str]]] = None
+    ) -> np.ndarray:
+        """
+        리뷰 목록의 광고 확률 일괄 예측
+
+        Args:
+            texts: 리뷰 텍스트 목록
+            checklist_results: 리뷰별 체크리스트 결과 (없으면 새로 검사)
+
+        Returns:
+            np.ndarray: 리뷰별 광고 확률 (0~1)
+        """
+        probabilities = np.empty(len(texts), dtype=np.float64)
+        for start in range(0, len(texts), BATCH_ROWS):
+            end = start + BATCH_ROWS
+            chunk_checklist = checklist_results[start:end] if checklist_results is not None else None
+            features = vectorize(texts[start:end], chunk_checklist)
+            probabilities[start:end] = _sigmoid(features @ self.weights + self.bias)
+        return probabilities
+
+    def classify_batch(
+        self,
+        texts: Sequence[str],
+        checklist_results: Optional[Sequence[Dict[int, str]]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        리뷰 목록 일괄 판정
+
+        Args:
+            texts: 리뷰 텍스트 목록
+            checklist_results: 리뷰별 체크리스트 결과 (없으면 새로 검사)
+
+        Returns:
+            List[Tuple[str, float]]: 리뷰별 (판정 "ad"/"genuine"/"uncertain", 광고 확률)
+        """
+        probabilities = self.predict_proba(texts, checklist_results)
+        decisions = np.where(
+            probabilities >= self.ad_threshold,
+            "ad",
+            np.where(probabilities <= self.genuine_threshold, "genuine", "uncertain")
+        )
+        return [(str(d), round(float(p), 4)) for d, p in zip(decisions, probabilities)]
+
+    def classify(
+        self,
+        text: str,
+        checklist_result: Optional[Dict[int, str]] = None
+    ) -> Tuple[str, float]:
+        """
+        단일 리뷰 판정 (classify_batch 래퍼)
+
+        Args:
+            text: 리뷰 텍스트
+            checklist_result: 체크리스트 결과 (없으면 새로 검사)
+
+        Returns:
+            Tuple[str, float]: (판정, 광고 확률)
+        """
+        checklist_results = [checklist_result] if checklist_result is not None else None
+        return self.classify_batch([text], checklist_results)[0]
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """
+        모델 파일 저장 (.npz, 메타데이터는 JSON 문자열로 포함)
+
+        Args:
+            path: 저장 경로 (기본값: default_model_path())
+
+        Returns:
+            Path: 저장된 파일 경로
+        """
+        target = Path(path) if path else default_model_path(self.version)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        metadata = {
+            **self.metadata,
+            "version": self.version,
+            "ngram_range": list(NGRAM_RANGE),
+            "hash_dim": HASH_DIM,
+            "checklist_items": CHECKLIST_ITEMS,
+            "ad_threshold": self.ad_threshold,
+            "genuine_threshold": self.genuine_threshold
+        }
+        with open(target, "wb") as f:
+            np.savez_compressed(
+                f,
+                weights=self.weights,
+                bias=np.array([self.bias], dtype=np.float64),
+                metadata=np.array(json.dumps(metadata, ensure_ascii=False))
+            )
+        return target
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "PreClassifier":
+        """
+        모델 파일 로드
+
+        Args:
+            path: 모델 파일 경로 (기본값: default_model_path())
+
+        Returns:
+            PreClassifier: 로드된 분류기
+
+        Raises:
+            FileNotFoundError: 모델 파일이 없는 경우
+            ValueError: 파일의 특징 구성이 현재 코드와 다른 경우 (다시 학습 필요)
+        """
+        source = Path(path) if path else default_model_path()
+        with np.load(source, allow_pickle=False) as data:
+            metadata = json.loads(str(data["metadata"]))
+            weights = data["weights"]
+            bias = float(data["bias"][0])
+
+        expected = {"ngram_range": list(NGRAM_RANGE), "hash_dim": HASH_DIM, "checklist_items": CHECKLIST_ITEMS}
+        mismatched = [key for key, value in expected.items() if metadata.get(key) != value]
+        if mismatched:
+            raise ValueError(f"모델 특징 구성이 현재 코드와 다릅니다 (다시 학습 필요): {mismatched}")
+
+        return cls(
+            weights,
+            bias,
+            ad_threshold=metadata.get("ad_threshold", AD_THRESHOLD),
+            genuine_threshold=metadata.get("genuine_threshold", GENUINE_THRESHOLD),
+            metadata=metadata
+        )
+
+
+def train(
+    texts: Sequence[str],
+    labels: Sequence[int],
+    checklist_results: Optional[Sequence[Dict[int, str]]] = None,
+    epochs: int = 500,
+    learning_rate: float = 1.0,
+    l2: float = 1e-3
+) -> PreClassifier:
+    """
+    로지스틱 회귀 학습 (전체 배치 경사 하강법, L2 정규화)
+
+    Args:
+        texts: 학습 리뷰 텍스트 목록
+        labels: 라벨 목록 (1: 광고, 0: 정상)
+        checklist_results: 리뷰별 체크리스트 결과 (없으면 새로 검사)
+        epochs: 반복 횟수
+        learning_rate: 학습률
+        l2: L2 정규화 계수
+
+    Returns:
+        PreClassifier: 학습된 분류기 (metadata에 학습 정보 포함)
+    """
+    features = vectorize(texts, checklist_results).astype(np.float64)
+    y = np.asarray(labels, dtype=np.float64)
+    weights = np.zeros(features.shape[1], dtype=np.float64)
+    bias = 0.0
+
+    for _ in range(epochs):
+        error = _sigmoid(features @ weights + bias) - y
+        weights -= learning_rate * (features.T @ error / len(y) + l2 * weights)
+        bias -= learning_rate * float(error.mean())
+
+    predictions = _sigmoid(features @ weights + bias) >= 0.5
+    return PreClassifier(
+        weights.astype(np.float32),
+        bias,
+        metadata={
+            "version": MODEL_VERSION,
+            "trained_at": datetime.now().isoformat(timespec="seconds"),
+            "train_size": int(len(y)),
+            "train_positive": int(y.sum()),
+            "train_accuracy": round(float((predictions == (y == 1)).mean()), 4),
+            "epochs": epochs,
+            "learning_rate": learning_rate,
+            "l2": l2
+        }
+    )
+
+
+_default_classifier: Optional[PreClassifier] = None
+_load_lock = threading.Lock()
+
+
+def get_pre_classifier() -> PreClassifier:
+    """
+    기본 사전 분류기 반환 (최초 호출 시 모델 파일을 한 번만 로드)
+
+    Returns:
+        PreClassifier: 기본 모델
+
+    Raises:
+        FileNotFoundError: 모델 파일이 없는 경우 (scripts/train_pre_classifier.py로 학습)
+    """
+    global _default_classifier
+    if _default_classifier is None:
+        with _load_lock:
+            if _default_classifier is None:
+                _default_classifier = PreClassifier.load()
+    return _default_classifier
@@ -3,7 +3,25 @@
 Supabase DB의 rating_avg, rating_count를 활용한 리뷰 평점 신뢰도 평가
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
+import numpy as np
+from core.stage_metrics import stage_metrics
+from .trust_score import round_scores
+
+# 배열 입력 (None 또는 NaN = 값 없음)
+ArrayLike = Union[Sequence[Optional[float]], np.ndarray]
+
+# 평점 차이 구간 상한 → 차이 점수 (_calculate_deviation_score와 같은 기준, 상한 포함)
+DEVIATION_BINS = np.array([0.5, 1.0, 1.5, 2.0, 2.5])
+DEVIATION_SCORES = np.array([60.0, 50.0, 35.0, 20.0, 10.0, 0.0])
+
+# 평점 개수 구간 하한 → 개수 가중치 (_calculate_count_weight와 같은 기준, 하한 포함)
+COUNT_BINS = np.array([10, 50, 100, 500, 1000])
+COUNT_WEIGHTS = np.array([5.0, 8.0, 12.0, 15.0, 18.0, 20.0])
+
+# 평점 신뢰도 점수 구간 하한 → 신뢰도 레벨 (get_rating_insight와 같은 기준)
+RELIABILITY_BINS = np.array([30, 50, 70])
+RELIABILITY_LEVELS = np.array(["very_low", "low", "medium", "high"])
 
 
 class RatingAnalyzer:
@@ -278,6 +296,112 @@ class RatingAnalyzer:
             "rating_count": product_rating_count
         }
 
+    def calculate_rating_reliability_batch(
+        self,
+        review_ratings: ArrayLike,
+        product_rating_avgs: ArrayLike,
+        product_rating_counts: ArrayLike
+    ) -> np.ndarray:
+        """
+        평점 신뢰도 점수 배열 계산 (calculate_rating_reliability()의 벡터 버전, 결과 동일)
+
+        Args:
+            review_ratings: 개별 리뷰 평점 배열 (None/NaN 가능)
+            product_rating_avgs: 제품 평균 평점 배열 (None/NaN 가능)
+            product_rating_counts: 총 평점 개수 배열 (None/NaN 가능)
+
+        Returns:
+            np.ndarray: 평점 신뢰도 점수 배열 (0-100, 값이 하나라도 없으면 50.0)
+        """
+        rating, avg, count = _to_arrays(review_ratings, product_rating_avgs, product_rating_counts)
+        missing = np.isnan(rating) | np.isnan(avg) | np.isnan(count)
+
+        # 1~3. 차이 점수 + 극단 평점 점수 + 개수 가중치 (구간 조회)
+        deviation_score = DEVIATION_SCORES[np.digitize(np.abs(rating - avg), DEVIATION_BINS, right=True)]
+        extremity_score = np.where((rating == 5) | (rating == 1), 5.0, 20.0)
+        count_weight = COUNT_WEIGHTS[np.digitize(count, COUNT_BINS)]
+
+        # 4. 5점 리뷰 추가 패널티 (평균보다 높을 경우)
+        diff = 5 - avg
+        five_star_penalty = np.where(
+            (rating == 5) & (avg < 4.8),
+            np.select([diff > 1.0, diff > 0.5], [20, 15], default=10),
+            0
+        )
+
+        total_score = deviation_score + extremity_score + count_weight - five_star_penalty
+        return np.where(missing, 50.0, round_scores(np.maximum(0, total_score)))
+
+    def detect_rating_manipulation_batch(
+        self,
+        review_ratings: ArrayLike,
+        product_rating_avgs: ArrayLike,
+        rating_reliability_scores: ArrayLike,
+        detected_counts: Optional[ArrayLike] = None,
+        praise_flags: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        평점 조작 패턴 탐지 (detect_rating_manipulation()의 벡터 버전)
+
+        체크리스트 결과는 딕셔너리 대신 배열로 받습니다:
+        detected_counts = len(detected_issues), praise_flags = (2 in detected_issues or 8 in detected_issues)
+
+        Args:
+            review_ratings: 개별 리뷰 평점 배열 (None/NaN 가능)
+            product_rating_avgs: 제품 평균 평점 배열 (None/NaN 가능)
+            rating_reliability_scores: 평점 신뢰도 점수 배열
+            detected_counts: 체크리스트 감지 항목 수 배열 (기본값: 전부 0)
+            praise_flags: 감탄사 남발/찬사 위주 감지 여부 배열 (기본값: 전부 False)
+
+        Returns:
+            np.ndarray: 조작 의심 여부 bool 배열 (평점/평균이 없으면 False)
+        """
+        rating, avg, reliability = _to_arrays(review_ratings, product_rating_avgs, rating_reliability_scores)
+        detected = np.zeros(len(rating)) if detected_counts is None else np.asarray(detected_counts)
+        praise = np.zeros(len(rating), dtype=bool) if praise_flags is None else np.asarray(praise_flags, dtype=bool)
+
+        suspicious = (
+            ((rating == 5) & (reliability < 30)) |          # 패턴 1: "5점 폭격"
+            (np.abs(rating - avg) > 2.5) |                  # 패턴 2: 평점 차이 극단
+            ((rating == 5) & (detected >= 2) & praise) |    # 패턴 3: 5점 + 감탄사/찬사
+            ((rating == 1) & (reliability < 20))            # 패턴 4: 악의적 비방
+        )
+        return suspicious & ~(np.isnan(rating) | np.isnan(avg))
+
+    def get_rating_pattern_type_batch(
+        self,
+        review_ratings: ArrayLike,
+        product_rating_avgs: ArrayLike
+    ) -> np.ndarray:
+        """
+        평점 패턴 분류 (get_rating_pattern_type()의 벡터 버전, 결과 동일)
+
+        Args:
+            review_ratings: 개별 리뷰 평점 배열 (None/NaN 가능)
+            product_rating_avgs: 제품 평균 평점 배열 (None/NaN 가능)
+
+        Returns:
+            np.ndarray: 패턴 타입 문자열 배열 (값이 없으면 'unknown')
+        """
+        rating, avg = _to_arrays(review_ratings, product_rating_avgs)
+        diff = rating - avg
+        missing = np.isnan(rating) | np.isnan(avg)
+
+        return np.select(
+            [
+                missing,
+                (rating == 5) & (diff > 1.5),
+                rating == 5,
+                (rating == 1) & (diff < -1.5),
+                rating == 1,
+                np.abs(diff) <= 1.0,
+                diff > 1.0
+            ],
+            ["unknown", "suspicious_high", "extreme_positive", "suspicious_low", "extreme_negative",
+             "normal", "suspicious_high"],
+            default="suspicious_low"
+        )
+
 
 # 편의 함수
 def analyze_rating(
@@ -300,28 +424,80 @@ def analyze_rating(
             "insight": 분석 인사이트
         }
     """
-    analyzer = RatingAnalyzer()
-
-    reliability_score = analyzer.calculate_rating_reliability(
-        review_rating,
-        product_rating_avg,
-        product_rating_count
-    )
-
-    pattern = analyzer.get_rating_pattern_type(
-        review_rating,
-        product_rating_avg
-    )
-
-    insight = analyzer.get_rating_insight(
-        review_rating,
-        product_rating_avg,
-        product_rating_count,
-        reliability_score
-    )
+    with stage_metrics.time("rating_analysis"):
+        analyzer = RatingAnalyzer()
+
+        reliability_score = analyzer.calculate_rating_reliability(
+            review_rating,
+            product_rating_avg,
+            product_rating_count
+        )
+
+        pattern = analyzer.get_rating_pattern_type(
+            review_rating,
+            product_rating_avg
+        )
+
+        insight = analyzer.get_rating_insight(
+            review_rating,
+            product_rating_avg,
+            product_rating_count,
+            reliability_score
+        )
 
     return {
         "rating_reliability_score": reliability_score,
         "pattern": pattern,
         "insight": insight
     }
+
+
+def analyze_ratings_batch(
+    review_ratings: ArrayLike,
+    product_rating_avgs: ArrayLike,
+    product_rating_counts: ArrayLike,
+    detected_counts: Optional[ArrayLike] = None,
+    praise_flags: Optional[ArrayLike] = None
+) -> Dict[str, np.ndarray]:
+    """
+    평점 분석 배치 함수 (리뷰 전체를 배열 연산으로 한 번에 분석)
+
+    Args:
+        review_ratings: 개별 리뷰 평점 배열 (None/NaN 가능)
+        product_rating_avgs: 제품 평균 평점 배열 (None/NaN 가능)
+        product_rating_counts: 총 평점 개수 배열 (None/NaN 가능)
+        detected_counts: 체크리스트 감지 항목 수 배열 (선택적)
+        praise_flags: 감탄사 남발/찬사 위주 감지 여부 배열 (선택적)
+
+    Returns:
+        Dict[str, np.ndarray]: {
+            "rating_reliability_score": 평점 신뢰도 점수,
+            "pattern": 평점 패턴 타입,
+            "reliability_level": 신뢰도 레벨 (get_rating_insight()와 같은 기준, 데이터 부족 시 'unknown'),
+            "is_manipulated": 평점 조작 의심 여부
+        }
+    """
+    with stage_metrics.time("rating_analysis"):
+        analyzer = RatingAnalyzer()
+        rating, avg, count = _to_arrays(review_ratings, product_rating_avgs, product_rating_counts)
+
+        reliability_score = analyzer.calculate_rating_reliability_batch(rating, avg, count)
+        reliability_level = np.where(
+            np.isnan(rating) | np.isnan(avg),
+            "unknown",
+            RELIABILITY_LEVELS[np.digitize(reliability_score, RELIABILITY_BINS)]
+        )
+
+        return {
+            "rating_reliability_score": reliability_score,
+            "pattern": analyzer.get_rating_pattern_type_batch(rating, avg),
+            "reliability_level": reliability_level,
+            "is_manipulated": analyzer.detect_rating_manipulation_batch(
+                rating, avg, reliability_score, detected_counts, praise_flags
+            )
+        }
+
+
+def _to_arrays(*columns: ArrayLike) -> tuple:
+    """입력 열을 float64 배열로 변환 (None → NaN)"""
+    return tuple(np.asarray(column, dtype=np.float64) for column in columns)
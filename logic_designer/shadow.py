@@ -0,0 +1,419 @@
+"""
+규칙 세트 섀도 비교 모듈
+기존 규칙 세트(baseline)와 후보 규칙 세트(candidate)를 코퍼스 한 번 순회로 함께 실행하고,
+항목별 감지 변화, 광고 판별 변화, 신뢰도 점수 분포 변화, 규칙 세트별 처리량을 보고합니다.
+
+리뷰마다 구간 분할(split_windows)은 한 번만 하고 두 규칙 세트가 공유하며,
+성분명 추출(extract_ingredients)과 영양성분 정보는 nutrition_utils 캐시로 공유됩니다.
+
+사용 방법:
+    python -m logic_designer.shadow data/reviews.csv --candidate rules/candidate.json -o output/shadow_report.json
+
+후보 규칙 파일(JSON) 형식 (모든 키 선택):
+    {
+        "name": "item12-v2",
+        "patterns": {"12": {"patterns": ["~했답니다", "협찬.*후기"]}},
+        "ad_threshold": 40,
+        "penalty_per_item": 10
+    }
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+from core.length_policy import split_windows
+from core.usage_metrics import percentile
+from .checklist import AdChecklist
+from .nutrition_utils import prefetch_nutrition_info
+from .pipeline import SCORE_FIELDS, _normalize_review
+from .trust_score import TrustScoreCalculator
+
+# 영양성분 정보 미리 조회 단위 (use_nutrition_validation=True인 경우)
+CHUNK_SIZE = 256
+
+# 점수 분포 히스토그램 구간 폭
+SCORE_BUCKET_WIDTH = 10
+
+
+@dataclass
+class RulePack:
+    """비교할 규칙 세트 (체크리스트 패턴 + 감점/광고 판별 기준)"""
+
+    name: str
+    checklist: AdChecklist = field(default_factory=AdChecklist)
+    calculator: TrustScoreCalculator = field(default_factory=TrustScoreCalculator)
+    ad_threshold: float = 40
+    penalty_per_item: int = 10
+
+    @property
+    def version(self) -> str:
+        """규칙 세트 버전 (항목 지문 + 판별 기준의 지문)"""
+        payload = {
+            "items": type(self.checklist).item_fingerprints(),
+            "ad_threshold": self.ad_threshold,
+            "penalty_per_item": self.penalty_per_item
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def from_overrides(
+        cls,
+        name: str,
+        patterns: Optional[Dict[Union[int, str], Dict[str, Any]]] = None,
+        ad_threshold: float = 40,
+        penalty_per_item: int = 10
+    ) -> "RulePack":
+        """
+        기본 체크리스트에서 일부 항목 패턴만 바꾼 규칙 세트 생성
+
+        Args:
+            name: 규칙 세트 이름
+            patterns: {항목번호: {"name"?, "patterns"?}} 바꿀 항목 (지정한 키만 교체)
+            ad_threshold: 광고 판별 점수 기준
+            penalty_per_item: 항목당 감점
+
+        Returns:
+            RulePack: 규칙 세트
+        """
+        ad_patterns = {num: dict(item) for num, item in AdChecklist.AD_PATTERNS.items()}
+        for num, override in (patterns or {}).items():
+            num = int(num)
+            if num not in ad_patterns:
+                raise ValueError(f"알 수 없는 체크리스트 항목: {num}")
+            ad_patterns[num].update(override)
+
+        checklist_cls = type(f"AdChecklist_{name}", (AdChecklist,), {"AD_PATTERNS": ad_patterns})
+        return cls(name=name, checklist=checklist_cls(), ad_threshold=ad_threshold, penalty_per_item=penalty_per_item)
+
+    def evaluate(
+        self,
+        windows: List[str],
+        review_text: str,
+        item: Dict[str, Any],
+        use_nutrition_validation: bool
+    ) -> Tuple[Dict[int, str], float, bool]:
+        """
+        구간 분할이 끝난 리뷰 1건 검사 (run_rule_stage()의 체크리스트 → 점수 → 판별과 같은 순서)
+
+        Returns:
+            Tuple[Dict[int, str], float, bool]: (감지 항목, 최종 신뢰도 점수, 광고 여부)
+        """
+        product_id = item["product_id"] if use_nutrition_validation else None
+        detected = self.checklist.check_windows(windows, review_text, product_id)
+        score = self.calculator.calculate_final_score(
+            **{name: item[name] for name in SCORE_FIELDS},
+            penalty_count=len(detected),
+            penalty_per_item=self.penalty_per_item,
+            review_text=review_text if use_nutrition_validation else None,
+            product_id=product_id,
+            use_nutrition_score=use_nutrition_validation
+        )["final_score"]
+        is_ad = self.calculator.is_ad(final_score=score, penalty_count=len(detected), threshold=self.ad_threshold)
+        return detected, score, is_ad
+
+
+def load_rule_pack(path: str) -> RulePack:
+    """
+    후보 규칙 파일(JSON)로 규칙 세트 생성
+
+    Args:
+        path: 규칙 파일 경로 (형식은 모듈 설명 참고)
+
+    Returns:
+        RulePack: 규칙 세트 (이름이 없으면 파일명)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    return RulePack.from_overrides(
+        name=spec.get("name") or path,
+        patterns=spec.get("patterns"),
+        ad_threshold=spec.get("ad_threshold", 40),
+        penalty_per_item=spec.get("penalty_per_item", 10)
+    )
+
+
+def run_shadow(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    baseline: RulePack,
+    candidate: RulePack,
+    use_nutrition_validation: bool = False,
+    sample_size: int = 20
+) -> Dict[str, Any]:
+    """
+    두 규칙 세트를 코퍼스 한 번 순회로 함께 실행하여 비교 보고서 생성
+
+    Args:
+        reviews: 리뷰 텍스트 또는 {"text", "id"?, "product_id"?, 점수 필드?} 딕셔너리 (스트리밍 가능)
+        baseline: 기존 규칙 세트
+        candidate: 후보 규칙 세트
+        use_nutrition_validation: 영양성분 DB 검증 사용 여부 (Supabase 접속 필요)
+        sample_size: 보고서에 포함할 판별 변경 사례 수
+
+    Returns:
+        Dict: {
+            "baseline", "candidate": {"name", "version"},
+            "reviews": 비교한 리뷰 수, "skipped": 10자 미만, "errors": {규칙 세트: 오류 수},
+            "verdicts": 광고 판별 변화, "item_flips": 항목별 감지 변화,
+            "scores": 점수 분포 변화, "throughput": 처리량, "samples": 판별 변경 사례
+        }
+    """
+    packs = {"baseline": baseline, "candidate": candidate}
+    item_names = {**baseline.checklist.AD_PATTERNS, **candidate.checklist.AD_PATTERNS}
+    flips: Dict[int, Dict[str, int]] = {}
+    detected_counts = {label: {} for label in packs}
+    scores: Dict[str, List[float]] = {label: [] for label in packs}
+    elapsed = {label: 0.0 for label in packs}
+    errors = {label: 0 for label in packs}
+    verdicts = {"ad_to_genuine": 0, "genuine_to_ad": 0}
+    ad_counts = {label: 0 for label in packs}
+    stats = {"reviews": 0, "skipped": 0, "item_changes": 0, "score_changes": 0}
+    samples: List[Dict[str, Any]] = []
+    prep_elapsed = 0.0
+    started_at = time.perf_counter()
+
+    for index, item in _iter_items(reviews, use_nutrition_validation):
+        text = item["text"]
+        if len(text.strip()) < 10:
+            stats["skipped"] += 1
+            continue
+
+        # 구간 분할은 한 번만 하고 두 규칙 세트가 공유
+        prep_start = time.perf_counter()
+        windows, covered_chars = split_windows(text)
+        covered_text = text[:covered_chars]
+        prep_elapsed += time.perf_counter() - prep_start
+
+        outcome = {}
+        for label, pack in packs.items():
+            pack_start = time.perf_counter()
+            try:
+                outcome[label] = pack.evaluate(windows, covered_text, item, use_nutrition_validation)
+            except Exception:
+                errors[label] += 1
+            elapsed[label] += time.perf_counter() - pack_start
+        if len(outcome) < len(packs):
+            continue
+
+        stats["reviews"] += 1
+        (base_items, base_score, base_ad), (cand_items, cand_score, cand_ad) = outcome["baseline"], outcome["candidate"]
+        for label, (detected, score, is_ad) in outcome.items():
+            scores[label].append(score)
+            ad_counts[label] += is_ad
+            for num in detected:
+                detected_counts[label][num] = detected_counts[label].get(num, 0) + 1
+
+        changed_items = set(base_items) ^ set(cand_items)
+        if changed_items:
+            stats["item_changes"] += 1
+            for num in changed_items:
+                counts = flips.setdefault(num, {"added": 0, "removed": 0})
+                counts["added" if num in cand_items else "removed"] += 1
+        if cand_score != base_score:
+            stats["score_changes"] += 1
+        if base_ad != cand_ad:
+            verdicts["ad_to_genuine" if base_ad else "genuine_to_ad"] += 1
+            if len(samples) < sample_size:
+                samples.append({
+                    "index": index,
+                    "id": item["id"],
+                    "text": text[:120],
+                    "baseline": {"trust_score": base_score, "is_ad": base_ad, "items": sorted(base_items)},
+                    "candidate": {"trust_score": cand_score, "is_ad": cand_ad, "items": sorted(cand_items)}
+                })
+
+    total = stats["reviews"]
+    changed = verdicts["ad_to_genuine"] + verdicts["genuine_to_ad"]
+    return {
+        "baseline": {"name": baseline.name, "version": baseline.version},
+        "candidate": {"name": candidate.name, "version": candidate.version},
+        "reviews": total,
+        "skipped": stats["skipped"],
+        "errors": errors,
+        "verdicts": {
+            "baseline_ad_rate": _rate(ad_counts["baseline"], total),
+            "candidate_ad_rate": _rate(ad_counts["candidate"], total),
+            "changed": changed,
+            "change_rate": _rate(changed, total),
+            **verdicts
+        },
+        "item_flips": {
+            str(num): {
+                "name": item_names[num]["name"],
+                "baseline_rate": _rate(detected_counts["baseline"].get(num, 0), total),
+                "candidate_rate": _rate(detected_counts["candidate"].get(num, 0), total),
+                **flips.get(num, {"added": 0, "removed": 0})
+            }
+            for num in sorted(set(flips) | set(detected_counts["baseline"]) | set(detected_counts["candidate"]))
+        },
+        "reviews_with_item_changes": stats["item_changes"],
+        "scores": _score_shift(scores["baseline"], scores["candidate"], stats["score_changes"]),
+        "throughput": {
+            "shared_prep_s": round(prep_elapsed, 3),
+            **{
+                label: {
+                    "elapsed_s": round(elapsed[label], 3),
+                    "reviews_per_s": round(total / elapsed[label], 1) if elapsed[label] > 0 else 0.0
+                }
+                for label in packs
+            },
+            "total_elapsed_s": round(time.perf_counter() - started_at, 3)
+        },
+        "samples": samples
+    }
+
+
+def _iter_items(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    use_nutrition_validation: bool
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """입력을 정규화하여 (번호, 항목)으로 반환 (영양성분 검증 시 묶음 단위로 미리 조회)"""
+    items = (_normalize_review(review) for review in reviews)
+    index = 0
+    while True:
+        chunk = list(islice(items, CHUNK_SIZE))
+        if not chunk:
+            return
+        if use_nutrition_validation:
+            prefetch_nutrition_info(item["product_id"] for item in chunk)
+        for item in chunk:
+            yield index, item
+            index += 1
+
+
+def _rate(count: int, total: int) -> float:
+    """비율 (소수 넷째 자리)"""
+    return round(count / total, 4) if total else 0.0
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    """정렬된 점수 목록의 분포 요약"""
+    if not values:
+        return {"mean": 0.0, "p10": 0.0, "p50": 0.0, "p90": 0.0, "min": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(values) / len(values), 2),
+        "p10": percentile(values, 10),
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "min": values[0],
+        "max": values[-1]
+    }
+
+
+def _score_shift(baseline: List[float], candidate: List[float], changed: int) -> Dict[str, Any]:
+    """
+    점수 분포 변화 요약
+
+    ks_statistic은 두 점수 분포의 누적 분포 함수 최대 차이(2표본 콜모고로프-스미르노프 통계량)입니다.
+    """
+    mean_abs_change = sum(abs(b - a) for a, b in zip(baseline, candidate)) / len(baseline) if baseline else 0.0
+    baseline, candidate = sorted(baseline), sorted(candidate)
+    base_dist, cand_dist = _distribution(baseline), _distribution(candidate)
+
+    histogram: Dict[str, List[int]] = {}
+    for start in range(0, 100, SCORE_BUCKET_WIDTH):
+        histogram[f"{start}-{start + SCORE_BUCKET_WIDTH}"] = [0, 0]
+    for column, values in enumerate((baseline, candidate)):
+        for value in values:
+            start = min(int(value // SCORE_BUCKET_WIDTH) * SCORE_BUCKET_WIDTH, 100 - SCORE_BUCKET_WIDTH)
+            histogram[f"{start}-{start + SCORE_BUCKET_WIDTH}"][column] += 1
+
+    return {
+        "baseline": base_dist,
+        "candidate": cand_dist,
+        "mean_shift": round(cand_dist["mean"] - base_dist["mean"], 2),
+        "median_shift": round(cand_dist["p50"] - base_dist["p50"], 2),
+        "mean_abs_change": round(mean_abs_change, 2),
+        "changed": changed,
+        "ks_statistic": round(_ks_statistic(baseline, candidate), 4),
+        "histogram": histogram
+    }
+
+
+def _ks_statistic(a: List[float], b: List[float]) -> float:
+    """정렬된 두 표본의 누적 분포 함수 최대 차이"""
+    if not a or not b:
+        return 0.0
+    i = j = 0
+    largest = 0.0
+    while i < len(a) and j < len(b):
+        value = min(a[i], b[j])
+        while i < len(a) and a[i] == value:
+            i += 1
+        while j < len(b) and b[j] == value:
+            j += 1
+        largest = max(largest, abs(i / len(a) - j / len(b)))
+    return largest
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """비교 보고서를 사람이 읽을 수 있는 텍스트로 변환"""
+    verdicts, scores, throughput = report["verdicts"], report["scores"], report["throughput"]
+    lines = [
+        f"기준: {report['baseline']['name']} ({report['baseline']['version']}) → "
+        f"후보: {report['candidate']['name']} ({report['candidate']['version']})",
+        f"비교한 리뷰: {report['reviews']:,}건 (10자 미만 {report['skipped']:,}건 제외, 오류 {report['errors']})",
+        f"광고 비율: {verdicts['baseline_ad_rate']:.2%} → {verdicts['candidate_ad_rate']:.2%} "
+        f"(판별 변경 {verdicts['changed']:,}건: 광고→정상 {verdicts['ad_to_genuine']:,}, "
+        f"정상→광고 {verdicts['genuine_to_ad']:,})",
+        f"점수 평균: {scores['baseline']['mean']} → {scores['candidate']['mean']} "
+        f"(중앙값 변화 {scores['median_shift']:+}, 평균 절대 변화 {scores['mean_abs_change']}, KS {scores['ks_statistic']})",
+        "항목별 감지 변화:"
+    ]
+    for num, flip in report["item_flips"].items():
+        if flip["added"] or flip["removed"]:
+            lines.append(f"  {num}. {flip['name']}: +{flip['added']:,} / -{flip['removed']:,} "
+                         f"({flip['baseline_rate']:.2%} → {flip['candidate_rate']:.2%})")
+    lines.append(
+        f"처리량: 기준 {throughput['baseline']['reviews_per_s']:,}건/초, 후보 {throughput['candidate']['reviews_per_s']:,}건/초 "
+        f"(공유 전처리 {throughput['shared_prep_s']}초, 전체 {throughput['total_elapsed_s']}초)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list] = None) -> None:
+    from .cli import FORMATS, iter_records
+
+    parser = argparse.ArgumentParser(
+        prog="python -m logic_designer.shadow",
+        description="규칙 세트 섀도 비교 (코퍼스 한 번 순회로 기존/후보 규칙 세트 실행)"
+    )
+    parser.add_argument("input", help="입력 파일 (CSV 또는 JSONL)")
+    parser.add_argument("--candidate", required=True, help="후보 규칙 파일 (JSON)")
+    parser.add_argument("--baseline", help="기준 규칙 파일 (기본값: 현재 규칙)")
+    parser.add_argument("--format", choices=FORMATS, default="auto", help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--limit", type=int, help="비교할 최대 레코드 수")
+    parser.add_argument("--nutrition", action="store_true", help="영양성분 DB 검증 사용 (Supabase 접속 필요)")
+    parser.add_argument("--samples", type=int, default=20, help="보고서에 포함할 판별 변경 사례 수")
+    parser.add_argument("-o", "--output", help="보고서 JSON 저장 경로 (선택)")
+    args = parser.parse_args(argv)
+
+    baseline = load_rule_pack(args.baseline) if args.baseline else RulePack(name="current")
+    candidate = load_rule_pack(args.candidate)
+    report = run_shadow(
+        islice(iter_records(args.input, args.format), args.limit),
+        baseline,
+        candidate,
+        use_nutrition_validation=args.nutrition,
+        sample_size=args.samples
+    )
+    print(format_report(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n보고서 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+스트리밍 JSON 점진 파싱 모듈
+Claude 스트리밍 응답에서 최상위 필드가 완성되는 즉시 값을 꺼냅니다.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+
+class IncrementalJSONParser:
+    """
+    최상위 JSON 객체의 필드를 점진적으로 파싱하는 클래스
+
+    청크 단위로 텍스트를 받아, 최상위 필드 값이 완성될 때마다
+    (필드명, 값) 쌍을 반환합니다. 첫 번째 '{' 이전의 문구나
+    코드 펜스(```json)는 무시합니다.
+
+    Example:
+        >>> parser = IncrementalJSONParser()
+        >>> parser.feed('{"summary": "눈 피로')
+        []
+        >>> parser.feed(' 감소", "tip"')
+        [('summary', '눈 피로 감소')]
+    """
+
+    def __init__(self):
+        """파서 초기화"""
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "key"
+        self._key = None
+        self._key_start = 0
+        self._value_start = 0
+        self.fields: Dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """최상위 객체가 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        텍스트 청크 추가 및 새로 완성된 필드 반환
+
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+
+        Returns:
+            List[Tuple[str, Any]]: 이번 청크로 완성된 (필드명, 값) 목록
+        """
+        if self._done or not chunk:
+            return []
+
+        self._buffer += chunk
+        completed = []
+
+        while self._pos < len(self._buffer) and not self._done:
+            i = self._pos
+            c = self._buffer[i]
+            self._pos += 1
+
+            if not self._started:
+                if c == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._expect == "key_str":
+                            self._key = self._load(self._key_start, i + 1)
+                            self._expect = "colon"
+                        elif self._expect == "value_str":
+                            self._emit(self._value_start, i + 1, completed)
+                continue
+
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    if self._expect == "key":
+                        self._key_start = i
+                        self._expect = "key_str"
+                    elif self._expect == "value":
+                        self._value_start = i
+                        self._expect = "value_str"
+                continue
+
+            if c in "{[":
+                if self._depth == 1 and self._expect == "value":
+                    self._value_start = i
+                    self._expect = "value_nested"
+                self._depth += 1
+                continue
+
+            if c in "}]":
+                if self._depth == 1 and self._expect == "value_prim":
+                    self._emit(self._value_start, i, completed)
+                self._depth -= 1
+                if self._depth == 1 and self._expect == "value_nested":
+                    self._emit(self._value_start, i + 1, completed)
+                elif self._depth == 0:
+                    self._done = True
+                continue
+
+            if self._depth == 1:
+                if c == ":" and self._expect == "colon":
+                    self._expect = "value"
+                elif c == ",":
+                    if self._expect == "value_prim":
+                        self._emit(self._value_start, i, completed)
+                    self._expect = "key"
+                elif not c.isspace() and self._expect == "value":
+                    self._value_start = i
+                    self._expect = "value_prim"
+
+        return completed
+
+    def _load(self, start: int, end: int) -> Any:
+        """버퍼 구간을 JSON으로 해석 (실패 시 None)"""
+        try:
+            return json.loads(self._buffer[start:end].strip())
+        except (json.JSONDecodeError, ValueError):
+            return None
+
+    def _emit(self, start: int, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """완성된 필드 값을 기록"""
+        self._expect = "comma"
+        if self._key is None:
+            return
+        value = self._load(start, end)
+        if value is None and self._buffer[start:end].strip() != "null":
+            return  # 해석 불가한 값은 건너뜀 (최종 검증 단계에서 처리)
+        self.fields[self._key] = value
+        completed.append((self._key, value))
+        self._key = None
@@ -0,0 +1,117 @@
+"""
+analyzer.py 테스트 스크립트 (모의 Anthropic 서버 사용)
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.mock_anthropic import MockAnthropicServer, fixed_latency
+from core.usage_metrics import usage_tracker
+from logic_designer.analyzer import PharmacistAnalyzer
+
+
+NORMAL_REVIEW = "루테인 한 달째 먹고 있는데 눈이 좀 덜 피곤해요. 캡슐도 작아서 삼키기 편해요."
+STREAM_FIELDS = ["summary", "efficacy", "side_effects", "tip"]
+
+
+def _stream_stats():
+    """analyze_stream() 호출의 사용량 집계"""
+    for entry in usage_tracker.summary()["by_source"]:
+        if entry["source"] == PharmacistAnalyzer.PARSE_METRICS_SOURCE:
+            return entry
+    return None
+
+
+def test_case_1_stream_fields_and_usage():
+    """테스트 케이스 1: 필드가 완성되는 대로 반환, 최종 결과는 analyze()와 같고 사용량 기록"""
+    print("=" * 80)
+    print("테스트 1: 스트리밍 필드 + 사용량")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(5)) as server:
+        analyzer = PharmacistAnalyzer(api_key=server.api_key, client=server.client())
+        expected = analyzer.analyze(NORMAL_REVIEW)
+        usage_tracker.reset()
+
+        stream = analyzer.analyze_stream(NORMAL_REVIEW)
+        first = next(stream)
+        # 첫 필드는 최종 메시지 도착 전에 반환 (아직 사용량 기록 없음)
+        assert first[0] == "summary" and _stream_stats() is None
+        events = [first, *stream]
+        print(f"필드 순서: {[field for field, _ in events]}")
+
+        assert [field for field, _ in events] == STREAM_FIELDS + ["disclaimer"]
+        assert dict(events) == expected
+
+        stats = _stream_stats()
+        print(f"사용량: {stats['outcomes']}, {stats['tokens']}")
+        assert stats["calls"] == 1 and stats["outcomes"] == {"structured": 1}
+        assert stats["tokens"]["input_tokens"] > 0 and stats["tokens"]["output_tokens"] > 0
+        assert server.get_stats()["requests"] == 2
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_stream_circuit_breaker():
+    """테스트 케이스 2: 스트림 연결 실패는 서킷 브레이커에 집계, 열린 뒤에는 요청 없이 차단"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 스트리밍 서킷 브레이커")
+    print("=" * 80)
+
+    with MockAnthropicServer(rate_limit_burst_rate=1.0, burst_length=100, retry_after_ms=1) as server:
+        analyzer = PharmacistAnalyzer(api_key=server.api_key, client=server.client(max_retries=0))
+        analyzer.breaker = CircuitBreaker(name="test_stream", failure_threshold=1, recovery_seconds=60)
+        usage_tracker.reset()
+
+        try:
+            list(analyzer.analyze_stream(NORMAL_REVIEW))
+            assert False, "429 오류가 전달되지 않음"
+        except CircuitOpenError:
+            assert False, "첫 호출은 서킷이 닫힌 상태여야 함"
+        except Exception as e:
+            print(f"첫 호출: {e}")
+        assert analyzer.breaker.state == CircuitBreaker.OPEN
+
+        try:
+            list(analyzer.analyze_stream(NORMAL_REVIEW))
+            assert False, "서킷이 열렸는데 호출됨"
+        except CircuitOpenError as e:
+            print(f"두 번째 호출: {e}")
+
+        assert server.get_stats()["requests"] == 1
+        assert _stream_stats()["outcomes"] == {"api_error": 1, "circuit_open": 1}
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 analyzer.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_stream_fields_and_usage()
+        test_case_2_stream_circuit_breaker()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
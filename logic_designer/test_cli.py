@@ -0,0 +1,228 @@
+"""
+cli.py 테스트 스크립트
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.stage_metrics import stage_metrics
+from logic_designer.cli import iter_records, main, run
+
+
+def _write_csv(path, count):
+    """export_supabase_data.py와 같은 형식(utf-8-sig, title/body 컬럼)의 CSV 작성"""
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", "product_id", "title", "body", "rating"])
+        writer.writeheader()
+        for i in range(count):
+            writer.writerow({
+                "id": i + 100,
+                "product_id": "",
+                "title": f"리뷰 {i}",
+                "body": "루테인 한 달째 먹고 있는데 눈이 좀 덜 피곤해요.",
+                "rating": 5
+            })
+
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_case_1_csv_and_jsonl_input():
+    """테스트 케이스 1: CSV/JSONL 입력 변환"""
+    print("=" * 80)
+    print("테스트 1: 입력 형식")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "reviews.csv")
+        _write_csv(csv_path, 2)
+        records = list(iter_records(csv_path))
+        print(f"CSV: {records[0]}")
+        assert records[0]["id"] == "100" and records[0]["product_id"] is None
+        assert records[0]["text"].startswith("리뷰 0 루테인")
+
+        jsonl_path = str(Path(tmp) / "reviews.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 7, "text": "본문", "product_id": 3, "photo_score": 100}) + "\n\n")
+        records = list(iter_records(jsonl_path))
+        assert records == [{"id": 7, "text": "본문", "product_id": 3, "photo_score": 100.0}]
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_resume_from_checkpoint():
+    """테스트 케이스 2: 중단 후 재실행 시 체크포인트부터 이어서 처리 (중복/누락 없음)"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 체크포인트 재개")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "reviews.csv")
+        output_path = str(Path(tmp) / "out.jsonl")
+        _write_csv(csv_path, 120)
+        options = {"local_only": True, "use_nutrition_validation": False, "log": io.StringIO()}
+
+        first = run(csv_path, output_path, limit=50, **options)
+        print(f"1차: {first}")
+        assert first["processed"] == 50 and not first["complete"]
+
+        # 마지막 체크포인트 이후에 기록된 줄(중단 직전 기록)은 재개 시 버려져야 함
+        with open(output_path, "a", encoding="utf-8") as f:
+            f.write('{"index": 999, "partial": true}\n')
+
+        second = run(csv_path, output_path, **options)
+        print(f"2차: {second}")
+        assert second["processed"] == 70 and second["skipped"] == 50 and second["complete"]
+
+        results = _read_jsonl(output_path)
+        assert sorted(r["index"] for r in results) == list(range(120))
+        assert {r["id"] for r in results} == {str(i + 100) for i in range(120)}
+        assert all(r["analysis"]["source"] == "local_rules" for r in results)
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_stage_metrics_flag():
+    """테스트 케이스 3: --stage-metrics로 단계 계측을 켜고 종료 시 JSONL/Prometheus 파일 기록"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 단계 계측 플래그")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "reviews.csv")
+        metrics_path = Path(tmp) / "stage_timings.jsonl"
+        prom_path = Path(tmp) / "stage_timings.prom"
+        _write_csv(csv_path, 5)
+
+        stage_metrics.reset()
+        try:
+            with mock.patch.dict(os.environ, {"STAGE_METRICS_PATH": str(metrics_path)}), \
+                    mock.patch("sys.stderr", io.StringIO()):
+                main([csv_path, "-o", str(Path(tmp) / "out.jsonl"), "--local-only",
+                      "--stage-metrics-prom", str(prom_path)])
+        finally:
+            stage_metrics.disable()
+            stage_metrics.reset()
+
+        entry = json.loads(metrics_path.read_text(encoding="utf-8"))
+        print(f"기록된 단계: {list(entry['stages'])}")
+        assert entry["run_id"].startswith("cli-")
+        assert entry["stages"]["checklist"]["count"] == 5
+        assert 'review_analysis_stage_duration_ms_count{stage="checklist"} 5' in prom_path.read_text(encoding="utf-8")
+    print("\n✅ 테스트 통과!")
+
+
+def _write_jsonl(path, count, bad_lines=()):
+    """스크래퍼 출력 형식 JSONL 작성 (bad_lines 위치에는 잘못된 줄 삽입)"""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            if i in bad_lines:
+                f.write('{"id": "broken", "text": \n')
+            f.write(json.dumps({"id": i, "text": f"리뷰 {i}: 루테인 한 달째 먹고 있는데 눈이 덜 피곤해요."},
+                               ensure_ascii=False) + "\n")
+
+
+def test_case_4_invalid_lines_and_offset_resume():
+    """테스트 케이스 4: 잘못된 JSONL 줄은 건너뛰고, 재개 시 저장된 바이트 위치부터 읽음"""
+    print("\n" + "=" * 80)
+    print("테스트 4: 잘못된 줄 + 바이트 위치 재개")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl_path = str(Path(tmp) / "reviews.jsonl")
+        output_path = str(Path(tmp) / "out.jsonl")
+        _write_jsonl(jsonl_path, 60, bad_lines=(10, 45))
+
+        errors = []
+        records = list(iter_records(jsonl_path, on_error=lambda offset, line, e: errors.append(offset)))
+        assert [r["id"] for r in records] == list(range(60)) and len(errors) == 2
+
+        log = io.StringIO()
+        options = {"local_only": True, "use_nutrition_validation": False, "log": log}
+        first = run(jsonl_path, output_path, limit=30, **options)
+        print(f"1차: {first}")
+        assert first["processed"] == 30 and first["invalid"] == 1
+        with open(output_path + ".ckpt", "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        assert checkpoint["input_offset_index"] == 30 and checkpoint["input_offset"] > 0
+
+        # 저장된 위치 이전을 같은 길이의 깨진 내용으로 덮어써도 재개 결과에 영향이 없어야 함 (다시 읽지 않음)
+        with open(jsonl_path, "r+b") as f:
+            f.write(b"#" * (checkpoint["input_offset"] - 1))
+
+        second = run(jsonl_path, output_path, **options)
+        print(f"2차: {second}")
+        assert second["processed"] == 30 and second["skipped"] == 0 and second["invalid"] == 1
+        assert second["complete"] and log.getvalue().count("잘못된 JSONL 줄") == 2
+
+        results = _read_jsonl(output_path)
+        assert sorted(r["id"] for r in results) == list(range(60))
+        assert sorted(r["index"] for r in results) == list(range(60))
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_5_missing_output_restarts():
+    """테스트 케이스 5: 체크포인트는 있는데 출력 파일이 없으면 처음부터 다시 처리"""
+    print("\n" + "=" * 80)
+    print("테스트 5: 출력 파일 없음")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl_path = str(Path(tmp) / "reviews.jsonl")
+        output_path = str(Path(tmp) / "out.jsonl")
+        _write_jsonl(jsonl_path, 20)
+        log = io.StringIO()
+        options = {"local_only": True, "use_nutrition_validation": False, "log": log}
+
+        run(jsonl_path, output_path, limit=10, **options)
+        os.remove(output_path)
+
+        summary = run(jsonl_path, output_path, **options)
+        print(f"재실행: {summary}")
+        assert summary["processed"] == 20 and summary["total_written"] == 20 and summary["complete"]
+        assert "처음부터 다시 처리" in log.getvalue()
+        assert sorted(r["id"] for r in _read_jsonl(output_path)) == list(range(20))
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 cli.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_csv_and_jsonl_input()
+        test_case_2_resume_from_checkpoint()
+        test_case_3_stage_metrics_flag()
+        test_case_4_invalid_lines_and_offset_resume()
+        test_case_5_missing_output_restarts()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,197 @@
+"""
+incremental.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.analysis_store import ReviewAnalysisStore
+from logic_designer import analyze
+from logic_designer.checklist import AdChecklist
+from logic_designer import incremental
+from logic_designer.incremental import LOCAL_MODEL_VERSION, refresh_analysis, rule_fingerprints
+from logic_designer.trust_score import TrustScoreCalculator
+
+
+def _reviews(count, changed=()):
+    """테스트용 리뷰 (changed에 있는 id는 텍스트 변경)"""
+    return [
+        {
+            "id": i,
+            "text": f"루테인 {i}일째 먹고 있는데 눈이 덜 피곤해요." + (" 재구매 예정!" if i in changed else ""),
+            "product_id": None
+        }
+        for i in range(count)
+    ]
+
+
+def test_case_1_only_changed_rows_reanalyzed():
+    """테스트 케이스 1: 두 번째 실행은 텍스트가 바뀐 리뷰만 다시 분석"""
+    print("=" * 80)
+    print("테스트 1: 텍스트 변경분만 재분석")
+    print("=" * 80)
+
+    store = ReviewAnalysisStore(":memory:")
+    first = refresh_analysis(_reviews(50), store, local_only=True, use_nutrition_validation=False)
+    print(f"1차: {first}")
+    assert first["stale"]["new"] == 50 and first["stored"] == 50
+    assert store.count() == 50
+
+    second = refresh_analysis(_reviews(50, changed={3, 7}), store, local_only=True, use_nutrition_validation=False)
+    print(f"2차: {second}")
+    assert second["scanned"] == 50
+    assert second["stale"] == {"new": 0, "text": 2, "rules": 0, "model": 0}
+    assert second["analyzed"] == 2
+
+    row = store.get(3)
+    assert row["model_version"] == LOCAL_MODEL_VERSION
+    assert row["validation"]["trust_score"] == row["trust_score"]
+    assert row["analysis"]["source"] == "local_rules"
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_model_change_and_dry_run():
+    """테스트 케이스 2: 모델 버전이 바뀌면 전체 재분석 대상, dry_run은 저장하지 않음"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 모델 변경 + dry_run")
+    print("=" * 80)
+
+    store = ReviewAnalysisStore(":memory:")
+    refresh_analysis(_reviews(20), store, local_only=True, use_nutrition_validation=False)
+    stats = refresh_analysis(_reviews(20), store, model="claude-test-model", dry_run=True)
+    print(f"dry_run: {stats}")
+
+    assert stats["stale"]["model"] == 20
+    assert stats["analyzed"] == 0
+    assert store.get(0)["model_version"] == LOCAL_MODEL_VERSION
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_item_level_rescore_matches_full_run():
+    """테스트 케이스 3: 한 항목의 패턴만 바뀌면 그 항목만 재검사하고, 결과는 전체 재분석과 같음"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 항목 단위 재검사")
+    print("=" * 80)
+
+    reviews = [
+        {"id": 1, "text": "제가 한 달째 먹어보니 피로가 줄었어요. 후기 남겨요", "product_id": None},
+        {"id": 2, "text": "최고 최고 대박!!! 강추합니다 정말 진짜 좋아요 기적의 효과", "product_id": None},
+        {"id": 3, "text": "루테인 먹은 지 두 달, 눈이 덜 뻑뻑해요. 다만 알이 커요", "product_id": None}
+    ]
+    store = ReviewAnalysisStore(":memory:")
+    refresh_analysis(reviews, store, local_only=True, use_nutrition_validation=False)
+    before = {review["id"]: store.get(review["id"]) for review in reviews}
+
+    original = AdChecklist.AD_PATTERNS[12]
+    try:
+        # 12번(홍보성 블로그 문체)에서 "후기.*남겨요" 패턴 제거
+        AdChecklist.AD_PATTERNS[12] = {
+            "name": original["name"],
+            "patterns": [p for p in original["patterns"] if p != r"후기.*남겨요"]
+        }
+        stats = refresh_analysis(reviews, store, local_only=True, use_nutrition_validation=False)
+        print(f"재검사: {stats}")
+        assert stats["stale"]["rules"] == 3
+        # 1번 리뷰는 광고 → 정상으로 바뀌어 분석이 새로 필요 (나머지는 항목 단위 재계산)
+        assert stats["rescored"] == 2 and stats["analyzed"] == 1
+        assert stats["rescored_items"] == [12]
+
+        for review in reviews:
+            row = store.get(review["id"])
+            expected = analyze(review["text"], local_only=True, use_nutrition_validation=False)["validation"]
+            assert row["trust_score"] == expected["trust_score"]
+            assert row["is_ad"] == expected["is_ad"]
+            assert sorted(row["validation"]["reasons"]) == sorted(expected["reasons"])
+        assert before[1]["is_ad"] and not store.get(1)["is_ad"]
+        assert store.get(1)["analysis"]["source"] == "local_rules"
+    finally:
+        AdChecklist.AD_PATTERNS[12] = original
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_4_framework_fingerprint_from_rule_data():
+    """테스트 케이스 4: 공통 규칙 지문은 규칙 데이터와 RULES_VERSION으로만 결정"""
+    print("\n" + "=" * 80)
+    print("테스트 4: 공통 규칙 지문")
+    print("=" * 80)
+
+    framework = rule_fingerprints()["framework"]
+    with mock.patch.object(incremental, "RULES_VERSION", incremental.RULES_VERSION + 1):
+        assert rule_fingerprints()["framework"] != framework
+    with mock.patch.object(TrustScoreCalculator, "AD_PENALTY_COUNT", 4):
+        assert rule_fingerprints()["framework"] != framework
+    assert rule_fingerprints()["framework"] == framework
+
+    # 로직 버전을 올리면 저장된 행 전체가 규칙 변경으로 재분석 대상
+    store = ReviewAnalysisStore(":memory:")
+    refresh_analysis(_reviews(10), store, local_only=True, use_nutrition_validation=False)
+    with mock.patch.object(incremental, "RULES_VERSION", incremental.RULES_VERSION + 1):
+        stats = refresh_analysis(_reviews(10), store, local_only=True, use_nutrition_validation=False, dry_run=True)
+    print(f"RULES_VERSION 변경: {stats['stale']}")
+    assert stats["stale"] == {"new": 0, "text": 0, "rules": 10, "model": 0}
+    stats = refresh_analysis(_reviews(10), store, local_only=True, use_nutrition_validation=False, dry_run=True)
+    assert stats["stale"] == {"new": 0, "text": 0, "rules": 0, "model": 0}
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_5_item_fingerprint_from_item_rule_data():
+    """테스트 케이스 5: 항목 지문은 그 항목의 규칙 데이터와 로직 버전으로만 결정 (소스 코드 무관)"""
+    print("\n" + "=" * 80)
+    print("테스트 5: 항목 지문")
+    print("=" * 80)
+
+    items = AdChecklist.item_fingerprints()
+    # 소스 코드가 없는 배포 환경에서도 지문 계산 가능
+    with mock.patch("inspect.getsource", side_effect=OSError("source not available")):
+        assert rule_fingerprints()["items"] == {str(num): fp for num, fp in items.items()}
+
+    def changed(**patches) -> set:
+        with mock.patch.multiple(AdChecklist, **patches):
+            after = AdChecklist.item_fingerprints()
+        return {num for num in items if after[num] != items[num]}
+
+    # 8번(찬사 위주)의 데이터가 바뀌면 8번과 이를 사용하는 7번만 바뀜
+    assert changed(ITEM_LOGIC_VERSIONS={8: 2}) == {7, 8}
+    assert changed(KEYWORD_REPETITION_THRESHOLD=8) == {6}
+    assert changed(NEGATIVE_PATTERNS=AdChecklist.NEGATIVE_PATTERNS + [r"흠"]) == {7}
+    assert changed(MIN_EFFECT_PERIOD_DAYS=7) == {10}
+    assert AdChecklist.item_fingerprints() == items
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 incremental.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_only_changed_rows_reanalyzed()
+        test_case_2_model_change_and_dry_run()
+        test_case_3_item_level_rescore_matches_full_run()
+        test_case_4_framework_fingerprint_from_rule_data()
+        test_case_5_item_fingerprint_from_item_rule_data()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,146 @@
+"""
+model_router.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.circuit_breaker import CircuitOpenError
+from core.structured_output import StructuredOutputError
+from logic_designer.model_router import ModelRouter
+from logic_designer.pipeline import run_rule_stage
+
+
+NORMAL_REVIEW = "루테인 한 달째 먹고 있는데 눈이 좀 덜 피곤해요. 캡슐도 작아서 삼키기 편해요."
+
+
+class _FakeAnalyzer:
+    """호출된 모델을 기록하는 PharmacistAnalyzer 대역 (fail_models의 모델은 error 발생)"""
+
+    def __init__(self, fail_models=(), error=None):
+        self.calls = []
+        self.fail_models = set(fail_models)
+        self.error = error or StructuredOutputError("AI 응답 파싱 실패")
+
+    def analyze(self, review_text, product_id=None, model=None):
+        self.calls.append(model)
+        if model in self.fail_models:
+            raise self.error
+        return {"summary": "요약", "trust_score": 80}
+
+
+def test_case_1_default_scores_route_fast():
+    """테스트 케이스 1: 기본 점수만 넣은 깨끗한 리뷰는 빠른 모델로 분석"""
+    print("=" * 80)
+    print("테스트 1: 기본 점수 리뷰 → fast")
+    print("=" * 80)
+
+    for use_nutrition_validation in (False, True):
+        validation, trust_score, _ = run_rule_stage(
+            NORMAL_REVIEW, use_nutrition_validation=use_nutrition_validation
+        )
+        assert not validation["is_ad"]
+
+        router = ModelRouter()
+        analyzer = _FakeAnalyzer()
+        result = router.analyze(analyzer, NORMAL_REVIEW, trust_score=trust_score)
+        print(f"영양성분 검증 {use_nutrition_validation}: 신뢰도 {trust_score} → {result['model_tier']}")
+
+        assert result["model_tier"] == "fast" and result["routing_reason"] is None
+        assert analyzer.calls == [router.fast_model]
+        assert router.get_stats()["escalations"]["borderline"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_escalation_rules():
+    """테스트 케이스 2: 경계 점수/긴 리뷰/검증 실패는 대형 모델로 승격"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 승격 규칙")
+    print("=" * 80)
+
+    router = ModelRouter()
+    assert router.choose_tier(NORMAL_REVIEW, 40.0) == ("strong", "borderline")
+    assert router.choose_tier(NORMAL_REVIEW, 44.0) == ("strong", "borderline")
+    assert router.choose_tier(NORMAL_REVIEW, 80.0) == ("fast", None)
+    assert router.choose_tier(NORMAL_REVIEW * 20, 80.0) == ("strong", "long_review")
+    assert router.choose_tier(NORMAL_REVIEW, None) == ("fast", None)
+
+    analyzer = _FakeAnalyzer(fail_models=[router.fast_model])
+    result = router.analyze(analyzer, NORMAL_REVIEW, trust_score=80.0)
+    print(f"빠른 모델 실패 → {result['model_tier']} ({result['routing_reason']})")
+    assert result["model_tier"] == "strong" and result["routing_reason"] == "validation_failed"
+    assert result["model"] == router.strong_model
+    assert analyzer.calls == [router.fast_model, router.strong_model]
+
+    stats = router.get_stats()
+    print(f"통계: {stats}")
+    assert stats["fast"]["count"] == 1 and stats["strong"]["count"] == 1
+    assert stats["escalations"]["validation_failed"] == 1
+    assert stats["strong"]["p95_latency_ms"] is not None
+
+    try:
+        ModelRouter(borderline_band=(50.0, 40.0))
+        assert False, "구간 순서 검사 실패"
+    except ValueError:
+        pass
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_api_errors_not_escalated():
+    """테스트 케이스 3: API 오류/서킷 차단은 대형 모델로 재시도하지 않고 그대로 전달"""
+    print("\n" + "=" * 80)
+    print("테스트 3: API 오류는 승격하지 않음")
+    print("=" * 80)
+
+    router = ModelRouter()
+    for error in (Exception("AI 분석 중 오류 발생: Error code: 429"),
+                  TimeoutError("AI 분석 제한 시간을 초과했습니다."),
+                  CircuitOpenError("서킷 열림"),
+                  ValueError("리뷰 텍스트가 너무 짧습니다")):
+        analyzer = _FakeAnalyzer(fail_models=[router.fast_model], error=error)
+        try:
+            router.analyze(analyzer, NORMAL_REVIEW, trust_score=80.0)
+            assert False, "오류가 전달되지 않음"
+        except Exception as e:
+            assert e is error
+        print(f"{type(error).__name__}: 호출 모델 {analyzer.calls}")
+        assert analyzer.calls == [router.fast_model]
+
+    stats = router.get_stats()
+    assert stats["strong"]["count"] == 0 and stats["escalations"]["validation_failed"] == 0
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 model_router.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_default_scores_route_fast()
+        test_case_2_escalation_rules()
+        test_case_3_api_errors_not_escalated()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,261 @@
+"""
+pipeline.py 테스트 스크립트
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.background_tasks import background_tasks
+from core.mock_anthropic import MockAnthropicServer, fixed_latency
+from logic_designer import analyze, analyze_batch, get_analysis_result
+from logic_designer.pre_classifier import PreClassifier, get_pre_classifier
+
+
+NORMAL_REVIEW = "루테인 한 달째 먹고 있는데 눈이 좀 덜 피곤해요. 캡슐도 작아서 삼키기 편해요."
+AD_REVIEW = "최고의 제품! 완벽한 효과! 모든 분께 강력 추천합니다! 인생템! 무조건 사세요! 기적의 효과!"
+
+
+def test_case_1_batch_matches_single_analyze():
+    """테스트 케이스 1: 배치 결과가 analyze() 단건 결과와 같고 index/id가 붙음"""
+    print("=" * 80)
+    print("테스트 1: 단건 분석과 동일한 결과")
+    print("=" * 80)
+
+    reviews = [
+        {"id": "r1", "text": NORMAL_REVIEW, "length_score": 80},
+        AD_REVIEW,
+        {"id": "r3", "text": "짧음"}
+    ]
+    results = sorted(analyze_batch(reviews, local_only=True, use_nutrition_validation=False),
+                     key=lambda r: r["index"])
+    print(f"결과 수: {len(results)}")
+
+    assert [r["index"] for r in results] == [0, 1, 2]
+    assert results[0]["id"] == "r1" and "id" not in results[1]
+    assert results[2]["error"] == "REVIEW_TOO_SHORT"
+
+    expected = analyze(NORMAL_REVIEW, length_score=80, local_only=True, use_nutrition_validation=False)
+    assert results[0]["validation"] == expected["validation"]
+    assert results[0]["analysis"] == expected["analysis"]
+    assert results[1]["validation"] == analyze(AD_REVIEW, local_only=True, use_nutrition_validation=False)["validation"]
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_lazy_input_and_bounded_in_flight():
+    """테스트 케이스 2: 입력을 필요한 만큼만 읽음 (진행 중 리뷰 수 상한)"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 메모리 상한")
+    print("=" * 80)
+
+    consumed = []
+
+    def reviews():
+        for i in range(100000):
+            consumed.append(i)
+            yield f"{NORMAL_REVIEW} ({i})"
+
+    stream = analyze_batch(reviews(), local_only=True, use_nutrition_validation=False,
+                           max_in_flight=16, prefetch_size=8)
+    first = [next(stream) for _ in range(5)]
+    stream.close()
+    print(f"읽은 입력: {len(consumed)}건")
+
+    assert all(r["analysis"]["source"] == "local_rules" for r in first)
+    assert len(consumed) <= 16 + 5
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_throughput():
+    """테스트 케이스 3: 규칙 단계 처리 속도"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 처리 속도")
+    print("=" * 80)
+
+    reviews = [f"{NORMAL_REVIEW} ({i})" for i in range(1000)]
+    start = time.perf_counter()
+    count = sum(1 for _ in analyze_batch(reviews, local_only=True, use_nutrition_validation=False))
+    rate = count / (time.perf_counter() - start)
+
+    print(f"처리 속도: {rate:,.0f}건/초")
+    assert count == 1000
+    assert rate > 100
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_4_speculative_ad_discards_llm():
+    """테스트 케이스 4: 투기적 실행 중 광고로 판별되면 AI 분석을 기다리지 않고 취소/폐기"""
+    print("\n" + "=" * 80)
+    print("테스트 4: 투기적 실행 (광고)")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(500)) as server, server.environment():
+        before = background_tasks.get_stats()
+        start = time.perf_counter()
+        result = analyze(AD_REVIEW, api_key=server.api_key, use_nutrition_validation=False,
+                         speculative=True, reuse_similar=False)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        after = background_tasks.get_stats()
+    print(f"소요 시간: {elapsed_ms:.0f}ms, 작업 통계: {after}")
+
+    assert result["validation"]["is_ad"] and result["analysis"]["error"] == "AD_REVIEW"
+    assert elapsed_ms < 500
+    assert after["submitted"] == before["submitted"] + 1
+    assert (after["cancelled"] + after["discarded"]) == (before["cancelled"] + before["discarded"]) + 1
+    assert after["stored"] == before["stored"]
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_5_speculative_non_ad_single_call():
+    """테스트 케이스 5: 투기적 실행 결과를 그대로 사용 (AI 호출 1회)"""
+    print("\n" + "=" * 80)
+    print("테스트 5: 투기적 실행 (정상 리뷰)")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(100)) as server, server.environment():
+        start = time.perf_counter()
+        result = analyze(NORMAL_REVIEW, api_key=server.api_key, use_nutrition_validation=False,
+                         speculative=True, reuse_similar=False)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats = server.get_stats()
+    print(f"소요 시간: {elapsed_ms:.0f}ms, 서버 응답: {stats}")
+
+    assert not result["validation"]["is_ad"]
+    assert result["analysis"]["summary"] == "모의 응답" and result["analysis"]["model_tier"] == "fast"
+    assert stats == {"requests": 1, "ok": 1}
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_6_deadline_pending_result():
+    """테스트 케이스 6: 마감 시간 초과 시 검증 결과와 핸들을 먼저 반환, AI 결과는 핸들로 나중에 조회"""
+    print("\n" + "=" * 80)
+    print("테스트 6: 마감 시간")
+    print("=" * 80)
+
+    with MockAnthropicServer(latency=fixed_latency(400)) as server, server.environment():
+        start = time.perf_counter()
+        result = analyze(NORMAL_REVIEW, api_key=server.api_key, use_nutrition_validation=False,
+                         deadline_ms=50, reuse_similar=False)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        handle = result.get("analysis_handle")
+        print(f"소요 시간: {elapsed_ms:.0f}ms, 진행 중: {result.get('analysis_pending')}")
+
+        assert elapsed_ms < 400
+        assert result["validation"]["trust_score"] == 45.0
+        assert result["analysis_pending"] is True and handle is not None
+        assert result["analysis"]["analysis_pending"] is True and result["analysis"]["handle"] == handle
+        assert get_analysis_result(handle) is None
+
+        analysis = get_analysis_result(handle, timeout=5.0)
+        print(f"나중에 조회한 결과: {analysis}")
+        assert analysis["summary"] == "모의 응답" and "analysis_pending" not in analysis
+        assert get_analysis_result(handle) == analysis
+        assert server.get_stats()["requests"] == 1
+
+    # 마감 시간 안에 끝나면 보류 표시 없이 결과 반환
+    with MockAnthropicServer() as server, server.environment():
+        result = analyze(NORMAL_REVIEW, api_key=server.api_key, use_nutrition_validation=False,
+                         deadline_ms=5000, reuse_similar=False)
+        assert "analysis_pending" not in result and result["analysis"]["summary"] == "모의 응답"
+
+    try:
+        get_analysis_result("unknown-handle")
+        assert False, "알 수 없는 핸들 검사 실패"
+    except KeyError:
+        pass
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_7_batch_pre_classify_per_chunk():
+    """테스트 케이스 7: 배치 사전 분류는 입력 단위(prefetch_size)마다 classify_batch() 한 번"""
+    print("\n" + "=" * 80)
+    print("테스트 7: 배치 사전 분류")
+    print("=" * 80)
+
+    reviews = [AD_REVIEW if i % 6 == 0 else f"{NORMAL_REVIEW} ({i}일째)" for i in range(24)]
+    with MockAnthropicServer() as server, server.environment(), \
+            mock.patch.object(PreClassifier, "classify_batch", autospec=True,
+                              side_effect=PreClassifier.classify_batch) as classify_batch, \
+            mock.patch.object(PreClassifier, "classify", side_effect=AssertionError("리뷰별 classify() 호출")):
+        results = sorted(
+            analyze_batch(reviews, api_key=server.api_key, use_nutrition_validation=False, reuse_similar=False,
+                          pre_classify=True, prefetch_size=8),
+            key=lambda r: r["index"]
+        )
+        batch_sizes = [len(call.args[1]) for call in classify_batch.call_args_list]
+    print(f"classify_batch 호출: {batch_sizes}")
+
+    # 광고(규칙 판별)는 사전 분류 대상에서 제외
+    assert batch_sizes == [6, 7, 7]
+    classifier = get_pre_classifier()
+    for review, result in zip(reviews, results):
+        if review == AD_REVIEW:
+            assert result["analysis"]["error"] == "AD_REVIEW" and "pre_classifier" not in result["validation"]
+            continue
+        decision, ad_probability = classifier.classify(review)
+        assert result["validation"]["pre_classifier"]["decision"] == decision
+        assert result["validation"]["pre_classifier"]["ad_probability"] == ad_probability
+        assert result["analysis"] is not None
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_8_reuse_similar_opt_in():
+    """테스트 케이스 8: 거의 같은 리뷰 결과 재사용은 reuse_similar=True일 때만"""
+    print("\n" + "=" * 80)
+    print("테스트 8: 유사 리뷰 재사용 (명시적 사용)")
+    print("=" * 80)
+
+    review = f"{NORMAL_REVIEW} 아침마다 한 알씩 먹고 있고 다음 달에도 계속 먹을 생각입니다."
+    with MockAnthropicServer() as server, server.environment():
+        default_results = [analyze(review, api_key=server.api_key, use_nutrition_validation=False)
+                           for _ in range(2)]
+        assert server.get_stats()["requests"] == 2
+        assert not any(r["analysis"].get("reused") for r in default_results)
+
+        analyze(review, api_key=server.api_key, use_nutrition_validation=False, reuse_similar=True)
+        reused = analyze(review, api_key=server.api_key, use_nutrition_validation=False, reuse_similar=True)
+        print(f"서버 요청: {server.get_stats()['requests']}, 재사용: {reused['analysis'].get('reused')}")
+        assert reused["analysis"]["reused"] is True
+        assert server.get_stats()["requests"] == 3
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 pipeline.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_batch_matches_single_analyze()
+        test_case_2_lazy_input_and_bounded_in_flight()
+        test_case_3_throughput()
+        test_case_4_speculative_ad_discards_llm()
+        test_case_5_speculative_non_ad_single_call()
+        test_case_6_deadline_pending_result()
+        test_case_7_batch_pre_classify_per_chunk()
+        test_case_8_reuse_similar_opt_in()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -2,9 +2,12 @@
 rating_analyzer.py 테스트 스크립트
 """
 
+import itertools
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
@@ -13,7 +16,7 @@ if sys.platform == 'win32':
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from logic_designer.rating_analyzer import RatingAnalyzer, analyze_rating
+from logic_designer.rating_analyzer import RatingAnalyzer, analyze_rating, analyze_ratings_batch
 
 
 def test_case_1_normal_review():
@@ -178,6 +181,44 @@ def test_case_6_edge_cases():
     print("\n✅ 모든 경계값 테스트 통과!")
 
 
+def test_case_7_batch_matches_scalar():
+    """테스트 케이스 7: 배치 분석이 단건 분석과 같음 (구간 경계값, NULL 포함)"""
+    print("\n" + "=" * 80)
+    print("테스트 7: 배치 분석")
+    print("=" * 80)
+
+    analyzer = RatingAnalyzer()
+    ratings = [None, 1, 2, 3, 4, 5]
+    averages = [None, 1.0, 2.5, 3.5, 3.9, 4.0, 4.2, 4.5, 4.79, 4.8, 5.0]
+    counts = [None, 0, 9, 10, 50, 99, 100, 500, 999, 1000, 5000]
+    rows = list(itertools.product(ratings, averages, counts))
+    detected = [i % 4 for i in range(len(rows))]
+    praise = [i % 3 == 0 for i in range(len(rows))]
+
+    result = analyze_ratings_batch(
+        [row[0] for row in rows], [row[1] for row in rows], [row[2] for row in rows], detected, praise
+    )
+
+    for i, (rating, avg, count) in enumerate(rows):
+        score = analyzer.calculate_rating_reliability(rating, avg, count)
+        issues = {10 + k: "항목" for k in range(detected[i])}
+        if praise[i] and issues:
+            issues = {2: "감탄사 남발", **{10 + k: "항목" for k in range(detected[i] - 1)}}
+        assert result["rating_reliability_score"][i] == score, (rating, avg, count)
+        assert result["pattern"][i] == analyzer.get_rating_pattern_type(rating, avg), (rating, avg)
+        assert result["reliability_level"][i] == analyzer.get_rating_insight(rating, avg, count, score)["reliability_level"]
+        assert bool(result["is_manipulated"][i]) == analyzer.detect_rating_manipulation(rating, avg, score, issues)
+
+    # NaN도 NULL로 처리
+    nan_result = analyze_ratings_batch(np.array([5.0, np.nan]), np.array([np.nan, 4.0]), np.array([100.0, 100.0]))
+    assert list(nan_result["rating_reliability_score"]) == [50.0, 50.0]
+    assert list(nan_result["pattern"]) == ["unknown", "unknown"]
+    assert not nan_result["is_manipulated"].any()
+
+    print(f"조합 {len(rows):,}개 일치")
+    print("\n✅ 테스트 통과!")
+
+
 def run_all_tests():
     """모든 테스트 실행"""
     print("\n" + "=" * 80)
@@ -191,6 +232,7 @@ def run_all_tests():
         test_case_4_manipulation_detection()
         test_case_5_null_handling()
         test_case_6_edge_cases()
+        test_case_7_batch_matches_scalar()
 
         print("\n" + "=" * 80)
         print("✅ 모든 테스트 통과!")
@@ -0,0 +1,115 @@
+"""
+shadow.py 테스트 스크립트
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import RulePack, run_rule_stage, run_shadow
+from logic_designer.shadow import format_report, load_rule_pack
+
+
+CORPUS = [
+    {"id": "n1", "text": "재구매 했어요\n두번째 구매입니다. 효과가 있는지는 모르겠지만 눈 건강을 위해 계속 먹으려고 합니다."},
+    {"id": "n2", "text": "눈의 피로가 줄었어요\n하루종일 모니터 보는 일을 하는데, 먹고나서 눈이 좀 덜 빡빡한 느낌이에요.",
+     "length_score": 80},
+    {"id": "n3", "text": "가격 대비 괜찮습니다\n루테인 함량도 적당하고 가격도 합리적이어서 좋습니다. 캡슐 크기도 삼키기 편해요."},
+    {"id": "a1", "text": "최고의 루테인! 강력 추천합니다!!!\n와 진짜 대박이에요!!! 먹자마자 바로 효과 느꼈어요!!"},
+    {"id": "a2", "text": "눈 건강의 혁명!\n단 3일만에 눈이 확 좋아졌습니다! 안경을 벗을 수 있게 되었어요!"},
+    {"id": "s1", "text": "짧음"}
+]
+
+
+def test_case_1_identical_packs():
+    """테스트 케이스 1: 같은 규칙 세트끼리는 변화가 없고 결과가 run_rule_stage()와 같음"""
+    print("=" * 80)
+    print("테스트 1: 동일 규칙 세트 비교")
+    print("=" * 80)
+
+    report = run_shadow(CORPUS, RulePack(name="a"), RulePack(name="b"))
+    print(format_report(report))
+
+    assert report["reviews"] == 5 and report["skipped"] == 1
+    assert report["baseline"]["version"] == report["candidate"]["version"]
+    assert report["verdicts"]["changed"] == 0
+    assert report["reviews_with_item_changes"] == 0
+    assert report["scores"]["changed"] == 0 and report["scores"]["ks_statistic"] == 0
+
+    expected_ads = 0
+    for review in CORPUS[:5]:
+        validation, _, _ = run_rule_stage(
+            review["text"], length_score=review.get("length_score", 50), use_nutrition_validation=False
+        )
+        expected_ads += validation["is_ad"]
+    assert report["verdicts"]["baseline_ad_rate"] == round(expected_ads / 5, 4)
+    assert sum(report["scores"]["histogram"][bucket][0] for bucket in report["scores"]["histogram"]) == 5
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_candidate_diff():
+    """테스트 케이스 2: 후보 규칙 세트의 항목 변화/판별 변화/점수 분포 변화 보고"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 후보 규칙 세트 비교")
+    print("=" * 80)
+
+    spec = {
+        "name": "strict",
+        "patterns": {"12": {"patterns": ["~했답니다", "먹으려고", "괜찮습니다"]}},
+        "ad_threshold": 60
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "strict.json"
+        path.write_text(json.dumps(spec, ensure_ascii=False), encoding="utf-8")
+        candidate = load_rule_pack(str(path))
+
+    report = run_shadow(CORPUS, RulePack(name="current"), candidate, sample_size=1)
+    print(format_report(report))
+
+    assert candidate.checklist.AD_PATTERNS[12]["name"] == "홍보성 블로그 문체"
+    assert RulePack(name="x").checklist.AD_PATTERNS[12]["patterns"][0] == "~했답니다"
+    assert report["baseline"]["version"] != report["candidate"]["version"]
+    assert report["item_flips"]["12"]["added"] == 2
+    assert report["item_flips"]["12"]["removed"] == 0
+    assert report["reviews_with_item_changes"] == 2
+    assert report["verdicts"]["genuine_to_ad"] >= 2
+    assert report["verdicts"]["ad_to_genuine"] == 0
+    assert report["scores"]["mean_shift"] < 0
+    assert len(report["samples"]) == 1 and report["samples"][0]["candidate"]["is_ad"]
+    assert report["throughput"]["candidate"]["reviews_per_s"] > 0
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 shadow.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_identical_packs()
+        test_case_2_candidate_diff()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,104 @@
+"""
+stream_parser.py 테스트 스크립트
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer.stream_parser import IncrementalJSONParser
+
+
+SAMPLE_RESPONSE = (
+    '{\n'
+    '  "summary": "눈 피로가 줄었다는 \\"체감\\" 후기",\n'
+    '  "efficacy": "한 달 복용 후 눈 피로 감소",\n'
+    '  "side_effects": "정보 없음",\n'
+    '  "tip": "식후 복용을 권장합니다",\n'
+    '  "ingredient_validation": {"mentioned_ingredients": ["루테인"], "valid_ingredients": [], "invalid_claims": []}\n'
+    '}'
+)
+
+
+def test_case_1_char_by_char():
+    """테스트 케이스 1: 한 글자씩 입력해도 필드가 순서대로 완성"""
+    print("=" * 80)
+    print("테스트 1: 한 글자씩 스트리밍")
+    print("=" * 80)
+
+    parser = IncrementalJSONParser()
+    emitted = []
+    for ch in SAMPLE_RESPONSE:
+        emitted.extend(parser.feed(ch))
+
+    fields = [field for field, _ in emitted]
+    print(f"완성 순서: {fields}")
+
+    assert fields == ["summary", "efficacy", "side_effects", "tip", "ingredient_validation"]
+    assert parser.fields["summary"] == '눈 피로가 줄었다는 "체감" 후기'
+    assert parser.fields["ingredient_validation"]["mentioned_ingredients"] == ["루테인"]
+    assert parser.done
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_summary_before_end():
+    """테스트 케이스 2: summary는 응답이 끝나기 전에 반환"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 첫 필드 조기 반환")
+    print("=" * 80)
+
+    parser = IncrementalJSONParser()
+    first = parser.feed('{"summary": "효과 체감", "effi')
+
+    print(f"첫 청크 결과: {first}")
+    assert first == [("summary", "효과 체감")]
+    assert not parser.done
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_code_fence_and_primitives():
+    """테스트 케이스 3: 코드 펜스, 숫자/불리언 값 처리"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 코드 펜스 + 원시 값")
+    print("=" * 80)
+
+    parser = IncrementalJSONParser()
+    emitted = parser.feed('```json\n{"score": 85, "is_ad": false, "note": null}\n```')
+
+    print(f"결과: {emitted}")
+    assert emitted == [("score", 85), ("is_ad", False), ("note", None)]
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 stream_parser.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_char_by_char()
+        test_case_2_summary_before_end()
+        test_case_3_code_fence_and_primitives()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,132 @@
+"""
+trust_score.py 벡터 계산 테스트 스크립트
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer.trust_score import TrustScoreCalculator, round_scores
+
+
+def test_case_1_round_scores_matches_python_round():
+    """테스트 케이스 1: round_scores()가 파이썬 round(x, 2)와 같음 (곱셈 오차로 .5가 되는 경우 포함)"""
+    print("=" * 80)
+    print("테스트 1: 배열 반올림")
+    print("=" * 80)
+
+    rng = random.Random(7)
+    values = [1.115, 2.675, 0.285, 1.005, -1.115, 0.0, 100.0]
+    values += [k / 1000 for k in range(0, 100001, 7)]
+    values += [rng.uniform(-50, 150) for _ in range(20000)]
+
+    expected = np.array([round(v, 2) for v in values])
+    actual = round_scores(values)
+    mismatches = int((actual != expected).sum())
+    print(f"값 {len(values):,}개, 불일치 {mismatches}개 (np.round 불일치 {int((np.round(values, 2) != expected).sum())}개)")
+    assert mismatches == 0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_batch_matches_scalar():
+    """테스트 케이스 2: 벡터 계산이 calculate_base_score/apply_penalty/is_ad 결과와 같음"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 스칼라 경로와 동일한 결과")
+    print("=" * 80)
+
+    rng = random.Random(11)
+    n = 5000
+    columns = [
+        np.array([rng.choice([rng.randint(0, 100), round(rng.uniform(0, 100), 1), rng.uniform(0, 100)])
+                  for _ in range(n)])
+        for _ in range(6)
+    ]
+    nutrition = columns[5].copy()
+    nutrition[::3] = np.nan
+    penalties = np.array([rng.randint(0, 6) for _ in range(n)])
+
+    calculator = TrustScoreCalculator()
+    result = calculator.calculate_final_scores(*columns[:5], penalties, nutrition, threshold=45)
+
+    for i in range(n):
+        n_score = None if np.isnan(nutrition[i]) else float(nutrition[i])
+        base = calculator.calculate_base_score(*(float(column[i]) for column in columns[:5]), n_score)
+        final = calculator.apply_penalty(base, int(penalties[i]))
+        assert result["base_score"][i] == base, (i, base, result["base_score"][i])
+        assert result["final_score"][i] == final, (i, final, result["final_score"][i])
+        assert bool(result["is_ad"][i]) == calculator.is_ad(final, int(penalties[i]), threshold=45)
+        assert result["penalty"][i] == penalties[i] * 10
+
+    # calculate_final_score()와 비교 (영양성분 점수 없음)
+    scalar = calculator.calculate_final_score(80, 100, 50, 0, 70, penalty_count=2, use_nutrition_score=False)
+    batch = calculator.calculate_final_scores([80], [100], [50], [0], [70], [2])
+    assert batch["base_score"][0] == scalar["base_score"]
+    assert batch["final_score"][0] == scalar["final_score"]
+    print(f"리뷰 {n:,}건 일치")
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_weight_sweep():
+    """테스트 케이스 3: 가중치/임계값 탐색 (큰 묶음도 빠르게 계산)"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 가중치 탐색")
+    print("=" * 80)
+
+    rng = np.random.default_rng(3)
+    n = 200_000
+    columns = [rng.integers(0, 101, n).astype(float) for _ in range(5)]
+    penalties = rng.integers(0, 5, n)
+    calculator = TrustScoreCalculator()
+
+    started = time.perf_counter()
+    ad_rates = {}
+    for photo_weight in (0.0, 0.1, 0.2):
+        weights = {**TrustScoreCalculator.BASE_WEIGHTS, "P": photo_weight}
+        for threshold in (35, 40, 45):
+            result = calculator.calculate_final_scores(*columns, penalties, threshold=threshold, weights=weights)
+            ad_rates[(photo_weight, threshold)] = float(result["is_ad"].mean())
+    elapsed = time.perf_counter() - started
+
+    print(f"조합 {len(ad_rates)}개 × 리뷰 {n:,}건: {elapsed:.2f}초")
+    assert ad_rates[(0.1, 35)] <= ad_rates[(0.1, 40)] <= ad_rates[(0.1, 45)]
+    assert ad_rates[(0.0, 40)] >= ad_rates[(0.2, 40)]
+    assert elapsed < 10
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 trust_score.py 벡터 계산 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_round_scores_matches_python_round()
+        test_case_2_batch_matches_scalar()
+        test_case_3_weight_sweep()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -3,7 +3,8 @@
 리뷰의 신뢰도를 수치화하여 평가합니다.
 """
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Union
+import numpy as np
 from .nutrition_utils import (
     get_nutrition_info_safe,
     extract_ingredients,
@@ -11,9 +12,55 @@ from .nutrition_utils import (
 )
 
 
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+# Dekker 분할 상수 (2^27 + 1): 곱셈 반올림 오차를 정확히 구할 때 사용
+_SPLITTER = 134217729.0
+
+
+def round_scores(values: ArrayLike, ndigits: int = 2) -> np.ndarray:
+    """
+    배열 반올림 (각 원소에 파이썬 round(x, ndigits)를 적용한 것과 같은 결과)
+
+    np.round()는 x × 10^ndigits를 반올림하므로 곱셈 오차로 정확히 .5가 된 경우
+    (예: 1.115 → 111.5) 파이썬 round()와 결과가 다를 수 있습니다. 그런 원소만
+    곱셈 오차의 부호(Dekker 곱셈)로 실제 값이 .5보다 큰지 작은지 판단합니다.
+
+    Args:
+        values: 반올림할 값 배열
+        ndigits: 소수 자릿수 (0-6)
+
+    Returns:
+        np.ndarray: 반올림된 float64 배열
+    """
+    x = np.asarray(values, dtype=np.float64)
+    scale = float(10 ** ndigits)
+    scaled = x * scale
+
+    # 정확한 곱 x × scale = scaled + error (scale은 27비트 이하라 분할 불필요)
+    split = _SPLITTER * x
+    x_hi = split - (split - x)
+    x_lo = x - x_hi
+    error = (x_hi * scale - scaled) + x_lo * scale
+
+    floor = np.floor(scaled)
+    rounded = np.rint(scaled)
+    half = (scaled - floor) == 0.5
+    rounded = np.where(half & (error > 0), floor + 1, rounded)
+    rounded = np.where(half & (error < 0), floor, rounded)
+    return rounded / scale
+
+
 class TrustScoreCalculator:
     """신뢰도 점수 계산 클래스"""
 
+    # 기본 점수 가중치 (영양성분 점수 없을 때 / 있을 때)
+    BASE_WEIGHTS = {"L": 0.2, "R": 0.2, "M": 0.3, "P": 0.1, "C": 0.2}
+    NUTRITION_WEIGHTS = {"L": 0.15, "R": 0.15, "M": 0.25, "P": 0.1, "C": 0.15, "N": 0.2}
+
+    # 감점 항목이 이 개수 이상이면 점수와 무관하게 광고로 판별
+    AD_PENALTY_COUNT = 3
+
     def __init__(self):
         """신뢰도 점수 계산기 초기화"""
         pass
@@ -49,22 +96,24 @@ class TrustScoreCalculator:
         """
         if nutrition_score is not None:
             # 영양성분 점수 포함 공식
+            w = self.NUTRITION_WEIGHTS
             score = (
-                length_score * 0.15 +
-                repurchase_score * 0.15 +
-                monthly_use_score * 0.25 +
-                photo_score * 0.1 +
-                consistency_score * 0.15 +
-                nutrition_score * 0.2
+                length_score * w["L"] +
+                repurchase_score * w["R"] +
+                monthly_use_score * w["M"] +
+                photo_score * w["P"] +
+                consistency_score * w["C"] +
+                nutrition_score * w["N"]
             )
         else:
             # 기존 공식 (하위 호환성)
+            w = self.BASE_WEIGHTS
             score = (
-                length_score * 0.2 +
-                repurchase_score * 0.2 +
-                monthly_use_score * 0.3 +
-                photo_score * 0.1 +
-                consistency_score * 0.2
+                length_score * w["L"] +
+                repurchase_score * w["R"] +
+                monthly_use_score * w["M"] +
+                photo_score * w["P"] +
+                consistency_score * w["C"]
             )
         return round(score, 2)
 
@@ -244,7 +293,135 @@ class TrustScoreCalculator:
             bool: 광고 여부 (True: 광고, False: 일반 리뷰)
         """
         # 40점 미만 또는 감점 항목 3개 이상이면 광고로 판별
-        return final_score < threshold or penalty_count >= 3
+        return final_score < threshold or penalty_count >= self.AD_PENALTY_COUNT
+
+    def calculate_base_scores(
+        self,
+        length_scores: ArrayLike,
+        repurchase_scores: ArrayLike,
+        monthly_use_scores: ArrayLike,
+        photo_scores: ArrayLike,
+        consistency_scores: ArrayLike,
+        nutrition_scores: Optional[ArrayLike] = None,
+        weights: Optional[Dict[str, float]] = None,
+        nutrition_weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        신뢰도 기본 점수 배열 계산 (calculate_base_score()의 벡터 버전, 결과 동일)
+
+        Args:
+            length_scores ~ consistency_scores: L/R/M/P/C 점수 배열 (같은 길이)
+            nutrition_scores: N 점수 배열 (None이면 전체 기존 공식, NaN인 행만 기존 공식)
+            weights: 기존 공식 가중치 (기본값: BASE_WEIGHTS, 가중치 탐색용)
+            nutrition_weights: 영양성분 포함 공식 가중치 (기본값: NUTRITION_WEIGHTS)
+
+        Returns:
+            np.ndarray: 기본 신뢰도 점수 배열
+        """
+        L, R, M, P, C = (
+            np.asarray(values, dtype=np.float64)
+            for values in (length_scores, repurchase_scores, monthly_use_scores, photo_scores, consistency_scores)
+        )
+        # 스칼라 경로와 같은 순서로 더해야 부동소수점 결과가 같음
+        w = weights or self.BASE_WEIGHTS
+        score = L * w["L"] + R * w["R"] + M * w["M"] + P * w["P"] + C * w["C"]
+
+        if nutrition_scores is not None:
+            N = np.asarray(nutrition_scores, dtype=np.float64)
+            w = nutrition_weights or self.NUTRITION_WEIGHTS
+            with_nutrition = L * w["L"] + R * w["R"] + M * w["M"] + P * w["P"] + C * w["C"] + N * w["N"]
+            score = np.where(np.isnan(N), score, with_nutrition)
+
+        return round_scores(score)
+
+    def apply_penalties(
+        self,
+        base_scores: ArrayLike,
+        penalty_counts: ArrayLike,
+        penalty_per_item: int = 10
+    ) -> np.ndarray:
+        """
+        감점 적용 (apply_penalty()의 벡터 버전, 결과 동일)
+
+        Args:
+            base_scores: 기본 점수 배열
+            penalty_counts: 감점 항목 개수 배열
+            penalty_per_item: 항목당 감점 점수 (기본값: 10)
+
+        Returns:
+            np.ndarray: 감점 적용 후 최종 점수 배열 (0 이상)
+        """
+        penalty = np.asarray(penalty_counts) * penalty_per_item
+        return round_scores(np.maximum(0, np.asarray(base_scores, dtype=np.float64) - penalty))
+
+    def is_ad_batch(
+        self,
+        final_scores: ArrayLike,
+        penalty_counts: ArrayLike,
+        threshold: float = 40
+    ) -> np.ndarray:
+        """
+        광고 여부 판별 (is_ad()의 벡터 버전)
+
+        Args:
+            final_scores: 최종 신뢰도 점수 배열
+            penalty_counts: 감점 항목 개수 배열
+            threshold: 광고 판별 임계값 (기본값: 40)
+
+        Returns:
+            np.ndarray: 광고 여부 bool 배열
+        """
+        return (np.asarray(final_scores) < threshold) | (np.asarray(penalty_counts) >= self.AD_PENALTY_COUNT)
+
+    def calculate_final_scores(
+        self,
+        length_scores: ArrayLike,
+        repurchase_scores: ArrayLike,
+        monthly_use_scores: ArrayLike,
+        photo_scores: ArrayLike,
+        consistency_scores: ArrayLike,
+        penalty_counts: ArrayLike,
+        nutrition_scores: Optional[ArrayLike] = None,
+        penalty_per_item: int = 10,
+        threshold: float = 40,
+        weights: Optional[Dict[str, float]] = None,
+        nutrition_weights: Optional[Dict[str, float]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        리뷰 묶음의 최종 신뢰도 점수와 광고 판별 (가중치/임계값 탐색용)
+
+        영양성분 점수는 DB 조회가 필요하므로 미리 계산한 값(nutrition_scores)을 받습니다.
+        calculate_final_score()에서 영양성분 공식을 쓴 행은 N 값, 아닌 행은 NaN을 넣으면 같은 결과가 나옵니다.
+
+        Args:
+            length_scores ~ consistency_scores: L/R/M/P/C 점수 배열
+            penalty_counts: 감점 항목 개수 배열
+            nutrition_scores: N 점수 배열 (선택적, NaN = 기존 공식)
+            penalty_per_item: 항목당 감점 점수 (기본값: 10)
+            threshold: 광고 판별 임계값 (기본값: 40)
+            weights, nutrition_weights: 기본 점수 가중치 (기본값: 클래스 가중치)
+
+        Returns:
+            Dict[str, np.ndarray]: {"base_score", "penalty", "final_score", "is_ad"}
+        """
+        penalty_counts = np.asarray(penalty_counts)
+        base_scores = self.calculate_base_scores(
+            length_scores,
+            repurchase_scores,
+            monthly_use_scores,
+            photo_scores,
+            consistency_scores,
+            nutrition_scores,
+            weights=weights,
+            nutrition_weights=nutrition_weights
+        )
+        final_scores = self.apply_penalties(base_scores, penalty_counts, penalty_per_item)
+        return {
+            "base_score": base_scores,
+            "penalty": penalty_counts * penalty_per_item,
+            "final_score": final_scores,
+            "is_ad": self.is_ad_batch(final_scores, penalty_counts, threshold)
+        }
 
 
 # 편의 함수
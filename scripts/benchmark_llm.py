@@ -0,0 +1,278 @@
+"""
+AI 분석 처리량 벤치마크 스크립트
+모의 Anthropic 서버(core/mock_anthropic.py)에 분석기를 연결하여
+sync/async/batched 모드별 처리량과 지연 시간 p50/p95/p99를 측정합니다 (실제 API 호출 없음).
+
+모드:
+- sync: 리뷰를 한 건씩 순차 분석
+- async: asyncio로 동시 분석 (동시 실행 수 = --concurrency)
+          langchain은 비동기 클라이언트(abatch) 경로, 분석기는 asyncio.to_thread 경로
+- batched: langchain은 parse_reviews_with_langchain_batch() 한 번 호출
+           (모든 리뷰의 지연 시간 = 배치 전체 소요 시간),
+           분석기는 스레드 풀(--concurrency)로 동시 분석
+"""
+import os
+import sys
+import io
+import json
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# UTF-8 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# 프로젝트 루트를 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from core.mock_anthropic import MockAnthropicServer, lognormal_latency
+from core.usage_metrics import percentile, usage_tracker
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+MODES = ("sync", "async", "batched")
+TARGETS = ("pharmacist", "core", "langchain")
+
+
+def build_reviews(count):
+    """mock 리뷰 템플릿을 반복하여 벤치마크 입력 구성"""
+    templates = NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES
+    return [
+        f"{templates[i % len(templates)]['title']} {templates[i % len(templates)]['body']}"
+        for i in range(count)
+    ]
+
+
+def make_target(target, server):
+    """
+    대상별 (동기 분석 함수, 비동기 분석 함수, 배치 분석 함수 또는 None) 생성
+    분석 함수는 실패 시 예외를 발생시켜 오류로 집계되도록 합니다.
+    """
+    if target == "langchain":
+        from core.langchain_parser import (
+            parse_review_with_langchain,
+            parse_reviews_with_langchain_batch,
+            aparse_reviews_with_langchain_batch
+        )
+
+        def analyze(text):
+            return parse_review_with_langchain(text, anthropic_api_key=server.api_key)
+
+        async def aanalyze(text):
+            result = (await aparse_reviews_with_langchain_batch([text], anthropic_api_key=server.api_key))[0]
+            if result is None:
+                raise ValueError("파싱 실패")
+            return result
+
+        def analyze_batch(texts, concurrency):
+            results = parse_reviews_with_langchain_batch(
+                texts, max_concurrency=concurrency, anthropic_api_key=server.api_key
+            )
+            return [r is not None for r in results]
+
+        return analyze, aanalyze, analyze_batch
+
+    if target == "pharmacist":
+        from logic_designer.analyzer import PharmacistAnalyzer
+    else:
+        from core.analyzer import PharmacistAnalyzer
+    analyzer = PharmacistAnalyzer(api_key=server.api_key, client=server.client())
+
+    def analyze(text):
+        return analyzer.analyze(text)
+
+    async def aanalyze(text):
+        return await asyncio.to_thread(analyzer.analyze, text)
+
+    return analyze, aanalyze, None
+
+
+def run_sync(analyze, reviews):
+    """순차 분석 → (리뷰별 지연 ms, 성공 여부)"""
+    latencies, successes = [], []
+    for text in reviews:
+        start = time.perf_counter()
+        try:
+            analyze(text)
+            successes.append(True)
+        except Exception:
+            successes.append(False)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, successes
+
+
+def run_async(aanalyze, reviews, concurrency):
+    """asyncio 동시 분석 → (리뷰별 지연 ms, 성공 여부)"""
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(text):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await aanalyze(text)
+                    ok = True
+                except Exception:
+                    ok = False
+                return (time.perf_counter() - start) * 1000, ok
+
+        return await asyncio.gather(*(one(text) for text in reviews))
+
+    outcomes = asyncio.run(main())
+    return [o[0] for o in outcomes], [o[1] for o in outcomes]
+
+
+def run_batched(analyze, analyze_batch, reviews, concurrency):
+    """배치 분석 → (리뷰별 지연 ms, 성공 여부)"""
+    if analyze_batch is not None:
+        start = time.perf_counter()
+        successes = analyze_batch(reviews, concurrency)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return [elapsed_ms] * len(reviews), successes
+
+    def one(text):
+        start = time.perf_counter()
+        try:
+            analyze(text)
+            ok = True
+        except Exception:
+            ok = False
+        return (time.perf_counter() - start) * 1000, ok
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(one, reviews))
+    return [o[0] for o in outcomes], [o[1] for o in outcomes]
+
+
+def run_benchmark(
+    target="langchain",
+    modes=MODES,
+    requests=100,
+    concurrency=8,
+    latency_median_ms=300.0,
+    latency_sigma=0.5,
+    rate_limit_burst_rate=0.0,
+    overload_burst_rate=0.0,
+    burst_length=3,
+    malformed_rate=0.0,
+    repairable_rate=0.0,
+    seed=42,
+    usage_metrics_path=None
+):
+    """
+    모드별 벤치마크 실행 (모드마다 새 모의 서버 사용)
+
+    usage_metrics_path를 지정하면 모드별 AI 사용량 요약을 지표 파일에 추가합니다
+    (run_id: benchmark-<대상>-<모드>, 기본값은 기록하지 않음).
+
+    Returns:
+        list: 모드별 결과 {"target", "mode", "requests", "errors", "elapsed_s",
+              "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "server", "usage"}
+    """
+    reviews = build_reviews(requests)
+    results = []
+    for mode in modes:
+        server = MockAnthropicServer(
+            latency=lognormal_latency(latency_median_ms, latency_sigma),
+            rate_limit_burst_rate=rate_limit_burst_rate,
+            overload_burst_rate=overload_burst_rate,
+            burst_length=burst_length,
+            malformed_rate=malformed_rate,
+            repairable_rate=repairable_rate,
+            seed=seed
+        )
+        usage_tracker.reset()
+        with server, server.environment():
+            analyze, aanalyze, analyze_batch = make_target(target, server)
+            start = time.perf_counter()
+            if mode == "sync":
+                latencies, successes = run_sync(analyze, reviews)
+            elif mode == "async":
+                latencies, successes = run_async(aanalyze, reviews, concurrency)
+            else:
+                latencies, successes = run_batched(analyze, analyze_batch, reviews, concurrency)
+            elapsed = time.perf_counter() - start
+
+        if usage_metrics_path:
+            usage = usage_tracker.write_summary(usage_metrics_path, run_id=f"benchmark-{target}-{mode}")
+        else:
+            usage = usage_tracker.summary()
+            usage_tracker.reset()
+
+        ordered = sorted(latencies)
+        results.append({
+            "target": target,
+            "mode": mode,
+            "requests": len(reviews),
+            "errors": successes.count(False),
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(len(reviews) / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(ordered, 50), 1),
+            "p95_ms": round(percentile(ordered, 95), 1),
+            "p99_ms": round(percentile(ordered, 99), 1),
+            "server": server.get_stats(),
+            "usage": usage["total"]
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 API 기반 AI 분석 처리량 벤치마크")
+    parser.add_argument("--target", choices=TARGETS, default="langchain")
+    parser.add_argument("--modes", default=",".join(MODES), help="쉼표로 구분 (sync,async,batched)")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-median-ms", type=float, default=300.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="요청당 429 연속 오류 시작 확률")
+    parser.add_argument("--overload-rate", type=float, default=0.0, help="요청당 529 연속 오류 시작 확률")
+    parser.add_argument("--burst-length", type=int, default=3)
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="복구 불가능한 JSON 응답 비율")
+    parser.add_argument("--repairable-rate", type=float, default=0.0, help="로컬 복구 가능한 JSON 응답 비율")
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (선택)")
+    parser.add_argument("--usage-metrics", help="모드별 AI 사용량 요약 JSONL 경로 (선택)")
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f"알 수 없는 모드: {unknown}")
+
+    print("=" * 50)
+    print(f"AI 분석 벤치마크 ({args.target}, 모의 서버)")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+
+    results = run_benchmark(
+        target=args.target,
+        modes=modes,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        latency_median_ms=args.latency_median_ms,
+        latency_sigma=args.latency_sigma,
+        rate_limit_burst_rate=args.rate_limit_rate,
+        overload_burst_rate=args.overload_rate,
+        burst_length=args.burst_length,
+        malformed_rate=args.malformed_rate,
+        repairable_rate=args.repairable_rate,
+        usage_metrics_path=args.usage_metrics
+    )
+
+    print(f"{'모드':<8} {'처리량(rps)':>12} {'p50(ms)':>10} {'p95(ms)':>10} {'p99(ms)':>10} {'오류':>6}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['throughput_rps']:>12} {r['p50_ms']:>10} {r['p95_ms']:>10} {r['p99_ms']:>10} {r['errors']:>6}")
+        print(f"         서버 응답: {r['server']}")
+        print(f"         AI 사용량: 호출 {r['usage']['calls']}건, 토큰 {r['usage']['tokens']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 """
-Products 테이블의 rating_avg와 rating_count를 실제 리뷰 데이터로 업데이트하는 스크립트
+Products 테이블의 rating_avg와 rating_count를 실제 리뷰 데이터로 맞추는 스크립트
 ⚠️ 발견된 문제: products.rating_avg와 rating_count가 NULL이거나 0
-✅ 해결: 실제 reviews 테이블 데이터를 집계하여 업데이트
+✅ 해결: 제품별 평점 집계(product_rating_stats)를 reviews 트리거로 증분 유지하고,
+        이 스크립트로 주기적인 정합성 확인 또는 전체 재집계를 실행
+
+사전 준비: database/create_product_rating_stats.sql 실행 (설치 직후 한 번 기본 모드로 전체 재집계)
+환경 변수: SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (관리자 권한)
 """
 import sys
 import io
 import os
-import requests
+import argparse
 from datetime import datetime
 
 # UTF-8 인코딩 설정
@@ -18,123 +22,48 @@ if sys.platform == 'win32':
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-# Supabase 설정 (SERVICE_ROLE_KEY 사용 - 관리자 권한)
-SUPABASE_URL = "https://bvowxbpqtfpkkxkzsumf.supabase.co"
-SUPABASE_KEY = "sb_secret_7colYDry0-0E76v-yrpzFA_ab48cpbo"  # SERVICE_ROLE_KEY
-
-def fetch_all_products():
-    """모든 제품 조회"""
-    url = f"{SUPABASE_URL}/rest/v1/products"
-    headers = {
-        "apikey": SUPABASE_KEY,
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "Content-Type": "application/json"
-    }
-    params = {"select": "id,brand,title"}
-    
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"❌ 제품 조회 실패: {response.status_code}")
-        return []
-
-def fetch_reviews_for_product(product_id):
-    """특정 제품의 모든 리뷰 조회"""
-    url = f"{SUPABASE_URL}/rest/v1/reviews"
-    headers = {
-        "apikey": SUPABASE_KEY,
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "Content-Type": "application/json"
-    }
-    params = {
-        "select": "rating",
-        "product_id": f"eq.{product_id}"
-    }
-    
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        return []
+from database.rating_aggregates import ProductRatingAggregates
+from database.supabase_client import SupabaseClient
 
-def update_product_ratings(product_id, rating_avg, rating_count):
-    """제품의 rating_avg와 rating_count 업데이트"""
-    url = f"{SUPABASE_URL}/rest/v1/products"
-    headers = {
-        "apikey": SUPABASE_KEY,
-        "Authorization": f"Bearer {SUPABASE_KEY}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation"
-    }
-    params = {"id": f"eq.{product_id}"}
-    
-    data = {
-        "rating_avg": rating_avg,
-        "rating_count": rating_count
-    }
-    
-    response = requests.patch(url, headers=headers, params=params, json=data)
-    return response.status_code == 200
 
 def main():
+    parser = argparse.ArgumentParser(description="제품 평점 집계(rating_avg, rating_count) 정합성 확인/재집계")
+    parser.add_argument("--reconcile", action="store_true",
+                        help="전체 재집계 대신 오래 확인하지 않은 제품부터 일부만 확인 (주기 실행용)")
+    parser.add_argument("--limit", type=int, default=200, help="--reconcile에서 확인할 제품 수")
+    parser.add_argument("--client-side", action="store_true",
+                        help="SQL 함수 없이 재집계 (리뷰/제품을 페이지 단위로 한 번씩 읽고 바뀐 제품만 갱신)")
+    parser.add_argument("--dry-run", action="store_true", help="--client-side에서 갱신하지 않고 바뀔 제품 수만 집계")
+    args = parser.parse_args()
+
     print("=" * 70)
-    print("Products 테이블 Rating 정보 자동 업데이트")
+    print("Products 테이블 Rating 정보 정합성 확인")
     print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
-    
-    # 1. 모든 제품 조회
-    print("\n📦 제품 목록 조회 중...")
-    products = fetch_all_products()
-    print(f"✅ 총 {len(products)}개 제품 발견")
-    
-    # 2. 각 제품의 리뷰 집계 및 업데이트
-    updated_count = 0
-    no_review_count = 0
-    
-    for i, product in enumerate(products, 1):
-        product_id = product['id']
-        product_name = f"{product.get('brand', 'N/A')} - {product.get('title', 'N/A')[:40]}"
-        
-        # 제품의 리뷰 조회
-        reviews = fetch_reviews_for_product(product_id)
-        
-        if reviews:
-            # 평균 평점 계산
-            ratings = [r['rating'] for r in reviews if r.get('rating') is not None]
-            if ratings:
-                rating_avg = sum(ratings) / len(ratings)
-                rating_count = len(ratings)
-                
-                # 업데이트
-                success = update_product_ratings(product_id, rating_avg, rating_count)
-                
-                if success:
-                    print(f"[{i}/{len(products)}] ✅ {product_name}")
-                    print(f"          평점: {rating_avg:.2f} / 리뷰 수: {rating_count}개")
-                    updated_count += 1
-                else:
-                    print(f"[{i}/{len(products)}] ❌ 업데이트 실패: {product_name}")
-            else:
-                print(f"[{i}/{len(products)}] ⚠️  리뷰는 있지만 평점 없음: {product_name}")
-                no_review_count += 1
+
+    aggregates = ProductRatingAggregates(SupabaseClient.get_service_client())
+
+    if args.client_side:
+        stats = aggregates.rebuild_client_side(dry_run=args.dry_run)
+        print(f"📦 제품 {stats['products']:,}개, 💬 리뷰 {stats['reviews']:,}개 조회")
+        print(f"{'🔍 바뀔' if args.dry_run else '✅ 갱신한'} 제품: {stats['changed']:,}개 (요청 {stats['requests']:,}회)")
+        return
+
+    try:
+        if args.reconcile:
+            result = aggregates.reconcile(limit=args.limit)
+            print(f"🔍 확인한 제품: {result['checked']:,}개")
+            print(f"🛠️  집계 보정: {result['stats_fixed']:,}개, 제품 평점 보정: {result['products_fixed']:,}개")
         else:
-            # 리뷰가 없는 경우 0으로 업데이트
-            success = update_product_ratings(product_id, 0, 0)
-            if success:
-                print(f"[{i}/{len(products)}] ⭕ 리뷰 없음 (0으로 설정): {product_name}")
-                no_review_count += 1
-    
-    # 결과 요약
-    print("\n" + "=" * 70)
-    print("업데이트 완료 요약")
-    print("=" * 70)
-    print(f"✅ 업데이트 성공: {updated_count}개")
-    print(f"⭕ 리뷰 없음: {no_review_count}개")
-    print(f"📊 전체: {len(products)}개")
-    print("=" * 70)
-    
+            changed = aggregates.rebuild()
+            print(f"✅ 전체 재집계 완료: 평점이 바뀐 제품 {changed:,}개")
+    except Exception as e:
+        print(f"❌ 집계 함수 호출 실패: {e}")
+        print("   database/create_product_rating_stats.sql을 먼저 실행하거나 --client-side 옵션을 사용하세요.")
+        sys.exit(1)
+
     print("\n✨ 이제 UI에서 제품 평점과 리뷰 수가 정확하게 표시됩니다!")
 
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+"""
+리뷰어 인덱스 재구축/조회 스크립트
+평소에는 reviews 트리거가 바뀐 (작성자, 제품) 쌍만 색인에 반영하므로 재구축은 설치 직후 한 번,
+또는 삭제된 작성자를 HyperLogLog 스케치에서 정리할 때만 실행합니다.
+
+사전 준비: database/create_reviewer_index.sql 실행
+환경 변수: SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (재구축), SUPABASE_ANON_KEY (조회)
+"""
+import sys
+import io
+import os
+import argparse
+from datetime import datetime
+
+# UTF-8 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# 프로젝트 루트를 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from database.reviewer_index import ReviewerIndex
+from database.supabase_client import SupabaseClient
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰어 인덱스 재구축 / 제품 간 같은 작성자 조회")
+    parser.add_argument("--product", help="재구축 대신 이 제품의 작성자 집계와 다른 제품 공유 작성자 조회")
+    parser.add_argument("--competitors", nargs="*", default=[], help="--product와 겹치는 작성자 수를 추정할 경쟁 제품 ID")
+    parser.add_argument("--limit", type=int, default=20, help="--product에서 보여줄 공유 작성자 수")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("리뷰어 인덱스")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+
+    try:
+        if args.product:
+            index = ReviewerIndex(SupabaseClient.get_client())
+            stats = index.product_stats([args.product]).get(str(args.product))
+            if not stats:
+                print(f"⚠️ 제품 {args.product}의 작성자 집계가 없습니다")
+                return
+            print(f"📦 제품 {args.product}: 리뷰 {stats['review_count']:,}개, 고유 작성자 {stats['reviewer_count']:,}명, "
+                  f"다른 제품에도 리뷰한 작성자 {stats['shared_reviewer_count']:,}명")
+            for row in index.shared_reviewers(args.product, limit=args.limit):
+                print(f"  - {row['author_key']}: 제품 {row['product_count']}개 (다른 제품 {row['other_product_ids']})")
+            for competitor_id, overlap in index.competitor_overlap(args.product, args.competitors).items():
+                print(f"🔍 경쟁 제품 {competitor_id}와 겹치는 작성자: 약 {overlap:,.0f}명")
+        else:
+            products = ReviewerIndex(SupabaseClient.get_service_client()).rebuild()
+            print(f"✅ 재구축 완료: 작성자 집계가 있는 제품 {products:,}개")
+    except Exception as e:
+        print(f"❌ 리뷰어 인덱스 호출 실패: {e}")
+        print("   database/create_reviewer_index.sql을 먼저 실행하세요.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
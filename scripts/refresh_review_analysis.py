@@ -0,0 +1,124 @@
+"""
+리뷰 분석 증분 갱신 스크립트
+Supabase reviews 테이블을 페이지 단위로 읽어 review_analysis 저장소(로컬 SQLite 미러)와 비교하고,
+텍스트·규칙 버전·모델 버전 중 하나라도 바뀐 리뷰만 다시 분석하여 저장합니다.
+야간 실행 비용이 전체 코퍼스가 아니라 그날 바뀐 리뷰 수에 비례합니다.
+체크리스트 규칙만 바뀐 경우에는 바뀐 항목만 다시 검사하고 신뢰도 점수/광고 판별을 다시 계산합니다.
+"""
+import os
+import sys
+import io
+import json
+import argparse
+from datetime import datetime
+
+# UTF-8 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# 프로젝트 루트를 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from database.analysis_store import DEFAULT_SQLITE_PATH, ReviewAnalysisStore
+from database.supabase_client import SupabaseClient
+from core.stage_metrics import stage_metrics
+from core.usage_metrics import usage_tracker
+from logic_designer.incremental import refresh_analysis
+
+PAGE_SIZE = 1000
+
+
+def iter_reviews(supabase, page_size=PAGE_SIZE):
+    """reviews 테이블을 id 순서로 페이지 단위 조회 → {"id", "text", "product_id"}"""
+    offset = 0
+    while True:
+        response = supabase.table("reviews")\
+            .select("id,product_id,title,body")\
+            .order("id")\
+            .range(offset, offset + page_size - 1)\
+            .execute()
+        rows = response.data or []
+        for row in rows:
+            text = " ".join(part for part in (row.get("title"), row.get("body")) if part)
+            yield {"id": row["id"], "text": text, "product_id": row.get("product_id")}
+        if len(rows) < page_size:
+            break
+        offset += page_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="바뀐 리뷰만 다시 분석하여 review_analysis 갱신")
+    parser.add_argument("--sqlite", default=DEFAULT_SQLITE_PATH, help="로컬 SQLite 미러 경로")
+    parser.add_argument("--no-upload", action="store_true", help="Supabase에 저장하지 않고 로컬 미러에만 저장")
+    parser.add_argument("--pull", action="store_true", help="시작 전 Supabase review_analysis를 로컬 미러로 가져오기")
+    parser.add_argument("--dry-run", action="store_true", help="다시 분석할 리뷰 수만 집계")
+    parser.add_argument("--local-only", action="store_true", help="AI 호출 없이 로컬 추출기로만 분석")
+    parser.add_argument("--pre-classify", action="store_true", help="사전 분류기로 확실한 경우 AI 호출 생략")
+    parser.add_argument("--model", help="분석 모델 지정 (기본: 모델 라우터)")
+    parser.add_argument("--rule-workers", type=int, default=4)
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--output", help="집계 결과 JSON 저장 경로 (선택)")
+    parser.add_argument("--usage-metrics", help="AI 사용량 요약 JSONL 경로 (기본값: LLM_USAGE_METRICS_PATH 또는 output/metrics/llm_usage.jsonl)")
+    parser.add_argument("--stage-metrics", action="store_true",
+                        help="단계별 소요 시간 계측 (종료 시 STAGE_METRICS_PATH 또는 output/metrics/stage_timings.jsonl에 기록)")
+    parser.add_argument("--stage-metrics-prom", help="단계 계측 결과를 Prometheus 텍스트 형식으로도 저장할 경로 (--stage-metrics 포함)")
+    args = parser.parse_args()
+
+    if args.stage_metrics or args.stage_metrics_prom:
+        stage_metrics.enable()
+    run_id = f"refresh-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+    print("=" * 50)
+    print("리뷰 분석 증분 갱신")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+
+    supabase = SupabaseClient.get_client()
+    upload_client = None if args.no_upload else SupabaseClient.get_service_client()
+    store = ReviewAnalysisStore(args.sqlite, supabase=upload_client)
+    try:
+        if args.pull:
+            store.supabase = supabase
+            print(f"Supabase에서 가져온 행: {store.pull_from_supabase()}")
+            store.supabase = upload_client
+
+        stats = refresh_analysis(
+            iter_reviews(supabase),
+            store,
+            model=args.model,
+            local_only=args.local_only,
+            pre_classify=args.pre_classify,
+            dry_run=args.dry_run,
+            rule_workers=args.rule_workers,
+            llm_concurrency=args.llm_concurrency
+        )
+    finally:
+        store.close()
+        # 중단된 실행도 그때까지의 지표를 기록
+        if usage_tracker.summary()["total"]["calls"]:
+            usage = usage_tracker.write_summary(args.usage_metrics, run_id=run_id)
+            print(f"AI 호출: {usage['total']['calls']}건, 토큰: {usage['total']['tokens']}, "
+                  f"추정 비용: ${usage['total']['estimated_cost_usd']:.4f}")
+        if stage_metrics.enabled:
+            stages = stage_metrics.dump(run_id=run_id)["stages"]
+            print("단계별 p95(ms): " + ", ".join(f"{stage} {s['p95_ms']}" for stage, s in stages.items()))
+            if args.stage_metrics_prom:
+                stage_metrics.write_prometheus(args.stage_metrics_prom)
+
+    print(f"규칙 버전: {stats['rule_version']}")
+    print(f"모델 버전: {stats['model_version']}")
+    print(f"조회: {stats['scanned']}건, 변경: {stats['stale']}")
+    print(f"항목 단위 재계산: {stats['rescored']}건 (다시 검사한 항목: {stats['rescored_items']})")
+    print(f"분석: {stats['analyzed']}건, 저장: {stats['stored']}건, 실패(다음 실행에 재시도): {stats['failed']}건")
+    print(f"소요 시간: {stats['elapsed_s']}초")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+로컬 사전 분류기 학습 스크립트
+mock 리뷰 템플릿(정상/광고)과 13단계 체크리스트 결과로 로지스틱 회귀를 학습하여
+logic_designer/models/pre_classifier_v{버전}.npz로 저장합니다.
+"""
+import os
+import sys
+import io
+from datetime import datetime
+
+# UTF-8 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+# 프로젝트 루트를 경로에 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+from logic_designer.checklist import AdChecklist
+from logic_designer.pre_classifier import train, default_model_path
+
+
+def build_training_set():
+    """
+    템플릿별로 제목+본문, 본문, 제목 세 가지 변형을 만들어 학습 데이터 구성
+
+    Returns:
+        tuple: (텍스트 목록, 라벨 목록 (1: 광고, 0: 정상))
+    """
+    texts, labels = [], []
+    for templates, label in ((NORMAL_REVIEW_TEMPLATES, 0), (AD_REVIEW_TEMPLATES, 1)):
+        for template in templates:
+            for text in (f"{template['title']} {template['body']}", template["body"], template["title"]):
+                texts.append(text)
+                labels.append(label)
+    return texts, labels
+
+
+def main():
+    print("=" * 50)
+    print("사전 분류기 학습 시작")
+    print(f"시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 50)
+
+    texts, labels = build_training_set()
+    checklist = AdChecklist()
+    checklist_results = [checklist.check_ad_patterns(text) for text in texts]
+    print(f"학습 데이터: {len(texts)}건 (광고 {sum(labels)}건)")
+
+    classifier = train(texts, labels, checklist_results)
+    path = classifier.save(default_model_path())
+
+    print(f"학습 정확도: {classifier.metadata['train_accuracy']:.2%}")
+    print(f"저장 위치: {path}")
+
+
+if __name__ == "__main__":
+    main()
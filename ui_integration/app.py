@@ -32,6 +32,16 @@ from supabase_data import (
 )
 USE_SUPABASE = True
 
+# AI 약사 분석 모듈 (프로젝트 루트의 logic_designer, 없으면 스트리밍 분석 비활성화)
+import sys
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+try:
+    from logic_designer.analyzer import PharmacistAnalyzer, get_pharmacist_analyzer
+except Exception:
+    PharmacistAnalyzer = None
+
 # ========== 성능 최적화: 데이터 캐싱 ==========
 @st.cache_data(ttl=300)  # 5분 캐시
 def get_cached_products():
@@ -53,6 +63,21 @@ def get_cached_analysis_results():
     """분석 결과 캐싱"""
     return get_all_analysis_results()
 
+@st.cache_resource
+def get_cached_pharmacist_analyzer():
+    """AI 약사 분석기 캐싱 (API 키가 없으면 None)"""
+    if PharmacistAnalyzer is None:
+        return None
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    try:
+        if 'ANTHROPIC_API_KEY' in st.secrets:
+            api_key = st.secrets['ANTHROPIC_API_KEY']
+    except Exception:
+        pass
+    if not api_key:
+        return None
+    return get_pharmacist_analyzer(api_key=api_key)
+
 # ========== 필터 검증 함수 ==========
 def validate_filters(filters: Dict) -> List[str]:
     """필터 값 검증 및 에러 메시지 반환"""
@@ -658,6 +683,59 @@ def render_individual_review_analysis(reviews: List[Dict]) -> None:
         
         st.markdown('</div>', unsafe_allow_html=True)
 
+    render_streaming_ai_analysis(filtered_reviews[:20])
+
+
+def render_streaming_ai_analysis(reviews: List[Dict]) -> None:
+    """AI 약사 실시간 분석 (필드가 완성되는 즉시 표시)"""
+    st.markdown("#### 🧑‍⚕️ AI 약사 실시간 분석")
+
+    analyzer = get_cached_pharmacist_analyzer()
+    if analyzer is None:
+        st.info("ANTHROPIC_API_KEY가 설정되지 않아 AI 약사 분석을 사용할 수 없습니다.")
+        return
+
+    review_labels = [
+        f"{idx + 1}. {'⭐' * r.get('rating', 5)} {r.get('text', '')[:40]}"
+        for idx, r in enumerate(reviews)
+    ]
+    selected_idx = st.selectbox(
+        "분석할 리뷰 선택",
+        options=list(range(len(reviews))),
+        format_func=lambda i: review_labels[i],
+        key="stream_review_select"
+    )
+
+    if not st.button("AI 약사 분석 시작", key="stream_analyze_button"):
+        return
+
+    review = reviews[selected_idx]
+    field_labels = {
+        "summary": "📌 한 줄 요약",
+        "efficacy": "💊 효능",
+        "side_effects": "⚠️ 부작용",
+        "tip": "💡 약사의 조언"
+    }
+    placeholders = {field: st.empty() for field in field_labels}
+    for field, label in field_labels.items():
+        placeholders[field].markdown(f"**{label}**: ⏳ 분석 중...")
+    disclaimer_placeholder = st.empty()
+
+    product_id = review.get("product_id")
+    try:
+        for field, value in analyzer.analyze_stream(
+            review.get("text", ""),
+            product_id=int(product_id) if str(product_id).isdigit() else None
+        ):
+            if field in placeholders:
+                placeholders[field].markdown(f"**{field_labels[field]}**: {value}")
+            elif field == "disclaimer":
+                disclaimer_placeholder.caption(value)
+    except ValueError as e:
+        st.warning(f"분석 불가: {e}")
+    except Exception as e:
+        st.error(f"AI 분석 실패: {e}")
+
 
 def main():
     """메인 앱 함수"""
@@ -4,9 +4,15 @@ Supabase REST API를 통해 products와 reviews 테이블에서 데이터를 가
 Streamlit Cloud와 로컬 환경 모두 지원합니다.
 """
 
+import functools
+import hashlib
+import inspect
 import os
 import requests
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from time_distribution import summarize_review_dates, time_distribution_check
 
 # 디버그 모드 (사용자 UI에서 숨김)
 DEBUG = False
@@ -307,10 +313,129 @@ def get_reviews_by_product(product_id: str) -> List[Dict]:
     return formatted
 
 
-def generate_checklist_results(reviews: List[Dict]) -> Dict:
-    """8단계 체크리스트 결과 생성"""
+def _cache_data(max_entries: int) -> Callable:
+    """
+    st.cache_data 데코레이터 (이름이 _로 시작하는 인자는 캐시 키에서 제외)
+
+    Streamlit이 없는 환경(스크립트/테스트)에서는 같은 키 규칙의 LRU 캐시로 대체합니다.
+    """
+    try:
+        import streamlit as st
+        return st.cache_data(max_entries=max_entries, show_spinner=False)
+    except ImportError:
+        pass
+
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        names = list(inspect.signature(func).parameters)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = tuple(arg for name, arg in zip(names, args) if not name.startswith("_"))
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            value = cache[key] = func(*args)
+            if len(cache) > max_entries:
+                cache.popitem(last=False)
+            return value
+
+        wrapper.clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _review_dates_fingerprint(reviews: List[Dict]) -> Tuple[int, str]:
+    """
+    시간 분포 요약 캐시 키: (리뷰 수, 정렬한 작성일 목록의 SHA-256)
+
+    작성일 범위(최초/최신)만으로는 범위 안의 작성일 수정을 알 수 없으므로 작성일 전체를 해시합니다.
+    정렬 후 해시하므로 조회 순서와 무관하며, 작성일 없는(NULL) 리뷰는 리뷰 수에만 반영됩니다.
+    """
+    dates = sorted(str(r["date"])[:10] for r in reviews if r.get("date"))
+    return len(reviews), hashlib.sha256("\n".join(dates).encode("utf-8")).hexdigest()
+
+
+@_cache_data(max_entries=512)
+def _cached_time_summary(product_id: str, fingerprint: Tuple, _dates: Iterable[Any]) -> Dict:
+    """제품/작성일 지문별 시간 분포 요약 (_dates는 캐시 키에서 제외)"""
+    return summarize_review_dates(_dates)
+
+
+def get_time_distribution_summary(product_id: str, reviews: List[Dict]) -> Dict:
+    """
+    제품의 리뷰 작성 시간 분포 요약 (리뷰 수와 작성일 목록이 같으면 캐시된 요약 반환)
+
+    Args:
+        product_id: 제품 ID
+        reviews: get_reviews_by_product() 결과
+
+    Returns:
+        Dict: time_distribution.summarize_review_dates() 결과
+    """
+    return _cached_time_summary(
+        str(product_id), _review_dates_fingerprint(reviews), (r.get("date") for r in reviews)
+    )
+
+
+def get_reviewer_stats(product_ids: List[str]) -> Dict[str, Dict]:
+    """
+    제품별 작성자 집계 조회 (리뷰어 인덱스 product_reviewer_stats, 제품당 행 하나)
+
+    Args:
+        product_ids: 제품 ID 목록
+
+    Returns:
+        Dict[str, Dict]: {product_id: {"review_count", "reviewer_count", "shared_reviewer_count"}}
+        (database/create_reviewer_index.sql 미설치 시 빈 dict)
+    """
+    if not product_ids:
+        return {}
+    rows = _fetch_from_supabase(
+        'product_reviewer_stats',
+        f'select=product_id,review_count,reviewer_count,shared_reviewer_count&product_id=in.({",".join(product_ids)})'
+    )
+    return {str(row['product_id']): row for row in rows}
+
+
+def _reviewer_diversity_check(reviews: List[Dict], reviewer_stats: Optional[Dict]) -> Dict:
+    """리뷰어 다양성 항목 (인덱스 집계가 있으면 사용, 없으면 리뷰 목록에서 계산)"""
+    if reviewer_stats and reviewer_stats.get('review_count'):
+        review_count = reviewer_stats['review_count']
+        reviewer_count = reviewer_stats.get('reviewer_count') or 0
+        shared = reviewer_stats.get('shared_reviewer_count') or 0
+        return {
+            "passed": reviewer_count >= review_count * 0.8,
+            "rate": reviewer_count / review_count,
+            "description": f"고유 작성자 {reviewer_count}/{review_count}, 다른 제품에도 리뷰한 작성자 {shared}명"
+        }
+
+    total_reviews = len(reviews)
+    reviewer_count = len(set(r.get("reviewer") for r in reviews))
+    return {
+        "passed": reviewer_count >= total_reviews * 0.8,
+        "rate": reviewer_count / total_reviews,
+        "description": f"고유 작성자 {reviewer_count}/{total_reviews}"
+    }
+
+
+def generate_checklist_results(
+    reviews: List[Dict],
+    time_summary: Optional[Dict] = None,
+    reviewer_stats: Optional[Dict] = None
+) -> Dict:
+    """
+    8단계 체크리스트 결과 생성
+
+    Args:
+        reviews: 제품 리뷰 목록
+        time_summary: 미리 계산한 시간 분포 요약 (없으면 reviews로 계산)
+        reviewer_stats: 리뷰어 인덱스 제품 집계 (get_reviewer_stats() 값, 없으면 reviews로 계산)
+    """
     if not reviews:
         return _empty_checklist()
+    if time_summary is None:
+        time_summary = summarize_review_dates(r.get("date") for r in reviews)
 
     total_reviews = len(reviews)
     verified_count = sum(1 for r in reviews if r.get("verified", False))
@@ -350,21 +475,13 @@ def generate_checklist_results(reviews: List[Dict]) -> Dict:
             "rate": min(1.0, sum(len(r.get("text", "")) for r in reviews) / total_reviews / 100) if total_reviews > 0 else 0,
             "description": "평균 리뷰 길이 적절"
         },
-        "6_time_distribution": {
-            "passed": True,
-            "rate": 0.85,
-            "description": "리뷰 작성 시간 분포 자연스러움"
-        },
+        "6_time_distribution": time_distribution_check(time_summary),
         "7_ad_detection": {
             "passed": ad_suspected / total_reviews < 0.1 if total_reviews > 0 else True,
             "rate": 1 - (ad_suspected / total_reviews) if total_reviews > 0 else 1,
             "description": f"광고 의심 리뷰: {ad_suspected}/{total_reviews}"
         },
-        "8_reviewer_diversity": {
-            "passed": len(set(r.get("reviewer") for r in reviews)) >= total_reviews * 0.8 if total_reviews > 0 else False,
-            "rate": len(set(r.get("reviewer") for r in reviews)) / total_reviews if total_reviews > 0 else 0,
-            "description": "리뷰어 다양성 양호"
-        }
+        "8_reviewer_diversity": _reviewer_diversity_check(reviews, reviewer_stats)
     }
 
 
@@ -414,7 +531,11 @@ def get_analysis_result(product_id: str) -> Optional[Dict]:
         return None
 
     reviews = get_reviews_by_product(product_id)
-    checklist = generate_checklist_results(reviews)
+    checklist = generate_checklist_results(
+        reviews,
+        get_time_distribution_summary(product_id, reviews),
+        get_reviewer_stats([product_id]).get(str(product_id))
+    )
     ai_analysis = generate_ai_analysis(product, checklist)
 
     return {
@@ -429,11 +550,16 @@ def get_all_analysis_results() -> Dict[str, Dict]:
     """모든 제품의 분석 결과 반환"""
     products = get_all_products()
     results = {}
+    reviewer_stats = get_reviewer_stats([product["id"] for product in products[:5]])
 
     for product in products[:5]:  # 상위 5개 제품만
         product_id = product["id"]
         reviews = get_reviews_by_product(product_id)
-        checklist = generate_checklist_results(reviews)
+        checklist = generate_checklist_results(
+            reviews,
+            get_time_distribution_summary(product_id, reviews),
+            reviewer_stats.get(product_id)
+        )
         ai_analysis = generate_ai_analysis(product, checklist)
 
         results[product_id] = {
@@ -0,0 +1,154 @@
+"""
+time_distribution.py 테스트 스크립트
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ui_integration 디렉토리를 Python 경로에 추가 (app.py와 같은 방식으로 import)
+sys.path.insert(0, str(Path(__file__).parent))
+
+import supabase_data
+from time_distribution import summarize_review_dates, time_distribution_check
+
+START = date(2024, 1, 1)
+
+
+def _spread_dates(rng, count, days, start=START):
+    """기간 안에 고르게 흩어진 작성일 (YYYY-MM-DD)"""
+    return [(start + timedelta(days=rng.randrange(days))).isoformat() for _ in range(count)]
+
+
+def test_case_1_natural_distribution():
+    """테스트 케이스 1: 고르게 흩어진 리뷰, 점점 늘어나는 리뷰는 버스트 아님"""
+    print("=" * 80)
+    print("테스트 1: 자연스러운 분포")
+    print("=" * 80)
+
+    rng = random.Random(1)
+    summary = summarize_review_dates(_spread_dates(rng, 300, 365))
+    print(f"균등: 최대 3일 {summary['max_window_count']}건, 버스트 {summary['burst_count']}개")
+    assert summary["burst_count"] == 0
+    assert summary["dated_reviews"] == 300 and summary["span_days"] <= 365
+    assert time_distribution_check(summary)["passed"]
+
+    # 인기가 늘어 최근 리뷰가 많아지는 제품 (주변 구간 기준 기대치 사용)
+    growing = [(START + timedelta(days=day)).isoformat()
+               for day in range(365) for _ in range(day // 30 + rng.randrange(2))]
+    summary = summarize_review_dates(growing)
+    print(f"증가 추세: 리뷰 {summary['dated_reviews']}건, 버스트 리뷰 비율 {summary['burst_ratio']}")
+    assert summary["burst_ratio"] < 0.05
+
+    # 날짜 없는 리뷰만 있으면 판단 보류
+    check = time_distribution_check(summarize_review_dates(["", None, "2024-01-01"]))
+    assert check["passed"] and check["rate"] == 1.0
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_2_burst_detected():
+    """테스트 케이스 2: 이틀에 몰린 리뷰 탐지 및 작성 간격 통계"""
+    print("\n" + "=" * 80)
+    print("테스트 2: 버스트 탐지")
+    print("=" * 80)
+
+    rng = random.Random(2)
+    dates = _spread_dates(rng, 200, 365)
+    burst_day = START + timedelta(days=200)
+    dates += [burst_day.isoformat()] * 40 + [(burst_day + timedelta(days=1)).isoformat()] * 30
+    rng.shuffle(dates)
+
+    summary = summarize_review_dates(dates)
+    print(f"버스트: {summary['bursts']}")
+    top = summary["bursts"][0]
+    assert top["start"] <= burst_day.isoformat() <= top["end"]
+    assert 70 <= top["count"] <= 75
+    assert summary["same_day_ratio"] > 0.2 and summary["gap_cv"] > 1
+
+    check = time_distribution_check(summary)
+    print(f"체크리스트: {check}")
+    assert not check["passed"] and check["rate"] < 0.8
+    print("\n✅ 테스트 통과!")
+
+
+def test_case_3_checklist_and_cache():
+    """테스트 케이스 3: 체크리스트 연동, 제품별 요약 캐시, 대량 리뷰 처리 시간"""
+    print("\n" + "=" * 80)
+    print("테스트 3: 체크리스트 연동 / 캐시 / 성능")
+    print("=" * 80)
+
+    rng = random.Random(3)
+    dates = sorted(_spread_dates(rng, 50_000, 3 * 365), reverse=True)
+    reviews = [{"date": day, "text": "x" * 120, "rating": 4, "reviewer": f"u{i}"} for i, day in enumerate(dates)]
+
+    # order=review_date.desc 조회처럼 작성일 없는 리뷰가 맨 앞
+    reviews.insert(0, {"date": None, "text": "x" * 120, "rating": 4, "reviewer": "no-date"})
+
+    started = time.perf_counter()
+    summary = supabase_data.get_time_distribution_summary("p1", reviews)
+    elapsed = time.perf_counter() - started
+    print(f"리뷰 {len(reviews):,}건: {elapsed * 1000:.0f}ms")
+    assert elapsed < 2
+
+    checklist = supabase_data.generate_checklist_results(reviews[:500])
+    item = checklist["6_time_distribution"]
+    print(f"체크리스트: {item}")
+    assert item["passed"] and item["rate"] > 0.9
+
+    with mock.patch.object(supabase_data, "summarize_review_dates",
+                           side_effect=supabase_data.summarize_review_dates) as summarize:
+        # 리뷰가 그대로면 다시 계산하지 않음
+        assert supabase_data.get_time_distribution_summary("p1", reviews) == summary
+        assert summarize.call_count == 0
+
+        # 리뷰 수가 같아도 최신 작성일이 바뀌면 다시 계산 (맨 앞의 작성일 없는 리뷰와 무관)
+        reviews[1] = {**reviews[1], "date": "2027-01-01"}
+        updated = supabase_data.get_time_distribution_summary("p1", reviews)
+        assert summarize.call_count == 1 and updated["span_days"] > summary["span_days"]
+
+        # 리뷰 수와 작성일 범위가 같아도 범위 안의 작성일이 바뀌면 다시 계산
+        assert reviews[25_000]["date"] != dates[-1]
+        reviews[25_000] = {**reviews[25_000], "date": dates[-1]}
+        supabase_data.get_time_distribution_summary("p1", reviews)
+        assert summarize.call_count == 2
+
+        # 새 리뷰가 들어오면 다시 계산, 다른 제품은 따로 캐시
+        reviews.insert(1, {"date": "2027-01-02", "text": "", "rating": 5, "reviewer": "new"})
+        supabase_data.get_time_distribution_summary("p1", reviews)
+        supabase_data.get_time_distribution_summary("p2", reviews)
+        assert summarize.call_count == 4
+    print("\n✅ 테스트 통과!")
+
+
+def run_all_tests():
+    """모든 테스트 실행"""
+    print("\n" + "=" * 80)
+    print("🧪 time_distribution.py 테스트 시작")
+    print("=" * 80)
+
+    try:
+        test_case_1_natural_distribution()
+        test_case_2_burst_detected()
+        test_case_3_checklist_and_cache()
+
+        print("\n" + "=" * 80)
+        print("✅ 모든 테스트 통과!")
+        print("=" * 80)
+
+    except AssertionError as e:
+        print(f"\n❌ 테스트 실패: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
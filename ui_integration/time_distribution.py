@@ -0,0 +1,167 @@
+"""
+리뷰 작성 시간 분포 분석 모듈 (체크리스트 6_time_distribution)
+review_date(일 단위)를 정렬한 뒤 슬라이딩 윈도우로 리뷰가 짧은 기간에 몰린 구간(버스트)을 찾고
+리뷰 간 작성 간격 통계를 계산합니다. 정렬 O(n log n) + 윈도우 이동 O(n) + 주변 구간 개수 이분 탐색 O(n log n).
+
+버스트 기준: BURST_WINDOW_DAYS일 동안의 리뷰 수가 기대치(주변 BASELINE_DAYS일 평균과
+전체 기간 평균 중 큰 값)보다 푸아송 기준 BURST_Z_SCORE 표준편차 이상 많고 MIN_BURST_REVIEWS개 이상
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from statistics import median
+from typing import Any, Dict, Iterable, List, Optional
+
+BURST_WINDOW_DAYS = 3
+BASELINE_DAYS = 28
+BURST_Z_SCORE = 3.0
+MIN_BURST_REVIEWS = 5
+MIN_DATED_REVIEWS = 5
+MAX_BURST_RATIO = 0.2     # 버스트 구간 리뷰 비율이 이 값 이상이면 체크리스트 불통과
+MAX_REPORTED_BURSTS = 3
+
+
+def _to_day(value: Any) -> Optional[int]:
+    """review_date 값(YYYY-MM-DD 문자열, date, datetime)을 일 번호로 변환 (변환 불가 시 None)"""
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    if isinstance(value, str) and len(value) >= 10:
+        try:
+            return date.fromisoformat(value[:10]).toordinal()
+        except ValueError:
+            return None
+    return None
+
+
+def summarize_review_dates(dates: Iterable[Any]) -> Dict[str, Any]:
+    """
+    리뷰 작성일 목록의 시간 분포 요약
+
+    Args:
+        dates: review_date 값 목록 (순서 무관, 최신순으로 조회한 목록이면 정렬 비용이 거의 없음)
+
+    Returns:
+        Dict: {
+            "dated_reviews": 날짜가 있는 리뷰 수,
+            "span_days": 첫 리뷰~마지막 리뷰 기간(일),
+            "daily_rate": 전체 기간 하루 평균 리뷰 수,
+            "max_window_count": BURST_WINDOW_DAYS일 구간 최대 리뷰 수,
+            "burst_reviews": 버스트 구간에 속한 리뷰 수,
+            "burst_ratio": burst_reviews / dated_reviews,
+            "bursts": 큰 순서 버스트 구간 [{"start", "end", "count", "expected"}] (최대 MAX_REPORTED_BURSTS개),
+            "burst_count": 버스트 구간 수,
+            "gap_mean_days", "gap_median_days", "gap_cv": 작성 간격 평균/중앙값/변동계수,
+            "same_day_ratio": 직전 리뷰와 같은 날 작성된 비율
+        }
+    """
+    days = sorted(day for day in map(_to_day, dates) if day is not None)
+    n = len(days)
+    summary: Dict[str, Any] = {
+        "dated_reviews": n, "span_days": 0, "daily_rate": 0.0, "max_window_count": n,
+        "burst_reviews": 0, "burst_ratio": 0.0, "bursts": [], "burst_count": 0,
+        "gap_mean_days": 0.0, "gap_median_days": 0.0, "gap_cv": 0.0, "same_day_ratio": 0.0
+    }
+    if n < 2:
+        return summary
+
+    span = days[-1] - days[0] + 1
+    global_rate = n / span
+    summary["span_days"] = span
+    summary["daily_rate"] = round(global_rate, 4)
+
+    # 작성 간격 통계
+    gaps = [days[i + 1] - days[i] for i in range(n - 1)]
+    gap_mean = sum(gaps) / len(gaps)
+    gap_var = sum((gap - gap_mean) ** 2 for gap in gaps) / len(gaps)
+    summary["gap_mean_days"] = round(gap_mean, 4)
+    summary["gap_median_days"] = float(median(gaps))
+    summary["gap_cv"] = round(gap_var ** 0.5 / gap_mean, 4) if gap_mean > 0 else 0.0
+    summary["same_day_ratio"] = round(sum(1 for gap in gaps if gap == 0) / len(gaps), 4)
+
+    # 슬라이딩 윈도우: 같은 날 리뷰의 마지막 인덱스에서만 윈도우를 평가 (같은 날 끝나는 윈도우 중 가장 큼)
+    bursts: List[Dict[str, Any]] = []
+    max_window = 0
+    burst_reviews = 0
+    marked_until = -1
+    left = 0
+    for right in range(n):
+        if right + 1 < n and days[right + 1] == days[right]:
+            continue
+        end = days[right]
+        start = end - BURST_WINDOW_DAYS + 1
+        while days[left] < start:
+            left += 1
+        count = right - left + 1
+        max_window = max(max_window, count)
+        if count < MIN_BURST_REVIEWS:
+            continue
+
+        # 주변 구간(윈도우 앞뒤 BASELINE_DAYS일, 첫/마지막 리뷰 밖은 제외) 리뷰 수로 국소 기대치 계산
+        around_days = min(BASELINE_DAYS, max(start - days[0], 0)) + min(BASELINE_DAYS, days[-1] - end)
+        local_rate = 0.0
+        if around_days > 0:
+            around = (bisect_left(days, start) - bisect_left(days, start - BASELINE_DAYS)) \
+                + (bisect_right(days, end + BASELINE_DAYS) - bisect_right(days, end))
+            local_rate = around / around_days
+        expected = max(local_rate, global_rate) * BURST_WINDOW_DAYS
+        if (count - expected) / max(expected, 1.0) ** 0.5 < BURST_Z_SCORE:
+            continue
+
+        # 겹치는 윈도우는 하나의 버스트로 합침
+        if left > marked_until:
+            bursts.append({"start": start, "end": end, "count": 0, "expected": expected})
+        burst = bursts[-1]
+        burst["end"] = end
+        burst["expected"] = max(burst["expected"], expected)
+        new_reviews = right - max(left, marked_until + 1) + 1
+        burst["count"] += new_reviews
+        burst_reviews += new_reviews
+        marked_until = right
+
+    bursts.sort(key=lambda burst: burst["count"], reverse=True)
+    summary["max_window_count"] = max_window
+    summary["burst_reviews"] = burst_reviews
+    summary["burst_ratio"] = round(burst_reviews / n, 4)
+    summary["burst_count"] = len(bursts)
+    summary["bursts"] = [
+        {
+            "start": date.fromordinal(max(burst["start"], days[0])).isoformat(),
+            "end": date.fromordinal(burst["end"]).isoformat(),
+            "count": burst["count"],
+            "expected": round(burst["expected"], 2)
+        }
+        for burst in bursts[:MAX_REPORTED_BURSTS]
+    ]
+    return summary
+
+
+def time_distribution_check(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    시간 분포 요약을 체크리스트 항목(6_time_distribution)으로 변환
+
+    Args:
+        summary: summarize_review_dates() 결과
+
+    Returns:
+        Dict: {"passed", "rate", "description"} (rate = 1 - 버스트 리뷰 비율)
+    """
+    dated = summary["dated_reviews"]
+    if dated < MIN_DATED_REVIEWS:
+        return {"passed": True, "rate": 1.0, "description": f"작성일 정보 부족 ({dated}건), 시간 분포 판단 보류"}
+
+    burst_ratio = summary["burst_ratio"]
+    if not summary["bursts"]:
+        description = f"리뷰 작성 시간 분포 자연스러움 (하루 평균 {summary['daily_rate']:.1f}건)"
+    else:
+        top = summary["bursts"][0]
+        description = (
+            f"리뷰 몰림 구간 {summary['burst_count']}개, 몰린 리뷰 {summary['burst_reviews']}/{dated} "
+            f"(최대 {top['start']}~{top['end']} {top['count']}건, 기대 {top['expected']:.1f}건)"
+        )
+    return {
+        "passed": burst_ratio < MAX_BURST_RATIO,
+        "rate": round(1 - burst_ratio, 4),
+        "description": description
+    }
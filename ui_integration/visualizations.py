@@ -39,7 +39,8 @@ def render_radar_chart(products_data):
             (sum(1 for x in r if x["reorder"]) / len(r) * 100) if r else 0,
             (sum(1 for x in r if x["one_month_use"]) / len(r) * 100) if r else 0,
             (sum(x["rating"] for x in r) / len(r) * 20) if r else 0,
-            (len(set(x["reviewer"] for x in r)) / len(r) * 100) if r else 0
+            # 체크리스트의 리뷰어 다양성 (리뷰어 인덱스 집계) 재사용
+            data.get("checklist_results", {}).get("8_reviewer_diversity", {}).get("rate", 0) * 100
         ]
         fig.add_trace(go.Scatterpolar(r=vals, theta=categories, fill='toself', name=p['brand'],
                                      line=dict(color=colors[idx % len(colors)], width=3)))